@@ -8,11 +8,32 @@ __version__ = '0.1.4'
 setattr(sys.modules[__name__], 'isplus', False)
 
 _dependencies = ('ladybug',)
+
+
+def _find_module(name):
+    """Check if a module can be imported without importing it."""
+    try:
+        from importlib.util import find_spec
+    except ImportError:
+        # python 2 and IronPython
+        import imp
+        try:
+            imp.find_module(name)
+        except ImportError:
+            return False
+        return True
+    else:
+        return find_spec(name) is not None
+
+
+# dependencies are imported by the modules which use them. importing ladybug here
+# would slow down starting every process that only needs commands or recipes.
 for lib in _dependencies:
-    if lib not in sys.modules:
+    if lib in sys.modules:
+        continue
+    if not _find_module(lib):
         sys.path.insert(
             0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-    try:
-        __import__(lib)
-    except ImportError as e:
-        raise ImportError('Failed to import {}:\n\t{}'.format(lib, e))
+        if not _find_module(lib):
+            raise ImportError('Failed to import {}:\n\tNo module named {}'.format(
+                lib, lib))
@@ -58,6 +58,9 @@ class HBAnalysisSurface(HBObject):
         """Initialize Honeybee Surface."""
         self._childSurfaces = ()
         self._states = []
+        self._parent = None
+        # (origin, polyline) for surfaces with children surfaces
+        self._polyline_cache = None
         if not name:
             name = util.random_name()
             is_name_set_by_user = False
@@ -365,15 +368,9 @@ class HBAnalysisSurface(HBObject):
         as self.points.
         """
         if self.is_relative_system:
-            ptgroups = range(len(self.points))
-            for count, ptGroup in enumerate(self.points):
-                ptgroups[count] = [
-                    (pt[0] + self.origin[0],
-                     pt[1] + self.origin[1],
-                     pt[2] + self.origin[2])
-                    for pt in ptGroup
-                ]
-            return ptgroups
+            origin = self.origin
+            return [[(pt[0] + origin[0], pt[1] + origin[1], pt[2] + origin[2])
+                     for pt in ptGroup] for ptGroup in self.points]
         else:
             return self.points
 
@@ -408,6 +405,7 @@ class HBAnalysisSurface(HBObject):
         """
         assert isinstance(pts, (list, tuple, types.GeneratorType)), \
             'Points should be a list or a tuple or a generator not {}'.format(type(pts))
+        self._points_changed()
         if len(pts) == 0:
             return
         if remove_current_points:
@@ -441,6 +439,7 @@ class HBAnalysisSurface(HBObject):
             subsurface_number: An optional input to indicate the subsurface that
             point should be added to (Default is -1)
         """
+        self._points_changed()
         try:
             self._points[subsurface_number].append(pt)
         except IndexError:
@@ -451,6 +450,12 @@ class HBAnalysisSurface(HBObject):
             self._points[subsurface_number] = list(self._points[subsurface_number])
             self._points[subsurface_number].append(pt)
 
+    def _points_changed(self):
+        """Clear the cached polyline for this surface and its parent surface."""
+        self._polyline_cache = None
+        if hasattr(self._parent, 'isHBAnalysisSurface'):
+            self._parent._polyline_cache = None
+
     @property
     def normal(self):
         """Return surface normal for the first face."""
@@ -540,13 +545,18 @@ class HBAnalysisSurface(HBObject):
         if self.is_child_surface or not self.has_child_surfaces:
             vertices = self.absolute_points
         else:
-            # get points for first glass face
-            glass_points = [childSrf.absolute_points[0]
-                            for childSrf in self.children_surfaces]
-
-            face_points = self.absolute_points[0]
-
-            vertices = (AnalsysiSurfacePolyline(face_points, glass_points).polyline,)
+            # polyline is cached until the points or the origin change
+            origin = self.origin if self.is_relative_system else None
+            if self._polyline_cache is None or self._polyline_cache[0] != origin:
+                # get points for first glass face
+                glass_points = tuple(
+                    tuple(tuple(pt) for pt in childSrf.absolute_points[0])
+                    for childSrf in self.children_surfaces)
+
+                face_points = tuple(tuple(pt) for pt in self.absolute_points[0])
+                polyline = AnalsysiSurfacePolyline(face_points, glass_points).polyline
+                self._polyline_cache = (origin, polyline)
+            vertices = (list(self._polyline_cache[1]),)
 
         if flipped:
             return tuple(tuple(reversed(pts)) for pts in vertices)
@@ -707,15 +717,82 @@ class AnalsysiSurfacePolyline(object):
 
         self.startIndex = ti
 
+    @staticmethod
+    def __min_distance(pt_list1, pt_list2):
+        """Shortest distance between two lists of points."""
+        return math.sqrt(min((pt2[0] - pt1[0]) ** 2 +
+                             (pt2[1] - pt1[1]) ** 2 +
+                             (pt2[2] - pt1[2]) ** 2
+                             for pt1 in pt_list1 for pt2 in pt_list2))
+
+    @staticmethod
+    def __bounding_box(pts):
+        xs, ys, zs = zip(*pts)
+        return min(xs), min(ys), min(zs), max(xs), max(ys), max(zs)
+
     def __calculate_polyline(self, source, targets):
-        """calculate single polyline for HBSurface with Fenestration."""
-        # sort point groups
-        sorted_targets = sorted(
-            targets, key=lambda target: self.__shortest_distance(source, target)[0])
+        """calculate single polyline for HBSurface with Fenestration.
 
-        self.__add_points(source, sorted_targets[0])
+        Starting from the surface, the closest remaining fenestration is added to the
+        polyline and becomes the source for the next one. This is the same as sorting
+        the remaining fenestrations by distance from the source in every step using a
+        stable sort. Ties are resolved by the distance from the previous sources and
+        finally by the input order.
 
-        if len(sorted_targets) > 1:
-            self.__calculate_polyline(sorted_targets[0], sorted_targets[1:])
-        else:
-            self.__add_points(sorted_targets[0], sorted_targets[0])
+        The distance between bounding boxes is a lower bound for the distance between
+        the points. Only the fenestrations with a lower bound smaller than the closest
+        distance will be measured.
+        """
+        min_distance = self.__min_distance
+        targets = list(targets)
+        boxes = [self.__bounding_box(target) for target in targets]
+        remaining = list(range(len(targets)))
+        sources = [source]  # sources for all the steps
+        distances = {}  # cache for distances from previous sources
+
+        while remaining:
+            sx0, sy0, sz0, sx1, sy1, sz1 = self.__bounding_box(source)
+            bounds = []
+            for i in remaining:
+                tx0, ty0, tz0, tx1, ty1, tz1 = boxes[i]
+                dx = max(0, tx0 - sx1, sx0 - tx1)
+                dy = max(0, ty0 - sy1, sy0 - ty1)
+                dz = max(0, tz0 - sz1, sz0 - tz1)
+                bounds.append((math.sqrt(dx ** 2 + dy ** 2 + dz ** 2), i))
+            bounds.sort()
+
+            closest = float('inf')
+            candidates = []
+            for bound, i in bounds:
+                if bound > closest:
+                    break
+                d = min_distance(source, targets[i])
+                if d < closest:
+                    closest = d
+                    candidates = [i]
+                elif d == closest:
+                    candidates.append(i)
+
+            # resolve ties by distance from previous sources
+            step = len(sources) - 2
+            while len(candidates) > 1 and step >= 0:
+                ds = []
+                for i in candidates:
+                    try:
+                        d = distances[(step, i)]
+                    except KeyError:
+                        d = distances[(step, i)] = \
+                            min_distance(sources[step], targets[i])
+                    ds.append(d)
+                closest = min(ds)
+                candidates = [i for i, d in zip(candidates, ds) if d == closest]
+                step -= 1
+
+            index = min(candidates)
+            remaining.remove(index)
+            target = targets[index]
+            self.__add_points(source, target)
+            sources.append(target)
+            source = target
+
+        self.__add_points(source, source)
@@ -120,6 +120,38 @@ def write_to_file_by_name(folder, fname, data, mkdir=False):
             raise IOError("Failed to write %s to file:\n\t%s" % (fname, str(e)))
 
 
+def write_lines_to_file_by_name(folder, fname, lines, mkdir=False):
+    """Write an iterable of strings to file by filename and folder.
+
+    Lines are written one by one as they are generated which keeps the memory flat for
+    large files. A new line will be added after each line.
+
+    Args:
+        folder: Target folder (e.g. c:/ladybug).
+        fname: File name (e.g. room.rad).
+        lines: An iterable of strings.
+        mkdir: Set to True to create the directory if doesn't exist (Default: False).
+    """
+    if not os.path.isdir(folder):
+        if mkdir:
+            preparedir(folder)
+        else:
+            created = preparedir(folder, False)
+            if not created:
+                raise ValueError("Failed to find %s." % folder)
+
+    file_path = os.path.join(folder, fname)
+
+    with open(file_path, writemode) as outf:
+        try:
+            for line in lines:
+                outf.write(line)
+                outf.write('\n')
+            return file_path
+        except Exception as e:
+            raise IOError("Failed to write %s to file:\n\t%s" % (fname, str(e)))
+
+
 def write_to_file(file_path, data, mkdir=False):
     """Write a string of data to file.
 
@@ -290,6 +290,7 @@ class HBSurface(HBAnalysisSurface):
             '{} is not a HBFenSurfaces'.format(type(fenestration_surface))
 
         self._child_surfaces.append(fenestration_surface)
+        self._polyline_cache = None
 
         # set up parent object if it's not set
         fenestration_surface._parent = self
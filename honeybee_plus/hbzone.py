@@ -2,6 +2,7 @@ import honeybee_plus.utilcol as util
 from .hbobject import HBObject
 from .vectormath.euclid import Point3
 from .radiance.radfile import RadFile
+from .radiance.radgeometry import RadGeometry
 from .energyplus.geometryrules import GlobalGeometryRules
 
 import os
@@ -173,6 +174,21 @@ class HBZone(HBObject):
         """
         return RadFile(self.surfaces)
 
+    def to_rad_geometry(self, mode=1, flipped=False):
+        """Return surfaces as a compact RadGeometry.
+
+        Use this method for zones with many surfaces. A RadGeometry can be passed to
+        RadFile or to recipes directly.
+
+        Args:
+            mode: An integer 0-2 (Default: 1)
+                0 - Do not include children surfaces.
+                1 - Include children surfaces.
+                2 - Only children surfaces.
+            flipped: Flip the surface geometry.
+        """
+        return RadGeometry.from_surfaces(self.surfaces, mode, flipped)
+
     def to_rad_string(self, mode=1, include_materials=False,
                       flipped=False, blacked=False):
         """Get full radiance file as a string.
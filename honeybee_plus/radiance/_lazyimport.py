@@ -0,0 +1,38 @@
+"""Import classes from sub-modules of a package on first use.
+
+Python 3.7 and later call the module level __getattr__ for missing attributes
+(PEP 562). Packages use lazy_exports to expose the classes in their sub-modules
+without importing all the sub-modules when the package is imported. With older
+versions of Python and IronPython import the classes from the sub-modules instead
+(e.g. from honeybee_plus.radiance.material.plastic import Plastic).
+"""
+import importlib
+import sys
+
+
+def lazy_exports(package, exports):
+    """Create __getattr__ and __dir__ functions for a package.
+
+    Args:
+        package: Full name of the package (e.g. __name__).
+        exports: A dictionary of {name: module} where module is the name of the
+            sub-module relative to the package (e.g. {'Plastic': '.plastic'}).
+
+    Usage:
+        __getattr__, __dir__ = lazy_exports(__name__, {'Plastic': '.plastic'})
+    """
+    def __getattr__(name):
+        try:
+            module = exports[name]
+        except KeyError:
+            raise AttributeError(
+                'module {} has no attribute {}'.format(package, name))
+        value = getattr(importlib.import_module(module, package), name)
+        # keep the value in the package so the sub-module is only looked up once
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
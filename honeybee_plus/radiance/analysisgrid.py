@@ -5,6 +5,8 @@ from ..dataoperation import match_data
 from ..schedule import Schedule
 from ..futil import write_to_file_by_name
 from .analysispoint import AnalysisPoint
+from .quantization import quantizer_from_json
+from .resultfile import ResultFile
 from ..exception import EmptyFileError
 import os
 try:
@@ -12,7 +14,7 @@ try:
 except:
     pass
 
-from collections import namedtuple, OrderedDict
+from collections import OrderedDict
 
 import sys
 if (sys.version_info >= (3, 0)):
@@ -29,9 +31,9 @@ class AnalysisGrid(object):
     """
 
     __slots__ = ('_analysis_points', '_name', '_sources', '_wgroups', '_directFiles',
-                 '_totalFiles')
+                 '_totalFiles', '_quantizer')
 
-    def __init__(self, analysis_points, name=None, window_groups=None):
+    def __init__(self, analysis_points, name=None, window_groups=None, quantizer=None):
         """Initialize a AnalysisPointGroup.
 
         analysis_points: A collection of AnalysisPoints.
@@ -40,6 +42,11 @@ class AnalysisGrid(object):
             This input is only meaningful in studies such as daylight coefficient
             and multi-phase studies that the contribution of each source will be
             calculated separately (default: None).
+        quantizer: An optional LinearQuantizer or LogQuantizer from
+            radiance.quantization. If provided the hourly values will be stored as
+            compact integer codes in memory. This reduces the memory for annual
+            studies considerably but the values will only be accurate within the
+            error bound of the quantizer (default: None).
         """
         self.name = name
         # name of sources and their state. It's only meaningful in multi-phase daylight
@@ -58,14 +65,18 @@ class AnalysisGrid(object):
         self._analysis_points = analysis_points
         self._directFiles = []  # list of results files
         self._totalFiles = []  # list of results files
+        self._quantizer = None
+        if quantizer:
+            self.quantizer = quantizer
 
     @classmethod
     def from_json(cls, ag_json):
         """Create an analysis grid from json objects."""
-        analysis_points = tuple(AnalysisPoint.from_json(pt)
+        quantizer = quantizer_from_json(ag_json.get("quantizer"))
+        analysis_points = tuple(AnalysisPoint.from_json(pt, quantizer)
                                 for pt in ag_json["analysis_points"])
         return cls(analysis_points=analysis_points, name=ag_json["name"],
-                   window_groups=None)
+                   window_groups=None, quantizer=quantizer)
 
     @classmethod
     def from_points_and_vectors(cls, points, vectors=None,
@@ -136,6 +147,23 @@ class AnalysisGrid(object):
     def window_groups(self, wgs):
         self._wgroups = tuple(wg.name for wg in wgs)
 
+    @property
+    def quantizer(self):
+        """Quantizer for storing the values in memory.
+
+        Quantizer can only be changed when there is no values loaded for the grid.
+        """
+        return self._quantizer
+
+    @quantizer.setter
+    def quantizer(self, quantizer):
+        if quantizer:
+            assert hasattr(quantizer, 'isQuantizer'), \
+                '{} is not a valid quantizer.'.format(quantizer)
+        for ap in self._analysis_points:
+            ap.quantizer = quantizer
+        self._quantizer = quantizer
+
     @property
     def points(self):
         """A generator of points as x, y, z."""
@@ -178,6 +206,9 @@ class AnalysisGrid(object):
     @property
     def hoys(self):
         """Return hours of the year for results if any."""
+        if not self.has_values and self._totalFiles + self._directFiles:
+            # results are available but are not loaded
+            return list((self._totalFiles + self._directFiles)[0].hoys)
         return self.analysis_points[0].hoys
 
     @property
@@ -191,17 +222,15 @@ class AnalysisGrid(object):
         return self._totalFiles, self._directFiles
 
     def add_result_files(self, file_path, hoys, start_line=None, is_direct=False,
-                         header=True, mode=0):
+                         header=True, mode=0, source=None, state=None):
         """Add new result files to grid.
 
         Use this methods if you want to get annual metrics without loading the values
         for each point. This method is only useful for cases with no window groups and
-        dynamic blind states. After adding the files you can call 'annualMetrics' method.
+        dynamic blind states. After adding the files you can call 'annualMetrics' method
+        or use values_from_files to read the values for selected sensors and hours.
         """
-        ResultFile = namedtuple(
-            'ResultFile', ('path', 'hoys', 'start_line', 'header', 'mode'))
-
-        inf = ResultFile(file_path, hoys, start_line, header, mode)
+        inf = ResultFile(file_path, hoys, start_line, header, mode, source, state)
 
         if is_direct:
             self._directFiles.append(inf)
@@ -244,7 +273,7 @@ class AnalysisGrid(object):
 
     def set_values_from_file(self, file_path, hoys=None, source=None, state=None,
                              start_line=None, is_direct=False, header=True,
-                             check_point_count=True, mode=0):
+                             check_point_count=True, mode=0, lazy=False):
         """Load values for test points from a file.
 
         Args:
@@ -268,6 +297,10 @@ class AnalysisGrid(object):
                     overcast sky with total horizontal illuminance of 10000 lux. Now to
                     get daylight factor you should divide the values by 100 ( 10000 / 100).
                     In that case you can use mode = 100 to get the correct values.
+            lazy: Set to True to only add the file to result files without loading
+                the values. Use values_from_files to read the values for selected
+                sensors and hours. The values will be loaded if you call any of the
+                methods that need all the values (e.g. combined_values_by_id).
         """
 
         if os.path.getsize(file_path) < 2:
@@ -275,11 +308,17 @@ class AnalysisGrid(object):
 
         st = start_line or 0
 
+        if lazy:
+            self.add_result_files(file_path, hoys, st, is_direct, header, mode,
+                                  source, state)
+            return
+
         with open(file_path, readmode) as inf:
             if header:
                 inf, _ = self.parse_header(inf, st, hoys, check_point_count)
 
-            self.add_result_files(file_path, hoys, st, is_direct, header, mode)
+            self.add_result_files(file_path, hoys, st, is_direct, header, mode,
+                                  source, state)
 
             for i in xrange(st):
                 next(inf)
@@ -304,7 +343,7 @@ class AnalysisGrid(object):
 
     def set_coupled_values_from_file(
             self, total_file_path, direct_file_path, hoys=None, source=None, state=None,
-            start_line=None, header=True, check_point_count=True, mode=0):
+            start_line=None, header=True, check_point_count=True, mode=0, lazy=False):
         """Load direct and total values for test points from two files.
 
         Args:
@@ -319,6 +358,8 @@ class AnalysisGrid(object):
                 will be 1. This is useful for studies such as sunlight hours. 2 >
                 load the values divided by mode number. Use this mode for daylight
                 factor or radiation analysis.
+            lazy: Set to True to only add the files to result files without loading
+                the values (default: False).
         """
 
         for file_path in (total_file_path, direct_file_path):
@@ -327,13 +368,22 @@ class AnalysisGrid(object):
 
         st = start_line or 0
 
+        if lazy:
+            self.add_result_files(total_file_path, hoys, st, False, header, mode,
+                                  source, state)
+            self.add_result_files(direct_file_path, hoys, st, True, header, mode,
+                                  source, state)
+            return
+
         with open(total_file_path, readmode) as inf, open(direct_file_path, readmode) as dinf:
             if header:
                 inf, _ = self.parse_header(inf, st, hoys, check_point_count)
                 dinf, _ = self.parse_header(dinf, st, hoys, check_point_count)
 
-            self.add_result_files(total_file_path, hoys, st, False, header, mode)
-            self.add_result_files(direct_file_path, hoys, st, True, header, mode)
+            self.add_result_files(total_file_path, hoys, st, False, header, mode,
+                                  source, state)
+            self.add_result_files(direct_file_path, hoys, st, True, header, mode,
+                                  source, state)
 
             for i in xrange(st):
                 next(inf)
@@ -365,6 +415,50 @@ class AnalysisGrid(object):
                 self.analysis_points[count].set_coupled_values(
                     hourlyValues, hoys, source, state)
 
+    def result_file(self, source=None, state=None, is_direct=False):
+        """Get the result file for a source and state.
+
+        If source and state are None the first file will be returned.
+        """
+        files = self._directFiles if is_direct else self._totalFiles
+        if not files:
+            raise ValueError(
+                'No {} result files are assigned to {}.'.format(
+                    'direct' if is_direct else 'total', self.name))
+        if source is None and state is None:
+            return files[0]
+        for rf in files:
+            rf_source, rf_state = self._source_and_state(rf)
+            if rf_source == source and (state is None or rf_state == state):
+                return rf
+        raise ValueError(
+            'Failed to find result file for source [{}] and state [{}].'.format(
+                source, state))
+
+    def values_from_files(self, sensor_ids=None, hoys=None, source=None, state=None,
+                          is_direct=False):
+        """Read values from result files without loading all the values.
+
+        Only the requested sensors and hours are read from the result file. This is
+        useful for large annual studies with lazy loaded results.
+
+        Args:
+            sensor_ids: A list of sensor indexes. By default all the sensors will be
+                returned.
+            hoys: A list of hours of the year. By default all the hours will be
+                returned.
+            source: Name of the source (default: None).
+            state: Name of the state (default: None).
+            is_direct: Set to True to read values from direct result files.
+
+        Returns:
+            A list of tuples. Each tuple includes hourly values for a sensor.
+        """
+        rf = self.result_file(source, state, is_direct)
+        if sensor_ids is None:
+            sensor_ids = xrange(len(self._analysis_points))
+        return rf.values(sensor_ids, hoys)
+
     def combined_value_by_id(self, hoy=None, blinds_state_ids=None):
         """Get combined value from all sources based on state_id.
 
@@ -769,9 +863,7 @@ class AnalysisGrid(object):
             for rf, df in zip(r_files, d_files):
                 rfPath, hoys, start_line, header, mode = rf
                 dfPath, hoys, start_line, header, mode = df
-                fn = os.path.split(rfPath)[-1][:-4].split("..")
-                source = fn[-2]
-                state = fn[-1]
+                source, state = self._source_and_state(rf)
                 print(
                     '\nloading total and direct results for {} AnalysisGrid'
                     ' from {}::{}\n{}\n{}\n'.format(
@@ -783,28 +875,36 @@ class AnalysisGrid(object):
         elif r_files:
             for rf in r_files:
                 rfPath, hoys, start_line, header, mode = rf
-                fn = os.path.split(rfPath)[-1][:-4].split("..")
-                source = fn[-2]
-                state = fn[-1]
+                source, state = self._source_and_state(rf)
                 print('\nloading the results for {} AnalysisGrid form {}::{}\n{}\n'
                       .format(self.name, source, state, rfPath))
                 self.set_values_from_file(
-                    rf, hoys, source, state, start_line, is_direct=False,
+                    rfPath, hoys, source, state, start_line, is_direct=False,
                     header=header, check_point_count=False, mode=mode
                 )
         elif d_files:
             for rf in d_files:
                 rfPath, hoys, start_line, header, mode = rf
-                fn = os.path.split(rfPath)[-1][:-4].split("..")
-                source = fn[-2]
-                state = fn[-1]
+                source, state = self._source_and_state(rf)
                 print('\nloading the results for {} AnalysisGrid form {}::{}\n{}\n'
                       .format(self.name, source, state, rfPath))
                 self.set_values_from_file(
-                    rf, hoys, source, state, start_line, is_direct=True,
+                    rfPath, hoys, source, state, start_line, is_direct=True,
                     header=header, check_point_count=False, mode=mode
                 )
 
+    @staticmethod
+    def _source_and_state(rf):
+        """Get source and state for a result file.
+
+        If the file is added without a source and state they will be parsed from the
+        file name (e.g. scene..default.ill).
+        """
+        if rf.source is not None or rf.state is not None:
+            return rf.source, rf.state
+        fn = os.path.split(rf.path)[-1][:-4].split("..")
+        return fn[-2], fn[-1]
+
     def unload(self):
         """Remove all the sources and values from analysis_points."""
         self._totalFiles = []
@@ -818,6 +918,7 @@ class AnalysisGrid(object):
         """Duplicate AnalysisGrid."""
         aps = tuple(ap.duplicate() for ap in self._analysis_points)
         dup = AnalysisGrid(aps, self._name)
+        dup._quantizer = self._quantizer
         dup._sources = aps[0]._sources
         dup._wgroups = self._wgroups
         return dup
@@ -838,10 +939,13 @@ class AnalysisGrid(object):
     def to_json(self):
         """Create json object from analysisGrid."""
         analysis_points = [ap.to_json() for ap in self.analysis_points]
-        return {
+        ag_json = {
             "name": self._name,
             "analysis_points": analysis_points
         }
+        if self._quantizer:
+            ag_json["quantizer"] = self._quantizer.to_json()
+        return ag_json
 
     def __add__(self, other):
         """Add two analysis grids and create a new one.
@@ -8,6 +8,7 @@ try:
 except ImportError:
     # python 3
     pass
+from .quantization import QuantizedHourlyValues
 import types
 import copy
 import ladybug.dt as dt
@@ -38,12 +39,22 @@ class AnalysisPoint(object):
 
     """
 
-    __slots__ = ('_loc', '_dir', '_sources', '_values', '_is_directLoaded', 'logic')
+    __slots__ = ('_loc', '_dir', '_sources', '_values', '_is_directLoaded', 'logic',
+                 '_quantizer')
 
-    def __init__(self, location, direction):
-        """Create an analysis point."""
+    def __init__(self, location, direction, quantizer=None):
+        """Create an analysis point.
+
+        Args:
+            location: Location of analysis point as (x, y, z).
+            direction: Direction of analysis point as (x, y, z).
+            quantizer: An optional quantizer from radiance.quantization to store the
+                values as compact integer codes. Values will be returned as decoded
+                values within the error bound of the quantizer (default: None).
+        """
         self.location = location
         self.direction = direction
+        self._quantizer = quantizer
 
         # name of sources and their state. It's only meaningful in multi-phase daylight
         # analysis. In analysis for a single time it will be {None: [None]}
@@ -64,11 +75,11 @@ class AnalysisPoint(object):
     # Note to self! This is a hack!
     # assume it's only a single source
     @classmethod
-    def from_json(cls, ap_json):
+    def from_json(cls, ap_json, quantizer=None):
         """Create an analysis point from json object.
             {"location": [x, y, z], "direction": [x, y, z]}
         """
-        _cls = cls(ap_json['location'], ap_json['direction'])
+        _cls = cls(ap_json['location'], ap_json['direction'], quantizer)
         if 'values' in ap_json:
             sid, stateid = _cls._create_data_structure(None, None)
             values = []
@@ -131,6 +142,19 @@ class AnalysisPoint(object):
                     'location should be a list or a tuple with 3 values.\n{}'
                     .format(direction, e))
 
+    @property
+    def quantizer(self):
+        """Quantizer for storing values or None if values are stored as they are."""
+        return self._quantizer
+
+    @quantizer.setter
+    def quantizer(self, quantizer):
+        if self.has_values and quantizer != self._quantizer:
+            raise ValueError(
+                'Quantizer cannot be changed after values are loaded. '
+                'Unload the values first.')
+        self._quantizer = quantizer
+
     @property
     def sources(self):
         """Get sorted list of light sources.
@@ -268,7 +292,10 @@ class AnalysisPoint(object):
             # add sources
             self._sources[source]['state'].append(state)
             # append a new dictionary for this state
-            self._values[sid].append(defaultdict(double))
+            if self._quantizer:
+                self._values[sid].append(QuantizedHourlyValues(self._quantizer))
+            else:
+                self._values[sid].append(defaultdict(double))
 
         # find the state id
         stateid = self._sources[source]['state'].index(state)
@@ -292,7 +319,10 @@ class AnalysisPoint(object):
         if is_direct:
             self._is_directLoaded = True
         ind = 1 if is_direct else 0
-        self._values[sid][stateid][int(hoy * 60)][ind] = value
+        if self._quantizer:
+            self._values[sid][stateid].set_value(int(hoy * 60), ind, value)
+        else:
+            self._values[sid][stateid][int(hoy * 60)][ind] = value
 
     def set_values(self, values, hoys, source=None, state=None, is_direct=False):
         """Set values for several hours of the year.
@@ -319,12 +349,17 @@ class AnalysisPoint(object):
             self._is_directLoaded = True
 
         ind = 1 if is_direct else 0
+        state_values = self._values[sid][stateid]
+        quantized = bool(self._quantizer)
 
         for hoy, value in zip(hoys, values):
             if hoy is None:
                 continue
             try:
-                self._values[sid][stateid][int(hoy * 60)][ind] = value
+                if quantized:
+                    state_values.set_value(int(hoy * 60), ind, value)
+                else:
+                    state_values[int(hoy * 60)][ind] = value
             except Exception as e:
                 raise ValueError(
                     'Failed to load {} results for window_group [{}], state[{}]'
@@ -963,7 +998,7 @@ class AnalysisPoint(object):
 
     def duplicate(self):
         """Duplicate the analysis point."""
-        ap = AnalysisPoint(self._loc, self._dir)
+        ap = AnalysisPoint(self._loc, self._dir, self._quantizer)
         # This should be good enough as most of the time an analysis point will be
         # copied with no values assigned.
         ap._values = copy.copy(self._values)
@@ -987,9 +1022,14 @@ class AnalysisPoint(object):
         """Create an analysis point from json object.
             {"location": [x, y, z], "direction": [x, y, z]}
         """
+        if self._quantizer:
+            values = [[dict(state.items()) for state in source]
+                      for source in self._values]
+        else:
+            values = self._values
         return {"location": tuple(self.location),
                 "direction": tuple(self.direction),
-                "values": self._values}
+                "values": values}
 
     def __repr__(self):
         """Print an analysis point."""
@@ -1 +1,33 @@
 """Radiance commands."""
+from .._lazyimport import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'Dctimestep': '.dctimestep',
+    'Epw2wea': '.epw2wea',
+    'Falsecolor': '.falsecolor',
+    'GenBSDF': '.genBSDF',
+    'Gendaylit': '.gendaylit',
+    'Gendaymtx': '.gendaymtx',
+    'Gensky': '.gensky',
+    'Genskyvec': '.genskyvec',
+    'Getbbox': '.getbbox',
+    'Getinfo': '.getinfo',
+    'Mkpmap': '.mkpmap',
+    'Obj2mesh': '.obj2mesh',
+    'Oconv': '.oconv',
+    'PcombImage': '.pcomb',
+    'Pcomb': '.pcomb',
+    'Pipeline': '.pipeline',
+    'RaBmp': '.raBmp',
+    'RaTiff': '.raTiff',
+    'Rcalc': '.rcalc',
+    'Rcollate': '.rcollate',
+    'Rcontrib': '.rcontrib',
+    'Rfluxmtx': '.rfluxmtx',
+    'RmtxopMatrix': '.rmtxop',
+    'Rmtxop': '.rmtxop',
+    'Rpict': '.rpict',
+    'Rtrace': '.rtrace',
+    'Vwrays': '.vwrays',
+    'Xform': '.xform'
+})
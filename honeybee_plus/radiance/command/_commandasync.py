@@ -0,0 +1,110 @@
+# coding=utf-8
+"""Execute Radiance commands with asyncio.
+
+This module uses async/await syntax and is only imported in Python 3.5 and higher.
+Use RadianceCommand.execute_async instead of importing this module directly.
+
+Usage:
+    loop = asyncio.get_event_loop()
+    results = loop.run_until_complete(
+        execute_many_async((rfluxmtx_1, rfluxmtx_2), max_concurrent=2, timeout=3600))
+"""
+import asyncio
+import os
+import signal
+import subprocess
+
+
+def _print_output(line, stream):
+    """Default output handler."""
+    print(line)
+
+
+async def _read_stream(stream, name, on_output):
+    """Pass the lines of a stream to on_output as they are generated."""
+    while True:
+        line = await stream.readline()
+        if not line:
+            break
+        on_output(line.decode(errors='replace').rstrip('\r\n'), name)
+
+
+async def _kill(process):
+    """Kill a process if it is still running and wait for it to exit."""
+    if process.returncode is None:
+        try:
+            if os.name == 'nt':
+                process.kill()
+            else:
+                # kill the shell and the Radiance programs that it has started
+                os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        await process.wait()
+
+
+async def execute_async(command, timeout=None, on_output=None):
+    """Execute a Radiance command without blocking the event loop.
+
+    Args:
+        command: A RadianceCommand.
+        timeout: Optional time out in seconds. The process will be killed and
+            asyncio.TimeoutError will be raised if the command takes longer.
+        on_output: An optional function which will be called with each line of
+            output and the name of the stream ('stdout' or 'stderr'). By default
+            the lines will be printed.
+
+    Returns:
+        Fullpath to the result file if any.
+    """
+    on_output = on_output or _print_output
+    command._prepare_execution()
+    cmd = command.to_rad_string()
+
+    process = await asyncio.create_subprocess_shell(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        start_new_session=os.name != 'nt')
+
+    async def communicate():
+        await asyncio.gather(
+            _read_stream(process.stdout, 'stdout', on_output),
+            _read_stream(process.stderr, 'stderr', on_output))
+        return await process.wait()
+
+    try:
+        returncode = await asyncio.wait_for(communicate(), timeout)
+    except BaseException:
+        # time out or cancellation. Don't leave a running Radiance process behind.
+        await asyncio.shield(_kill(process))
+        raise
+
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd)
+
+    return command._output_file_path()
+
+
+async def execute_many_async(commands, max_concurrent=None, timeout=None,
+                             on_output=None):
+    """Execute several Radiance commands concurrently.
+
+    Args:
+        commands: A list of RadianceCommands.
+        max_concurrent: Maximum number of commands to run at the same time. By
+            default all the commands start at once.
+        timeout: Optional time out in seconds for each command.
+        on_output: An optional function which will be called with each line of
+            output and the name of the stream ('stdout' or 'stderr').
+
+    Returns:
+        A list of output files in the same order as the commands.
+    """
+    semaphore = asyncio.Semaphore(max_concurrent) if max_concurrent else None
+
+    async def run(command):
+        if semaphore is None:
+            return await execute_async(command, timeout, on_output)
+        async with semaphore:
+            return await execute_async(command, timeout, on_output)
+
+    return await asyncio.gather(*(run(cmd) for cmd in commands))
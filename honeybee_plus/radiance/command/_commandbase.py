@@ -216,13 +216,8 @@ class RadianceCommand(object):
         """
         pass
 
-    # TODO: Add post process of the analysis and handle errors for Radiance comments
-    def execute(self):
-        """Execute the command.
-
-        Returns:
-            Return fullpath to the result file if any as a string.
-        """
+    def _prepare_execution(self):
+        """Check the files and set the environment before executing the command."""
         # check if the files exist on the computer
         self.__check_files()
 
@@ -232,13 +227,8 @@ class RadianceCommand(object):
             os.environ['PATH'] += ';%s' % self.normspace(config.radbin_path)
             os.environ['RAYPATH'] += ';%s' % self.normspace(config.radlib_path)
 
-        p = subprocess.Popen(self.to_rad_string(), shell=True,
-                             stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-
-        for line in p.stdout.readlines():
-            print(line)
-        p.wait()
-
+    def _output_file_path(self):
+        """Return fullpath to the result file if any."""
         try:
             if os.path.split(self.output_file.normpath)[0] == "":
                 # add directory to file if it's not a full path
@@ -251,6 +241,48 @@ class RadianceCommand(object):
             # this command doesn't have an output file
             pass
 
+    # TODO: Add post process of the analysis and handle errors for Radiance comments
+    def execute(self):
+        """Execute the command.
+
+        Returns:
+            Return fullpath to the result file if any as a string.
+        """
+        self._prepare_execution()
+
+        p = subprocess.Popen(self.to_rad_string(), shell=True,
+                             stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+
+        # print the lines as they are generated
+        for line in iter(p.stdout.readline, b''):
+            print(line)
+        p.wait()
+
+        return self._output_file_path()
+
+    def execute_async(self, timeout=None, on_output=None):
+        """Execute the command with asyncio.
+
+        The output of the command is streamed line by line while the command is
+        running and many commands can be awaited concurrently from the same event loop.
+        The process will be killed if the timeout is reached or the task is cancelled.
+        This method is only available in Python 3.5 and higher.
+
+        Args:
+            timeout: Optional time out in seconds.
+            on_output: An optional function which will be called with each line of
+                output and the name of the stream ('stdout' or 'stderr'). By default
+                the lines will be printed.
+
+        Returns:
+            A coroutine which returns fullpath to the result file if any.
+
+        Usage:
+            output_file = await rfluxmtx.execute_async(timeout=3600)
+        """
+        from ._commandasync import execute_async
+        return execute_async(self, timeout, on_output)
+
     def __repr__(self):
         """Class representation."""
         return self.to_rad_string()
@@ -0,0 +1,74 @@
+# coding=utf-8
+"""obj2mesh - create a compiled RADIANCE mesh from a Wavefront .OBJ file."""
+
+from ._commandbase import RadianceCommand
+from ..datatype import RadiancePath, RadianceNumber, RadianceBoolFlag
+
+import os
+
+
+class Obj2mesh(RadianceCommand):
+    """Create a compiled Radiance mesh from a Wavefront .OBJ file.
+
+    Read more at: http://radsite.lbl.gov/radiance/man_html/obj2mesh.1.html
+
+    Attributes:
+        obj_file: Input Wavefront .OBJ file.
+        output_file: Output mesh file (Default: obj_file with .msh extension).
+        material_file: An optional Radiance material file for materials which are
+            used in .OBJ file. It is not needed if the mesh modifier is not void.
+        objlim: Maximum number of surfaces in each octree voxel.
+        maxres: Maximum resolution of the mesh octree.
+        warnings_suppress: Suppress warnings.
+
+    Usage:
+        obj2mesh = Obj2mesh('c:/ladybug/room/scene/room.obj')
+        print(obj2mesh.to_rad_string())
+        > c:/radiance/bin/obj2mesh c:/ladybug/room/scene/room.obj
+          c:/ladybug/room/scene/room.msh
+    """
+
+    obj_file = RadiancePath('obj_file', 'Wavefront .OBJ file', extension='.obj')
+    output_file = RadiancePath('msh', 'mesh file', extension='.msh',
+                               check_exists=False)
+    material_file = RadiancePath('a', 'material file')
+    objlim = RadianceNumber('n', 'maximum surfaces per voxel', num_type=int,
+                            check_positive=True)
+    maxres = RadianceNumber('r', 'maximum octree resolution', num_type=int,
+                            check_positive=True)
+    warnings_suppress = RadianceBoolFlag('w', 'warnings_suppress')
+
+    def __init__(self, obj_file=None, output_file=None, material_file=None,
+                 objlim=None, maxres=None, warnings_suppress=None):
+        """Init command."""
+        RadianceCommand.__init__(self)
+
+        self.obj_file = obj_file
+        self.output_file = output_file or \
+            (os.path.splitext(obj_file)[0] + '.msh' if obj_file else None)
+        self.material_file = material_file
+        self.objlim = objlim
+        self.maxres = maxres
+        self.warnings_suppress = warnings_suppress
+
+    def to_rad_string(self, relative_path=False):
+        """Return full command as a string."""
+        cmd_path = self.normspace(os.path.join(self.radbin_path, 'obj2mesh'))
+        options = ' '.join(
+            v for v in (self.warnings_suppress.to_rad_string(),
+                        self.objlim.to_rad_string(), self.maxres.to_rad_string())
+            if v)
+        material_file = self.material_file.to_rad_string()
+        if material_file:
+            options = '{} -a {}'.format(options, self.normspace(material_file))
+        rad_string = '{0} {1} {2} {3}'.format(
+            cmd_path, options, self.normspace(self.obj_file.to_rad_string()),
+            self.normspace(self.output_file.to_rad_string()))
+        self.check_input_files(rad_string)
+
+        return ' '.join(rad_string.split())
+
+    @property
+    def input_files(self):
+        """Return input files by user."""
+        return (self.obj_file.to_rad_string(),)
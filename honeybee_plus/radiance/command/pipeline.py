@@ -0,0 +1,208 @@
+# coding=utf-8
+"""Chain Radiance commands with pipes.
+
+Many Radiance commands write their results to standard output and the next command
+reads the same file back (e.g. dctimestep > results.rgb and rmtxop results.rgb >
+results.ill). A Pipeline connects these commands with pipes so the intermediate file is
+never written to disk. This saves a large amount of disk I/O for annual studies where
+the intermediate files can be several GB.
+
+Use pipe_commands to chain a list of commands only where the intermediate files are not
+used by any other command.
+
+Usage:
+    dct = Dctimestep(...)  # dctimestep ... > tmp/total.rgb
+    rmtx = Rmtxop(matrix_files=('tmp/total.rgb',), output_file='result/total.ill')
+    pipeline = Pipeline((dct, rmtx))
+    print(pipeline.to_rad_string())
+    > dctimestep ... | rmtxop -fa -c 47.4 119.9 11.6 - > result/total.ill
+"""
+from .pyRad.pyRadLib.pyrad_proc import ProcMixin
+from ...futil import normspace
+
+import os
+import re
+
+# paths with white space are wrapped in double quotes on Windows and single quotes on
+# other platforms (see futil.normspace)
+_tokens = re.compile(r'"[^"]*"|\'[^\']*\'|\S+')
+
+
+def _unquote(token):
+    """Remove double or single quotes from a token."""
+    if len(token) > 1 and token[0] == token[-1] and token[0] in ('"', "'"):
+        return token[1:-1]
+    return token
+
+
+def _same_file(token, file_path):
+    """Check if a command line token points to a file path."""
+    return os.path.normpath(_unquote(token)) == file_path
+
+
+def parse_rad_string(rad_string):
+    """Split a command line to arguments, input file and output file.
+
+    Only the redirections at the end of the command line are considered as input and
+    output files.
+
+    Returns:
+        A tuple of (arguments, input_file, output_file). Input and output files will be
+        None if the command doesn't read from or write to a file.
+    """
+    args = _tokens.findall(rad_string)
+    redirects = {'<': None, '>': None}
+    while args:
+        if len(args) > 1 and args[-2] in redirects:
+            file_path = args.pop()
+            symbol = args.pop()
+        elif args[-1][0] in redirects and len(args[-1]) > 1:
+            token = args.pop()
+            symbol, file_path = token[0], token[1:]
+        else:
+            break
+        redirects[symbol] = os.path.normpath(_unquote(file_path))
+    return args, redirects['<'], redirects['>']
+
+
+class Pipeline(ProcMixin):
+    """A chain of Radiance commands connected with pipes.
+
+    The output file of each command is replaced with a pipe to the next command. The
+    next command must use the same file as input, either as an argument (which will be
+    replaced by - to read from standard input) or as the input redirection (e.g.
+    rcontrib < points.pts).
+
+    Attributes:
+        commands: A list of Radiance commands (e.g. Dctimestep, Rmtxop). All the
+            commands but the last one must write their output to a file.
+    """
+
+    def __init__(self, commands):
+        """Create a pipeline."""
+        self.commands = list(commands)
+        assert len(self.commands) > 1, \
+            'A pipeline needs at least two commands not {}.'.format(len(self.commands))
+
+    @property
+    def isPipeline(self):
+        """Return True for Pipeline."""
+        return True
+
+    @property
+    def input_file(self):
+        """Input file for the first command in the pipeline if any."""
+        return parse_rad_string(self.commands[0].to_rad_string())[1]
+
+    @property
+    def output_file(self):
+        """Output file for the last command in the pipeline if any."""
+        return parse_rad_string(self.commands[-1].to_rad_string())[2]
+
+    @property
+    def intermediate_files(self):
+        """Files that will be replaced by pipes."""
+        return tuple(parse_rad_string(cmd.to_rad_string())[2]
+                     for cmd in self.commands[:-1])
+
+    def command_lines(self):
+        """Get the arguments for each command in the pipeline.
+
+        Returns:
+            A tuple of (list of arguments for each command, input file, output file).
+        """
+        cmdlines = []
+        input_file = output_file = None
+        for count, cmd in enumerate(self.commands):
+            args, stdin, stdout = parse_rad_string(cmd.to_rad_string())
+            if count == 0:
+                input_file = stdin
+            else:
+                assert output_file, \
+                    '{} has no output file to pipe to {}.'.format(
+                        self.commands[count - 1].__class__.__name__,
+                        cmd.__class__.__name__)
+                if stdin == output_file:
+                    # read from standard input
+                    pass
+                else:
+                    assert stdin is None, \
+                        '{} reads {} and cannot read from the pipe.'.format(
+                            cmd.__class__.__name__, stdin)
+                    indexes = [i for i, arg in enumerate(args)
+                               if _same_file(arg, output_file)]
+                    assert len(indexes) == 1, \
+                        '{} must use {} once to read from the pipe.'.format(
+                            cmd.__class__.__name__, output_file)
+                    args[indexes[0]] = '-'
+            output_file = stdout
+            cmdlines.append(args)
+        return cmdlines, input_file, output_file
+
+    def to_rad_string(self, relative_path=False):
+        """Return full command as a string."""
+        cmdlines, input_file, output_file = self.command_lines()
+        rad_string = ' | '.join(' '.join(args) for args in cmdlines)
+        if input_file:
+            first, _, rest = rad_string.partition(' | ')
+            rad_string = '{} < {} | {}'.format(first, normspace(input_file), rest)
+        if output_file:
+            rad_string = '{} > {}'.format(rad_string, normspace(output_file))
+        return rad_string
+
+    def execute(self):
+        """Execute the pipeline.
+
+        Returns:
+            Path to the output file if any.
+        """
+        cmdlines, input_file, output_file = self.command_lines()
+        self.call_many([[_unquote(arg) for arg in args] for args in cmdlines],
+                       'run ' + ' | '.join(c.__class__.__name__ for c in self.commands),
+                       _in=input_file, out=output_file)
+        return output_file
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __len__(self):
+        return len(self.commands)
+
+    def __repr__(self):
+        return self.to_rad_string()
+
+
+def pipe_commands(commands, keep_files=None):
+    """Chain commands with pipes where the intermediate files are not reused.
+
+    The output of a command is piped to the next command if the next command is the
+    only command that reads the file and the file is not in keep_files.
+
+    Args:
+        commands: A list of Radiance commands in the order of execution.
+        keep_files: An optional list of files which are used after these commands and
+            must be written to disk.
+
+    Returns:
+        A list of Radiance commands and Pipelines.
+    """
+    keep_files = set(os.path.normpath(f) for f in keep_files or ())
+    parsed = [parse_rad_string(cmd.to_rad_string()) for cmd in commands]
+
+    def readers(file_path):
+        """Indexes of the commands which read a file once for each use of the file."""
+        return [i for i, (args, stdin, _) in enumerate(parsed)
+                for arg in args + [stdin] if arg and _same_file(arg, file_path)]
+
+    chains = []
+    for count, cmd in enumerate(commands):
+        if count:
+            output_file = parsed[count - 1][2]
+            if output_file and output_file not in keep_files and \
+                    readers(output_file) == [count]:
+                chains[-1].append(cmd)
+                continue
+        chains.append([cmd])
+
+    return [chain[0] if len(chain) == 1 else Pipeline(chain) for chain in chains]
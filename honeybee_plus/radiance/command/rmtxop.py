@@ -172,7 +172,7 @@ class Rmtxop(RadianceCommand):
         # This are just plain matrix files..for simple addition.
         matrix_files = ''
         if self.matrix_files:
-            matrix_files = " + ".join(self.matrix_files)
+            matrix_files = " + ".join(self.normspace(f) for f in self.matrix_files)
             # If compound matrices have already been specified, then add a plus in
             # the beginning.
             if compound_matrices:
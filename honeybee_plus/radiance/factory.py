@@ -1,27 +1,38 @@
 """Material utility."""
-import honeybee_plus.radiance.material.bsdf
-import honeybee_plus.radiance.material.glass
-import honeybee_plus.radiance.material.glow
-import honeybee_plus.radiance.material.light
-import honeybee_plus.radiance.material.metal
-import honeybee_plus.radiance.material.mirror
-import honeybee_plus.radiance.material.plastic
-import honeybee_plus.radiance.material.spotlight
 import honeybee_plus.radiance.primitive as primitive
 import honeybee_plus.radiance.radparser as radparser
 
+import importlib
+
+# modules are imported on first use
 material_mapper = {
-    'BSDF': honeybee_plus.radiance.material.bsdf,
-    'glass': honeybee_plus.radiance.material.glass,
-    'glow': honeybee_plus.radiance.material.glow,
-    'light': honeybee_plus.radiance.material.light,
-    'metal': honeybee_plus.radiance.material.metal,
-    'mirror': honeybee_plus.radiance.material.mirror,
-    'plastic': honeybee_plus.radiance.material.plastic,
-    'spotlight': honeybee_plus.radiance.material.spotlight
+    'BSDF': 'honeybee_plus.radiance.material.bsdf',
+    'glass': 'honeybee_plus.radiance.material.glass',
+    'glow': 'honeybee_plus.radiance.material.glow',
+    'light': 'honeybee_plus.radiance.material.light',
+    'metal': 'honeybee_plus.radiance.material.metal',
+    'mirror': 'honeybee_plus.radiance.material.mirror',
+    'plastic': 'honeybee_plus.radiance.material.plastic',
+    'spotlight': 'honeybee_plus.radiance.material.spotlight'
+}
+
+geometry_mapper = {
+    'instance': 'honeybee_plus.radiance.geometry.instance',
+    'mesh': 'honeybee_plus.radiance.geometry.mesh',
+    'polygon': 'honeybee_plus.radiance.geometry.polygon'
 }
 
 
+def _material_class(type):
+    """Import the module for a material type and return the material class."""
+    module = importlib.import_module(material_mapper[type])
+    try:
+        return getattr(module, type.capitalize())
+    except AttributeError:
+        # BSDF
+        return getattr(module, type)
+
+
 def primitive_from_json(prm_json):
     """
     Args:
@@ -67,13 +78,7 @@ def material_from_json(mat_json):
         )
 
     # create a Radiance material based on the input
-    try:
-        matcls = getattr(material_mapper[type], type.capitalize())
-        return matcls.from_json(mat_json)
-    except AttributeError:
-        # BSDF
-        matcls = getattr(material_mapper[type], type)
-        return matcls.from_json(mat_json)
+    return _material_class(type).from_json(mat_json)
 
 
 def primitive_from_string(prm_string):
@@ -92,10 +97,11 @@ def primitive_from_string(prm_string):
         return primitive.Void()
 
     # run the initial parsing
-    materials = radparser.parse_from_string(prm_string)
-    type = materials[-1].split()[1]
+    type = _last_type(prm_string)
     if type in primitive.Primitive.MATERIALTYPES:
         return material_from_string(prm_string)
+    elif type in geometry_mapper:
+        return geometry_from_string(prm_string)
     else:
         raise NotImplementedError(
             'Pasring for {} primitives is not implemented!'.format(type)
@@ -116,18 +122,40 @@ def material_from_string(mat_string):
         return primitive.Void()
 
     # run the initial parsing
-    materials = radparser.parse_from_string(mat_string)
-    type = materials[-1].split()[1]
+    type = _last_type(mat_string)
 
     assert type in primitive.Primitive.MATERIALTYPES, \
         '{} is not a Radiance material:\n{}'.format(
             type, '\n'.join(primitive.Primitive.MATERIALTYPES)
         )
     # create a Radiance material based on the input
-    try:
-        matcls = getattr(material_mapper[type], type.capitalize())
-        return matcls.from_string(mat_string)
-    except AttributeError:
-        # BSDF
-        matcls = getattr(material_mapper[type], type)
-        return matcls.from_string(mat_string)
+    return _material_class(type).from_string(mat_string)
+
+
+def geometry_from_string(geo_string):
+    """Create Honeybee Radiance geometry from string.
+
+    Args:
+        geo_string: A radiance geometry string. The input can be a multi-line string.
+            The modifier should be void or be included in the string.
+
+    Returns:
+        A Honeybee Radiance geometry.
+    """
+    type = _last_type(geo_string)
+
+    assert type in geometry_mapper, \
+        'Pasring for {} geometries is not implemented!'.format(type)
+
+    geocls = getattr(importlib.import_module(geometry_mapper[type]), type.capitalize())
+    return geocls.from_string(geo_string)
+
+
+def _last_type(prm_string):
+    """Get the type of the last primitive in a Radiance string."""
+    record = None
+    for record in radparser.iter_records((prm_string,)):
+        pass
+    if not record:
+        raise ValueError('{} includes no radiance primitives.'.format(prm_string))
+    return record.type
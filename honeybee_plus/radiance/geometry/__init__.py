@@ -3,3 +3,17 @@
 In Radiance manual geometries are named as Surfaces.
 Read more at: http://radsite.lbl.gov/radiance/refer/ray.html#Surfaces
 """
+from .._lazyimport import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'Bubble': '.bubble',
+    'Cone': '.cone',
+    'Cylinder': '.cylinder',
+    'Instance': '.instance',
+    'Mesh': '.mesh',
+    'Polygon': '.polygon',
+    'Ring': '.ring',
+    'Source': '.source',
+    'Sphere': '.sphere',
+    'Tube': '.tube'
+})
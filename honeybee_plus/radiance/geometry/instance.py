@@ -5,8 +5,6 @@ http://radsite.lbl.gov/radiance/refer/ray.html#Instance
 from .geometrybase import RadianceGeometry
 
 
-# TODO(): Implement the class. It's currently creates this geometry as generic Radiance
-# geometry
 class Instance(RadianceGeometry):
     """Radiance Instance.
 
@@ -31,6 +29,96 @@ class Instance(RadianceGeometry):
     incorporated correctly in the calculation, and they are not recommended. Finally,
     there is no advantage (other than convenience) to using a single instance of an
     octree, or an octree containing only a few surfaces. An xform command on the
-    subordinate description is prefered in such cases. 
+    subordinate description is prefered in such cases.
     """
-    pass
+
+    def __init__(self, name, octree_file, transform=None, modifier=None):
+        """Radiance Instance.
+
+        Attributes:
+            name: Geometry name as a string. Do not use white space and special
+                character.
+            octree_file: Path to a frozen octree file (*.oct).
+            transform: An optional list of xform arguments (e.g. ('-t', 0, 0, 10)) or
+                an xform string (e.g. '-t 0 0 10').
+            modifier: Geometry modifier (Default: "void").
+
+        Usage:
+            instance = Instance("context", "scene/context.oct", "-rz 90")
+            print(instance)
+        """
+        RadianceGeometry.__init__(self, name, modifier=modifier)
+        self.octree_file = octree_file
+        self.transform = transform
+        self._update_values()
+
+    @property
+    def transform(self):
+        """A tuple of xform arguments for this instance."""
+        return self._transform
+
+    @transform.setter
+    def transform(self, value):
+        if not value:
+            self._transform = ()
+        else:
+            try:
+                value = value.split()
+            except AttributeError:
+                pass
+            self._transform = tuple(str(v) for v in value)
+
+    @classmethod
+    def from_string(cls, geometry_string, modifier=None):
+        """Create a Radiance instance from a string.
+
+        If the instance has a modifier the modifier material should also be part of
+        the string or should be provided using modifier argument.
+        """
+        modifier, name, base_geometry_data = cls._analyze_string_input(
+            cls.__name__.lower(), geometry_string, modifier)
+
+        count = int(base_geometry_data[0])
+        octree_file = base_geometry_data[1]
+        transform = base_geometry_data[2:count + 1]
+
+        return cls(name, octree_file, transform, modifier)
+
+    @classmethod
+    def from_json(cls, geo_json):
+        """Make radiance instance from json
+        {
+            "type": "instance", // Geometry type
+            "modifier": {} or "void",
+            "name": "", // Geometry Name
+            "octree_file": "", // Path to octree file
+            "transform": [] // xform arguments
+        }
+        """
+        modifier = cls._analyze_json_input(cls.__name__.lower(), geo_json)
+        return cls(name=geo_json["name"],
+                   octree_file=geo_json["octree_file"],
+                   transform=geo_json.get("transform"),
+                   modifier=modifier)
+
+    def _update_values(self):
+        """update value dictionaries."""
+        self._values[0] = [self.octree_file] + list(self.transform)
+
+    def to_json(self):
+        """Translate radiance instance to json
+        {
+            "type": "instance", // Geometry type
+            "modifier": {} or "void",
+            "name": "", // Geometry Name
+            "octree_file": "", // Path to octree file
+            "transform": [] // xform arguments
+        }
+        """
+        return {
+            "modifier": self.modifier.to_json(),
+            "type": "instance",
+            "name": self.name,
+            "octree_file": self.octree_file,
+            "transform": list(self.transform)
+        }
@@ -5,8 +5,6 @@ http://radsite.lbl.gov/radiance/refer/ray.html#Mesh
 from .geometrybase import RadianceGeometry
 
 
-# TODO(): Implement the class. It's currently creates this geometry as generic Radiance
-# geometry
 class Mesh(RadianceGeometry):
     """Radiance Mesh.
 
@@ -31,4 +29,94 @@ class Mesh(RadianceGeometry):
     pattern and texture mapping. These are made available to function files via the Lu
     and Lv variables.
     """
-    pass
+
+    def __init__(self, name, mesh_file, transform=None, modifier=None):
+        """Radiance Mesh.
+
+        Attributes:
+            name: Geometry name as a string. Do not use white space and special
+                character.
+            mesh_file: Path to a compiled mesh file (*.msh).
+            transform: An optional list of xform arguments (e.g. ('-t', 0, 0, 10)) or
+                an xform string (e.g. '-t 0 0 10').
+            modifier: Geometry modifier (Default: "void").
+
+        Usage:
+            mesh = Mesh("context", "scene/context.msh", "-t 0 0 10", plastic)
+            print(mesh)
+        """
+        RadianceGeometry.__init__(self, name, modifier=modifier)
+        self.mesh_file = mesh_file
+        self.transform = transform
+        self._update_values()
+
+    @property
+    def transform(self):
+        """A tuple of xform arguments for this mesh."""
+        return self._transform
+
+    @transform.setter
+    def transform(self, value):
+        if not value:
+            self._transform = ()
+        else:
+            try:
+                value = value.split()
+            except AttributeError:
+                pass
+            self._transform = tuple(str(v) for v in value)
+
+    @classmethod
+    def from_string(cls, geometry_string, modifier=None):
+        """Create a Radiance mesh from a string.
+
+        If the mesh has a modifier the modifier material should also be part of the
+        string or should be provided using modifier argument.
+        """
+        modifier, name, base_geometry_data = cls._analyze_string_input(
+            cls.__name__.lower(), geometry_string, modifier)
+
+        count = int(base_geometry_data[0])
+        mesh_file = base_geometry_data[1]
+        transform = base_geometry_data[2:count + 1]
+
+        return cls(name, mesh_file, transform, modifier)
+
+    @classmethod
+    def from_json(cls, geo_json):
+        """Make radiance mesh from json
+        {
+            "type": "mesh", // Geometry type
+            "modifier": {} or "void",
+            "name": "", // Geometry Name
+            "mesh_file": "", // Path to mesh file
+            "transform": [] // xform arguments
+        }
+        """
+        modifier = cls._analyze_json_input(cls.__name__.lower(), geo_json)
+        return cls(name=geo_json["name"],
+                   mesh_file=geo_json["mesh_file"],
+                   transform=geo_json.get("transform"),
+                   modifier=modifier)
+
+    def _update_values(self):
+        """update value dictionaries."""
+        self._values[0] = [self.mesh_file] + list(self.transform)
+
+    def to_json(self):
+        """Translate radiance mesh to json
+        {
+            "type": "mesh", // Geometry type
+            "modifier": {} or "void",
+            "name": "", // Geometry Name
+            "mesh_file": "", // Path to mesh file
+            "transform": [] // xform arguments
+        }
+        """
+        return {
+            "modifier": self.modifier.to_json(),
+            "type": "mesh",
+            "name": self.name,
+            "mesh_file": self.mesh_file,
+            "transform": list(self.transform)
+        }
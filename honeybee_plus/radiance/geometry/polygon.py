@@ -56,7 +56,7 @@ class Polygon(RadianceGeometry):
         vertices = base_geometry_data[3:]
 
         points = (vertices[3 * count: 3 * (count + 1)]
-                  for count in range(len(vertices) / 3))
+                  for count in range(len(vertices) // 3))
         return cls(name, points, modifier)
 
     @classmethod
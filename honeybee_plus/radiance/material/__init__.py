@@ -1 +1,34 @@
 """Radiance Materials."""
+from .._lazyimport import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'Antimatter': '.antimatter',
+    'Ashik2': '.ashik2',
+    'BRTDfunc': '.brtdfunc',
+    'BSDF': '.bsdf',
+    'Dielectric': '.dielectric',
+    'Glass': '.glass',
+    'Glow': '.glow',
+    'WhiteGlow': '.glow',
+    'Illum': '.illum',
+    'Interface': '.interface',
+    'Light': '.light',
+    'Metal': '.metal',
+    'Metal2': '.metal2',
+    'Metdata': '.metdata',
+    'Metfunc': '.metfunc',
+    'Mirror': '.mirror',
+    'Mist': '.mist',
+    'Plasdata': '.plasdata',
+    'Plasfunc': '.plasfunc',
+    'Plastic': '.plastic',
+    'BlackMaterial': '.plastic',
+    'Plastic2': '.plastic2',
+    'Prism1': '.prism1',
+    'Prism2': '.prism2',
+    'Spotlight': '.spotlight',
+    'Trans': '.trans',
+    'Trans2': '.trans2',
+    'Transdata': '.transdata',
+    'Transfunc': '.transfunc'
+})
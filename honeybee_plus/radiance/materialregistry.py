@@ -0,0 +1,148 @@
+"""Registry of unique Radiance materials.
+
+Honeybee surfaces usually end up with many material objects that have the same
+definition (e.g. a new Plastic for every surface or a BlackMaterial for every
+RadianceProperties). MaterialRegistry interns the materials so identical materials are
+shared between the surfaces. The Radiance definition for each unique material is
+calculated once and cached.
+
+Interned materials are shared. Do not modify them in place and assign a new material to
+the surface instead.
+
+Usage:
+    registry = MaterialRegistry()
+    registry.intern_surfaces(hb_surfaces)
+    print(len(registry))  # number of unique materials
+    RadFile(hb_surfaces).write_materials('c:/ladybug/room/scene', 'room.mat')
+"""
+
+
+class MaterialRegistry(object):
+    """Registry of unique Radiance materials.
+
+    Materials are identical if they are of the same class and have the same Radiance
+    definition including their modifiers.
+    """
+
+    __slots__ = ('_materials', '_keys', '_objects', '_rad_strings')
+
+    def __init__(self, materials=None):
+        """Create a registry."""
+        self._materials = {}  # {key: material}
+        self._keys = {}  # {id(material): key}
+        self._objects = []  # keep a reference to materials with a key in _keys
+        self._rad_strings = {}  # {key: full radiance definition}
+        for material in materials or ():
+            self.intern(material)
+
+    @property
+    def isMaterialRegistry(self):
+        """Return True for MaterialRegistry."""
+        return True
+
+    @property
+    def materials(self):
+        """A tuple of unique materials."""
+        return tuple(self._materials.values())
+
+    @property
+    def names(self):
+        """A tuple of unique material names."""
+        return tuple(sorted(set(m.name for m in self._materials.values())))
+
+    @classmethod
+    def key(cls, material):
+        """Key for a material.
+
+        The key is a tuple of class name, type, name, modifier key and values of the
+        material which is stable between sessions. The key is built from the values
+        without generating the Radiance definition.
+        """
+        modifier = material.modifier
+        modifier_key = 'void' if modifier.name == 'void' else cls.key(modifier)
+        values = material.values
+        lines = tuple(tuple(str(v) for v in values.get(count) or ())
+                      for count in range(3))
+        return (material.__class__.__name__, material.type, material.name,
+                modifier_key, lines)
+
+    def _key(self, material):
+        """Get key for a material from cache or calculate it."""
+        try:
+            return self._keys[id(material)]
+        except KeyError:
+            key = self.key(material)
+            self._keys[id(material)] = key
+            self._objects.append(material)
+            return key
+
+    def intern(self, material):
+        """Get the shared instance for a material.
+
+        If the material is not in the registry it will be added and returned.
+        """
+        if material is None:
+            return None
+        key = self._key(material)
+        try:
+            return self._materials[key]
+        except KeyError:
+            self._materials[key] = material
+            return material
+
+    def intern_surfaces(self, hb_surfaces):
+        """Replace materials of surfaces with shared instances.
+
+        Materials for all the states, child surfaces and state surfaces as well as
+        black and glow materials will be interned.
+
+        Returns:
+            Number of unique materials in the registry.
+        """
+        seen = set()
+        surfaces = list(hb_surfaces)
+        while surfaces:
+            srf = surfaces.pop()
+            if id(srf) in seen:
+                continue
+            seen.add(id(srf))
+            for state in srf.states:
+                if state.radiance_properties:
+                    state.radiance_properties.intern_materials(self)
+                surfaces.extend(state.surfaces)
+            if srf.has_child_surfaces:
+                surfaces.extend(srf.children_surfaces)
+        return len(self._materials)
+
+    def rad_string(self, material):
+        """Cached Radiance definition for a material.
+
+        The definition is generated once for each unique material.
+        """
+        key = self._key(material)
+        try:
+            return self._rad_strings[key]
+        except KeyError:
+            rad_string = self.intern(material).to_rad_string()
+            self._rad_strings[key] = rad_string
+            return rad_string
+
+    def to_rad_string(self):
+        """Radiance definition of all the materials in the registry."""
+        return '\n'.join(self.rad_string(m) for m in self._materials.values())
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __contains__(self, material):
+        return self._key(material) in self._materials
+
+    def __iter__(self):
+        return iter(self._materials.values())
+
+    def __len__(self):
+        return len(self._materials)
+
+    def __repr__(self):
+        return 'MaterialRegistry::#{} materials'.format(len(self._materials))
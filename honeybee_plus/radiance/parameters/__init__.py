@@ -0,0 +1,24 @@
+"""Radiance parameters."""
+from .._lazyimport import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'DctimestepParameters': '.dctimestep',
+    'FalsecolorParameters': '.falsecolor',
+    'GenbsdfParameters': '.genBsdf',
+    'GendaylitParameters': '.gendaylit',
+    'GendaymtxParameters': '.gendaymtx',
+    'GenskyParameters': '.gensky',
+    'MkpmapParameters': '.mkpmap',
+    'OconvParameters': '.oconv',
+    'PcombParameters': '.pcomb',
+    'RaBmpParameters': '.raBmp',
+    'RaTiffParameters': '.raTiff',
+    'RcalcParameters': '.rcalc',
+    'RcontribParameters': '.rcontrib',
+    'RfluxmtxParameters': '.rfluxmtx',
+    'RmtxopParameters': '.rmtxop',
+    'RpictParameters': '.rpict',
+    'RtraceParameters': '.rtrace',
+    'VwraysParameters': '.vwrays',
+    'XformParameters': '.xform'
+})
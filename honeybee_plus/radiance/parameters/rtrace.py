@@ -82,6 +82,21 @@ class RtraceParameters(AdvancedRadianceParameters):
         error from indirect illuminance interpolation. A value of zero implies
         no interpolation."""
 
+        self.add_radiance_value('af', descriptive_name='ambient file',
+                                attribute_name='ambient_file')
+        self.ambient_file = None
+        """Path to ambient file. Ambient values are read from this file at start
+        and new ambient values are added to the file. The file can be shared by
+        several processes at the same time and it will be locked while it is being
+        updated."""
+
+        self.add_radiance_value('ap', descriptive_name='photon map',
+                                attribute_name='photon_map')
+        self.photon_map = None
+        """Photon map file and an optional bandwidth for density estimates (e.g.
+        room.gpm 50). Use -ap again in the value to add more maps (e.g. room.gpm 50
+        -ap room.cpm 50)."""
+
         self.add_radiance_number('dj', descriptive_name='direct source jitter',
                                  attribute_name='direct_jitter', num_type=float)
         self.direct_jitter = None
@@ -8,6 +8,7 @@ http://radsite.lbl.gov/radiance/refer/ray.html
 """
 from ..utilcol import check_name
 from .radparser import parse_from_string
+import itertools
 try:
     from .factory import primitive_from_string
 except ImportError:
@@ -19,6 +20,10 @@ except ImportError:
     # circular import
     pass
 
+# a unique version for every change in primitives. It is used to invalidate the cached
+# radiance strings.
+_versions = itertools.count(1)
+
 
 class Void(object):
     """Void modifier."""
@@ -38,10 +43,14 @@ class Void(object):
         """False for a void."""
         return True
 
-    def to_rad_string(self):
+    def to_rad_string(self, minimal=False, include_modifier=True):
         """Return full radiance definition."""
         return 'void'
 
+    def _rad_version(self):
+        """Void never changes."""
+        return None
+
     def to_json(self):
         """Return void."""
         return self.to_rad_string()
@@ -64,6 +73,10 @@ class Primitive(object):
             (Default: "void").
         values: A dictionary of primitive data. key is line number and item is the list
             of values {0: [], 1: [], 2: ['0.500', '0.500', '0.500', '0.000', '0.050']}
+
+    The output of to_rad_string is cached. Setting any attribute of the primitive or
+    its modifier (including the Radiance descriptors) invalidates the cache. Assign a
+    new dictionary to values instead of changing the current values in place.
     """
 
     # list of Radiance material types
@@ -98,6 +111,11 @@ class Primitive(object):
                            'dielectric', 'BSDF', 'mixfunc', 'BRTDfunc', 'mist',
                            'prism1', 'prism2'))
 
+    # version of the primitive and cached radiance strings as
+    # (version of primitive and modifiers, {(minimal, include_modifier): string})
+    _version = 0
+    _rad_strings = (None, None)
+
     def __init__(self, name, type, modifier=None, values=None, is_opaque=None):
         """Create primitive base."""
         self.name = name
@@ -420,6 +438,21 @@ class Primitive(object):
 
         return modifier
 
+    def __setattr__(self, name, value):
+        """Set attribute and invalidate the cached radiance strings."""
+        object.__setattr__(self, name, value)
+        if name in ('_rad_strings', '_version'):
+            return
+        # primitives which use this primitive as a modifier cache the version even if
+        # this primitive has never been rendered.
+        object.__setattr__(self, '_version', next(_versions))
+        if self._rad_strings[1] is not None:
+            object.__setattr__(self, '_rad_strings', (None, None))
+
+    def _rad_version(self):
+        """Version of this primitive and its modifiers."""
+        return self._version, self.modifier._rad_version()
+
     def _update_values(self):
         """update value dictionaries.
 
@@ -443,9 +476,28 @@ class Primitive(object):
         else:
             return "%s %s %s\n" % (self.modifier.name, self.type, self.name)
 
-    # add string format for float values
     def to_rad_string(self, minimal=False, include_modifier=True):
-        """Return full radiance definition."""
+        """Return full radiance definition.
+
+        The definition is generated once and will be returned from cache until the
+        primitive or its modifier changes.
+        """
+        version = self._rad_version()
+        cached_version, rad_strings = self._rad_strings
+        if cached_version != version:
+            rad_strings = {}
+            self._rad_strings = version, rad_strings
+        key = minimal, include_modifier
+        try:
+            return rad_strings[key]
+        except KeyError:
+            rad_string = self._to_rad_string(minimal, include_modifier)
+            rad_strings[key] = rad_string
+            return rad_string
+
+    # add string format for float values
+    def _to_rad_string(self, minimal=False, include_modifier=True):
+        """Generate full radiance definition."""
         output = [self.head_line(minimal, include_modifier).strip()]
         for line_count in range(3):
             try:
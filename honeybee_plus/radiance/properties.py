@@ -25,6 +25,8 @@ class RadianceProperties(object):
         """Create radiance properties for surface."""
         self._is_black_material_modified = False
         self._is_glow_material_modified = False
+        self._black_material = None
+        self._glow_material = None
 
         self.material = material
         self.black_material = black_material
@@ -59,20 +61,17 @@ class RadianceProperties(object):
                 TypeError('Expected RadianceMaterial not {}'.format(type(material)))
             # set new material
             self._material = material
-            # update name for black and glow materials
-            if not self.is_black_material_set_by_user:
-                try:
-                    self.black_material.name = material.name
-                except AttributeError:
-                    # black material is not assigned yet
-                    pass
-
-            if not self.is_glow_material_set_by_user:
-                try:
-                    self.glow_material.name = material.name
-                except AttributeError:
-                    # glow material is not assigned yet
-                    pass
+            # default black and glow materials will be created for the new name on
+            # next access. The current ones can be shared with other surfaces.
+            if not self.is_black_material_set_by_user and \
+                    self._black_material is not None and \
+                    self._black_material.name != material.name:
+                self._black_material = None
+
+            if not self.is_glow_material_set_by_user and \
+                    self._glow_material is not None and \
+                    self._glow_material.name != material.name:
+                self._glow_material = None
         else:
             self._material = None
 
@@ -82,6 +81,10 @@ class RadianceProperties(object):
 
         This material is used for direct daylight calculation.
         """
+        if self._black_material is None:
+            # default black material is created on demand
+            self._black_material = BlackMaterial(self._material.name) \
+                if self._material else BlackMaterial()
         return self._black_material
 
     @black_material.setter
@@ -99,9 +102,7 @@ class RadianceProperties(object):
             self._black_material = material
             self._is_black_material_modified = True
         else:
-            self._black_material = BlackMaterial()
-            if self.material:
-                self._black_material.name = self.material.name
+            self._black_material = None
             self._is_black_material_modified = False
 
     @property
@@ -110,6 +111,10 @@ class RadianceProperties(object):
 
         This material will be used for daylight coefficeint calculation.
         """
+        if self._glow_material is None:
+            # default glow material is created on demand
+            self._glow_material = WhiteGlow(self._material.name) \
+                if self._material else WhiteGlow()
         return self._glow_material
 
     @glow_material.setter
@@ -129,11 +134,26 @@ class RadianceProperties(object):
             self._glow_material = material
             self._is_glow_material_modified = True
         else:
-            self._glow_material = WhiteGlow()
-            if self.material:
-                self._glow_material.name = self.material.name
+            self._glow_material = None
             self._is_glow_material_modified = False
 
+    def intern_materials(self, registry):
+        """Replace materials with shared instances from a MaterialRegistry.
+
+        Interned materials can be shared between many surfaces and should not be
+        modified in place.
+
+        Args:
+            registry: A MaterialRegistry.
+        """
+        assert hasattr(registry, 'isMaterialRegistry'), \
+            TypeError('Expected MaterialRegistry not {}'.format(type(registry)))
+        self._material = registry.intern(self._material)
+        # default black and glow materials which are not created yet will be created
+        # on demand.
+        self._black_material = registry.intern(self._black_material)
+        self._glow_material = registry.intern(self._glow_material)
+
     def duplicate(self):
         """Duplicate RadianceProperties."""
         return copy.copy(self)
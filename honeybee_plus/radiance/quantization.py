@@ -0,0 +1,328 @@
+"""Compact quantized encoding for illuminance and radiation values.
+
+Annual studies keep 8760 values for every sensor, source and state. Storing each value
+as a full Python or sqlite integer is wasteful since illuminance rarely needs more than
+16 bits of precision. The quantizers in this module map a non-negative value to an
+unsigned integer code and back.
+
+LinearQuantizer: value = code * scale. The absolute error is at most scale / 2. Sums of
+    codes are still valid which makes it the only option for values that are added
+    together in the database (e.g. multiple window groups).
+LogQuantizer: Codes are spread evenly on a log scale between min_value and max_value.
+    The relative error is at most exp(step / 2) - 1 where
+    step = ln(max_value / min_value) / (2 ** bits - 2). For the default range of
+    0.01 - 1,000,000 lux and 16 bits this is 0.015%. Values smaller than min_value / 2
+    are stored as 0.
+
+Values are clipped to the valid range of each quantizer. Keep in mind that metrics with
+a threshold (e.g. daylight autonomy) can change for values which are within the error
+bound of the threshold.
+
+Usage:
+    quantizer = LogQuantizer()
+    code = quantizer.encode(1250)
+    value = quantizer.decode(code)  # 1250.07
+"""
+from __future__ import division
+from array import array
+from bisect import bisect_left
+import math
+
+
+class LinearQuantizer(object):
+    """Linear quantizer with a fixed scale.
+
+    Attributes:
+        scale: Size of each step. Decoded value is code * scale.
+        bits: Number of bits for each code (default: 16).
+    """
+
+    __slots__ = ('_scale', '_bits', '_max_code')
+
+    def __init__(self, scale=1, bits=16):
+        assert scale > 0, 'Scale must be larger than 0: {}'.format(scale)
+        assert 1 < bits <= 32, 'Bits must be between 2 and 32: {}'.format(bits)
+        self._scale = float(scale)
+        self._bits = int(bits)
+        self._max_code = 2 ** self._bits - 1
+
+    @classmethod
+    def from_max_value(cls, max_value, bits=16):
+        """Create a quantizer that covers values between 0 and max_value."""
+        assert max_value > 0, 'Max value must be larger than 0: {}'.format(max_value)
+        return cls(max_value / (2 ** bits - 1), bits)
+
+    @property
+    def isQuantizer(self):
+        """Return True for quantizers."""
+        return True
+
+    @property
+    def scale(self):
+        """Size of each step."""
+        return self._scale
+
+    @property
+    def bits(self):
+        """Number of bits for each code."""
+        return self._bits
+
+    @property
+    def typecode(self):
+        """array typecode for storing the codes."""
+        return 'H' if self._bits <= 16 else 'I'
+
+    @property
+    def max_value(self):
+        """Largest value that can be stored without clipping."""
+        return self._max_code * self._scale
+
+    @property
+    def max_error(self):
+        """Maximum absolute error for values between 0 and max_value."""
+        return self._scale / 2
+
+    def encode(self, value):
+        """Convert a value to an integer code."""
+        code = int(value / self._scale + 0.5)
+        if code < 0:
+            return 0
+        return code if code < self._max_code else self._max_code
+
+    def decode(self, code):
+        """Convert an integer code to a value."""
+        return code * self._scale
+
+    def to_json(self):
+        """Convert quantizer to a dictionary."""
+        return {'type': 'linear', 'scale': self._scale, 'bits': self._bits}
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __eq__(self, other):
+        return isinstance(other, LinearQuantizer) and \
+            (self._scale, self._bits) == (other._scale, other._bits)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        return 'LinearQuantizer::{}bit::scale {}'.format(self._bits, self._scale)
+
+
+class LogQuantizer(object):
+    """Log quantizer between a minimum and a maximum value.
+
+    Code 0 is reserved for 0 and codes 1 to 2 ** bits - 1 are spread evenly on a log
+    scale between min_value and max_value.
+
+    Attributes:
+        min_value: Smallest non-zero value (default: 0.01).
+        max_value: Largest value (default: 1,000,000).
+        bits: Number of bits for each code (default: 16).
+    """
+
+    __slots__ = ('_min_value', '_max_value', '_bits', '_max_code', '_step',
+                 '_log_min')
+
+    def __init__(self, min_value=0.01, max_value=1000000, bits=16):
+        assert 0 < min_value < max_value, \
+            'Min value must be between 0 and max value: {}'.format(min_value)
+        assert 2 < bits <= 32, 'Bits must be between 3 and 32: {}'.format(bits)
+        self._min_value = float(min_value)
+        self._max_value = float(max_value)
+        self._bits = int(bits)
+        self._max_code = 2 ** self._bits - 1
+        self._log_min = math.log(self._min_value)
+        self._step = (math.log(self._max_value) - self._log_min) / (self._max_code - 1)
+
+    @property
+    def isQuantizer(self):
+        """Return True for quantizers."""
+        return True
+
+    @property
+    def min_value(self):
+        """Smallest non-zero value."""
+        return self._min_value
+
+    @property
+    def max_value(self):
+        """Largest value that can be stored without clipping."""
+        return self._max_value
+
+    @property
+    def bits(self):
+        """Number of bits for each code."""
+        return self._bits
+
+    @property
+    def typecode(self):
+        """array typecode for storing the codes."""
+        return 'H' if self._bits <= 16 else 'I'
+
+    @property
+    def max_relative_error(self):
+        """Maximum relative error for values between min_value and max_value."""
+        return math.exp(self._step / 2) - 1
+
+    def encode(self, value):
+        """Convert a value to an integer code."""
+        if value < self._min_value / 2:
+            return 0
+        elif value <= self._min_value:
+            return 1
+        code = int((math.log(value) - self._log_min) / self._step + 1.5)
+        return code if code < self._max_code else self._max_code
+
+    def decode(self, code):
+        """Convert an integer code to a value."""
+        if code == 0:
+            return 0
+        return math.exp(self._log_min + (code - 1) * self._step)
+
+    def to_json(self):
+        """Convert quantizer to a dictionary."""
+        return {'type': 'log', 'min_value': self._min_value,
+                'max_value': self._max_value, 'bits': self._bits}
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __eq__(self, other):
+        return isinstance(other, LogQuantizer) and \
+            (self._min_value, self._max_value, self._bits) == \
+            (other._min_value, other._max_value, other._bits)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        return 'LogQuantizer::{}bit::{}-{}'.format(
+            self._bits, self._min_value, self._max_value)
+
+
+def quantizer_from_json(quantizer_json):
+    """Create a quantizer from a dictionary."""
+    if not quantizer_json:
+        return None
+    qt = quantizer_json['type']
+    if qt == 'linear':
+        return LinearQuantizer(quantizer_json['scale'], quantizer_json['bits'])
+    elif qt == 'log':
+        return LogQuantizer(quantizer_json['min_value'], quantizer_json['max_value'],
+                            quantizer_json['bits'])
+    raise ValueError('Unknown quantizer type: {}'.format(qt))
+
+
+class QuantizedHourlyValues(object):
+    """Compact container for hourly (total, direct) values of a source at a state.
+
+    This class replaces the {moy: [total, direct]} dictionary in AnalysisPoint when
+    a quantizer is assigned to the analysis grid. Minutes of the year are kept in an
+    array of integers and values are kept as quantized codes in two arrays. Missing
+    direct values are stored as the largest code and returned as None.
+    """
+
+    __slots__ = ('_quantizer', '_moys', '_total', '_direct')
+
+    def __init__(self, quantizer):
+        self._quantizer = quantizer
+        self._moys = array('i')
+        self._total = array(quantizer.typecode)
+        self._direct = array(quantizer.typecode)
+
+    @property
+    def quantizer(self):
+        """Quantizer for this container."""
+        return self._quantizer
+
+    def _index(self, moy):
+        """Get index for a moy. Return -1 if moy is not available."""
+        moys = self._moys
+        i = bisect_left(moys, moy)
+        if i != len(moys) and moys[i] == moy:
+            return i
+        return -1
+
+    def _encode(self, value):
+        # the largest code is reserved for missing values
+        missing = 2 ** self._quantizer.bits - 1
+        if value is None:
+            return missing
+        code = self._quantizer.encode(value)
+        return code if code < missing else missing - 1
+
+    def _decode(self, code, missing):
+        if code == missing:
+            return None
+        return self._quantizer.decode(code)
+
+    def set_value(self, moy, ind, value):
+        """Set total (ind=0) or direct (ind=1) value for a moy."""
+        i = self._index(moy)
+        if i == -1:
+            i = self._insert(moy)
+        if ind == 0:
+            self._total[i] = self._encode(value)
+        else:
+            self._direct[i] = self._encode(value)
+
+    def _insert(self, moy):
+        """Add a new moy and return its index."""
+        missing = 2 ** self._quantizer.bits - 1
+        moys = self._moys
+        if not moys or moys[-1] < moy:
+            # values are almost always added in order
+            i = len(moys)
+            moys.append(moy)
+            self._total.append(missing)
+            self._direct.append(missing)
+        else:
+            i = bisect_left(moys, moy)
+            moys.insert(i, moy)
+            self._total.insert(i, missing)
+            self._direct.insert(i, missing)
+        return i
+
+    def keys(self):
+        """Minutes of the year."""
+        return list(self._moys)
+
+    def items(self):
+        """A generator of (moy, [total, direct])."""
+        return ((moy, self[moy]) for moy in self._moys)
+
+    def __contains__(self, moy):
+        return self._index(moy) != -1
+
+    def __getitem__(self, moy):
+        i = self._index(moy)
+        if i == -1:
+            raise KeyError(moy)
+        missing = 2 ** self._quantizer.bits - 1
+        return self._decode(self._total[i], missing), \
+            self._decode(self._direct[i], missing)
+
+    def __setitem__(self, moy, value):
+        self.set_value(moy, 0, value[0])
+        self.set_value(moy, 1, value[1])
+
+    def __iter__(self):
+        return iter(self._moys)
+
+    def __len__(self):
+        return len(self._moys)
+
+    def __copy__(self):
+        cp = QuantizedHourlyValues(self._quantizer)
+        cp._moys = array('i', self._moys)
+        cp._total = array(self._total.typecode, self._total)
+        cp._direct = array(self._direct.typecode, self._direct)
+        return cp
+
+    def __repr__(self):
+        return 'QuantizedHourlyValues::#{}::{}'.format(len(self), self._quantizer)
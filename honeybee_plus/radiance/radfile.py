@@ -2,12 +2,15 @@
 
 Create, modify and generate radiance files from a collection of hbobjects.
 """
-from ..futil import write_to_file_by_name, copy_files_to_folder, preparedir
-from .geometry.polygon import Polygon
+from ..futil import write_to_file_by_name, write_lines_to_file_by_name, \
+    copy_files_to_folder, preparedir
 from .material.plastic import BlackMaterial
 from .material.glow import WhiteGlow
-from .radparser import parse_from_file
+from .radgeometry import RadGeometry
+from .materialregistry import MaterialRegistry
+from .command.obj2mesh import Obj2mesh
 
+from itertools import chain
 import datetime
 import os
 
@@ -22,53 +25,43 @@ class RadFile(object):
         hb_surfaces: A collection of honeybee surfaces.
         additional_materials: Additional radiance material objects that will be added on
             top of the file.
+        rad_geometry: Optional RadGeometry for compact geometries (e.g. imported from
+            Radiance files or created from honeybee surfaces). These geometries are
+            written after honeybee surfaces and are considered as base surfaces for
+            mode.
+        as_mesh: Set to True to write triangles and quads of surfaces as Radiance meshes
+            in write_geometries. See write_meshes for more information (Default: False).
     """
-    __slots__ = ('hb_surfaces', 'additional_materials')
+    __slots__ = ('hb_surfaces', 'additional_materials', 'rad_geometry', 'as_mesh',
+                 '_mesh_commands')
 
     # TODO(Mostapha) add property for inputs to check the input values
-    def __init__(self, hb_surfaces, additional_materials=None):
+    def __init__(self, hb_surfaces, additional_materials=None, rad_geometry=None,
+                 as_mesh=False):
         """Initiate a radiance file."""
         self.hb_surfaces = hb_surfaces
         if additional_materials:
             raise NotImplementedError('additional_materials is not implemented!')
+        self.rad_geometry = rad_geometry
+        self.as_mesh = as_mesh
+        self._mesh_commands = ()
 
     @classmethod
     def from_file(cls, file_paths):
-        """create a RadFile from Radiance files."""
-        # parse the file and get the materials and geometries
-        geometries = []
-        materials = []
-        for file_path in file_paths:
-            for obj in parse_from_file(file_path):
-                if obj.startswith('#'):
-                    continue
-        return cls(geometries, materials)
+        """create a RadFile from Radiance files.
+
+        Polygons are imported as compact arrays in a RadGeometry and not as honeybee
+        surfaces. Use rad_geometry to filter or transform the imported geometries.
+        """
+        return cls([], rad_geometry=RadGeometry.from_files(file_paths))
 
     def find_bsdf_materials(self, mode=1):
         """Return a list fo BSDF materials if any."""
         mode = 1 if mode is None else mode
-        if mode == 0:
-            # do not include children surface
-            mt = set(srf.radiance_material for srf in self.hb_surfaces
-                     if hasattr(srf.radiance_material, 'xmlfile'))
-
-        elif mode == 1:
-            # do not include children surface
-            mt_base = [srf.radiance_material for srf in self.hb_surfaces
-                       if hasattr(srf.radiance_material, 'xmlfile')]
-            mt_child = [childSrf.radiance_material
-                        for srf in self.hb_surfaces
-                        for childSrf in srf.children_surfaces
-                        if srf.has_child_surfaces and
-                        hasattr(childSrf.radiance_material, 'xmlfile')]
-            mt = set(mt_base + mt_child)
-        elif mode == 2:
-            # only child surfaces
-            mt = set(childSrf.radiance_material
-                     for srf in self.hb_surfaces
-                     for childSrf in srf.children_surfaces
-                     if srf.has_child_surfaces and
-                     hasattr(childSrf.radiance_material, 'xmlfile'))
+        mt = set(m for m in self.unique_materials(mode) if hasattr(m, 'xmlfile'))
+
+        if self.rad_geometry is not None and mode < 2:
+            mt.update(m for m in self.rad_geometry.modifiers if hasattr(m, 'xmlfile'))
 
         return tuple(mt)
 
@@ -82,24 +75,10 @@ class RadFile(object):
                 2 - Only children surfaces.
         """
         mode = 1 if mode is None else mode
-        if mode == 0:
-            # do not include children surface
-            mt = set(srf.radiance_material.name for srf in self.hb_surfaces)
-
-        elif mode == 1:
-            # do not include children surface
-            mt_base = [srf.radiance_material.name for srf in self.hb_surfaces]
-            mt_child = [childSrf.radiance_material.name
-                        for srf in self.hb_surfaces
-                        for childSrf in srf.children_surfaces
-                        if srf.has_child_surfaces]
-            mt = set(mt_base + mt_child)
-        elif mode == 2:
-            # only child surfaces
-            mt = set(childSrf.radiance_material.name
-                     for srf in self.hb_surfaces
-                     for childSrf in srf.children_surfaces
-                     if srf.has_child_surfaces)
+        mt = set(m.name for m in self.unique_materials(mode))
+
+        if self.rad_geometry is not None and mode < 2:
+            mt.update(self.rad_geometry.modifier_names)
 
         return tuple(mt)
 
@@ -125,6 +104,11 @@ class RadFile(object):
         # copy the xml file locally
         copy_files_to_folder(bsdf_files, target_folder)
 
+        return RadFile.replace_xml_files(material_string, bsdf_materials)
+
+    @staticmethod
+    def replace_xml_files(material_string, bsdf_materials):
+        """Replace xml files full path with the relative path under scene/bsdf."""
         # replace the full path with relative path
         # The root folder in Radiance is the place that commands are executed
         # which in honeybee is the root so the relative path is scene/glazing/bsdf
@@ -137,111 +121,193 @@ class RadFile(object):
 
         return material_string
 
-    def materials(self, mode=1, join=False, blacked=False, glowed=False):
-        """Get materials as a list of radiance strings.
+    def surfaces(self, mode=1):
+        """A generator of surfaces based on mode.
+
+        Args:
+            mode: An integer 0-2 (Default: 1)
+                0 - Do not include children surfaces.
+                1 - Include children surfaces.
+                2 - Only children surfaces.
+        """
+        mode = 1 if mode is None else mode
+        if mode < 2:
+            for srf in self.hb_surfaces:
+                yield srf
+        if mode > 0:
+            for srf in self.hb_surfaces:
+                if srf.has_child_surfaces:
+                    for child_srf in srf.children_surfaces:
+                        yield child_srf
+
+    def unique_materials(self, mode=1):
+        """A generator of surface materials de-duplicated by object.
+
+        Args:
+            mode: An integer 0-2 (Default: 1)
+                0 - Do not include children surfaces.
+                1 - Include children surfaces.
+                2 - Only children surfaces.
+        """
+        seen = set()
+        for srf in self.surfaces(mode):
+            material = srf.radiance_material
+            if id(material) in seen:
+                continue
+            seen.add(id(material))
+            yield material
+
+    def intern_materials(self, registry=None):
+        """Share identical materials between the surfaces of this file.
+
+        After interning the materials iter_materials, find_bsdf_materials and
+        radiance_material_names only visit each unique material once.
+
+        Args:
+            registry: An optional MaterialRegistry. A new registry will be created
+                by default.
+
+        Returns:
+            The MaterialRegistry.
+        """
+        registry = registry or MaterialRegistry()
+        registry.intern_surfaces(self.hb_surfaces)
+        return registry
+
+    def iter_materials(self, mode=1, blacked=False, glowed=False, folder=None):
+        """A generator of unique radiance materials as strings.
+
+        Materials are de-duplicated by object and by name. The string for a material
+        is only generated once even if it is assigned to many surfaces. Materials
+        with the same name and different definitions will all be returned similar to
+        materials method.
 
         Args:
             mode: An integer 0-2 (Default: 1)
                 0 - Do not include children surfaces.
                 1 - Include children surfaces.
                 2 - Only children surfaces.
-            join: Set to True to join the output strings (Default: False).
             blacked: If True materials will all be set to plastic 0 0 0 0 0.
+            glowed: If True materials will all be set to glow 0 0 1 1 1 0.
+            folder: Target folder. If provided the xml files for BSDF materials will
+                be copied to the bsdf folder next to this folder and the path will be
+                replaced in material definitions.
         """
         assert not (blacked and glowed), \
             ValueError('You can either use blacked or glowed option.')
-
         mode = 1 if mode is None else mode
-        if mode == 0:
-            # do not include children surface
-            if blacked:
-                mt = set(BlackMaterial(srf.radiance_material.name).to_rad_string()
-                         for srf in self.hb_surfaces)
-            elif glowed:
-                mt = set(WhiteGlow(srf.radiance_material.name).to_rad_string()
-                         for srf in self.hb_surfaces)
-            else:
-                mt = set(srf.radiance_material.to_rad_string()
-                         for srf in self.hb_surfaces)
 
-        elif mode == 1:
-            # do not include children surface
-            if blacked:
-                mt_base = [BlackMaterial(srf.radiance_material.name).to_rad_string()
-                           for srf in self.hb_surfaces]
-                mt_child = [BlackMaterial(childSrf.radiance_material.name)
-                            .to_rad_string()
-                            for srf in self.hb_surfaces
-                            for childSrf in srf.children_surfaces
-                            if srf.has_child_surfaces]
-            elif glowed:
-                mt_base = [
-                    WhiteGlow(srf.radiance_material.name).to_rad_string()
-                    for srf in self.hb_surfaces]
-                mt_child = [
-                    WhiteGlow(childSrf.radiance_material.name).to_rad_string()
-                    for srf in self.hb_surfaces
-                    for childSrf in srf.children_surfaces
-                    if srf.has_child_surfaces]
-            else:
-                mt_base = [srf.radiance_material.to_rad_string()
-                           for srf in self.hb_surfaces]
-                mt_child = [childSrf.radiance_material.to_rad_string()
-                            for srf in self.hb_surfaces
-                            for childSrf in srf.children_surfaces
-                            if srf.has_child_surfaces]
-            mt = set(mt_base + mt_child)
-        elif mode == 2:
-            # only child surfaces
+        bsdf_materials = None
+        if folder and not (glowed or blacked):
+            bsdf_materials = self.find_bsdf_materials(mode)
+            if bsdf_materials:
+                # copy the xml files once
+                self.copy_and_replace_xml_files('', bsdf_materials, folder)
+
+        seen_names = {}
+        for material in self.unique_materials(mode):
+            name = material.name
             if blacked:
-                mt = set(BlackMaterial(childSrf.radiance_material.name).to_rad_string()
-                         for srf in self.hb_surfaces
-                         for childSrf in srf.children_surfaces
-                         if srf.has_child_surfaces)
+                material_string = BlackMaterial(name).to_rad_string()
             elif glowed:
-                mt = set(WhiteGlow(childSrf.radiance_material.name)
-                         .to_rad_string()
-                         for srf in self.hb_surfaces
-                         for childSrf in srf.children_surfaces
-                         if srf.has_child_surfaces)
+                material_string = WhiteGlow(name).to_rad_string()
             else:
-                mt = set(childSrf.radiance_material.to_rad_string()
-                         for srf in self.hb_surfaces
-                         for childSrf in srf.children_surfaces
-                         if srf.has_child_surfaces)
+                material_string = material.to_rad_string()
+
+            strings = seen_names.setdefault(name, set())
+            if material_string in strings:
+                continue
+            strings.add(material_string)
+            if bsdf_materials:
+                material_string = self.replace_xml_files(material_string, bsdf_materials)
+            yield material_string
+
+        if self.rad_geometry is not None and mode < 2:
+            for material_string in self.rad_geometry.iter_materials(blacked, glowed):
+                name = material_string.split(None, 3)[2]
+                strings = seen_names.setdefault(name, set())
+                if material_string in strings:
+                    continue
+                strings.add(material_string)
+                if bsdf_materials:
+                    material_string = self.replace_xml_files(
+                        material_string, bsdf_materials)
+                yield material_string
 
+    def materials(self, mode=1, join=False, blacked=False, glowed=False):
+        """Get materials as a list of radiance strings.
+
+        Args:
+            mode: An integer 0-2 (Default: 1)
+                0 - Do not include children surfaces.
+                1 - Include children surfaces.
+                2 - Only children surfaces.
+            join: Set to True to join the output strings (Default: False).
+            blacked: If True materials will all be set to plastic 0 0 0 0 0.
+        """
+        mt = self.iter_materials(mode, blacked, glowed)
         return '\n'.join(mt) if join else tuple(mt)
 
-    def geometries(self, mode=1, join=False, flipped=False):
-        """Get geometry as a list of radiance strings.
+    def iter_geometries(self, mode=1, flipped=False, modifier_name=None):
+        """A generator of radiance polygons as strings.
 
         Args:
             mode: An integer 0-2 (Default: 1)
                 0 - Do not include children surfaces.
                 1 - Include children surfaces.
                 2 - Only children surfaces.
-            join: Set to True to join the output strings (Default: False).
             flipped: Flip the surface geometry.
+            modifier_name: An optional modifier name to replace the name of surface
+                materials (e.g. BlackMaterial().name).
         """
         mode = 1 if mode is None else mode
         get_polygon = self.get_surface_rad_string
-        if mode == 0:
-            # do not include children surface
-            geo = (get_polygon(srf, flipped) for srf in self.hb_surfaces)
-
-        elif mode == 1:
-            # do not include children surface
-            geo_base = [get_polygon(srf, flipped) for srf in self.hb_surfaces]
-            geo_child = [get_polygon(childSrf, flipped) for srf in self.hb_surfaces
-                         for childSrf in srf.children_surfaces if srf.has_child_surfaces]
-            geo = geo_base + geo_child
-        elif mode == 2:
-            # only child surfaces
-            geo = (get_polygon(childSrf, flipped) for srf in self.hb_surfaces
-                   for childSrf in srf.children_surfaces if srf.has_child_surfaces)
+        for srf in self.surfaces(mode):
+            yield get_polygon(srf, flipped, modifier_name)
+
+        if self.rad_geometry is not None and mode < 2:
+            for geometry in self.rad_geometry.iter_geometries(flipped, modifier_name):
+                yield geometry
+
+    def geometries(self, mode=1, join=False, flipped=False):
+        """Get geometry as a list of radiance strings.
 
+        Args:
+            mode: An integer 0-2 (Default: 1)
+                0 - Do not include children surfaces.
+                1 - Include children surfaces.
+                2 - Only children surfaces.
+            join: Set to True to join the output strings (Default: False).
+            flipped: Flip the surface geometry.
+        """
+        geo = self.iter_geometries(mode, flipped)
         return '\n'.join(geo) if join else tuple(geo)
 
+    def iter_rad_strings(self, mode=1, include_materials=True, flipped=False,
+                         blacked=False, glowed=False, folder=None):
+        """A generator of materials and geometries as radiance strings.
+
+        Args:
+            mode: An integer 0-2 (Default: 1)
+                0 - Do not include children surfaces.
+                1 - Include children surfaces.
+                2 - Only children surfaces.
+            include_materials: Set to False if you only want the geometry definition
+             (default:True).
+            flipped: Flip the surface geometry.
+            blacked: If True materials will all be set to plastic 0 0 0 0 0.
+            glowed: If True materials will all be set to glow 0 0 1 1 1 0.
+            folder: Target folder. If provided the xml files for BSDF materials will
+                be copied to the bsdf folder next to this folder and the path will be
+                replaced in material definitions.
+        """
+        if include_materials:
+            for material in self.iter_materials(mode, blacked, glowed, folder):
+                yield material
+
+        for geometry in self.iter_geometries(mode, flipped):
+            yield geometry
+
     def to_rad_string(self, mode=1, include_materials=True, flipped=False, blacked=False,
                       glowed=False):
         """Get full radiance file as a string.
@@ -267,6 +333,9 @@ class RadFile(object):
               flipped=False, blacked=False, glowed=False, mkdir=False):
         """write materials and geometries to a file.
 
+        Materials and geometries are written one by one to the file without
+        collecting the full string in memory.
+
         Args:
             folder: Target folder.
             filename: File name and extension as a string.
@@ -280,14 +349,11 @@ class RadFile(object):
             blacked: If True materials will all be set to plastic 0 0 0 0 0.
             mkdir: Create the folder if does not exist already.
         """
-
-        data = str(self.to_rad_string(mode, include_materials, flipped, blacked, glowed))
-        if not (glowed or blacked):
-            data = self.copy_and_replace_xml_files(
-                data, self.find_bsdf_materials(mode), folder
-            )
-        text = self.header() + '\n\n' + data
-        return write_to_file_by_name(folder, filename, text, mkdir)
+        lines = chain(
+            (self.header() + '\n',),
+            self.iter_rad_strings(mode, include_materials, flipped, blacked, glowed,
+                                  folder))
+        return write_lines_to_file_by_name(folder, filename, lines, mkdir)
 
     def write_materials(self, folder, filename, mode=1, blacked=False, glowed=False,
                         mkdir=False):
@@ -308,16 +374,24 @@ class RadFile(object):
                 either use blacked or glowed.
             mkdir: Create the folder if does not exist already.
         """
-        data = self.materials(mode, True, blacked, glowed)
-        if not (glowed or blacked):
-            data = self.copy_and_replace_xml_files(
-                data, self.find_bsdf_materials(mode), folder
-            )
-        text = self.header() + '\n\n' + data
-        return write_to_file_by_name(folder, filename, text, mkdir)
+        lines = chain((self.header() + '\n',),
+                      self.iter_materials(mode, blacked, glowed, folder))
+        return write_lines_to_file_by_name(folder, filename, lines, mkdir)
 
-    def write_geometries(self, folder, filename, mode=1, flipped=False, mkdir=False):
+    @property
+    def mesh_commands(self):
+        """obj2mesh commands for the meshes in the last call to write_meshes.
+
+        The commands are only needed if write_meshes is called with a project_folder.
+        """
+        return self._mesh_commands
+
+    def write_geometries(self, folder, filename, mode=1, flipped=False, mkdir=False,
+                         project_folder=None):
         """write geometries to a file.
+
+        If as_mesh is True the surfaces will be written as Radiance meshes.
+
         Args:
             folder: Target folder.
             filename: File name and extension as a string.
@@ -327,34 +401,142 @@ class RadFile(object):
                 2 - Only children surfaces.
             flipped: Flip the surface geometry.
             mkdir: Create the folder if does not exist already.
+            project_folder: Folder which the Radiance commands are executed from. See
+                write_meshes for more information (Default: None).
         """
-        data = self.to_rad_string(mode, False, flipped, False)
-        text = self.header() + '\n\n' + data
-        return write_to_file_by_name(folder, filename, text, mkdir)
+        if self.as_mesh:
+            return self.write_meshes(folder, filename, mode, flipped, mkdir=mkdir,
+                                     project_folder=project_folder)
+        lines = chain((self.header() + '\n',), self.iter_geometries(mode, flipped))
+        return write_lines_to_file_by_name(folder, filename, lines, mkdir)
+
+    def write_meshes(self, folder, filename, mode=1, flipped=False, modifier_name=None,
+                     mkdir=False, execute=True, project_folder=None):
+        """Write geometries to a file and use Radiance meshes for triangles and quads.
+
+        Triangles and quads of surfaces with the same material are written to a
+        Wavefront .OBJ file next to the geometry file (e.g. room..plastic_mat.obj) and
+        compiled to a mesh using obj2mesh. The geometry file includes a mesh primitive
+        for each material and polygons for the rest of the faces (e.g. surfaces with
+        apertures). Meshes are faster to load in oconv and use much less memory than
+        individual polygons for large models.
+
+        Mesh files are referenced by their full path in the geometry file unless a
+        project_folder is provided.
+
+        Args:
+            folder: Target folder.
+            filename: File name and extension as a string.
+            mode: An integer 0-2 (Default: 1)
+                0 - Do not include children surfaces.
+                1 - Include children surfaces.
+                2 - Only children surfaces.
+            flipped: Flip the surface geometry.
+            modifier_name: An optional modifier name to replace the name of surface
+                materials (e.g. BlackMaterial().name). All the faces will be written
+                to a single mesh.
+            mkdir: Create the folder if does not exist already.
+            execute: Set to False to only write the .OBJ files. obj2mesh must be
+                executed for each .OBJ file before using the geometry file
+                (Default: True).
+            project_folder: Folder which the Radiance commands are executed from
+                (e.g. the project folder of a recipe). If provided the mesh files are
+                referenced relative to this folder and obj2mesh is not executed. Add
+                mesh_commands to the commands of the project instead.
+
+        Returns:
+            Path to geometry file.
+        """
+        mode = 1 if mode is None else mode
+        basename = os.path.splitext(filename)[0]
+
+        # collect faces for each modifier
+        groups = {}
+        polygons = []
+        for srf in self.surfaces(mode):
+            name = modifier_name or srf.radiance_material.name
+            points = srf.duplicate_vertices(flipped)
+            for count, pts in enumerate(points):
+                if len(pts) in (3, 4):
+                    groups.setdefault(name, []).append(pts)
+                elif len(points) == 1:
+                    polygons.append(polygon_rad_string(name, srf.name, pts))
+                else:
+                    polygons.append(polygon_rad_string(
+                        name, '{}_{}'.format(srf.name, count), pts))
+
+        meshes = []
+        commands = []
+        for name, faces in sorted(groups.items()):
+            mesh_name = '{}..{}'.format(basename, name)
+            obj_file = self.write_obj(folder, mesh_name + '.obj', faces, mkdir)
+            if project_folder:
+                obj2mesh = Obj2mesh(os.path.relpath(obj_file, project_folder))
+                mesh_file = str(obj2mesh.output_file)
+                commands.append(obj2mesh.to_rad_string())
+            else:
+                obj2mesh = Obj2mesh(obj_file)
+                mesh_file = os.path.abspath(str(obj2mesh.output_file))
+                if execute:
+                    obj2mesh.execute()
+            mesh_file = mesh_file.replace('\\', '/')
+            assert len(mesh_file.split()) == 1, \
+                'Path to mesh files cannot have white space: {}'.format(mesh_file)
+            meshes.append(mesh_rad_string(name, mesh_name, mesh_file))
+        self._mesh_commands = tuple(commands)
+
+        lines = chain((self.header() + '\n',), meshes, polygons)
+        if self.rad_geometry is not None and mode < 2:
+            lines = chain(lines,
+                          self.rad_geometry.iter_geometries(flipped, modifier_name))
+        return write_lines_to_file_by_name(folder, filename, lines, mkdir)
+
+    @staticmethod
+    def write_obj(folder, filename, faces, mkdir=False):
+        """Write faces to a Wavefront .OBJ file.
+
+        Args:
+            folder: Target folder.
+            filename: File name and extension as a string.
+            faces: A list of faces. Each face is a list of 3 or 4 (x, y, z) points
+                ordered counter-clockwise as viewed from the front side.
+            mkdir: Create the folder if does not exist already.
+        """
+        vertices = {}
+        vertex_lines = []
+        face_lines = []
+        for face in faces:
+            indexes = []
+            for pt in face:
+                pt = tuple(float(v) for v in pt)
+                try:
+                    index = vertices[pt]
+                except KeyError:
+                    index = vertices[pt] = len(vertices) + 1
+                    vertex_lines.append('v %s %s %s' % pt)
+                indexes.append(str(index))
+            face_lines.append('f ' + ' '.join(indexes))
+
+        lines = chain(('# Created by Honeybee[+]',), vertex_lines, face_lines)
+        return write_lines_to_file_by_name(folder, filename, lines, mkdir)
 
     def write_black_material(self, folder, filename, mkdir=False):
         """Write black material to a file."""
         text = self.header() + '\n\n' + BlackMaterial().to_rad_string()
         return write_to_file_by_name(folder, filename, text, mkdir)
 
-    # TODO(): fix the bug for multiple surfaces. The material only changes for
-    # the first one.
     def write_geometries_blacked(self, folder, filename, mode=0, flipped=False,
                                  mkdir=False):
         """Write all the surfaces to a file with BlackMaterial.
 
         Use this method to write objects like window-groups.
         """
-        geo = self.geometries(mode, join=True, flipped=flipped)
-        mat_name = BlackMaterial().name
-        # replace the material in string with BlackMaterial.name
-        names = self.radiance_material_names(mode)
-
-        for name in names:
-            geo = geo.replace(name, mat_name)
-
-        text = self.header() + '\n\n' + geo
-        return write_to_file_by_name(folder, filename, text, mkdir)
+        if self.as_mesh:
+            return self.write_meshes(folder, filename, mode, flipped,
+                                     BlackMaterial().name, mkdir)
+        lines = chain((self.header() + '\n',),
+                      self.iter_geometries(mode, flipped, BlackMaterial().name))
+        return write_lines_to_file_by_name(folder, filename, lines, mkdir)
 
     def write_glow_material(self, folder, filename, mkdir=False):
         """Write white glow material to a file."""
@@ -367,16 +549,12 @@ class RadFile(object):
 
         Use this method to write objects like window-groups.
         """
-        geo = self.geometries(mode, flipped=flipped)
-        mat_name = WhiteGlow().name
-        # replace the material in string with BlackMaterial.name
-        names = self.radiance_material_names(mode)
-
-        for name in names:
-            geo = geo.replace(name, mat_name)
-
-        text = self.header() + '\n\n' + geo
-        return write_to_file_by_name(folder, filename, text, mkdir)
+        if self.as_mesh:
+            return self.write_meshes(folder, filename, mode, flipped,
+                                     WhiteGlow().name, mkdir)
+        lines = chain((self.header() + '\n',),
+                      self.iter_geometries(mode, flipped, WhiteGlow().name))
+        return write_lines_to_file_by_name(folder, filename, lines, mkdir)
 
     @staticmethod
     def header():
@@ -387,30 +565,29 @@ class RadFile(object):
         return '%s\n%s' % (header, note)
 
     @staticmethod
-    def get_surface_rad_string(surface, flipped=False):
+    def get_surface_rad_string(surface, flipped=False, modifier_name=None):
         """Get the polygon definition for a honeybee surface.
 
         This is a static method. For the full string try geometries method.
+
+        Args:
+            surface: A honeybee surface.
+            flipped: Flip the surface geometry.
+            modifier_name: An optional modifier name to be used instead of the name
+                of surface material.
         """
         points = surface.duplicate_vertices(flipped)
         name = surface.name
+        modifier_name = modifier_name or surface.radiance_material.name
 
         sub_srf_count = len(points)
+        if sub_srf_count == 1:
+            return polygon_rad_string(modifier_name, name, points[0])
 
-        # create a place holder for each point group (face)
-        # for a planar surface sub_srf_count is one
-        place_holder = list(range(sub_srf_count))
-
-        for ptCount, pts in enumerate(points):
-
-            # modify name for each sub_surface
-            _name = name if sub_srf_count == 1 else '{}_{}'.format(name, ptCount)
-
-            # collect definition for each subsurface
-            pl = Polygon(_name, pts, modifier=surface.radiance_material)
-            place_holder[ptCount] = pl.to_rad_string(include_modifier=False)
-
-        return '\n'.join(place_holder)
+        # modify name for each sub_surface
+        return '\n'.join(
+            polygon_rad_string(modifier_name, '{}_{}'.format(name, count), pts)
+            for count, pts in enumerate(points))
 
     def ToString(self):
         """Overwrite .NET's ToString."""
@@ -423,3 +600,25 @@ class RadFile(object):
     def __repr__(self):
         """rad file."""
         return 'RadFile::#{}'.format(len(self.hb_surfaces))
+
+
+def polygon_rad_string(modifier_name, name, points):
+    """Get Radiance definition of a polygon directly from vertices.
+
+    The output is the same as Polygon(name, points, modifier).to_rad_string(
+    include_modifier=False) without creating the Polygon object.
+    """
+    values = [str(float(v)) for pt in points if len(pt) == 3 for v in pt]
+    assert len(values) > 8, \
+        'Not enough points to create a polygon [%d].' % (len(values) // 3)
+    return '%s polygon %s\n0\n0\n%d %s' % (
+        modifier_name, name, len(values), ' '.join(values))
+
+
+def mesh_rad_string(modifier_name, name, mesh_file):
+    """Get Radiance definition of a mesh.
+
+    The output is the same as Mesh(name, mesh_file, modifier=modifier).to_rad_string(
+    include_modifier=False) without creating the Mesh object.
+    """
+    return '%s mesh %s\n1 %s\n0\n0' % (modifier_name, name, mesh_file)
@@ -0,0 +1,477 @@
+"""Compact geometry for Radiance files and honeybee surfaces.
+
+RadGeometry keeps the polygons of a Radiance scene in flat arrays instead of creating
+one Python object for each polygon:
+
+    vertices: x, y, z values for all the polygons as a float array.
+    offsets: Index of the first vertex for each polygon. The vertices for polygon i
+        are between offsets[i] and offsets[i + 1].
+    modifier_indexes: Index of the modifier name in modifier_names for each polygon.
+    names: Polygon names.
+
+Normals and areas are calculated for all the polygons at once on first access and are
+cached until the polygons change.
+
+Modifiers (materials, patterns, textures and mixtures) are kept as a table of parsed
+records or honeybee materials. The other geometry types (e.g. sphere, ring, instance)
+are kept as records since they are usually only a small part of the scene.
+
+Use RadGeometry.from_surfaces to convert a large number of honeybee surfaces once and
+write them several times (e.g. normal, blacked and glowed) without the overhead of
+honeybee surface objects.
+
+Usage:
+    geometry = RadGeometry.from_files(['c:/ladybug/site/context.rad'])
+    geometry = geometry.filter_by_bounding_box((-100, -100, -10), (100, 100, 200))
+    geometry.move((0, 0, -2))
+    RadFile([], rad_geometry=geometry).write('c:/ladybug/room/scene', 'context.rad')
+"""
+from .primitive import Primitive
+from .material.plastic import BlackMaterial
+from .material.glow import WhiteGlow
+from .radparser import iter_records_from_file
+from array import array
+import math
+
+import sys
+if (sys.version_info >= (3, 0)):
+    xrange = range
+
+
+class RadGeometry(object):
+    """Radiance polygons and modifiers as compact arrays.
+
+    Attributes:
+        modifiers: A list of modifiers as records (radparser.Record) or honeybee
+            Radiance materials.
+        others: A list of records for non-polygon geometries.
+    """
+
+    __slots__ = ('modifiers', 'others', '_modifier_names', '_modifier_map',
+                 '_modifier_indexes', '_names', '_vertices', '_offsets', '_normals',
+                 '_areas')
+
+    def __init__(self, modifiers=None, others=None):
+        """Create an empty geometry collection."""
+        self.modifiers = list(modifiers or [])
+        self.others = list(others or [])
+        self._modifier_names = []
+        self._modifier_map = {}
+        self._modifier_indexes = array('i')
+        self._names = []
+        self._vertices = array('d')
+        self._offsets = array('i', (0,))
+        self._normals = None
+        self._areas = None
+        # non-polygon geometries need their modifiers for blacked and glowed files
+        for record in self.others:
+            self._modifier_index(record.modifier)
+
+    @classmethod
+    def from_records(cls, records):
+        """Create geometry from an iterable of radparser records."""
+        geometry = cls()
+        for record in records:
+            geometry.add_record(record)
+        return geometry
+
+    @classmethod
+    def from_files(cls, file_paths):
+        """Create geometry from Radiance files.
+
+        Files are parsed one object at a time and are never loaded into memory.
+        """
+        geometry = cls()
+        if isinstance(file_paths, str):
+            file_paths = (file_paths,)
+        for file_path in file_paths:
+            for record in iter_records_from_file(file_path):
+                geometry.add_record(record)
+        return geometry
+
+    @classmethod
+    def from_arrays(cls, modifiers, others, names, modifier_names, modifier_indexes,
+                    vertices, vertex_counts):
+        """Create geometry from the arrays of another RadGeometry.
+
+        Args:
+            modifiers: A list of modifiers.
+            others: A list of records for non-polygon geometries.
+            names: Polygon names.
+            modifier_names: Modifier names for modifier_indexes.
+            modifier_indexes: Index of the modifier name for each polygon.
+            vertices: x, y, z values for all the polygons.
+            vertex_counts: Number of vertices for each polygon.
+        """
+        geometry = cls(modifiers, others)
+        geometry._modifier_names = list(modifier_names)
+        geometry._modifier_map = {n: i for i, n in enumerate(modifier_names)}
+        for record in geometry.others:
+            geometry._modifier_index(record.modifier)
+        geometry._names = list(names)
+        geometry._modifier_indexes = array('i', modifier_indexes)
+        geometry._vertices = array('d', vertices)
+        offsets = geometry._offsets
+        for count in vertex_counts:
+            offsets.append(offsets[-1] + count)
+        assert len(offsets) == len(geometry._names) + 1 == \
+            len(geometry._modifier_indexes) + 1, \
+            'Number of polygons, modifier indexes and vertex counts must be the same.'
+        assert 3 * offsets[-1] == len(geometry._vertices), \
+            'Number of vertices does not match the vertex counts.'
+        return geometry
+
+    @classmethod
+    def from_surfaces(cls, hb_surfaces, mode=1, flipped=False):
+        """Create geometry from honeybee surfaces.
+
+        Polygons and names are the same as RadFile(hb_surfaces).geometries().
+
+        Args:
+            hb_surfaces: A collection of honeybee surfaces.
+            mode: An integer 0-2 (Default: 1)
+                0 - Do not include children surfaces.
+                1 - Include children surfaces.
+                2 - Only children surfaces.
+            flipped: Flip the surface geometry.
+        """
+        mode = 1 if mode is None else mode
+        surfaces = list(hb_surfaces) if mode < 2 else []
+        if mode > 0:
+            surfaces.extend(child_srf for srf in hb_surfaces if srf.has_child_surfaces
+                            for child_srf in srf.children_surfaces)
+
+        geometry = cls()
+        seen_materials = set()
+        for srf in surfaces:
+            material = srf.radiance_material
+            if id(material) not in seen_materials:
+                seen_materials.add(id(material))
+                geometry.modifiers.append(material)
+            name = srf.name
+            modifier_name = material.name
+            faces = srf.duplicate_vertices(flipped)
+            if len(faces) == 1:
+                geometry.add_polygon(
+                    modifier_name, name, [v for pt in faces[0] if len(pt) == 3
+                                          for v in pt])
+                continue
+            for count, pts in enumerate(faces):
+                geometry.add_polygon(
+                    modifier_name, '{}_{}'.format(name, count),
+                    [v for pt in pts if len(pt) == 3 for v in pt])
+        return geometry
+
+    @property
+    def isRadGeometry(self):
+        """Return True for RadGeometry."""
+        return True
+
+    @property
+    def polygon_count(self):
+        """Number of polygons."""
+        return len(self._names)
+
+    @property
+    def vertex_count(self):
+        """Number of vertices for all the polygons."""
+        return len(self._vertices) // 3
+
+    @property
+    def names(self):
+        """Polygon names."""
+        return self._names
+
+    @property
+    def modifier_names(self):
+        """Unique modifier names for polygons."""
+        return self._modifier_names
+
+    @property
+    def modifier_indexes(self):
+        """Index of modifier name in modifier_names for each polygon."""
+        return self._modifier_indexes
+
+    @property
+    def vertices(self):
+        """x, y, z values for all the polygons as a float array."""
+        return self._vertices
+
+    @property
+    def offsets(self):
+        """Index of the first vertex of each polygon plus the total vertex count."""
+        return self._offsets
+
+    @property
+    def normals(self):
+        """x, y, z values of unit normal vectors for all the polygons."""
+        if self._normals is None:
+            self._calculate_normals()
+        return self._normals
+
+    @property
+    def areas(self):
+        """Area of polygons as a float array."""
+        if self._areas is None:
+            self._calculate_normals()
+        return self._areas
+
+    def _calculate_normals(self):
+        """Calculate normals and areas for all the polygons using Newell's method."""
+        vertices = self._vertices
+        offsets = self._offsets
+        normals = array('d')
+        areas = array('d')
+        sqrt = math.sqrt
+        for count in xrange(len(self._names)):
+            st, end = 3 * offsets[count], 3 * offsets[count + 1]
+            xs, ys, zs = vertices[st:end:3], vertices[st + 1:end:3], \
+                vertices[st + 2:end:3]
+            nx = ny = nz = 0
+            px, py, pz = xs[-1], ys[-1], zs[-1]
+            for x, y, z in zip(xs, ys, zs):
+                nx += (py - y) * (pz + z)
+                ny += (pz - z) * (px + x)
+                nz += (px - x) * (py + y)
+                px, py, pz = x, y, z
+            length = sqrt(nx * nx + ny * ny + nz * nz)
+            if length:
+                normals.extend((nx / length, ny / length, nz / length))
+            else:
+                normals.extend((0, 0, 0))
+            areas.append(length / 2.0)
+        self._normals = normals
+        self._areas = areas
+
+    def normal(self, index):
+        """Unit normal vector for a polygon as (x, y, z)."""
+        normals = self.normals
+        return normals[3 * index], normals[3 * index + 1], normals[3 * index + 2]
+
+    def area(self, index):
+        """Area of a polygon."""
+        return self.areas[index]
+
+    def _modifier_index(self, modifier_name):
+        try:
+            return self._modifier_map[modifier_name]
+        except KeyError:
+            index = len(self._modifier_names)
+            self._modifier_map[modifier_name] = index
+            self._modifier_names.append(modifier_name)
+            return index
+
+    def add_record(self, record):
+        """Add a parsed Radiance object."""
+        if record.type == 'polygon':
+            self.add_polygon(record.modifier, record.name, record.real_args)
+        elif record.type in Primitive.GEOMETRYTYPES:
+            self._modifier_index(record.modifier)
+            self.others.append(record)
+        else:
+            self.modifiers.append(record)
+
+    def add_polygon(self, modifier_name, name, values):
+        """Add a polygon.
+
+        Args:
+            modifier_name: Modifier name.
+            name: Polygon name.
+            values: A flat list of x, y, z values as numbers or strings.
+        """
+        count = len(values)
+        if count < 9 or count % 3:
+            raise ValueError(
+                'Invalid number of values for polygon {}: {}'.format(name, count))
+        try:
+            self._vertices.extend(array('d', values))
+        except TypeError:
+            # values are strings
+            self._vertices.extend(array('d', [float(v) for v in values]))
+        self._offsets.append(self._offsets[-1] + count // 3)
+        self._names.append(name)
+        self._modifier_indexes.append(self._modifier_index(modifier_name))
+        self._normals = self._areas = None
+
+    def modifier_name(self, index):
+        """Modifier name for a polygon."""
+        return self._modifier_names[self._modifier_indexes[index]]
+
+    def points(self, index):
+        """A tuple of (x, y, z) points for a polygon."""
+        v = self._vertices
+        return tuple((v[i], v[i + 1], v[i + 2]) for i in
+                     xrange(3 * self._offsets[index], 3 * self._offsets[index + 1], 3))
+
+    def subset(self, indexes, others=None):
+        """Create a new RadGeometry from a list of polygon indexes.
+
+        Args:
+            indexes: A list of polygon indexes.
+            others: An optional list of records for non-polygon geometries. By default
+                all the non-polygon geometries will be copied.
+
+        Returns:
+            A new RadGeometry. Modifiers are shared between the two objects.
+        """
+        geometry = RadGeometry(self.modifiers,
+                               self.others if others is None else others)
+        geometry._add_polygons(self, indexes)
+        return geometry
+
+    def extend(self, other):
+        """Add modifiers and geometries from another RadGeometry."""
+        seen_modifiers = set(id(m) for m in self.modifiers)
+        self.modifiers.extend(m for m in other.modifiers if id(m) not in seen_modifiers)
+        for record in other.others:
+            self._modifier_index(record.modifier)
+        self.others.extend(other.others)
+        self._add_polygons(other, xrange(len(other)))
+
+    def _add_polygons(self, other, indexes):
+        """Copy polygons from another RadGeometry."""
+        vertices = other._vertices
+        offsets = other._offsets
+        new_vertices = self._vertices
+        new_offsets = self._offsets
+        new_indexes = self._modifier_indexes
+        names = other._names
+        modifier_names = other._modifier_names
+        modifier_indexes = other._modifier_indexes
+        for i in indexes:
+            new_vertices.extend(vertices[3 * offsets[i]:3 * offsets[i + 1]])
+            new_offsets.append(new_offsets[-1] + offsets[i + 1] - offsets[i])
+            self._names.append(names[i])
+            new_indexes.append(self._modifier_index(modifier_names[modifier_indexes[i]]))
+        self._normals = self._areas = None
+
+    def filter_by_modifiers(self, modifier_names, exclude=False):
+        """Get a new RadGeometry for geometries with certain modifiers.
+
+        Args:
+            modifier_names: A list of modifier names.
+            exclude: Set to True to remove geometries with these modifiers instead of
+                keeping them (default: False).
+        """
+        names = set(modifier_names)
+        selected = set(i for i, n in enumerate(self._modifier_names)
+                       if (n in names) != exclude)
+        return self.subset(
+            (i for i, mi in enumerate(self._modifier_indexes) if mi in selected),
+            [r for r in self.others if (r.modifier in names) != exclude])
+
+    def filter_by_opacity(self, opaque=True):
+        """Get a new RadGeometry for geometries with opaque or non-opaque modifiers.
+
+        Honeybee materials are checked by is_opaque and records by type. Geometries
+        with a modifier which is not in modifiers are considered opaque.
+        """
+        non_opaque = set(
+            m.name for m in self.modifiers
+            if not getattr(m, 'is_opaque', m.type not in Primitive.NONEOPAQUETYPES))
+        if opaque:
+            return self.filter_by_modifiers(non_opaque, exclude=True)
+        return self.filter_by_modifiers(non_opaque)
+
+    def filter_by_bounding_box(self, min_pt, max_pt):
+        """Get a new RadGeometry for polygons that intersect a bounding box.
+
+        Non-polygon geometries are not filtered.
+
+        Args:
+            min_pt: Minimum (x, y, z) of the bounding box.
+            max_pt: Maximum (x, y, z) of the bounding box.
+        """
+        vertices = self._vertices
+        offsets = self._offsets
+
+        def intersects(i):
+            st, end = 3 * offsets[i], 3 * offsets[i + 1]
+            for c in xrange(3):
+                values = vertices[st + c:end:3]
+                if max(values) < min_pt[c] or min(values) > max_pt[c]:
+                    return False
+            return True
+
+        return self.subset(i for i in xrange(len(self._names)) if intersects(i))
+
+    def move(self, vector):
+        """Move polygons by a vector. Non-polygon geometries won't be moved."""
+        vertices = self._vertices
+        for c in xrange(3):
+            d = float(vector[c])
+            if d:
+                vertices[c::3] = array('d', [v + d for v in vertices[c::3]])
+
+    def transform(self, matrix):
+        """Transform polygons by a matrix. Non-polygon geometries won't be transformed.
+
+        Args:
+            matrix: A 3 x 4 affine transformation matrix as a list of rows. The fourth
+                column is the translation.
+        """
+        (a, b, c, d), (e, f, g, h), (i, j, k, l) = \
+            [[float(v) for v in row] for row in matrix]
+        vertices = self._vertices
+        xs, ys, zs = vertices[0::3], vertices[1::3], vertices[2::3]
+        vertices[0::3] = array('d', [a * x + b * y + c * z + d
+                                     for x, y, z in zip(xs, ys, zs)])
+        vertices[1::3] = array('d', [e * x + f * y + g * z + h
+                                     for x, y, z in zip(xs, ys, zs)])
+        vertices[2::3] = array('d', [i * x + j * y + k * z + l
+                                     for x, y, z in zip(xs, ys, zs)])
+        self._normals = self._areas = None
+
+    def iter_materials(self, blacked=False, glowed=False):
+        """A generator of modifiers as Radiance strings.
+
+        Args:
+            blacked: If True polygon modifiers will be set to plastic 0 0 0 0 0 and
+                other modifiers won't be returned.
+            glowed: If True polygon modifiers will be set to glow 0 0 1 1 1 0 and
+                other modifiers won't be returned.
+        """
+        if blacked or glowed:
+            for name in self._modifier_names:
+                material = BlackMaterial(name) if blacked else WhiteGlow(name)
+                yield material.to_rad_string()
+        else:
+            for record in self.modifiers:
+                yield record.to_rad_string()
+
+    def iter_geometries(self, flipped=False, modifier_name=None):
+        """A generator of geometries as Radiance strings.
+
+        Args:
+            flipped: Flip the polygons by reversing the order of the vertices.
+                Non-polygon geometries won't be flipped.
+            modifier_name: An optional modifier name to replace the modifier names.
+        """
+        vertices = self._vertices
+        offsets = self._offsets
+        modifier_names = self._modifier_names
+        for count, (name, mi) in enumerate(zip(self._names, self._modifier_indexes)):
+            st, end = 3 * offsets[count], 3 * offsets[count + 1]
+            if flipped:
+                values = [str(v) for p in xrange(end - 3, st - 3, -3)
+                          for v in vertices[p:p + 3]]
+            else:
+                values = map(str, vertices[st:end])
+            yield '%s polygon %s\n0\n0\n%d %s' % (
+                modifier_name or modifier_names[mi], name, end - st, ' '.join(values))
+
+        for record in self.others:
+            if modifier_name:
+                record = record._replace(modifier=modifier_name)
+            yield record.to_rad_string()
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __len__(self):
+        return len(self._names)
+
+    def __repr__(self):
+        return 'RadGeometry::#{} polygons::#{} modifiers::#{} other geometries'.format(
+            len(self._names), len(self.modifiers), len(self.others))
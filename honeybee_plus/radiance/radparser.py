@@ -1,8 +1,186 @@
-"""A collection of auxiliary funtions for working with radiance files and objects."""
-import re
+"""A collection of auxiliary funtions for working with radiance files and objects.
+
+Radiance objects are parsed with a streaming tokenizer. Each object is returned as a
+Record with modifier, type, name and string, integer and real arguments:
+
+    modifier type name
+    n S1 S2 ... Sn
+    n I1 I2 ... In
+    n R1 R2 ... Rn
+
+Arguments are kept as strings to keep the original values untouched. Files are read
+in blocks and only the words for one block are kept in memory which means a large file
+is never loaded into memory at once. An object can be written in as many lines as
+needed. Lines that start with # (comments) or ! (commands) are skipped. A word that
+starts with # and the rest of its line is also considered a comment.
+
+Usage:
+    with open('c:/ladybug/context.rad') as inf:
+        for record in iter_records(inf):
+            print(record.type, record.name)
+"""
+from collections import namedtuple
 import os
 
 
+class Record(namedtuple('Record', 'modifier type name string_args int_args real_args')):
+    """A parsed Radiance object.
+
+    Attributes:
+        modifier: Modifier name.
+        type: Radiance type (e.g. plastic, polygon).
+        name: Object name.
+        string_args: A list of string arguments.
+        int_args: A list of integer arguments as strings.
+        real_args: A list of real arguments as strings.
+    """
+
+    __slots__ = ()
+
+    def to_rad_string(self):
+        """Return the object as a single-line Radiance string."""
+        return ' '.join(
+            [self.modifier, self.type, self.name, str(len(self.string_args))] +
+            self.string_args + [str(len(self.int_args))] + self.int_args +
+            [str(len(self.real_args))] + self.real_args)
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.to_rad_string()
+
+
+def iter_records(lines, batch_size=65536):
+    """Parse Radiance objects from an iterable of strings.
+
+    Args:
+        lines: An iterable of strings with complete lines (e.g. an open file, a list
+            of lines or blocks of a file). Strings are consumed one at a time.
+        batch_size: Number of words to collect before parsing the objects. Only the
+            words for one batch are kept in memory (default: 65536).
+
+    Returns:
+        A generator of Records.
+    """
+    words = []
+    for block in lines:
+        if '#' in block or '!' in block:
+            for line in block.splitlines():
+                line = line.lstrip()
+                if not line or line[0] in ('#', '!'):
+                    # empty line, comment or command
+                    continue
+                if '#' in line:
+                    line = _strip_comment(line)
+                words.extend(line.split())
+        else:
+            words.extend(block.split())
+        if len(words) >= batch_size:
+            for record in _parse_words(words):
+                yield record
+
+    for record in _parse_words(words):
+        yield record
+
+    if words:
+        raise ValueError(
+            'Failed to parse {}: Unexpected end of input.'.format(' '.join(words[:3])))
+
+
+def _strip_comment(line):
+    """Remove a comment from the end of a line.
+
+    A comment starts with a word that starts with #.
+    """
+    i = line.find('#')
+    while i != -1:
+        if line[i - 1].isspace():
+            return line[:i]
+        i = line.find('#', i + 1)
+    return line
+
+
+def _count(words, i, p):
+    """Get the number of arguments at index i for the object that starts at p."""
+    try:
+        count = int(words[i])
+    except ValueError:
+        raise ValueError(
+            'Failed to parse {}: "{}" is not a valid number of arguments.'.format(
+                ' '.join(words[p:p + 3]), words[i]))
+    if count < 0:
+        raise ValueError(
+            'Failed to parse {}: Number of arguments cannot be negative.'.format(
+                ' '.join(words[p:p + 3])))
+    return count
+
+
+def _parse_words(words):
+    """Parse complete objects from a list of words.
+
+    The words for the parsed objects will be removed from the list and the words for
+    the last object will be kept if the object is not complete.
+    """
+    n = len(words)
+    p = 0
+    while p + 3 < n:
+        q = p + 4 + _count(words, p + 3, p)
+        if q >= n:
+            break
+        r = q + 1 + _count(words, q, p)
+        if r >= n:
+            break
+        e = r + 1 + _count(words, r, p)
+        if e > n:
+            break
+        yield Record(words[p], words[p + 1], words[p + 2], words[p + 4:q],
+                     words[q + 1:r], words[r + 1:e])
+        p = e
+    del words[:p]
+
+
+def iter_records_from_file(file_path, block_size=1048576):
+    """Parse Radiance objects from a file one object at a time.
+
+    Args:
+        file_path: Path to Radiance file
+        block_size: Size of each block of the file in bytes. Each block is extended to
+            the end of its last line (default: 1048576).
+
+    Returns:
+        A generator of Records.
+    """
+    assert os.path.isfile(file_path), "Can't find %s." % file_path
+
+    with open(file_path, "r") as rad_file:
+        for record in iter_records(_read_blocks(rad_file, block_size)):
+            yield record
+
+
+def _read_blocks(rad_file, block_size):
+    """Read a file in blocks of complete lines."""
+    while True:
+        block = rad_file.read(block_size)
+        if not block:
+            break
+        yield block + rad_file.readline()
+
+
+def referenced_files(file_path):
+    """Get the files which are referenced by instance and mesh objects in a file.
+
+    Paths are returned as they are written in the file. Radiance resolves relative
+    paths from the folder that the command is executed from.
+
+    Args:
+        file_path: Path to Radiance file
+
+    Returns:
+        A list of file paths.
+    """
+    return [record.string_args[0] for record in iter_records_from_file(file_path)
+            if record.type in ('instance', 'mesh') and record.string_args]
+
+
 # support comments [#] and commands [!]
 def parse_from_string(full_string):
     """
@@ -14,18 +192,8 @@ def parse_from_string(full_string):
     Returns:
         A list of strings. Each string represents a different Radiance Object
     """
-    raw_rad_objects = re.findall(
-        r'^\s*([^0-9].*(\s*[\d.-]+.*)*)',
-        full_string,
-        re.MULTILINE)
-
-    rad_objects = (' '.join(radiance_object[0].split())
-                   for radiance_object in raw_rad_objects)
-
-    filtered_objects = tuple(rad_object for rad_object in rad_objects
-                             if rad_object and rad_object[0] not in ['#', '!'])
-
-    return filtered_objects
+    return tuple(record.to_rad_string()
+                 for record in iter_records((full_string,)))
 
 
 def parse_from_file(file_path):
@@ -41,7 +209,5 @@ def parse_from_file(file_path):
     Usage:
         get_radiance_objects_from_file("C:/ladybug/21MAR900/imageBasedSimulation/21MAR900.rad")
     """
-    assert os.path.isfile(file_path), "Can't find %s." % file_path
-
-    with open(file_path, "r") as rad_file:
-        return parse_from_string(rad_file.read())
+    return tuple(record.to_rad_string()
+                 for record in iter_records_from_file(file_path))
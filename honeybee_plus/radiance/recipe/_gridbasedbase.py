@@ -9,8 +9,7 @@ from ..analysisgrid import AnalysisGrid
 from ...futil import write_to_file
 from ...utilcol import random_name
 from ._recipebase import AnalysisRecipe
-
-from ladybug.legend import LegendParameters
+from .recipepackage import write_recipe_package, read_recipe_package
 
 import os
 
@@ -95,6 +94,7 @@ class GenericGridBased(AnalysisRecipe):
     @property
     def legend_parameters(self):
         """Legend parameters for grid based analysis."""
+        from ladybug.legend import LegendParameters
         return LegendParameters(0, 3000)
 
     @staticmethod
@@ -153,6 +153,34 @@ class GenericGridBased(AnalysisRecipe):
                 for ag in self.analysis_grids
             )
 
+    @classmethod
+    def from_package(cls, file_path, lazy=False):
+        """Load the recipe from a binary recipe package.
+
+        Args:
+            file_path: Full path to the package.
+            lazy: Set to True to only create the analysis points when they are
+                needed (default: False).
+        """
+        recipe = read_recipe_package(file_path, lazy)
+        assert isinstance(recipe, cls), \
+            '{} includes a {} not a {}.'.format(
+                file_path, recipe.__class__.__name__, cls.__name__)
+        return recipe
+
+    def to_package(self, file_path):
+        """Write the recipe to a binary recipe package.
+
+        The package is a compact alternative to to_json for large models.
+
+        Args:
+            file_path: Full path to the package.
+
+        Returns:
+            Path to the package.
+        """
+        return write_recipe_package(self, file_path)
+
     @abstractmethod
     def results(self):
         """Return results for this analysis."""
@@ -1,6 +1,8 @@
 """Base class for RADIANCE Analysis Recipes."""
 from ...futil import preparedir, get_radiance_path_lines
 from .recipeutil import input_srfs_to_rad_files
+from .checkpoint import CheckpointManifest
+from .runreport import profile_command_file
 
 import os
 import subprocess
@@ -10,12 +12,16 @@ class AnalysisRecipe(object):
     """Analysis Recipe Base class.
 
     Attributes:
-        hb_objects: An optional list of Honeybee surfaces or zones (Default: None).
+        hb_objects: An optional list of Honeybee surfaces, zones or RadGeometry
+            objects (Default: None).
         sub_folder: Sub-folder for this analysis recipe. (e.g. "gridbased")
+        opaque_as_mesh: Set to True to write opaque surfaces as Radiance meshes. obj2mesh
+            commands are added to the commands of the recipe (Default: False).
     """
 
     def __init__(self, hb_objects=None, sub_folder=None, scene=None):
         """Create Analysis recipe."""
+        self._opaque_as_mesh = False
         self.hb_objects = hb_objects
         """An optional list of Honeybee surfaces or zones. (Default: None)"""
 
@@ -29,6 +35,7 @@ class AnalysisRecipe(object):
         self._radiance_materials = ()
         self._commands = []
         self._result_files = []
+        self._run_report = None
         self._isCalculated = False
         self.isChanged = True
 
@@ -54,6 +61,11 @@ class AnalysisRecipe(object):
         """Get list of result files for this recipe."""
         return self._result_files
 
+    @property
+    def run_report(self):
+        """RunReport for the last run with profile or resume set to True."""
+        return self._run_report
+
     @property
     def commands(self):
         """List of recipe commands."""
@@ -75,7 +87,9 @@ class AnalysisRecipe(object):
             self._hbObjs = []
             try:
                 for obj in hb_objects:
-                    if hasattr(obj, 'isHBZone'):
+                    if hasattr(obj, 'isRadGeometry'):
+                        self._hbObjs.append(obj)
+                    elif hasattr(obj, 'isHBZone'):
                         self._hbObjs.extend(obj.surfaces)
                         for srf in obj.surfaces:
                             self._hbObjs.extend(srf.children_surfaces)
@@ -92,6 +106,21 @@ class AnalysisRecipe(object):
                 )
 
         self._opaque, self._glazing, self._wgs = input_srfs_to_rad_files(self._hbObjs)
+        self._opaque.as_mesh = self._opaque_as_mesh
+
+    @property
+    def opaque_as_mesh(self):
+        """Write triangles and quads of opaque surfaces as Radiance meshes.
+
+        Opaque surfaces with the same material are compiled to a mesh using obj2mesh
+        which makes oconv faster and the octree smaller for large context models.
+        """
+        return self._opaque_as_mesh
+
+    @opaque_as_mesh.setter
+    def opaque_as_mesh(self, value):
+        self._opaque_as_mesh = bool(value)
+        self._opaque.as_mesh = self._opaque_as_mesh
 
     @property
     def opaque_surfaces(self):
@@ -222,11 +251,41 @@ class AnalysisRecipe(object):
         return _basePath
 
     # TODO: Write a runmanager class to handle runs
-    def run(self, command_file, debug=False, env=None):
-        """Run the analysis."""
+    def run(self, command_file, debug=False, env=None, profile=False, resume=False,
+            executor=None):
+        """Run the analysis.
+
+        Args:
+            command_file: Path to command file.
+            debug: Set to True to pause the command file at the end.
+            env: Optional environment variables for the run.
+            profile: Set to True to execute the commands one by one and collect wall
+                time, CPU time, peak memory and bytes read and written for each step.
+                The results will be available from run_report (Default: False).
+            resume: Set to True to keep a checkpoint for each step of the command file
+                in a manifest next to the command file and skip the steps which are
+                already done with unchanged input and output files (Default: False).
+            executor: An optional executor with a run_command_file method to execute
+                the commands (e.g. honeybee_plus.server.workqueue.Coordinator to run
+                the independent steps on several workers).
+        """
         assert os.path.isfile(command_file), \
             ValueError('Failed to find command file: {}'.format(command_file))
 
+        if executor is not None:
+            success = executor.run_command_file(command_file)
+            self._isCalculated = True
+            return success
+
+        if profile or resume:
+            manifest = CheckpointManifest.from_command_file(command_file) \
+                if resume else None
+            self._run_report = profile_command_file(command_file, env, manifest)
+            if profile:
+                print(self._run_report.summary())
+            self._isCalculated = True
+            return self._run_report.succeeded
+
         if debug:
             with open(command_file, "a") as bf:
                 bf.write("\npause\n")
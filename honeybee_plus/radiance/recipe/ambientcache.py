@@ -0,0 +1,87 @@
+"""Shared ambient cache for point-in-time recipes.
+
+rtrace and rpict can save the indirect irradiance values to an ambient file (-af) and
+reuse them in the next runs. The values are only valid for the same scene, sky and
+ambient parameters. Ambient files are named by a hash of the content of the scene
+files, the sky and the ambient parameters and are kept under the project folder
+(target_folder/project_name/ambient) so they are not removed when a recipe is written
+again and can be shared between recipes.
+
+Several rtrace or rpict processes can use the same ambient file at the same time.
+Radiance locks the file while new values are added to it.
+"""
+from copy import deepcopy
+import hashlib
+import os
+
+# parameters which change the ambient values. Radiance writes the same list to the
+# header of the ambient file.
+AMBIENT_PARAMETERS = ('ambient_bounces', 'ambient_divisions', 'ambient_supersamples',
+                      'ambient_resolution', 'ambient_accuracy', 'ambient_value',
+                      'ambient_weight', 'limit_reflections', 'limit_weight',
+                      'photon_map')
+
+
+def ambient_parameters_string(radiance_parameters):
+    """Get the parameters which change the ambient values as a string."""
+    values = (getattr(radiance_parameters, name, None) for name in AMBIENT_PARAMETERS)
+    return ' '.join(v.to_rad_string() for v in values
+                    if v is not None and v.to_rad_string())
+
+
+def scene_cache_key(scene_files, sky, *values):
+    """Create a hash for scene files, sky and an optional list of values.
+
+    Args:
+        scene_files: A list of Radiance files for the scene. The content of the files
+            will be used for the hash. Files which are not created yet (e.g. sky files
+            that will be generated by the commands) are added by their path.
+        sky: A honeybee sky.
+        values: Optional strings which should also change the hash.
+    """
+    key = hashlib.sha1()
+    for f in scene_files:
+        if not os.path.isfile(f):
+            key.update(os.path.basename(f).encode('utf-8'))
+            continue
+        with open(f, 'rb') as inf:
+            for chunk in iter(lambda: inf.read(1024 * 1024), b''):
+                key.update(chunk)
+    key.update(sky.to_rad_string().encode('utf-8'))
+    for value in values:
+        key.update(str(value).encode('utf-8'))
+    return key.hexdigest()[:16]
+
+
+def ambient_cache_key(scene_files, sky, radiance_parameters):
+    """Create a hash for scene, sky and ambient parameters.
+
+    Args:
+        scene_files: A list of Radiance files for the scene.
+        sky: A honeybee sky.
+        radiance_parameters: Radiance parameters for rtrace or rpict.
+    """
+    return scene_cache_key(scene_files, sky,
+                           ambient_parameters_string(radiance_parameters))
+
+
+def ambient_cache_file(project_folder, scene_files, sky, radiance_parameters):
+    """Get the path to the ambient file for a recipe.
+
+    The ambient folder will be created next to the recipe folder under the project.
+
+    Returns:
+        Path to the ambient file relative to project_folder.
+    """
+    folder = os.path.join(os.path.dirname(os.path.normpath(project_folder)), 'ambient')
+    if not os.path.isdir(folder):
+        os.makedirs(folder)
+    key = ambient_cache_key(scene_files, sky, radiance_parameters)
+    return os.path.relpath(os.path.join(folder, key + '.amb'), project_folder)
+
+
+def with_ambient_file(radiance_parameters, ambient_file):
+    """Return a copy of Radiance parameters with ambient file set to ambient_file."""
+    rad_parameters = deepcopy(radiance_parameters)
+    rad_parameters.ambient_file = ambient_file
+    return rad_parameters
@@ -0,0 +1,118 @@
+"""Step-level checkpoints for resuming recipe runs.
+
+A checkpoint manifest keeps a record for each successful step of a command file. The
+record includes a hash of the command and the size and modification time of the files
+that the step has read and written. When the recipe is executed again, the steps
+with an unchanged command, unchanged inputs and unchanged outputs are skipped. If a
+step is executed again its outputs will change and the steps after that which use
+those files will also be executed.
+
+Usage:
+    command_file = recipe.write('c:/ladybug', 'room')
+    recipe.run(command_file, resume=True)
+    # the run stopped in the middle. only the remaining steps will be executed.
+    recipe.run(command_file, resume=True)
+"""
+import hashlib
+import json
+import os
+
+VERSION = 1
+
+
+class CheckpointManifest(object):
+    """Checkpoints for the steps of a command file.
+
+    Attributes:
+        file_path: Path to the manifest JSON file. The manifest will be loaded if the
+            file already exists.
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self._steps = {}
+        if os.path.isfile(file_path):
+            try:
+                with open(file_path) as inf:
+                    data = json.load(inf)
+            except ValueError:
+                # the manifest is damaged. run all the steps again.
+                print('Failed to load checkpoints from {}.'.format(file_path))
+            else:
+                if data.get('version') == VERSION:
+                    self._steps = data['steps']
+
+    @classmethod
+    def from_command_file(cls, command_file):
+        """Create the manifest for a command file (e.g. commands.checkpoints.json)."""
+        return cls(os.path.splitext(command_file)[0] + '.checkpoints.json')
+
+    @staticmethod
+    def key(command, cwd):
+        """Hash for a command which is executed from the cwd folder."""
+        return hashlib.md5(
+            '{}\n{}'.format(os.path.normpath(cwd), command).encode('utf-8')
+        ).hexdigest()
+
+    @staticmethod
+    def fingerprint(files):
+        """Get current size and modification time for a list of files.
+
+        Missing files will be None.
+        """
+        fingerprints = {}
+        for f in files:
+            try:
+                st = os.stat(f)
+            except OSError:
+                fingerprints[f] = None
+            else:
+                fingerprints[f] = [st.st_size, st.st_mtime]
+        return fingerprints
+
+    def is_done(self, command, cwd):
+        """Check if a step has been executed and none of its files has changed."""
+        step = self._steps.get(self.key(command, cwd))
+        if not step:
+            return False
+        for files in (step['inputs'], step['outputs']):
+            if self.fingerprint(files) != files:
+                return False
+        return True
+
+    def record(self, command, cwd, inputs, outputs):
+        """Record a successful step and save the manifest.
+
+        Args:
+            command: Command line.
+            cwd: Working directory for the command.
+            inputs: A list of files which are read by the command.
+            outputs: A list of files which are written by the command.
+        """
+        self._steps[self.key(command, cwd)] = {
+            'command': command,
+            'inputs': self.fingerprint(inputs),
+            'outputs': self.fingerprint(outputs)
+        }
+        self.write()
+
+    def remove(self, command, cwd):
+        """Remove the checkpoint for a step and save the manifest."""
+        if self._steps.pop(self.key(command, cwd), None):
+            self.write()
+
+    def write(self):
+        """Write the manifest to file_path."""
+        with open(self.file_path, 'w') as outf:
+            json.dump({'version': VERSION, 'steps': self._steps}, outf)
+        return self.file_path
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __len__(self):
+        return len(self._steps)
+
+    def __repr__(self):
+        return 'CheckpointManifest::{}::#{}'.format(self.file_path, len(self._steps))
@@ -3,6 +3,7 @@ from ..recipeutil import write_extra_files
 from ..recipedcutil import write_rad_files_daylight_coeff, get_commands_sky
 from ..recipedcutil import get_commands_scene_daylight_coeff
 from ..recipedcutil import get_commands_w_groups_daylight_coeff
+from ..recipedcutil import write_context_instance_daylight_coeff
 from .._gridbasedbase import GenericGridBased
 from ..parameters import get_radiance_parameters_grid_based
 from ...sky.skymatrix import SkyMatrix
@@ -28,7 +29,12 @@ class DaylightCoeffGridBased(GenericGridBased):
             should be an instance of RfluxmtxParameters.
         hb_objects: An optional list of Honeybee surfaces or zones (Default: None).
         sub_folder: Analysis subfolder for this recipe. (Default: "daylightcoeff").
-
+        context_as_instance: Set to True to freeze opaque surfaces and additional
+            Radiance files once into an octree and reference it as an instance in
+            all the daylight matrix calculations (Default: False). The commands for
+            window groups and their states only read the instance and do not depend
+            on each other. The batch file runs them one by one; use a work queue
+            Coordinator (honeybee_plus.server.workqueue) to run them concurrently.
 
     Usage:
 
@@ -52,7 +58,7 @@ class DaylightCoeffGridBased(GenericGridBased):
 
     def __init__(self, sky_mtx, analysis_grids, simulation_type=0,
                  radiance_parameters=None, reuse_daylight_mtx=True, hb_objects=None,
-                 sub_folder="gridbased_daylightcoeff"):
+                 sub_folder="gridbased_daylightcoeff", context_as_instance=False):
         """Create an annual recipe."""
         GenericGridBased.__init__(
             self, analysis_grids, hb_objects, sub_folder
@@ -69,6 +75,9 @@ class DaylightCoeffGridBased(GenericGridBased):
 
         self.reuse_daylight_mtx = reuse_daylight_mtx
 
+        self.context_as_instance = context_as_instance
+        """Freeze static context into an octree and use it as an instance."""
+
     @classmethod
     def from_json(cls, rec_json):
         """Create daylight coefficient recipe from JSON file
@@ -79,7 +88,8 @@ class DaylightCoeffGridBased(GenericGridBased):
             "analysis_grids": [], // list of analysis grids
             "surfaces": [], // list of honeybee surfaces
             "simulation_type": int // value between 0-2
-            "rad_parameters": {} // radiance gridbased parameters json file
+            "rad_parameters": {}, // radiance gridbased parameters json file
+            "context_as_instance": bool // optional (Default: false)
             }
         """
         sky_mtx = SkyMatrix.from_json(rec_json["sky_mtx"])
@@ -88,10 +98,12 @@ class DaylightCoeffGridBased(GenericGridBased):
         hb_objects = tuple(HBSurface.from_json(srf) for srf in rec_json["surfaces"])
         rad_parameters = RfluxmtxParameters.from_json(rec_json["rad_parameters"])
         simulation_type = rec_json["simulation_type"]
+        context_as_instance = rec_json.get("context_as_instance", False)
 
         return cls(sky_mtx=sky_mtx, analysis_grids=analysis_grids,
                    radiance_parameters=rad_parameters, hb_objects=hb_objects,
-                   simulation_type=simulation_type)
+                   simulation_type=simulation_type,
+                   context_as_instance=context_as_instance)
 
     @classmethod
     def from_weather_file_points_and_vectors(
@@ -255,7 +267,8 @@ class DaylightCoeffGridBased(GenericGridBased):
             "analysis_grids": [], // list of analysis grids
             "surfaces": [], // list of honeybee surfaces
             "simulation_type": int // value between 0-2
-            "rad_parameters": {} // radiance gridbased parameters json file
+            "rad_parameters": {}, // radiance gridbased parameters json file
+            "context_as_instance": bool
             }
         """
         return {
@@ -265,7 +278,8 @@ class DaylightCoeffGridBased(GenericGridBased):
             "analysis_grids": [ag.to_json() for ag in self.analysis_grids],
             "surfaces": [srf.to_json() for srf in self.hb_objects],
             "simulation_type": self.simulation_type,
-            "rad_parameters": self.radiance_parameters.to_json()
+            "rad_parameters": self.radiance_parameters.to_json(),
+            "context_as_instance": self.context_as_instance
         }
 
     def write(self, target_folder, project_name='untitled', header=True,
@@ -299,6 +313,13 @@ class DaylightCoeffGridBased(GenericGridBased):
         # additional radiance files added to the recipe as scene
         extrafiles = write_extra_files(self.scene, project_folder + '/scene', True)
 
+        # freeze static context into an octree for the normal and the blacked scene
+        context_commands = []
+        if self.context_as_instance:
+            opqfiles, extrafiles, context_commands = \
+                write_context_instance_daylight_coeff(
+                    project_folder, project_name, opqfiles, extrafiles)
+
         # 0.write points
         points_file = self.write_analysis_grids(project_folder, project_name)
 
@@ -306,12 +327,17 @@ class DaylightCoeffGridBased(GenericGridBased):
         if header:
             self._commands.append(self.header(project_folder))
 
+        # compile opaque meshes before they are used in the scene
+        self._commands.extend(self.opaque_rad_file.mesh_commands)
+
         # # 2.1.Create sky matrix.
         # # 2.2. Create sun matrix
         skycommands, skyfiles = get_commands_sky(project_folder, self.sky_matrix,
                                                  reuse=True)
 
         self._commands.extend(skycommands)
+        # context octrees are added before the scene commands if any of them is added
+        context_index = len(self._commands)
 
         # for each window group - calculate total, direct and direct-analemma results
         # calculate the contribution of glazing if any with all window groups blacked
@@ -340,6 +366,9 @@ class DaylightCoeffGridBased(GenericGridBased):
                 os.path.join(project_folder, str(result)) for result in results
             )
 
+        if len(self._commands) > context_index:
+            self._commands[context_index:context_index] = context_commands
+
         # # 2.5 write batch file
         batch_file = os.path.join(project_folder, 'commands.bat')
 
@@ -348,8 +377,15 @@ class DaylightCoeffGridBased(GenericGridBased):
 
         return batch_file
 
-    def results(self):
-        """Return results for this analysis."""
+    def results(self, lazy=False):
+        """Return results for this analysis.
+
+        Args:
+            lazy: Set to True to only add the result files to analysis grids without
+                loading the values. Values for selected sensors and hours can be read
+                using AnalysisGrid.values_from_files and all the values will be loaded
+                on the first call to methods which need them (default: False).
+        """
         assert self._isCalculated, \
             "You haven't run the Recipe yet. Use self.run " + \
             "to run the analysis before loading the results."
@@ -385,7 +421,7 @@ class DaylightCoeffGridBased(GenericGridBased):
                     # total value only
                     analysisGrid.set_values_from_file(
                         rf, self.sky_matrix.hoys, source, state, start_line=start_line,
-                        header=True, check_point_count=False, mode=mode
+                        header=True, check_point_count=False, mode=mode, lazy=lazy
                     )
                 else:
                     # total and direct values
@@ -397,7 +433,7 @@ class DaylightCoeffGridBased(GenericGridBased):
                     analysisGrid.set_coupled_values_from_file(
                         rf, df, self.sky_matrix.hoys, source, state,
                         start_line=start_line, header=True, check_point_count=False,
-                        mode=mode
+                        mode=mode, lazy=lazy
                     )
 
         return self.analysis_grids
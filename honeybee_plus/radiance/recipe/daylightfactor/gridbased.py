@@ -4,7 +4,6 @@ from ...sky.certainIlluminance import CertainIlluminanceLevel
 from ...parameters.rtrace import RtraceParameters
 from ...analysisgrid import AnalysisGrid
 from ladybug.dt import DateTime
-from ladybug.legend import LegendParameters
 from ....hbsurface import HBSurface
 
 
@@ -104,6 +103,7 @@ class GridBased(PITGridBased):
     @property
     def legend_parameters(self):
         """Legend parameters for daylight factor analysis."""
+        from ladybug.legend import LegendParameters
         return LegendParameters(0, 100)
 
     def results(self):
@@ -10,7 +10,6 @@ from ...sky.analemma import Analemma
 from ....futil import write_to_file
 from ....hbsurface import HBSurface
 
-from ladybug.sunpath import Sunpath
 from ladybug.location import Location
 
 import os
@@ -67,6 +66,7 @@ class DirectReflectionGridBased(SolarAccessGridBased):
               "sun_vectors": [] // list of sun vectors if location is not provided
             }
         """
+        from ladybug.sunpath import Sunpath
         raise NotImplementedError()
         hoys = rec_json["hoys"]
         if 'sun_vectors' not in rec_json or not rec_json['sun_vectors']:
@@ -223,6 +223,9 @@ class DirectReflectionGridBased(SolarAccessGridBased):
         if header:
             self._commands.append(self.header(project_folder))
 
+        # compile opaque meshes before they are used in the scene
+        self._commands.extend(self.opaque_rad_file.mesh_commands)
+
         # TODO(Mostapha): add window_groups here if any!
         # # 4.1.prepare oconv
         oct_scene_files = opqfiles + glzfiles + wgsfiles + [suns_geo] + \
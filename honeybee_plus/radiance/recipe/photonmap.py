@@ -0,0 +1,173 @@
+"""Photon maps for point-in-time recipes.
+
+Light shelves, mirrors and prismatic materials redirect daylight in directions that
+the ambient calculation only finds with a high number of ambient bounces. mkpmap
+traces photons from the sky through the scene once and rtrace or rpict look up the
+indirect light in the photon maps. With a global and a caustic photon map one ambient
+bounce is enough for the final gathering.
+
+Photon maps are named by a hash of the content of the scene files, the sky and the
+photon map settings and are kept under the project folder
+(target_folder/project_name/photonmap). mkpmap only runs if the maps for the same
+scene and sky are not created yet.
+
+Usage:
+    recipe = GridBased(sky, analysis_grids, hb_objects=hb_objects)
+    recipe.photon_map = PhotonMap(global_photons=200000, caustic_photons=20000)
+    recipe.write('c:/ladybug', 'light_shelf')
+"""
+from .ambientcache import scene_cache_key
+from ..command.mkpmap import Mkpmap
+from ..parameters.mkpmap import MkpmapParameters
+from ...futil import write_to_file
+
+from copy import deepcopy
+import os
+
+
+class PhotonMap(object):
+    """Global and caustic photon maps for a scene and a sky.
+
+    Attributes:
+        global_photons: Number of photons in the global photon map. Set to 0 to
+            not create a global photon map (Default: 100000).
+        caustic_photons: Number of photons in the caustic photon map for light
+            which is redirected by specular materials. Set to 0 to not create a
+            caustic photon map (Default: 10000).
+        bandwidth: Number of photons for each density estimate in rtrace and rpict
+            (Default: 50).
+        ports: A list of modifier names for photon ports. Photons from the sky are
+            emitted from the surfaces with these modifiers. If None, the materials
+            of the glazing surfaces in the recipe will be used (Default: None).
+        mkpmap_parameters: Optional MkpmapParameters for the other mkpmap settings
+            (e.g. max_bounce or number_processers). Output files and photon ports
+            will be set by the recipe.
+    """
+
+    __slots__ = ('global_photons', 'caustic_photons', 'bandwidth', 'ports',
+                 'mkpmap_parameters')
+
+    def __init__(self, global_photons=100000, caustic_photons=10000, bandwidth=50,
+                 ports=None, mkpmap_parameters=None):
+        assert global_photons or caustic_photons, \
+            'Number of global or caustic photons should be larger than 0.'
+        self.global_photons = int(global_photons)
+        self.caustic_photons = int(caustic_photons)
+        self.bandwidth = int(bandwidth)
+        self.ports = ports
+        self.mkpmap_parameters = mkpmap_parameters or MkpmapParameters()
+
+    @classmethod
+    def from_json(cls, rec_json):
+        """Create photon map settings from json.
+            {
+            "global_photons": int,
+            "caustic_photons": int,
+            "bandwidth": int,
+            "ports": [], // list of modifier names or null
+            "mkpmap_parameters": string // mkpmap parameters (e.g. -apm 5 -n 4)
+            }
+        """
+        mkpmap_parameters = MkpmapParameters()
+        if rec_json.get('mkpmap_parameters'):
+            mkpmap_parameters.import_parameter_values_from_string(
+                rec_json['mkpmap_parameters'])
+        return cls(rec_json['global_photons'], rec_json['caustic_photons'],
+                   rec_json['bandwidth'], rec_json.get('ports'), mkpmap_parameters)
+
+    def _settings_string(self):
+        """Settings which change the photon maps as a string."""
+        return '{} {} {}'.format(self.global_photons, self.caustic_photons,
+                                 self.mkpmap_parameters.to_rad_string())
+
+    def photon_files(self, project_folder, scene_files, sky):
+        """Get the path to global and caustic photon map files.
+
+        The photonmap folder will be created next to the recipe folder under the
+        project.
+
+        Returns:
+            A tuple of (global, caustic) paths relative to project_folder. The path
+            is None if the map is not created.
+        """
+        folder = os.path.join(os.path.dirname(os.path.normpath(project_folder)),
+                              'photonmap')
+        if not os.path.isdir(folder):
+            os.makedirs(folder)
+        key = scene_cache_key(scene_files, sky, self._settings_string())
+        base = os.path.relpath(os.path.join(folder, key), project_folder)
+        return (base + '.gpm' if self.global_photons else None,
+                base + '.cpm' if self.caustic_photons else None)
+
+    def commands(self, project_folder, octree_file, scene_files, sky, ports=()):
+        """Get the commands to create the photon maps.
+
+        The commands are empty if the photon maps are already created.
+
+        Args:
+            project_folder: Recipe folder.
+            octree_file: Path to octree file relative to project_folder.
+            scene_files: A list of Radiance files for the scene. Used to name the
+                photon map files.
+            sky: A honeybee sky.
+            ports: Modifier names for photon ports if self.ports is None.
+
+        Returns:
+            A tuple of (commands, radiance_value). radiance_value is the value for
+            -ap in rtrace and rpict parameters.
+        """
+        photon_files = self.photon_files(project_folder, scene_files, sky)
+        value = ' -ap '.join('{} {}'.format(f, self.bandwidth)
+                             for f in photon_files if f)
+
+        if all(os.path.isfile(os.path.join(project_folder, f))
+               for f in photon_files if f):
+            return [], value
+
+        mkpmap_parameters = deepcopy(self.mkpmap_parameters)
+        gpm, cpm = photon_files
+        if gpm:
+            mkpmap_parameters.global_photon_file = \
+                '{} {}'.format(gpm, self.global_photons)
+        if cpm:
+            mkpmap_parameters.caustic_photon_file = \
+                '{} {}'.format(cpm, self.caustic_photons)
+
+        ports = ports if self.ports is None else self.ports
+        if ports:
+            ports_file = os.path.splitext(gpm or cpm)[0] + '.ports'
+            write_to_file(os.path.join(project_folder, ports_file),
+                          '\n'.join(ports) + '\n', True)
+            mkpmap_parameters.photon_port_modifierfile = ports_file
+
+        mk = Mkpmap(octree_file, mkpmap_parameters)
+        return [mk.to_rad_string()], value
+
+    def with_photon_map(self, radiance_parameters, value):
+        """Return a copy of Radiance parameters which uses the photon maps.
+
+        Ambient bounces are reduced to 1 for the final gathering.
+        """
+        rad_parameters = deepcopy(radiance_parameters)
+        rad_parameters.photon_map = value
+        ab = rad_parameters.ambient_bounces
+        if getattr(ab, '_value', ab) is None or ab > 1:
+            rad_parameters.ambient_bounces = 1
+        return rad_parameters
+
+    def to_json(self):
+        """Convert photon map settings to a dictionary."""
+        return {
+            'global_photons': self.global_photons,
+            'caustic_photons': self.caustic_photons,
+            'bandwidth': self.bandwidth,
+            'ports': list(self.ports) if self.ports is not None else None,
+            'mkpmap_parameters': self.mkpmap_parameters.to_rad_string()
+        }
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        return 'PhotonMap::{}::{}'.format(self.global_photons, self.caustic_photons)
@@ -1,6 +1,8 @@
 """Radiance Grid-based Analysis Recipe."""
 from .._gridbasedbase import GenericGridBased
 from ..recipeutil import write_rad_files, write_extra_files
+from ..ambientcache import ambient_cache_file, with_ambient_file
+from ..photonmap import PhotonMap
 from ...parameters.rtrace import LowQuality
 from ...command.oconv import Oconv
 from ...command.rtrace import Rtrace
@@ -28,6 +30,12 @@ class GridBased(GenericGridBased):
             (Default: gridbased.LowQuality)
         hb_objects: An optional list of Honeybee surfaces or zones (Default: None).
         sub_folder: Analysis subfolder for this recipe. (Default: "gridbased")
+        ambient_cache: Set to True to save the ambient values to an ambient file
+            which is shared by all the runs with the same scene, sky and ambient
+            parameters (Default: False).
+        photon_map: An optional PhotonMap to create global and caustic photon maps
+            for the scene and the sky. Use photon maps for scenes with light
+            shelves, mirrors or prismatic materials (Default: None).
 
     Usage:
         # create the sky
@@ -54,7 +62,8 @@ class GridBased(GenericGridBased):
     # TODO: implemnt isChanged at AnalysisRecipe level to reload the results
     # if there has been no changes in inputs.
     def __init__(self, sky, analysis_grids, simulation_type=0, rad_parameters=None,
-                 hb_objects=None, sub_folder="gridbased"):
+                 hb_objects=None, sub_folder="gridbased", ambient_cache=False,
+                 photon_map=None):
         """Create grid-based recipe."""
         GenericGridBased.__init__(
             self, analysis_grids, hb_objects, sub_folder)
@@ -71,6 +80,12 @@ class GridBased(GenericGridBased):
            2: Luminance (Candela) (Default: 0)
         """
 
+        self.ambient_cache = ambient_cache
+        """Reuse ambient values from previous runs with the same scene and sky."""
+
+        self.photon_map = photon_map
+        """An optional PhotonMap for light which is redirected by specular surfaces."""
+
     @classmethod
     def from_json(cls, rec_json):
         """Create the solar access recipe from json.
@@ -81,7 +96,9 @@ class GridBased(GenericGridBased):
           "surfaces": [], // list of honeybee surfaces
           "analysis_grids": [] // list of analysis grids
           // [0] illuminance(lux), [1] radiation (kwh), [2] luminance (Candela).
-          "analysis_type": 0
+          "analysis_type": 0,
+          "ambient_cache": false, // optional
+          "photon_map": null // optional photon map settings
         }
         """
         sky = CIE.from_json(rec_json['sky'])
@@ -89,8 +106,11 @@ class GridBased(GenericGridBased):
             tuple(AnalysisGrid.from_json(ag) for ag in rec_json['analysis_grids'])
         hb_objects = tuple(HBSurface.from_json(srf) for srf in rec_json['surfaces'])
         rad_parameters = RtraceParameters.from_json(rec_json["rad_parameters"])
+        photon_map = PhotonMap.from_json(rec_json['photon_map']) \
+            if rec_json.get('photon_map') else None
         return cls(sky, analysis_grids, rec_json['analysis_type'], rad_parameters,
-                   hb_objects)
+                   hb_objects, ambient_cache=rec_json.get('ambient_cache', False),
+                   photon_map=photon_map)
 
     @classmethod
     def from_points_and_vectors(cls, sky, point_groups, vector_groups=None,
@@ -219,6 +239,9 @@ class GridBased(GenericGridBased):
         if header:
             self.commands.append(self.header(project_folder))
 
+        # compile opaque meshes before they are used in the scene
+        self.commands.extend(self.opaque_rad_file.mesh_commands)
+
         # 3.write sky file
         self._commands.append(self.sky.to_rad_string(folder='sky'))
 
@@ -244,9 +267,22 @@ class GridBased(GenericGridBased):
                                for f in oct_scene_files_items)
 
         # # 4.2.prepare rtrace
+        rad_parameters = self.radiance_parameters
+        pmap_commands = []
+        if self.photon_map:
+            pmap_commands, pmap = self.photon_map.commands(
+                project_folder, str(oc.output_file), oct_scene_files_items, self.sky,
+                sorted(self.glazing_rad_file.radiance_material_names()))
+            rad_parameters = self.photon_map.with_photon_map(rad_parameters, pmap)
+
+        if self.ambient_cache:
+            ambient_file = ambient_cache_file(
+                project_folder, oct_scene_files_items, self.sky, rad_parameters)
+            rad_parameters = with_ambient_file(rad_parameters, ambient_file)
+
         rt = Rtrace('result/' + project_name,
                     simulation_type=self.simulation_type,
-                    radiance_parameters=self.radiance_parameters)
+                    radiance_parameters=rad_parameters)
         rt.radiance_parameters.h = True
         rt.octree_file = str(oc.output_file)
         rt.points_file = self.relpath(points_file, project_folder)
@@ -261,6 +297,7 @@ class GridBased(GenericGridBased):
 
         # # 4.4 write batch file
         self._commands.append(oc.to_rad_string())
+        self._commands.extend(pmap_commands)
         self._commands.append(rt.to_rad_string())
         self._commands.append(rc.to_rad_string())
 
@@ -313,7 +350,9 @@ class GridBased(GenericGridBased):
               "surfaces": [], // list of honeybee surfaces
               "analysis_grids": [] // list of analysis grids
               // [0] illuminance(lux), [1] radiation (kwh), [2] luminance (Candela).
-              "analysis_type": 0
+              "analysis_type": 0,
+              "ambient_cache": false,
+              "photon_map": null
             }
         """
         return {
@@ -323,7 +362,9 @@ class GridBased(GenericGridBased):
             "surfaces": [srf.to_json() for srf in self.hb_objects],
             "analysis_grids": [ag.to_json() for ag in self.analysis_grids],
             "analysis_type": self.simulation_type,
-            "rad_parameters": self.radiance_parameters.to_json()
+            "rad_parameters": self.radiance_parameters.to_json(),
+            "ambient_cache": self.ambient_cache,
+            "photon_map": self.photon_map.to_json() if self.photon_map else None
         }
 
     def __repr__(self):
@@ -2,11 +2,20 @@
 
 from .._imagebasedbase import GenericImageBased
 from ..recipeutil import write_rad_files, write_extra_files
+from ..ambientcache import ambient_cache_file, with_ambient_file
 from ...parameters.rpict import RpictParameters
 from ...command.oconv import Oconv
 from ...command.rpict import Rpict
 from ....futil import write_to_file
+from copy import deepcopy
 import os
+import subprocess
+
+try:
+    from multiprocessing.pool import ThreadPool
+except ImportError:
+    # IronPython
+    ThreadPool = None
 
 
 class ImageBased(GenericImageBased):
@@ -21,6 +30,20 @@ class ImageBased(GenericImageBased):
             (Default: imagebased.LowQualityImage)
         hb_objects: An optional list of Honeybee surfaces or zones (Default: None).
         sub_folder: Analysis subfolder for this recipe. (Default: "gridbased")
+        view_grid: Number of divisions in x and y direction for tiled rendering
+            (Default: (1, 1)). Each view will be split into x * y sub-views using
+            View.calculate_view_grid. Sub-views are rendered separately and stitched
+            together using pcompos. Tiled rendering is only available for perspective
+            and parallel views.
+        worker_count: Number of sub-views that will be rendered in parallel when the
+            recipe is executed using the run method (Default: 1).
+        ambient_cache: Set to True to share the ambient values between views, tiles
+            and runs with the same scene, sky and ambient parameters. A low
+            resolution overture of each view fills the ambient file before rendering
+            the view (Default: False).
+        photon_map: An optional PhotonMap to render scenes with light shelves,
+            mirrors or prismatic materials using global and caustic photon maps
+            (Default: None).
 
     Usage:
         # create the sky
@@ -40,6 +63,12 @@ class ImageBased(GenericImageBased):
         # run the analysis
         analysis_recipe.run(debaug=False)
 
+        # render each view as 4 x 4 tiles on 8 workers
+        analysis_recipe.view_grid = (4, 4)
+        analysis_recipe.worker_count = 8
+        batch_file = analysis_recipe.write(_folder_, _name_)
+        analysis_recipe.run(batch_file)
+
         # get the results
         print(analysis_recipe.results())
     """
@@ -47,11 +76,28 @@ class ImageBased(GenericImageBased):
     # TODO: implemnt isChanged at AnalysisRecipe level to reload the results
     # if there has been no changes in inputs.
     def __init__(self, sky, views, simulation_type=2, rad_parameters=None,
-                 hb_objects=None, sub_folder="imagebased"):
+                 hb_objects=None, sub_folder="imagebased", view_grid=None,
+                 worker_count=1, ambient_cache=False, photon_map=None):
         """Create grid-based recipe."""
         GenericImageBased.__init__(
             self, views, hb_objects, sub_folder)
 
+        self.view_grid = view_grid
+        """Number of divisions in x and y direction for tiled rendering."""
+
+        self.worker_count = worker_count
+        """Number of sub-views that will be rendered in parallel."""
+
+        self.ambient_cache = ambient_cache
+        """Share ambient values between views and runs."""
+
+        self.photon_map = photon_map
+        """An optional PhotonMap for light which is redirected by specular surfaces."""
+
+        # (start, end) index of tile commands in self._commands for each view
+        self._tile_commands = []
+        self._project_folder = None
+
         self.sky = sky
         """A honeybee sky for the analysis."""
 
@@ -94,6 +140,40 @@ class ImageBased(GenericImageBased):
         else:
             self.radiance_parameters.irradiance_calc = None
 
+    @property
+    def view_grid(self):
+        """Get/set number of divisions in x and y direction for tiled rendering."""
+        return self._view_grid
+
+    @view_grid.setter
+    def view_grid(self, value):
+        if not value:
+            value = (1, 1)
+        try:
+            x_div, y_div = int(value[0]), int(value[1])
+        except (TypeError, IndexError, ValueError):
+            raise ValueError(
+                'view_grid should be a tuple of two integers not {}.'.format(value))
+        assert x_div > 0 and y_div > 0, \
+            'Number of divisions should be larger than 0: {}'.format(value)
+        self._view_grid = (x_div, y_div)
+
+    @property
+    def is_tiled(self):
+        """Return True if views will be rendered in tiles."""
+        return self._view_grid != (1, 1)
+
+    @property
+    def worker_count(self):
+        """Get/set number of sub-views that will be rendered in parallel."""
+        return self._worker_count
+
+    @worker_count.setter
+    def worker_count(self, value):
+        value = int(value or 1)
+        assert value > 0, 'Worker count should be larger than 0: {}'.format(value)
+        self._worker_count = value
+
     @property
     def sky(self):
         """Get and set sky definition."""
@@ -169,6 +249,9 @@ class ImageBased(GenericImageBased):
         if header:
             self.commands.append(self.header(project_folder))
 
+        # compile opaque meshes before they are used in the scene
+        self.commands.extend(self.opaque_rad_file.mesh_commands)
+
         # 3.write sky file
         self._commands.append(self.sky.to_rad_string(folder='sky'))
 
@@ -188,15 +271,39 @@ class ImageBased(GenericImageBased):
         self._commands.append(oc.to_rad_string())
 
         # # 4.2.prepare rpict
-        # TODO: Add overtrue
+        rad_parameters = self.radiance_parameters
+        if self.photon_map:
+            pmap_commands, pmap = self.photon_map.commands(
+                project_folder, str(oc.output_file), oct_scene_files, self.sky,
+                sorted(self.glazing_rad_file.radiance_material_names()))
+            self._commands.extend(pmap_commands)
+            rad_parameters = self.photon_map.with_photon_map(rad_parameters, pmap)
+
+        if self.ambient_cache:
+            ambient_file = ambient_cache_file(
+                project_folder, oct_scene_files, self.sky, rad_parameters)
+            rad_parameters = with_ambient_file(rad_parameters, ambient_file)
+
+        self._tile_commands = []
+        self._project_folder = project_folder
         for view, f in zip(self.views, view_files):
+            if self.ambient_cache and rad_parameters.ambient_bounces > 0:
+                self._commands.append(self._overture_command(
+                    view, self.relpath(f, project_folder), str(oc.output_file),
+                    rad_parameters))
+
+            if self.is_tiled:
+                self._write_tiled_view(view, str(oc.output_file), project_folder,
+                                       rad_parameters)
+                continue
+
             # set x and y resolution based on x and y resolution in view
-            self.radiance_parameters.x_resolution = view.x_resolution
-            self.radiance_parameters.y_resolution = view.y_resolution
+            rad_parameters.x_resolution = view.x_resolution
+            rad_parameters.y_resolution = view.y_resolution
 
             rp = Rpict('result/' + view.name,
                        simulation_type=self.simulation_type,
-                       rpict_parameters=self.radiance_parameters)
+                       rpict_parameters=rad_parameters)
             rp.octree_file = str(oc.output_file)
             rp.view_file = self.relpath(f, project_folder)
 
@@ -211,6 +318,109 @@ class ImageBased(GenericImageBased):
 
         return batch_file
 
+    def _overture_command(self, view, view_file, octree_file, rad_parameters):
+        """Render a low resolution image of a view to fill the ambient file."""
+        rad_parameters = deepcopy(rad_parameters)
+        rad_parameters.x_resolution = min(view.x_resolution, 64)
+        rad_parameters.y_resolution = min(view.y_resolution, 64)
+        rp = Rpict('result/%s_overture' % view.name,
+                   simulation_type=self.simulation_type,
+                   rpict_parameters=rad_parameters)
+        rp.octree_file = octree_file
+        rp.view_file = view_file
+        return rp.to_rad_string()
+
+    def _write_tiled_view(self, view, octree_file, project_folder,
+                          rad_parameters=None):
+        """Add rpict commands for sub-views of a view and pcompos to stitch them.
+
+        Sub-views are rendered with pixel aspect ratio of 0 to guarantee the size of
+        each tile. Tiles are placed next to each other based on their index which
+        makes the seams deterministic.
+        """
+        assert view.view_type in (0, 2), \
+            'Tiled rendering is only supported for perspective and parallel views.' \
+            ' {} has view type {}.'.format(view.name, view.view_type)
+
+        x_div, y_div = self.view_grid
+        sub_views = view.calculate_view_grid(x_div, y_div)
+
+        # use a copy of parameters to keep pixel aspect ratio for other views
+        rad_parameters = deepcopy(rad_parameters or self.radiance_parameters)
+        rad_parameters.pixel_aspect_ratio = 0
+        start = len(self._commands)
+        tiles = []
+        for count, sub_view in enumerate(sub_views):
+            vf = write_to_file(
+                os.path.join(project_folder, 'view', sub_view.name + '.vf'),
+                'rvu ' + sub_view.to_rad_string() + '\n')
+
+            rad_parameters.x_resolution = sub_view.x_resolution
+            rad_parameters.y_resolution = sub_view.y_resolution
+
+            rp = Rpict('result/' + sub_view.name,
+                       simulation_type=self.simulation_type,
+                       rpict_parameters=rad_parameters)
+            rp.octree_file = octree_file
+            rp.view_file = self.relpath(vf, project_folder)
+            self._commands.append(rp.to_rad_string())
+
+            # position of the lower-left corner of the tile in the final image
+            tiles.append('%s %d %d' % (
+                rp.output_file, (count % x_div) * sub_view.x_resolution,
+                (count // x_div) * sub_view.y_resolution))
+
+        self._tile_commands.append((start, len(self._commands)))
+
+        output = 'result/%s.hdr' % view.name
+        self._commands.append('pcompos %s > %s' % (' '.join(tiles), output))
+        self._result_files.append(os.path.join(project_folder, output))
+
+    def run(self, command_file, debug=False, env=None, profile=False, resume=False,
+            executor=None):
+        """Run the analysis.
+
+        If the views are rendered in tiles and worker_count is larger than 1 the
+        commands will be executed from Python and the tiles for each view will be
+        rendered in parallel. Otherwise the command file will be executed. Tiles are
+        rendered one by one if profile or resume is set to True and by the executor if
+        an executor is provided.
+        """
+        # Radiance can't lock the ambient file on Windows to share it between tiles
+        if not self._tile_commands or self.worker_count == 1 or debug \
+                or profile or resume or executor or ThreadPool is None \
+                or (self.ambient_cache and os.name == 'nt'):
+            return super(ImageBased, self).run(command_file, debug, env, profile,
+                                               resume, executor)
+
+        def execute(command):
+            return command, subprocess.call(command, shell=True,
+                                            cwd=self._project_folder, env=env)
+
+        # the first command is the header which changes the directory
+        tile_commands = dict(self._tile_commands)
+        pool = ThreadPool(self.worker_count)
+        try:
+            count = 1 if self.commands[0] == self.header(self._project_folder) else 0
+            while count < len(self.commands):
+                if count in tile_commands:
+                    end = tile_commands[count]
+                    results = pool.map(execute, self.commands[count:end])
+                    count = end
+                else:
+                    results = [execute(self.commands[count])]
+                    count += 1
+                for command, code in results:
+                    assert code == 0, \
+                        'Failed to run command [exit code: {}]:\n{}'.format(
+                            code, command)
+        finally:
+            pool.close()
+            pool.join()
+
+        self._isCalculated = True
+        return True
+
     def results(self):
         """Return results for this analysis."""
         assert self._isCalculated, \
@@ -10,6 +10,7 @@ from ..recipeutil import write_extra_files
 from ..recipedcutil import write_rad_files_daylight_coeff, get_commands_radiation_sky
 from ..recipedcutil import get_commands_scene_daylight_coeff
 from ..recipedcutil import get_commands_w_groups_daylight_coeff
+from ..recipedcutil import write_context_instance_daylight_coeff
 from ..daylightcoeff.gridbased import DaylightCoeffGridBased
 from ...sky.skymatrix import SkyMatrix
 from ....futil import write_to_file
@@ -33,19 +34,22 @@ class GridBased(DaylightCoeffGridBased):
             should be an instance of RfluxmtxParameters.
         hb_objects: An optional list of Honeybee surfaces or zones (Default: None).
         sub_folder: Analysis subfolder for this recipe. (Default: "daylightcoeff").
+        context_as_instance: Set to True to freeze opaque surfaces and additional
+            Radiance files once into an octree and reference it as an instance in
+            all the daylight matrix calculations (Default: False).
 
     """
 
     def __init__(self, sky_mtx, analysis_grids,
                  radiance_parameters=None, reuse_daylight_mtx=True, hb_objects=None,
-                 sub_folder="gridbased_radiation"):
+                 sub_folder="gridbased_radiation", context_as_instance=False):
         """Create an annual recipe."""
 
         simulation_type = 1
 
         DaylightCoeffGridBased.__init__(
             self, sky_mtx, analysis_grids, simulation_type, radiance_parameters,
-            reuse_daylight_mtx, hb_objects, sub_folder)
+            reuse_daylight_mtx, hb_objects, sub_folder, context_as_instance)
 
     @classmethod
     def from_json(cls, rec_json):
@@ -56,7 +60,8 @@ class GridBased(DaylightCoeffGridBased):
             "sky_mtx": {}, // sky matrix json file
             "analysis_grids": [], // list of analysis grids
             "surfaces": [], // list of honeybee surfaces
-            "rad_parameters": {} // radiance gridbased parameters json file
+            "rad_parameters": {}, // radiance gridbased parameters json file
+            "context_as_instance": bool // optional (Default: false)
             }
         """
         sky_mtx = SkyMatrix.from_json(rec_json["sky_mtx"])
@@ -65,9 +70,11 @@ class GridBased(DaylightCoeffGridBased):
         hb_objects = tuple(HBSurface.from_json(srf) for srf in rec_json["surfaces"])
 
         rad_parameters = RfluxmtxParameters.from_json(rec_json["rad_parameters"])
+        context_as_instance = rec_json.get("context_as_instance", False)
 
         return cls(sky_mtx=sky_mtx, analysis_grids=analysis_grids,
-                   radiance_parameters=rad_parameters, hb_objects=hb_objects)
+                   radiance_parameters=rad_parameters, hb_objects=hb_objects,
+                   context_as_instance=context_as_instance)
 
     @classmethod
     def from_weather_file_points_and_vectors(
@@ -124,7 +131,8 @@ class GridBased(DaylightCoeffGridBased):
             "analysis_grids": [], // list of analysis grids
             "surfaces": [], // list of honeybee surfaces
             "simulation_type": int // value between 0-2
-            "rad_parameters": {} // radiance gridbased parameters json file
+            "rad_parameters": {}, // radiance gridbased parameters json file
+            "context_as_instance": bool
             }
         """
         return {
@@ -133,7 +141,8 @@ class GridBased(DaylightCoeffGridBased):
             "sky_mtx": self.sky_matrix.to_json(),
             "analysis_grids": [ag.to_json() for ag in self.analysis_grids],
             "surfaces": [srf.to_json() for srf in self.hb_objects],
-            "rad_parameters": self.radiance_parameters.to_json()
+            "rad_parameters": self.radiance_parameters.to_json(),
+            "context_as_instance": self.context_as_instance
         }
 
     def write(self, target_folder, project_name='untitled', header=True,
@@ -167,6 +176,13 @@ class GridBased(DaylightCoeffGridBased):
         # additional radiance files added to the recipe as scene
         extrafiles = write_extra_files(self.scene, project_folder + '/scene', True)
 
+        # freeze static context into an octree for the normal and the blacked scene
+        context_commands = []
+        if self.context_as_instance:
+            opqfiles, extrafiles, context_commands = \
+                write_context_instance_daylight_coeff(
+                    project_folder, project_name, opqfiles, extrafiles)
+
         # 0.write points
         points_file = self.write_analysis_grids(project_folder, project_name)
 
@@ -174,12 +190,17 @@ class GridBased(DaylightCoeffGridBased):
         if header:
             self._commands.append(self.header(project_folder))
 
+        # compile opaque meshes before they are used in the scene
+        self._commands.extend(self.opaque_rad_file.mesh_commands)
+
         # # 2.1.Create sky matrix.
         # # 2.2. Create sun matrix
         skycommands, skyfiles = get_commands_radiation_sky(
             project_folder, self.sky_matrix, reuse=True, simplified=simplified)
 
         self._commands.extend(skycommands)
+        # context octrees are added before the scene commands if any of them is added
+        context_index = len(self._commands)
 
         # for each window group - calculate total, direct and direct-analemma results
         # calculate the contribution of glazing if any with all window groups blacked
@@ -210,6 +231,9 @@ class GridBased(DaylightCoeffGridBased):
                 os.path.join(project_folder, str(result)) for result in results
             )
 
+        if len(self._commands) > context_index:
+            self._commands[context_index:context_index] = context_commands
+
         # # 2.5 write batch file
         batch_file = os.path.join(project_folder, 'commands.bat')
 
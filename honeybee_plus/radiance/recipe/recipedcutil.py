@@ -1,5 +1,5 @@
 """A collection of useful methods for daylight-coeff recipes."""
-from ...futil import preparedir, copy_files_to_folder
+from ...futil import preparedir, copy_files_to_folder, write_to_file_by_name
 from ..command.rfluxmtx import Rfluxmtx
 from ..command.dctimestep import Dctimestep
 from ..command.rmtxop import Rmtxop, RmtxopMatrix
@@ -10,6 +10,8 @@ from ..command.oconv import Oconv
 from ..command.rpict import Rpict
 from ..command.rcontrib import Rcontrib
 from ..command.vwrays import Vwrays
+from ..command.pipeline import pipe_commands
+from ..geometry.instance import Instance
 from ..parameters.rpict import RpictParameters
 from .recipeutil import glz_srf_to_window_group
 from .parameters import get_radiance_parameters_grid_based, \
@@ -41,7 +43,8 @@ def write_rad_files_daylight_coeff(working_dir, project_name, opq, glz, wgs):
     Files = namedtuple('Files', ['fp', 'fpblk'])
 
     folder = os.path.join(working_dir, 'opaque')
-    of = opq.write_geometries(folder, '%s..opq.rad' % project_name, 0, mkdir=True)
+    of = opq.write_geometries(folder, '%s..opq.rad' % project_name, 0, mkdir=True,
+                              project_folder=os.path.dirname(working_dir))
     om = opq.write_materials(folder, '%s..opq.mat' % project_name, 0, blacked=False)
     bm = opq.write_materials(folder, '%s..blk.mat' % project_name, 0, blacked=True)
     opqf = Files((om, of), (bm, of))
@@ -85,6 +88,52 @@ def write_rad_files_daylight_coeff(working_dir, project_name, opq, glz, wgs):
     return opqf, glzf, wgfs
 
 
+def write_context_instance_daylight_coeff(project_folder, project_name, opqfiles,
+                                          extrafiles):
+    """Freeze the static context of the scene into octrees and use them as instances.
+
+    Opaque surfaces and additional Radiance files are the same for all the window groups
+    and states. Instead of adding them to every rfluxmtx and oconv command they are
+    frozen once into an octree for the normal scene and an octree for the blacked scene
+    and are referenced using an instance primitive. The octrees are written under
+    project_folder/scene/opaque.
+
+    Octree files in additional files are not frozen and will be kept as they are.
+
+    Args:
+        project_folder: Path to project_folder.
+        project_name: A string to generate uniqe file names for this project.
+        opqfiles: Files for opaque surfaces as a namedtuple of (fp, fpblk).
+        extrafiles: Files for additional Radiance files as a namedtuple of (fp, fpblk).
+
+    Returns:
+        New opaque files, new extra files and the list of oconv commands which should
+        be executed before the rest of the commands.
+    """
+    Files = namedtuple('Files', ['fp', 'fpblk'])
+    folder = os.path.join(project_folder, 'scene', 'opaque')
+    rad_files = Files(
+        tuple(opqfiles.fp) + tuple(f for f in extrafiles.fp if not f.endswith('.oct')),
+        tuple(opqfiles.fpblk) +
+        tuple(f for f in extrafiles.fpblk if not f.endswith('.oct'))
+    )
+
+    commands = [':: :: freezing static context']
+    instance_files = []
+    for postfix, files in (('ctx', rad_files.fp), ('ctx_blk', rad_files.fpblk)):
+        name = '{}..{}'.format(project_name, postfix)
+        octree = Oconv(os.path.relpath(os.path.join(folder, name), project_folder))
+        octree.scene_files = tuple(os.path.relpath(f, project_folder) for f in files)
+        commands.append(octree.to_rad_string())
+        instance = Instance(name, str(octree.output_file).replace('\\', '/'))
+        instance_files.append(write_to_file_by_name(
+            folder, name + '.rad', instance.to_rad_string() + '\n'))
+
+    extra = Files(tuple(f for f in extrafiles.fp if f.endswith('.oct')),
+                  tuple(f for f in extrafiles.fpblk if f.endswith('.oct')))
+    return Files((instance_files[0],), (instance_files[1],)), extra, commands
+
+
 def get_commands_sky(project_folder, sky_matrix, reuse=True):
     """Get list of commands to generate the skies.
 
@@ -462,8 +511,6 @@ def _get_commands_daylight_coeff(
                 d_matrix=d_matrix, sky_matrix=sky_mtx_total
             )
 
-        commands.append(dct_total.to_rad_string())
-
         if radiation_only:
             commands.append(
                 ':: :: rmtxop -c 47.4 119.9 11.6 [results.rgb] ^> [%s results.ill]' %
@@ -485,7 +532,9 @@ def _get_commands_daylight_coeff(
             )
 
         commands.append('::')
-        commands.append(finalmtx.to_rad_string())
+        # intermediate rgb values are piped to rmtxop
+        commands.extend(cmd.to_rad_string()
+                        for cmd in pipe_commands((dct_total, finalmtx)))
 
         if not radiation_only:
             commands.append(
@@ -498,7 +547,6 @@ def _get_commands_daylight_coeff(
                 'tmp/direct..{}..{}.rgb'.format(window_group.name, state.name),
                 d_matrix=d_matrix_direct, sky_matrix=sky_mtx_direct
             )
-            commands.append(dct_direct.to_rad_string())
             commands.append(
                 ':: :: rmtxop -c 47.4 119.9 11.6 [direct results.rgb] ^> '
                 '[direct results.ill]'
@@ -509,7 +557,8 @@ def _get_commands_daylight_coeff(
                 'result/direct..{}..{}.ill'.format(window_group.name, state.name),
                 transpose
             )
-            commands.append(finalmtx.to_rad_string())
+            commands.extend(cmd.to_rad_string()
+                            for cmd in pipe_commands((dct_direct, finalmtx)))
 
         if not simplified:
             if not radiation_only:
@@ -525,7 +574,6 @@ def _get_commands_daylight_coeff(
                 dc_matrix=sun_matrix,
                 sky_matrix=os.path.relpath(analemmaMtx, project_folder)
             )
-            commands.append(dct_sun.to_rad_string())
 
             commands.append(
                 ':: :: rmtxop -c 47.4 119.9 11.6 [sun results.rgb] ^> '
@@ -537,7 +585,8 @@ def _get_commands_daylight_coeff(
                 'result/sun..{}..{}.ill'.format(window_group.name, state.name),
                 transpose
             )
-            commands.append(finalmtx.to_rad_string())
+            commands.extend(cmd.to_rad_string()
+                            for cmd in pipe_commands((dct_sun, finalmtx)))
 
             commands.append(':: :: 3. calculating final results')
             if radiation_only:
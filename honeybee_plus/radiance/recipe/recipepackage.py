@@ -0,0 +1,423 @@
+"""Compact binary package for grid-based recipes.
+
+A recipe package is an alternative to recipe.to_json for shipping large models. The
+small parts of the recipe (sky, parameters, hours, etc.) are kept as JSON and surfaces,
+materials and analysis grids are written as typed arrays:
+
+    magic (8 bytes) | version (uint32) | header length (uint32) | JSON header |
+    sections
+
+The header includes the recipe JSON without surfaces and analysis grids, a table of
+unique materials as JSON objects, surface names and types, grid names and the
+position of each section in the file. Sections are arrays of doubles (vertices and
+analysis points) and integers (material indexes and point counts) in the byte order
+of the machine that wrote the file.
+
+Similar to to_json, surfaces are written as HBSurfaces with their current material
+and analysis grids are written without their results. RadGeometry objects are written
+with their polygons as arrays and their modifiers and other geometries as Radiance
+strings.
+
+Usage:
+    write_recipe_package(recipe, 'c:/ladybug/job.hbpkg')
+    recipe = read_recipe_package('c:/ladybug/job.hbpkg', lazy=True)
+"""
+from ..analysisgrid import AnalysisGrid
+from ..analysispoint import AnalysisPoint
+from ..datatype import RadianceDataType
+from ..factory import material_from_json
+from ..quantization import quantizer_from_json
+from ..radgeometry import RadGeometry
+from ..radparser import iter_records
+from ...futil import write_to_file_by_name
+from ...hbsurface import HBSurface
+from ... import surfacetype
+
+from array import array
+from importlib import import_module
+import copy
+import json
+import struct
+import sys
+
+MAGIC = b'HBRCPKG\x00'
+VERSION = 2
+
+
+def write_recipe_package(recipe, file_path):
+    """Write a grid-based recipe to a binary package.
+
+    Args:
+        recipe: A grid-based recipe with to_json and from_json methods.
+        file_path: Full path to the output file.
+
+    Returns:
+        Path to the package.
+    """
+    assert hasattr(recipe, 'analysis_grids'), \
+        'Only grid-based recipes can be packaged not {}.'.format(type(recipe))
+
+    # recipe json without the surfaces and the grids
+    base = copy.copy(recipe)
+    base._analysis_grids = ()
+    base._hbObjs = ()
+    recipe_json = base.to_json()
+
+    # surfaces and unique materials
+    names, types, material_indexes = [], [], array('i')
+    group_counts, point_counts, vertices = array('i'), array('i'), array('d')
+    materials, material_ids, material_keys = [], {}, {}
+    geometries, geometry_modifier_indexes = [], array('i')
+    geometry_vertex_counts, geometry_vertices = array('i'), array('d')
+    for srf in recipe.hb_objects:
+        if hasattr(srf, 'isRadGeometry'):
+            geometries.append({
+                'modifiers': '\n'.join(m.to_rad_string() for m in srf.modifiers),
+                'others': '\n'.join(r.to_rad_string() for r in srf.others),
+                'names': srf.names,
+                'modifier_names': srf.modifier_names
+            })
+            geometry_modifier_indexes.extend(srf.modifier_indexes)
+            offsets = srf.offsets
+            geometry_vertex_counts.extend(
+                offsets[i + 1] - offsets[i] for i in range(len(srf)))
+            geometry_vertices.extend(srf.vertices)
+            continue
+        if not hasattr(srf, 'isHBAnalysisSurface'):
+            raise TypeError(
+                'Only Honeybee surfaces and RadGeometry can be packaged not {}.'.format(
+                    type(srf).__name__))
+        names.append(srf.name)
+        types.append(srf.surface_type.typeId)
+        material = srf.radiance_material
+        try:
+            index = material_ids[id(material)]
+        except KeyError:
+            material_json = material.to_json()
+            key = json.dumps(material_json, sort_keys=True, default=_json_default)
+            try:
+                index = material_keys[key]
+            except KeyError:
+                index = material_keys[key] = len(materials)
+                materials.append(material_json)
+            material_ids[id(material)] = index
+        material_indexes.append(index)
+        group_counts.append(len(srf.points))
+        for pts in srf.points:
+            point_counts.append(len(pts))
+            for pt in pts:
+                vertices.extend((pt[0], pt[1], pt[2]))
+
+    # analysis points as x, y, z, dx, dy, dz
+    grids, grid_points = [], array('d')
+    for ag in recipe.analysis_grids:
+        grid_json = {'name': ag.name, 'count': len(ag)}
+        quantizer = getattr(ag, 'quantizer', None)
+        if quantizer:
+            grid_json['quantizer'] = quantizer.to_json()
+        grids.append(grid_json)
+        for pt, v in zip(ag.points, ag.vectors):
+            grid_points.extend((pt[0], pt[1], pt[2], v[0], v[1], v[2]))
+
+    sections = (('material_indexes', material_indexes), ('group_counts', group_counts),
+                ('point_counts', point_counts), ('vertices', vertices),
+                ('grid_points', grid_points),
+                ('geometry_modifier_indexes', geometry_modifier_indexes),
+                ('geometry_vertex_counts', geometry_vertex_counts),
+                ('geometry_vertices', geometry_vertices))
+
+    cls = recipe.__class__
+    header = {
+        'class': [cls.__module__, cls.__name__],
+        'byteorder': sys.byteorder,
+        'recipe': recipe_json,
+        'materials': materials,
+        'surfaces': {'names': names, 'types': types},
+        'geometries': geometries,
+        'grids': grids,
+        'sections': {}
+    }
+
+    # offsets are relative to the end of the header
+    offset = 0
+    for name, values in sections:
+        header['sections'][name] = [offset, values.typecode, len(values)]
+        offset += values.itemsize * len(values)
+
+    header_bytes = json.dumps(header, default=_json_default).encode('utf-8')
+    with open(file_path, 'wb') as outf:
+        outf.write(MAGIC)
+        outf.write(struct.pack('<II', VERSION, len(header_bytes)))
+        outf.write(header_bytes)
+        for name, values in sections:
+            values.tofile(outf)
+
+    return file_path
+
+
+def read_recipe_package(file_path, lazy=False):
+    """Load a grid-based recipe from a binary package.
+
+    Args:
+        file_path: Full path to the package.
+        lazy: Set to True to load the analysis grids as PackedAnalysisGrids. Analysis
+            points for a packed grid are only created when they are needed. Writing
+            the points to a file doesn't create the analysis points (default: False).
+
+    Returns:
+        A grid-based recipe.
+    """
+    with open(file_path, 'rb') as inf:
+        header, data_start = _read_header(inf, file_path)
+        sections = {
+            name: _read_section(inf, header, data_start, name)
+            for name in ('material_indexes', 'group_counts', 'point_counts',
+                         'vertices')
+        }
+        if not lazy:
+            grid_points = _read_section(inf, header, data_start, 'grid_points')
+        # packages before version 2 don't have RadGeometry objects
+        if header.get('geometries'):
+            sections.update(
+                (name, _read_section(inf, header, data_start, name))
+                for name in ('geometry_modifier_indexes', 'geometry_vertex_counts',
+                             'geometry_vertices'))
+
+    module_name, class_name = header['class']
+    assert module_name.startswith('honeybee_plus.radiance.recipe.'), \
+        'Invalid recipe class in {}: {}'.format(file_path, module_name)
+    cls = getattr(import_module(module_name), class_name)
+
+    recipe = cls.from_json(header['recipe'])
+
+    # create surfaces
+    materials = [material_from_json(m) for m in header['materials']]
+    srf_types = {}
+    surfaces = []
+    group_counts = sections['group_counts']
+    point_counts = sections['point_counts']
+    vertices = sections['vertices']
+    g = v = 0
+    for i, (name, type_id) in enumerate(zip(header['surfaces']['names'],
+                                            header['surfaces']['types'])):
+        points = []
+        for _ in range(group_counts[i]):
+            count = point_counts[g]
+            points.append([tuple(vertices[j:j + 3])
+                           for j in range(v, v + 3 * count, 3)])
+            g += 1
+            v += 3 * count
+        try:
+            srf_type = srf_types[type_id]
+        except KeyError:
+            srf_type = srf_types[type_id] = \
+                surfacetype.SurfaceTypes.get_type_by_key(type_id)
+        srf = HBSurface(name, points, srf_type)
+        srf.radiance_material = materials[sections['material_indexes'][i]]
+        surfaces.append(srf)
+
+    # create RadGeometry objects
+    p = v = 0
+    for geometry_json in header.get('geometries', ()):
+        count = len(geometry_json['names'])
+        vertex_counts = sections['geometry_vertex_counts'][p:p + count]
+        vertex_count = 3 * sum(vertex_counts)
+        surfaces.append(RadGeometry.from_arrays(
+            list(iter_records((geometry_json['modifiers'],))),
+            list(iter_records((geometry_json['others'],))),
+            geometry_json['names'], geometry_json['modifier_names'],
+            sections['geometry_modifier_indexes'][p:p + count],
+            sections['geometry_vertices'][v:v + vertex_count], vertex_counts))
+        p += count
+        v += vertex_count
+    recipe.hb_objects = surfaces
+
+    # create analysis grids. grids are already new objects and don't need to be
+    # duplicated in analysis_grids setter.
+    grids = []
+    start = 0
+    for grid_json in header['grids']:
+        count = grid_json['count']
+        quantizer = quantizer_from_json(grid_json.get('quantizer'))
+        if lazy:
+            offset, typecode, _ = header['sections']['grid_points']
+            position = data_start + offset + start * 6 * array(typecode).itemsize
+            grid = PackedAnalysisGrid(
+                grid_json['name'], file_path, position, count,
+                header['byteorder'] != sys.byteorder, quantizer)
+        else:
+            values = grid_points[start * 6:(start + count) * 6]
+            grid = PackedAnalysisGrid.create_grid(values, grid_json['name'], quantizer)
+        grids.append(grid)
+        start += count
+    recipe._analysis_grids = tuple(grids)
+
+    return recipe
+
+
+def _json_default(obj):
+    """Convert Radiance values in material JSON objects to numbers."""
+    if isinstance(obj, RadianceDataType):
+        return obj._value
+    raise TypeError('{} is not JSON serializable.'.format(type(obj)))
+
+
+def _read_header(inf, file_path):
+    """Read package header and return the header and start of the data."""
+    if inf.read(len(MAGIC)) != MAGIC:
+        raise ValueError('{} is not a recipe package.'.format(file_path))
+    version, header_length = struct.unpack('<II', inf.read(8))
+    if version > VERSION:
+        raise ValueError(
+            'Unsupported recipe package version in {}: {}'.format(file_path, version))
+    header = json.loads(inf.read(header_length).decode('utf-8'))
+    return header, inf.tell()
+
+
+def _read_section(inf, header, data_start, name):
+    """Read a section of the package as an array."""
+    offset, typecode, count = header['sections'][name]
+    values = array(typecode)
+    inf.seek(data_start + offset)
+    values.fromfile(inf, count)
+    if header['byteorder'] != sys.byteorder:
+        values.byteswap()
+    return values
+
+
+class PackedAnalysisGrid(object):
+    """An analysis grid which is loaded from a recipe package on demand.
+
+    Points and vectors are read from the package without creating the analysis
+    points. The AnalysisGrid is created on first access to any other attribute (e.g.
+    analysis_points or loading the results) and all the calls will be passed to the
+    AnalysisGrid afterwards.
+
+    Attributes:
+        name: Grid name.
+        file_path: Path to recipe package.
+        position: Position of the first point of the grid in the package.
+        count: Number of analysis points.
+        byteswap: A Boolean to byteswap the values after reading.
+        quantizer: An optional quantizer for the values of analysis points.
+    """
+
+    __slots__ = ('_name', '_file_path', '_position', '_count', '_byteswap',
+                 '_quantizer', '_grid')
+
+    def __init__(self, name, file_path, position, count, byteswap=False,
+                 quantizer=None):
+        self._name = name
+        self._file_path = file_path
+        self._position = position
+        self._count = count
+        self._byteswap = byteswap
+        self._quantizer = quantizer
+        self._grid = None
+
+    @staticmethod
+    def create_grid(values, name, quantizer=None):
+        """Create an AnalysisGrid from a flat list of x, y, z, dx, dy, dz values."""
+        aps = tuple(AnalysisPoint(values[i:i + 3], values[i + 3:i + 6], quantizer)
+                    for i in range(0, len(values), 6))
+        return AnalysisGrid(aps, name, quantizer=quantizer)
+
+    @property
+    def isAnalysisGrid(self):
+        """Return True for PackedAnalysisGrid."""
+        return True
+
+    @property
+    def isPackedAnalysisGrid(self):
+        """Return True for PackedAnalysisGrid."""
+        return True
+
+    @property
+    def name(self):
+        """Grid name."""
+        return self._name
+
+    @property
+    def is_loaded(self):
+        """Return True if the AnalysisGrid is created."""
+        return self._grid is not None
+
+    @property
+    def grid(self):
+        """The AnalysisGrid for this packed grid."""
+        if self._grid is None:
+            self._grid = self.create_grid(self.values(), self._name, self._quantizer)
+        return self._grid
+
+    def values(self):
+        """Point and vector values as an array of x, y, z, dx, dy, dz."""
+        values = array('d')
+        with open(self._file_path, 'rb') as inf:
+            inf.seek(self._position)
+            values.fromfile(inf, 6 * self._count)
+        if self._byteswap:
+            values.byteswap()
+        return values
+
+    @property
+    def points(self):
+        """A generator of points as x, y, z."""
+        if self._grid is not None:
+            return self._grid.points
+        values = self.values()
+        return (values[i:i + 3] for i in range(0, len(values), 6))
+
+    @property
+    def vectors(self):
+        """A generator of vectors as x, y, z."""
+        if self._grid is not None:
+            return self._grid.vectors
+        values = self.values()
+        return (values[i + 3:i + 6] for i in range(0, len(values), 6))
+
+    def duplicate(self):
+        """Duplicate the grid.
+
+        Recipes duplicate the grids on assignment. A grid which is not loaded yet is
+        duplicated as a new PackedAnalysisGrid for the same part of the package so
+        the points are not loaded. A loaded grid is duplicated as an AnalysisGrid.
+        """
+        if self._grid is not None:
+            return self._grid.duplicate()
+        return PackedAnalysisGrid(self._name, self._file_path, self._position,
+                                  self._count, self._byteswap, self._quantizer)
+
+    def to_rad_string(self):
+        """Return analysis points as a Radiance string."""
+        if self._grid is not None:
+            return self._grid.to_rad_string()
+        values = self.values()
+        return '\n'.join('%.3f %.3f %.3f %.3f %.3f %.3f' % tuple(values[i:i + 6])
+                         for i in range(0, len(values), 6))
+
+    def write(self, folder, filename=None, mkdir=False):
+        """write analysis grid to file."""
+        name = filename or self.name + '.pts'
+        return write_to_file_by_name(folder, name, self.to_rad_string() + '\n', mkdir)
+
+    def __getattr__(self, attr):
+        """Pass other attributes to AnalysisGrid."""
+        if attr.startswith('__'):
+            raise AttributeError(attr)
+        return getattr(self.grid, attr)
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        return self.grid[index]
+
+    def __iter__(self):
+        return iter(self.grid)
+
+    def __repr__(self):
+        return 'PackedAnalysisGrid::{}::#{}'.format(self._name, self._count)
@@ -2,6 +2,7 @@
 from ..command.xform import Xform, XformParameters
 from ..material.plastic import BlackMaterial
 from ..radfile import RadFile
+from ..radgeometry import RadGeometry
 from ...futil import write_to_file_by_name, copy_files_to_folder, preparedir
 
 import os
@@ -12,14 +13,19 @@ def input_srfs_to_rad_files(in_srfs):
     """separate input honeybee surfaces to RadFiles based on type.
 
     This function analyzes a collection of input honeybee surfaces and returns
-    3 rad_file like objecs for opaque, glazing and tuple(window groups).
+    3 rad_file like objecs for opaque, glazing and tuple(window groups). Input
+    RadGeometry objects are separated to opaque and glazing based on their modifiers.
     """
     opaque = []
     fen = []
     wgs = []
+    geometry = None
 
     for srf in in_srfs:
-        if srf.isHBDynamicSurface:
+        if hasattr(srf, 'isRadGeometry'):
+            geometry = geometry or RadGeometry()
+            geometry.extend(srf)
+        elif srf.isHBDynamicSurface:
             # window groups, multiple of single state
             wgs.append(srf)
         elif srf.isHBFenSurface or not srf.radiance_material.is_opaque:
@@ -40,6 +46,13 @@ def input_srfs_to_rad_files(in_srfs):
     print('Found %d opaque surfaces.' % len(opaque))
     print('Found %d fenestration surfaces.' % len(fen))
     print('Found %d window-groups.' % len(wgs))
+    if geometry is not None:
+        opaque_geometry = geometry.filter_by_opacity(True)
+        fen_geometry = geometry.filter_by_opacity(False)
+        print('Found %d opaque and %d fenestration polygons.' % (
+            len(opaque_geometry), len(fen_geometry)))
+    else:
+        opaque_geometry = fen_geometry = None
 
     for count, wg in enumerate(wgs):
         if len(wg.states) == 1:
@@ -47,7 +60,8 @@ def input_srfs_to_rad_files(in_srfs):
         else:
             print('  [%d] %s, %d states.' % (count, wg.name, len(wg.states)))
 
-    return RadFile(opaque), RadFile(fen), tuple(RadFile((wg,)) for wg in wgs)
+    return RadFile(opaque, rad_geometry=opaque_geometry), \
+        RadFile(fen, rad_geometry=fen_geometry), tuple(RadFile((wg,)) for wg in wgs)
 
 
 def glz_srf_to_window_group():
@@ -153,7 +167,8 @@ def write_rad_files(scene_folder, project_name, opq, glz, wgs):
         and its states.
     """
     folder = os.path.join(scene_folder, 'opaque')
-    of = opq.write_geometries(folder, '%s..opq.rad' % project_name, 0, mkdir=True)
+    of = opq.write_geometries(folder, '%s..opq.rad' % project_name, 0, mkdir=True,
+                              project_folder=os.path.dirname(scene_folder))
     om = opq.write_materials(folder, '%s..opq.mat' % project_name, 0, blacked=False)
     opqf = [om, of]
 
@@ -4,6 +4,7 @@ from .recipedcutil import window_group_to_receiver, coeff_matrix_commands, sky_r
 from .recipedcutil import matrix_calculation, rgb_matrix_file_to_ill, \
     sun_coeff_matrix_commands
 from .recipedcutil import sun_matrix_calculation, final_matrix_addition
+from ..command.pipeline import pipe_commands
 from ...futil import preparedir, copy_files_to_folder
 
 import os
@@ -34,7 +35,8 @@ def write_rad_files_multi_phase(working_dir, project_name, opq, glz, wgs):
     Files = namedtuple('Files', ['fp', 'fpblk', 'fpglw'])
 
     folder = os.path.join(working_dir, 'opaque')
-    of = opq.write_geometries(folder, '%s..opq.rad' % project_name, 0, mkdir=True)
+    of = opq.write_geometries(folder, '%s..opq.rad' % project_name, 0, mkdir=True,
+                              project_folder=os.path.dirname(working_dir))
     om = opq.write_materials(folder, '%s..opq.mat' % project_name, 0, blacked=False)
     bm = opq.write_materials(folder, '%s..blk.mat' % project_name, 0, blacked=True)
     opqf = Files((om, of), (bm, of), ())
@@ -294,7 +296,6 @@ def matrix_calculation_three_phase(
                         .format(state.name, stcount + 1, len(window_group.states)))
         commands.append(':: :: [3/3] v_matrix * d_matrix * t_matrix')
         commands.append(':: :: dctimestep [vmx] [tmtx] [dmtx] ^ > [results.rgb]')
-        commands.append(dct.to_rad_string())
 
         # 5. convert r, g ,b values to illuminance
         final_output = r'result/{}..{}.ill'.format(window_group.name, state.name)
@@ -303,7 +304,8 @@ def matrix_calculation_three_phase(
             ':: :: rmtxop -c 47.4 119.9 11.6 [results.rgb] ^> [results.ill]')
         commands.append('::')
         commands.append('::')
-        commands.append(finalmtx.to_rad_string())
+        # intermediate rgb values are piped to rmtxop
+        commands.extend(cmd.to_rad_string() for cmd in pipe_commands((dct, finalmtx)))
 
         results.append(os.path.join(project_folder, final_output))
 
@@ -357,13 +359,12 @@ def matrix_calculation_five_phase(
         dct = matrix_calculation(output, v_matrix, t_matrix, d_matrix, sky_mtx_total)
         commands.append(':: :: [3/5] v_matrix * d_matrix * t_matrix')
         commands.append(':: :: dctimestep [vmx] [tmtx] [dmtx] ^ > [results.rgb]')
-        commands.append(dct.to_rad_string())
 
         # 5. convert r, g ,b values to illuminance
         final_output = r'result/3phase..{}..{}.ill'.format(
             window_group.name, state.name)
         finalmtx = rgb_matrix_file_to_ill((dct.output_file,), final_output, transpose)
-        commands.append(finalmtx.to_rad_string())
+        commands.extend(cmd.to_rad_string() for cmd in pipe_commands((dct, finalmtx)))
 
         results.append(os.path.join(project_folder, final_output))
 
@@ -374,13 +375,12 @@ def matrix_calculation_five_phase(
         dct = matrix_calculation(output, dv_matrix, t_matrix, dd_matrix, sky_mtx_direct)
         commands.append(':: :: [4/5] v_matrix * d_matrix * t_matrix')
         commands.append(':: :: dctimestep [vmx] [tmtx] [dmtx] ^ > [results.rgb]')
-        commands.append(dct.to_rad_string())
 
         # 5. convert r, g ,b values to illuminance
         final_output = r'result/direct..{}..{}.ill'.format(
             window_group.name, state.name)
         finalmtx = rgb_matrix_file_to_ill((dct.output_file,), final_output, transpose)
-        commands.append(finalmtx.to_rad_string())
+        commands.extend(cmd.to_rad_string() for cmd in pipe_commands((dct, finalmtx)))
 
         results.append(os.path.join(project_folder, final_output))
 
@@ -430,7 +430,6 @@ def matrix_calculation_five_phase(
             dc_matrix=sun_matrix,
             sky_matrix=os.path.relpath(analemmaMtx, project_folder)
         )
-        commands.append(dct_sun.to_rad_string())
 
         commands.append(
             ':: :: rmtxop -c 47.4 119.9 11.6 [sun results.rgb] ^> '
@@ -441,7 +440,8 @@ def matrix_calculation_five_phase(
             (dct_sun.output_file,),
             'result/sun..{}..{}.ill'.format(window_group.name, state.name), transpose
         )
-        commands.append(finalmtx.to_rad_string())
+        commands.extend(cmd.to_rad_string()
+                        for cmd in pipe_commands((dct_sun, finalmtx)))
 
         commands.append(':: :: calculating final results')
         commands.append(
@@ -0,0 +1,335 @@
+"""Per-step profiling for recipe runs.
+
+A run report executes the commands of a recipe one by one and records wall time, CPU
+time, peak memory and the size of the files that each step has read and written. It
+is useful to find the slow steps of a recipe and to compare the cost of different
+Radiance parameters.
+
+CPU time and peak memory are collected from the operating system when the process
+exits (os.wait4) and include all the programs in a piped command. They are not
+available on Windows and will be None. Bytes read and written are the size of the
+files in the command line which existed before the step (input) and the files which
+were created or modified by the step (output). Files in the command line include the
+values of options (e.g. rtrace -af ambient.amb or mkpmap -apg global.gpm 10000), the
+files which match numbered output patterns (e.g. rfluxmtx -o result/dc/%03d.hdr) and
+the octrees and meshes which are referenced by instance and mesh objects in the .rad
+files of the command. Other files that a program reads or writes (e.g. files that are
+referenced in .cal files or in BSDF materials) are not included.
+
+Usage:
+    command_file = recipe.write('c:/ladybug', 'room')
+    recipe.run(command_file, profile=True)
+    print(recipe.run_report.summary())
+    recipe.run_report.write('c:/ladybug/room/gridbased/run_report.json')
+"""
+from ... import config
+from ...futil import normspace
+from ..command.pipeline import _tokens, _unquote
+from ..radparser import referenced_files
+
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+
+# numbered file names in output patterns (e.g. %03d)
+_numbered = re.compile(r'%+0?\d*d')
+
+# lines in command files which only prepare the shell
+_shell_lines = re.compile(r'^(@|#|::|echo\b|rem\b|pause\b|set\b|path=|[a-z]:$)',
+                          re.IGNORECASE)
+
+
+class StepReport(object):
+    """Resource usage for a single command.
+
+    Attributes:
+        command: Command line for this step.
+        returncode: Exit code of the command.
+        wall_time: Elapsed time in seconds.
+        user_time: CPU time in user mode in seconds (None on Windows).
+        system_time: CPU time in system mode in seconds (None on Windows).
+        peak_memory: Peak resident memory in bytes (None on Windows).
+        input_bytes: Size of existing files in the command line in bytes.
+        output_bytes: Size of files which are created or modified in bytes.
+        skipped: True if the step is skipped because of a checkpoint.
+    """
+
+    __slots__ = ('command', 'returncode', 'wall_time', 'user_time', 'system_time',
+                 'peak_memory', 'input_bytes', 'output_bytes', 'skipped')
+
+    def __init__(self, command, returncode=0, wall_time=0, user_time=None,
+                 system_time=None, peak_memory=None, input_bytes=0, output_bytes=0,
+                 skipped=False):
+        self.command = command
+        self.returncode = returncode
+        self.wall_time = wall_time
+        self.user_time = user_time
+        self.system_time = system_time
+        self.peak_memory = peak_memory
+        self.input_bytes = input_bytes
+        self.output_bytes = output_bytes
+        self.skipped = skipped
+
+    @classmethod
+    def from_json(cls, rep_json):
+        """Create a step report from a dictionary."""
+        return cls(**rep_json)
+
+    @property
+    def program(self):
+        """Name of the first program in the command."""
+        tokens = _tokens.findall(self.command)
+        if not tokens:
+            return ''
+        return os.path.splitext(os.path.basename(_unquote(tokens[0])))[0]
+
+    @property
+    def cpu_time(self):
+        """Total CPU time in seconds (None on Windows)."""
+        if self.user_time is None:
+            return None
+        return self.user_time + self.system_time
+
+    def to_json(self):
+        """Convert step report to a dictionary."""
+        return {key: getattr(self, key) for key in self.__slots__}
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        return 'StepReport::{}::{:.2f}s'.format(self.program, self.wall_time)
+
+
+class RunReport(object):
+    """Resource usage for a recipe run.
+
+    Attributes:
+        steps: A list of StepReports in the order of execution.
+    """
+
+    def __init__(self, steps=None):
+        self.steps = list(steps or ())
+
+    @classmethod
+    def from_json(cls, rep_json):
+        """Create a run report from a dictionary."""
+        return cls(StepReport.from_json(s) for s in rep_json['steps'])
+
+    @property
+    def wall_time(self):
+        """Total wall time in seconds."""
+        return sum(s.wall_time for s in self.steps)
+
+    @property
+    def succeeded(self):
+        """Return True if all the steps exited with 0."""
+        return all(s.returncode == 0 for s in self.steps)
+
+    def execute(self, command, cwd=None, env=None):
+        """Execute a RadianceCommand and add the resource usage to the report.
+
+        Returns:
+            Fullpath to the result file if any.
+        """
+        command._prepare_execution()
+        self.steps.append(profile_command(command.to_rad_string(), cwd, env))
+        return command._output_file_path()
+
+    def summary(self):
+        """Return the report as a table."""
+        def fmt(value, pattern):
+            return '-' if value is None else pattern % value
+
+        mb = 1024.0 ** 2
+        lines = ['%-4s %-12s %10s %10s %10s %10s %10s %5s' % (
+            '#', 'program', 'wall(s)', 'cpu(s)', 'mem(MB)', 'read(MB)', 'write(MB)',
+            'exit')]
+        for count, s in enumerate(self.steps):
+            lines.append('%-4d %-12s %10.2f %10s %10s %10.1f %10.1f %5s' % (
+                count, s.program[:12], s.wall_time, fmt(s.cpu_time, '%.2f'),
+                fmt(s.peak_memory and s.peak_memory / mb, '%.1f'),
+                s.input_bytes / mb, s.output_bytes / mb,
+                'skip' if s.skipped else s.returncode))
+        lines.append('total wall time: %.2f s' % self.wall_time)
+        return '\n'.join(lines)
+
+    def to_json(self):
+        """Convert run report to a dictionary."""
+        return {'wall_time': self.wall_time,
+                'steps': [s.to_json() for s in self.steps]}
+
+    def write(self, file_path):
+        """Write the report to a JSON file."""
+        with open(file_path, 'w') as outf:
+            json.dump(self.to_json(), outf, indent=2)
+        return file_path
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __len__(self):
+        return len(self.steps)
+
+    def __iter__(self):
+        return iter(self.steps)
+
+    def __repr__(self):
+        return 'RunReport::#{}::{:.2f}s'.format(len(self.steps), self.wall_time)
+
+
+def _file_states(command, cwd):
+    """Get size and modification time for files in a command line."""
+    paths = []
+    program = True
+    for token in _tokens.findall(command):
+        if program or token == '|':
+            # ignore the executables
+            program = token == '|'
+            continue
+        token = _unquote(token.lstrip('<>'))
+        if not token or token.startswith('-'):
+            continue
+        path = os.path.join(cwd, token)
+        if '%' in token:
+            paths.extend(_numbered_files(path))
+        elif os.path.isfile(path):
+            paths.append(path)
+            if path.endswith('.rad'):
+                paths.extend(_referenced_files(path, cwd))
+
+    states = {}
+    for path in paths:
+        if os.path.isfile(path):
+            st = os.stat(path)
+            states[os.path.normpath(path)] = (st.st_size, st.st_mtime)
+    return states
+
+
+def _numbered_files(pattern):
+    """Get the files which match a numbered file pattern (e.g. result/%03d.hdr)."""
+    folder, name = os.path.split(pattern)
+    if not os.path.isdir(folder):
+        return []
+    # %% is used to escape % in batch files
+    parts = _numbered.split(name.replace('%%', '%'))
+    regex = re.compile(r'\d+'.join(re.escape(part) for part in parts) + '$')
+    return [os.path.join(folder, f) for f in os.listdir(folder) if regex.match(f)]
+
+
+def _referenced_files(rad_file, cwd):
+    """Get the files which are referenced by instance and mesh objects."""
+    try:
+        return [os.path.join(cwd, f) for f in referenced_files(rad_file)]
+    except ValueError:
+        # not a valid Radiance file
+        return []
+
+
+def profile_command(command, cwd=None, env=None):
+    """Execute a command line and collect the resource usage.
+
+    Args:
+        command: Command line as a string. Pipes and redirections are supported.
+        cwd: Working directory (Default: current working directory).
+        env: Optional environment variables for the command.
+
+    Returns:
+        A StepReport.
+    """
+    cwd = cwd or os.getcwd()
+    before = _file_states(command, cwd)
+    start = time.time()
+    p = subprocess.Popen(command, shell=True, cwd=cwd, env=env)
+    if hasattr(os, 'wait4'):
+        _, status, usage = os.wait4(p.pid, 0)
+        wall_time = time.time() - start
+        # set the return code for Popen to avoid waiting for the process again
+        if os.WIFSIGNALED(status):
+            p.returncode = -os.WTERMSIG(status)
+        else:
+            p.returncode = os.WEXITSTATUS(status)
+        # ru_maxrss is in kilobytes on Linux and in bytes on Mac
+        factor = 1 if sys.platform == 'darwin' else 1024
+        report = StepReport(command, p.returncode, wall_time, usage.ru_utime,
+                            usage.ru_stime, usage.ru_maxrss * factor)
+    else:
+        p.wait()
+        report = StepReport(command, p.returncode, time.time() - start)
+
+    after = _file_states(command, cwd)
+    for path, state in after.items():
+        if before.get(path) == state:
+            report.input_bytes += state[0]
+        else:
+            report.output_bytes += state[0]
+
+    return report
+
+
+def _batch_command(line):
+    """Convert a line of a batch file to a command line.
+
+    % is escaped as %% in batch files on Windows but cmd /c does not collapse them.
+    """
+    return line.replace('%%', '%') if os.name == 'nt' else line
+
+
+def profile_command_file(command_file, env=None, manifest=None):
+    """Execute the commands in a command file one by one and profile each step.
+
+    Lines which only prepare the shell (e.g. comments, echo, setting environment
+    variables) are skipped and cd lines change the working directory for the next
+    commands.
+
+    Args:
+        command_file: Path to a command file which is written by a recipe.
+        env: Optional environment variables for the commands. On Windows path to
+            Radiance will be added to PATH and RAYPATH by default.
+        manifest: An optional CheckpointManifest. Steps which are already done will
+            be skipped and successful steps will be added to the manifest.
+
+    Returns:
+        A RunReport.
+    """
+    if env is None and os.name == 'nt':
+        env = dict(os.environ)
+        env['PATH'] = '%s;%s' % (normspace(config.radbin_path), env.get('PATH', ''))
+        env['RAYPATH'] = '.;%s' % normspace(config.radlib_path)
+
+    cwd = os.path.dirname(os.path.abspath(command_file))
+    report = RunReport()
+    with open(command_file) as inf:
+        for line in inf:
+            line = line.strip()
+            if not line or _shell_lines.match(line):
+                continue
+            if line.lower().startswith('cd '):
+                cwd = os.path.join(cwd, _unquote(line[3:].strip()))
+                continue
+            line = _batch_command(line)
+            if manifest is None:
+                report.steps.append(profile_command(line, cwd, env))
+                continue
+
+            if manifest.is_done(line, cwd):
+                report.steps.append(StepReport(line, skipped=True))
+                continue
+
+            before = _file_states(line, cwd)
+            step = profile_command(line, cwd, env)
+            report.steps.append(step)
+            if step.returncode != 0:
+                manifest.remove(line, cwd)
+                continue
+            after = _file_states(line, cwd)
+            inputs = [f for f, state in after.items() if before.get(f) == state]
+            outputs = [f for f in after if f not in inputs]
+            manifest.record(line, cwd, inputs, outputs)
+
+    return report
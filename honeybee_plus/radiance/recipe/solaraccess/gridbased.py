@@ -5,16 +5,14 @@ from ..recipedcutil import rgb_matrix_file_to_ill
 from ...parameters.rcontrib import RcontribParameters
 from ...command.oconv import Oconv
 from ...command.rcontrib import Rcontrib
+from ...command.pipeline import pipe_commands
 from ...analysisgrid import AnalysisGrid
 from ...sky.analemma import Analemma
 from ....futil import write_to_file
 from ....vectormath.euclid import Vector3
 from ....hbsurface import HBSurface
 
-from ladybug.sunpath import Sunpath
 from ladybug.location import Location
-from ladybug.legend import LegendParameters
-from ladybug.color import Colorset
 
 import os
 
@@ -89,6 +87,7 @@ class SolarAccessGridBased(GenericGridBased):
               "sun_vectors": [] // list of sun vectors if location is not provided
             }
         """
+        from ladybug.sunpath import Sunpath
         hoys = rec_json["hoys"]
         if 'sun_vectors' not in rec_json or not rec_json['sun_vectors']:
             # create sun vectors from location inputs
@@ -164,6 +163,7 @@ class SolarAccessGridBased(GenericGridBased):
     def from_location_and_hoys(cls, location, hoys, point_groups, vector_groups=[],
                                timestep=1, hb_objects=None, sub_folder='sunlighthour'):
         """Create sunlighthours recipe from Location and hours of year."""
+        from ladybug.sunpath import Sunpath
         sp = Sunpath.from_location(location)
 
         suns = tuple(sp.calculate_sun_from_hoy(hoy) for hoy in hoys)
@@ -180,6 +180,7 @@ class SolarAccessGridBased(GenericGridBased):
         cls, location, analysis_period, point_groups, vector_groups=None,
             hb_objects=None, sub_folder='sunlighthour'):
         """Create sunlighthours recipe from Location and analysis period."""
+        from ladybug.sunpath import Sunpath
         vector_groups = vector_groups or ()
 
         sp = Sunpath.from_location(location)
@@ -239,6 +240,8 @@ class SolarAccessGridBased(GenericGridBased):
     @property
     def legend_parameters(self):
         """Legend parameters for solar access analysis."""
+        from ladybug.color import Colorset
+        from ladybug.legend import LegendParameters
         col = Colorset.ecotect()
         return LegendParameters(0, None, colors=col)
 
@@ -301,6 +304,9 @@ class SolarAccessGridBased(GenericGridBased):
         if header:
             self._commands.append(self.header(project_folder))
 
+        # compile opaque meshes before they are used in the scene
+        self._commands.extend(self.opaque_rad_file.mesh_commands)
+
         # TODO(Mostapha): add window_groups here if any!
         # # 4.1.prepare oconv
         oct_scene_files = opqfiles + glzfiles + wgsfiles + [suns_geo] + \
@@ -330,8 +336,8 @@ class SolarAccessGridBased(GenericGridBased):
                                       transpose)
         # # 4.3 write batch file
         self._commands.append(oc.to_rad_string())
-        self._commands.append(rct.to_rad_string())
-        self._commands.append(rmtx.to_rad_string())
+        # rcontrib results are piped to rmtxop
+        self._commands.extend(cmd.to_rad_string() for cmd in pipe_commands((rct, rmtx)))
 
         self._result_files = os.path.join(project_folder, str(rmtx.output_file))
 
@@ -266,6 +266,9 @@ class ThreePhaseGridBased(DaylightCoeffGridBased):
         if header:
             self.commands.append(self.header(project_folder))
 
+        # compile opaque meshes before they are used in the scene
+        self.commands.extend(self.opaque_rad_file.mesh_commands)
+
         # # 2.1.Create sky matrix.
         # # 2.2. Create sun matrix
         skycommands, skyfiles = get_commands_sky(project_folder, self.sky_matrix,
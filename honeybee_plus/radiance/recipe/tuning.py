@@ -0,0 +1,205 @@
+"""Find the cheapest Radiance parameters for a grid-based recipe.
+
+The tuner runs the recipe for a random sample of the analysis points with increasing
+parameter levels. After each run the results are compared with the results of the
+previous level. Once the difference between two successive levels is less than the
+tolerance the lower level is considered converged and will be used for the full run.
+Confirming a level always runs the sample for the next level, levels after that are
+never executed.
+
+The difference is the root mean square of the changes in the values divided by the
+mean of the values of the higher level. By default the value for each point is the
+sum of the values for all the hours.
+
+Usage:
+    tuner = ParameterTuner(recipe, tolerance=0.02, sample_size=50)
+    recipe.radiance_parameters = tuner.tune('c:/ladybug', 'room_tuning')
+    for level in tuner.levels:
+        print(level)
+"""
+from ..analysisgrid import AnalysisGrid
+
+from copy import copy, deepcopy
+import math
+import random
+import time
+
+# parameters which will be changed for each level and how to change them
+AMBIENT_STEPS = (
+    ('ambient_bounces', lambda v: v + 1),
+    ('ambient_divisions', lambda v: v * 2),
+    ('ambient_supersamples', lambda v: v * 2),
+    ('ambient_resolution', lambda v: v * 2),
+    ('ambient_accuracy', lambda v: v * 0.5),
+    ('limit_weight', lambda v: v * 0.5)
+)
+
+
+def parameter_levels(radiance_parameters, count=4):
+    """Create a list of Radiance parameters with increasing ambient settings.
+
+    The first level is a copy of the input parameters. For the next levels ambient
+    bounces is increased by one, ambient divisions, super-samples and resolution are
+    doubled and ambient accuracy and limit weight are halved.
+
+    Args:
+        radiance_parameters: Radiance parameters for the first level (e.g.
+            RtraceParameters or RfluxmtxParameters).
+        count: Number of levels (Default: 4).
+    """
+    levels = [deepcopy(radiance_parameters)]
+    for _ in range(count - 1):
+        par = deepcopy(levels[-1])
+        for name, step in AMBIENT_STEPS:
+            value = getattr(par, name, None)
+            if value is None or getattr(value, '_value', value) is None:
+                continue
+            setattr(par, name, step(value))
+        levels.append(par)
+    return levels
+
+
+def sample_analysis_grids(analysis_grids, sample_size, seed=None):
+    """Create an analysis grid from a random sample of points in analysis grids.
+
+    Args:
+        analysis_grids: A list of analysis grids.
+        sample_size: Number of points in the sample. All the points will be used if
+            the grids have less points.
+        seed: An optional seed for the random sample.
+    """
+    points, vectors = [], []
+    for ag in analysis_grids:
+        points.extend(ag.points)
+        vectors.extend(ag.vectors)
+    indexes = range(len(points))
+    if sample_size < len(points):
+        indexes = sorted(random.Random(seed).sample(indexes, sample_size))
+    return AnalysisGrid.from_points_and_vectors(
+        [points[i] for i in indexes], [vectors[i] for i in indexes], 'tuning_sample')
+
+
+def relative_difference(values, reference):
+    """Root mean square of difference between two lists divided by reference mean."""
+    assert len(values) == len(reference), \
+        'Number of values ({}) does not match the reference ({}).'.format(
+            len(values), len(reference))
+    if not reference:
+        return 0
+    rms = math.sqrt(sum((v - r) ** 2 for v, r in zip(values, reference)) /
+                    len(reference))
+    mean = abs(sum(reference)) / float(len(reference))
+    if mean == 0:
+        return 0 if rms == 0 else float('inf')
+    return rms / mean
+
+
+class TuningLevel(object):
+    """Results for a parameter level.
+
+    Attributes:
+        radiance_parameters: Radiance parameters for this level.
+        wall_time: Time in seconds to run the sample.
+        values: A list of values for sample points.
+        difference: Relative difference to the next level. None if the next level is
+            not executed.
+    """
+
+    __slots__ = ('radiance_parameters', 'wall_time', 'values', 'difference')
+
+    def __init__(self, radiance_parameters, wall_time, values, difference=None):
+        self.radiance_parameters = radiance_parameters
+        self.wall_time = wall_time
+        self.values = values
+        self.difference = difference
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        return 'TuningLevel::{:.2f}s::{}::{}'.format(
+            self.wall_time,
+            '-' if self.difference is None else '{:.4f}'.format(self.difference),
+            self.radiance_parameters.to_rad_string())
+
+
+class ParameterTuner(object):
+    """Find the cheapest Radiance parameters which meet a tolerance.
+
+    Attributes:
+        recipe: A grid-based recipe with radiance_parameters (e.g. point-in-time or
+            daylight coefficient grid-based recipes). The recipe itself will not be
+            changed.
+        tolerance: Maximum relative difference between two successive levels
+            (Default: 0.02).
+        sample_size: Number of analysis points for tuning runs (Default: 100).
+        radiance_parameters: A list of Radiance parameters with increasing quality.
+            By default 4 levels will be created from recipe.radiance_parameters using
+            parameter_levels.
+        seed: Seed for the random sample of the points (Default: 0).
+    """
+
+    def __init__(self, recipe, tolerance=0.02, sample_size=100, radiance_parameters=None,
+                 seed=0):
+        assert hasattr(recipe, 'radiance_parameters') and \
+            hasattr(recipe, 'analysis_grids'), \
+            'Only grid-based recipes with radiance_parameters can be tuned not {}.' \
+            .format(type(recipe))
+        self.recipe = recipe
+        self.tolerance = tolerance
+        self.sample_size = sample_size
+        self.radiance_parameters = radiance_parameters or \
+            parameter_levels(recipe.radiance_parameters)
+        self.seed = seed
+        self.levels = []
+
+    def sample_recipe(self):
+        """Create a copy of the recipe for the sample points."""
+        recipe = copy(self.recipe)
+        recipe._commands = []
+        recipe._result_files = []
+        recipe.analysis_grids = (sample_analysis_grids(
+            self.recipe.analysis_grids, self.sample_size, self.seed),)
+        return recipe
+
+    def run_level(self, recipe, target_folder, project_name):
+        """Run the sample recipe and return the values for the sample points.
+
+        Overwrite this method to use a different metric. By default the value for
+        each point is the sum of total values for all the hours.
+        """
+        command_file = recipe.write(target_folder, project_name)
+        recipe.run(command_file)
+        return [value[0] for ag in recipe.results()
+                for value in ag.sum_values_by_id()]
+
+    def tune(self, target_folder, project_name='tuning'):
+        """Run the levels until the results converge.
+
+        Returns:
+            Radiance parameters for the cheapest level that meets the tolerance. If
+            none of the levels meets the tolerance the last level will be returned.
+        """
+        recipe = self.sample_recipe()
+        self.levels = []
+        for count, par in enumerate(self.radiance_parameters):
+            recipe.radiance_parameters = deepcopy(par)
+            start = time.time()
+            # recipes also use the project name as a prefix for the files
+            values = self.run_level(recipe, target_folder,
+                                    '{}_level_{}'.format(project_name, count))
+            level = TuningLevel(par, time.time() - start, values)
+            if self.levels:
+                previous = self.levels[-1]
+                previous.difference = relative_difference(previous.values, values)
+                print('Parameter level {} [{:.2f}s]: difference {:.4f}'.format(
+                    count - 1, previous.wall_time, previous.difference))
+                if previous.difference <= self.tolerance:
+                    self.levels.append(level)
+                    return previous.radiance_parameters
+            self.levels.append(level)
+
+        print('Results did not converge to {} for any of the levels. '
+              'Using the last level.'.format(self.tolerance))
+        return self.levels[-1].radiance_parameters
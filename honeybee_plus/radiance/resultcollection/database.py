@@ -4,6 +4,7 @@ from ..recipe.id import COMBINEDRECIPEIDS, FLOATRECIPEIDS
 from ..recipe.id import get_id as get_recipe_id
 from ..recipe.id import get_name as get_recipe_name
 from ..recipe.id import is_point_in_time as is_recipe_pit
+from ..quantization import LinearQuantizer
 import contextlib
 from datetime import timedelta
 import os
@@ -22,6 +23,8 @@ class Database(object):
     The database currently only supports grid-based simulations.
     """
     BASESOURCEID = 1000000
+    # sqlite stores integers between -32768 and 32767 in 2 bytes
+    QUANTIZATIONBITS = 15
 
     def __init__(self, filepath='radout.db', remove_if_exist=False):
         """Initate database.
@@ -82,6 +85,13 @@ class Database(object):
                 FOREIGN KEY (grid_id) REFERENCES Grid(id)
                 );"""
 
+        # optional scale for storing grid results as quantized values
+        quantization_table_schema = """CREATE TABLE IF NOT EXISTS Quantization (
+                grid_id INTEGER PRIMARY KEY,
+                scale REAL NOT NULL,
+                FOREIGN KEY (grid_id) REFERENCES Grid(id)
+                );"""
+
         print('connecting to database at: {}'.format(filepath))
         conn = lite.connect(filepath)
         conn.execute('PRAGMA synchronous=OFF')
@@ -94,6 +104,7 @@ class Database(object):
         # create table for sources and place holder for results
         c.execute(source_table_schema)
         c.execute(source_grid_table_schema)
+        c.execute(quantization_table_schema)
 
         # add sky as the first light source if it doesn't exsit
         c.execute(
@@ -326,6 +337,44 @@ class Database(object):
         command = """SELECT count FROM Grid ORDER BY id;"""
         return tuple(c[0] for c in self.execute(command))
 
+    def set_grid_quantizer(self, grid_id, quantizer):
+        """Store the results for an analysis grid as quantized values.
+
+        Results will be stored as int(value / scale) and will be decoded by result
+        collections on read. The absolute error is at most scale / 2. Since the codes
+        are linear they can still be added together in the database for several
+        sources. Use LinearQuantizer.from_max_value(max_value, 15) to keep all the
+        codes in 2 bytes. Set the quantizer before loading the results.
+
+        Args:
+            grid_id: Analysis grid id.
+            quantizer: A LinearQuantizer. Set to None to remove the quantizer.
+        """
+        if not quantizer:
+            self.execute("""DELETE FROM Quantization WHERE grid_id=?;""", (grid_id,))
+            return
+        assert isinstance(quantizer, LinearQuantizer), \
+            'Results can only be stored with a LinearQuantizer not {}.' \
+            .format(type(quantizer))
+        self.execute(
+            """INSERT OR REPLACE INTO Quantization (grid_id, scale) VALUES (?, ?);""",
+            (grid_id, quantizer.scale))
+
+    def grid_quantizer(self, grid_id):
+        """Get LinearQuantizer for an analysis grid or None if it is not quantized."""
+        scale = self.execute(
+            """SELECT scale FROM Quantization WHERE grid_id=?;""", (grid_id,))
+        if not scale:
+            return None
+        return LinearQuantizer(scale[0][0], self.QUANTIZATIONBITS)
+
+    @property
+    def grid_quantizers(self):
+        """A dictionary of grid_id: LinearQuantizer for quantized grids."""
+        scales = self.execute("""SELECT grid_id, scale FROM Quantization;""")
+        return {gid: LinearQuantizer(scale, self.QUANTIZATIONBITS)
+                for gid, scale in scales}
+
     def add_result_tables(self, recipe_id):
         """Add result tables to database.
 
@@ -410,6 +459,59 @@ class Database(object):
 
             return table_names
 
+    @staticmethod
+    def _time_major_index_name(table_name):
+        """Name of time-major index for a result table."""
+        return '%s_time_major' % table_name
+
+    def has_time_major_index(self, table_name):
+        """Check if time-major index is already created for a result table."""
+        command = """SELECT name FROM sqlite_master WHERE type='index' AND name=?;"""
+        return bool(self.execute(command, (self._time_major_index_name(table_name),)))
+
+    def add_time_major_index(self, table_name, column_name='value'):
+        """Add a time-major covering index to a result table.
+
+        Result tables are sorted by their primary key (sensor_id, grid_id, source_id,
+        moy) which is the right order for loading the results from files and for
+        annual metrics. Getting the values for all the sensors at a single hour against
+        this order requires a full scan of the table. This index sorts the rows by
+        (moy, grid_id, source_id, sensor_id) and also includes the value so hourly
+        queries can be answered from the index without touching the table.
+
+        For point-in-time tables the index is created on (grid_id, source_id,
+        sensor_id).
+
+        The index is only created once and it will be kept up to date by sqlite for
+        newly added results. Keep in mind that it roughly doubles the size of the
+        table on disk.
+
+        Args:
+            table_name: Name of result table.
+            column_name: Name of value column (default: value).
+
+        Returns:
+            True if a new index is created and False if it already existed.
+        """
+        if self.has_time_major_index(table_name):
+            return False
+
+        columns = ['grid_id', 'source_id', 'sensor_id', column_name]
+        if self.is_column(table_name, 'moy'):
+            columns.insert(0, 'moy')
+
+        command = """CREATE INDEX IF NOT EXISTS %s ON %s (%s);""" % (
+            self._time_major_index_name(table_name), table_name, ', '.join(columns))
+
+        print('Creating time-major index for {}.'.format(table_name))
+        self.execute(command)
+        return True
+
+    def remove_time_major_index(self, table_name):
+        """Remove time-major index from a result table if it exists."""
+        self.execute(
+            """DROP INDEX IF EXISTS %s;""" % self._time_major_index_name(table_name))
+
     def add_analysis_grids(self, analysis_grids):
         """Add an analysis grids to database."""
         sensor_command = """
@@ -506,6 +608,7 @@ class Database(object):
 
         num_type = int if integer else float
         ptc = self.point_count
+        quantizers = self.grid_quantizers if integer else {}
 
         # for now there will be only sky source
         source_id = 0
@@ -527,9 +630,11 @@ class Database(object):
             cursor.execute('BEGIN')
             with open(filepath) as inf:
                 for grid_id, pt_count in enumerate(ptc):
+                    encode = quantizers[grid_id].encode \
+                        if grid_id in quantizers else num_type
                     for sensor_id in range(pt_count):
                         value = float(next(inf)) / divide_by
-                        values.append((sensor_id, grid_id, source_id, num_type(value)))
+                        values.append((sensor_id, grid_id, source_id, encode(value)))
                         if len(values) % 250 == 0:
                             cursor.executemany(command, values)
                             values = []
@@ -862,6 +967,7 @@ class Database(object):
         total_rows = ptc[0] * len(moys)
         # for now there will be only sky source
         source_id = self.source_id(source, state)
+        quantizers = self.grid_quantizers
 
         db = lite.connect(self.db_filepath, isolation_level=None)
         # Set journal mode to WAL.
@@ -896,6 +1002,8 @@ class Database(object):
                 n = 0
                 pr_count = 1000000
                 for grid_id, pt_count in enumerate(ptc):
+                    encode = quantizers[grid_id].encode if grid_id in quantizers \
+                        else int
                     for sensor_id in range(pt_count):
                         tl = next(inf)
                         for count, tv in enumerate(tl.split('\t')):
@@ -904,7 +1012,7 @@ class Database(object):
                             except IndexError:
                                 # extra tab at the end of the file.
                                 continue
-                            value = int(float(tv))
+                            value = encode(float(tv))
                             values.append((sensor_id, grid_id, source_id, moy, value))
 
                             if len(values) % pr_count == 0:
@@ -90,7 +90,7 @@ class ImageCollection(object):
         if not self.has_values:
             return []
         else:
-            return sorted(self._values[0][0].keys())
+            return sorted(moy / 60.0 for moy in self._values[0][0].keys())
 
     def source_id(self, source):
         """Get source id from source name."""
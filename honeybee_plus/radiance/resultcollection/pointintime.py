@@ -10,9 +10,10 @@ from .resultgrid import ResultGrid
 
 class PointInTime(ResultGrid):
 
-    __slots__ = ('_db', '_db_file', '_grid_id', '_recipe_id', '_hoy')
+    __slots__ = ('_db', '_db_file', '_grid_id', '_recipe_id', '_hoy', '_time_major')
 
-    def __init__(self, db_file, grid_id=0, recipe_id=100001, hoy=None):
+    def __init__(self, db_file, grid_id=0, recipe_id=100001, hoy=None,
+                 time_major_index=True):
         """Result collection for point-in-time daylight studies.
 
         Use this PointInTime result grid to load the results from database for daylight
@@ -27,8 +28,10 @@ class PointInTime(ResultGrid):
             recipe_id: A 6 digit number to identify study type.
                 See radiance.recipe.id.IDS for full list of ids.
             hoy: Hour of the year for this results.
+            time_major_index: Set to True to create an index for the result table on
+                the first call to values (default: True).
         """
-        ResultGrid.__init__(self, db_file, grid_id, recipe_id)
+        ResultGrid.__init__(self, db_file, grid_id, recipe_id, time_major_index)
         self._hoy = hoy
 
     @property
@@ -108,9 +111,11 @@ class PointInTime(ResultGrid):
 
         if not source_ids:
             # input was all -1. return 0s
-            return tuple(0 for point in self.point_count)
+            return tuple(0 for point in range(self.point_count))
 
-        elif len(sources) == 1 or len(source_ids) == 1:
+        self._ensure_time_major_index()
+
+        if len(sources) == 1 or len(source_ids) == 1:
             # the scene only has one result or the result for one source is requested
             last_gid = self.db.last_grid_id
             source_count = self.source_count
@@ -135,7 +140,7 @@ class PointInTime(ResultGrid):
                 command = """SELECT value FROM %s
                     WHERE source_id=? AND grid_id=? ORDER BY sensor_id;""" \
                     % self.recipe_name
-                results = self.execute(command, (source_ids, self.grid_id))
+                results = self.execute(command, (source_ids[0], self.grid_id))
         else:
             # from several sources
             command = \
@@ -144,7 +149,7 @@ class PointInTime(ResultGrid):
                 % (self.recipe_name, ', '.join(str(sid) for sid in source_ids))
             results = self.execute(command, (self.grid_id,))
 
-        return tuple(r[0] for r in results)
+        return self._decode((r[0] for r in results), self.quantizer)
 
     def __repr__(self):
         """Result Grid."""
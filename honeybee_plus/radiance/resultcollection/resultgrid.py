@@ -41,9 +41,9 @@ except ImportError:
 
 class ResultGrid(object):
 
-    __slots__ = ('_db', '_db_file', '_grid_id', '_recipe_id', '_hoy')
+    __slots__ = ('_db', '_db_file', '_grid_id', '_recipe_id', '_hoy', '_time_major')
 
-    def __init__(self, db_file, grid_id, recipe_id):
+    def __init__(self, db_file, grid_id, recipe_id, time_major_index=True):
         """Result collection base class for daylight studies.
 
         Except for development do not use this class directly.
@@ -55,12 +55,18 @@ class ResultGrid(object):
                 AnalysisResult.
             recipe_id: A 6 digit number to identify study type.
                 See radiance.recipe.id.IDS for full list of ids.
+            time_major_index: Set to True to create a time-major index for the result
+                table on the first hourly query. Hourly queries will be much faster
+                after the index is created but the database file will also be larger
+                (default: True).
         """
         assert os.path.isfile(db_file), \
             'Failed to find {}'.format(db_file)
         self._db = Database(db_file, remove_if_exist=False)
         self._db_file = db_file
         self._grid_id = grid_id
+        # None means it is not checked yet
+        self._time_major = None if time_major_index else False
         self.recipe_id = recipe_id
 
     @property
@@ -195,6 +201,38 @@ class ResultGrid(object):
         """
         raise NotImplementedError()
 
+    @property
+    def quantizer(self):
+        """LinearQuantizer for stored values or None if values are not quantized."""
+        return self.db.grid_quantizer(self.grid_id)
+
+    @staticmethod
+    def _decode(values, quantizer):
+        """Decode a tuple of stored values if the grid is quantized."""
+        if not quantizer:
+            return tuple(values)
+        decode = quantizer.decode
+        return tuple(decode(v) if v is not None else v for v in values)
+
+    @property
+    def has_time_major_index(self):
+        """Check if the result table has a time-major index."""
+        return self.db.has_time_major_index(self.recipe_name)
+
+    def build_time_major_index(self):
+        """Create a time-major index for the result table.
+
+        This method is called on the first hourly query if time_major_index is set to
+        True. You can also call it directly to create the index in advance.
+        """
+        self.db.add_time_major_index(self.recipe_name)
+        self._time_major = True
+
+    def _ensure_time_major_index(self):
+        """Create time-major index for hourly queries if it is not created yet."""
+        if self._time_major is None:
+            self.build_time_major_index()
+
     def source_id(self, name, state):
         """Get id for a light sources at a specific state.
 
@@ -17,9 +17,9 @@ except ImportError:
 
 class TimeSeries(ResultGrid):
 
-    __slots__ = ('_db', '_db_file', '_grid_id', '_recipe_id')
+    __slots__ = ('_db', '_db_file', '_grid_id', '_recipe_id', '_time_major')
 
-    def __init__(self, db_file, grid_id=0, recipe_id=200000):
+    def __init__(self, db_file, grid_id=0, recipe_id=200000, time_major_index=True):
         """Result collection for point-in-time daylight studies.
 
         Use this PointInTime result grid to load the results from database for daylight
@@ -33,8 +33,10 @@ class TimeSeries(ResultGrid):
                 AnalysisResult.
             recipe_id: A 6 digit number to identify study type.
                 See radiance.recipe.id.IDS for full list of ids.
+            time_major_index: Set to True to create a time-major index for the result
+                table on the first call to values_hourly (default: True).
         """
-        ResultGrid.__init__(self, db_file, grid_id, recipe_id)
+        ResultGrid.__init__(self, db_file, grid_id, recipe_id, time_major_index)
 
     @property
     def recipe_id(self):
@@ -108,9 +110,12 @@ class TimeSeries(ResultGrid):
 
         if not source_ids:
             # input was all -1. return 0s
-            return tuple(0 for point in self.point_count)
+            return tuple(0 for point in range(self.point_count))
 
-        elif len(sources) == 1 or len(source_ids) == 1:
+        # sort results by moy for fast hourly queries
+        self._ensure_time_major_index()
+
+        if len(sources) == 1 or len(source_ids) == 1:
             # the scene only has one result or the result for one source is requested
             last_gid = self.db.last_grid_id
             source_count = self.source_count
@@ -137,7 +142,7 @@ class TimeSeries(ResultGrid):
                 command = """SELECT value FROM %s
                     WHERE moy=? AND source_id=? AND grid_id=? ORDER BY sensor_id;""" \
                     % self.recipe_name
-                results = self.execute(command, (moy, source_ids, self.grid_id))
+                results = self.execute(command, (moy, source_ids[0], self.grid_id))
         else:
             # from several sources
             command = \
@@ -146,7 +151,7 @@ class TimeSeries(ResultGrid):
                 % (self.recipe_name, ', '.join(str(sid) for sid in source_ids))
             results = self.execute(command, (moy, self.grid_id,))
 
-        return tuple(r[0] for r in results)
+        return self._decode((r[0] for r in results), self.quantizer)
 
     def values(self, hoys=None, sids_hourly=None, group_by=0, direct=False):
         """Get values for several hours from all sources based on state_id.
@@ -289,6 +294,8 @@ class TimeSeries(ResultGrid):
                     ', '.join(str(gid) for gid in gids),
                     ', '.join(str(h * 60) for h in hoys))
 
+        quantizer = self.quantizer
+        decode = self._decode
         db, cursor = self._get_cursor()
         cursor.execute('BEGIN')
         # TODO(@mostapha) October 15 2018: Replace divide chunks with an iterator
@@ -297,7 +304,7 @@ class TimeSeries(ResultGrid):
             results = (r[0] for r in cursor.execute(command, (self.grid_id,)))
             # separate data based on chunk_size
             counter = range(chunk_size)
-            return tuple(tuple(next(results) for i in counter)
+            return tuple(decode((next(results) for i in counter), quantizer)
                          for g in range(group_count))
         except Exception:
             import traceback
@@ -363,6 +370,7 @@ class TimeSeries(ResultGrid):
         # convert state ids to expanded global source ids
         # this method returns a list of 1 and 0s for all sources
         exp_gid = list(self._sids_hourly_to_expanded_gids(sids_hourly))
+        quantizer = self.quantizer
 
         # get the value for all sources and multiply them by exp_gid
         db, cursor = self._get_cursor()
@@ -407,6 +415,8 @@ class TimeSeries(ResultGrid):
             import traceback
             raise Exception(traceback.format_exc())
         else:
+            if quantizer:
+                results = [list(self._decode(r, quantizer)) for r in results]
             return results
         finally:
             cursor.execute('COMMIT')
@@ -0,0 +1,324 @@
+"""Result files for analysis grids with on-demand access to values.
+
+A result file is a Radiance matrix with a row for each sensor and a column for each hour.
+ResultFile keeps the path to the file and reads only the requested rows and columns.
+The first access builds an index of the file which is shared between all the
+ResultFiles with the same path:
+
+    ascii files: Byte offset for the start of each row. Rows are found by seeking to
+        the offset and columns by splitting the row.
+    binary files (FORMAT=float or FORMAT=double): Offsets are calculated from the size
+        of the header and the number of columns and every value is read by seeking to
+        its position.
+
+Usage:
+    rf = ResultFile('c:/ladybug/annual/result/scene..default.ill', range(8760))
+    # values for the first sensor
+    values = rf.sensor_values(0)
+    # values for all the sensors at 12 on January 1st
+    values = rf.hourly_values(12, sensor_count=100)
+"""
+from ..exception import EmptyFileError
+from array import array
+from bisect import bisect_left
+import os
+import struct
+
+import sys
+if (sys.version_info >= (3, 0)):
+    xrange = range
+
+
+class ResultFile(object):
+    """A result file for an AnalysisGrid.
+
+    Attributes:
+        path: Full path to the result file.
+        hoys: A collection of hours of the year for the columns. If None it will be
+            set to range(0, number of columns) on first access.
+        start_line: Index of the row for the first sensor of the grid (default: 0).
+        header: A Boolean to declare if the file has a header (default: True).
+        mode: 0 > integer values, 1 > binary values (0 or 1), 2 or greater > values
+            divided by mode. Similar to AnalysisGrid.set_values_from_file.
+        source: Name of the source for this file (default: None).
+        state: Name of the state for this file (default: None).
+    """
+
+    __slots__ = ('_path', '_hoys', '_start_line', '_header', '_mode', '_source',
+                 '_state')
+
+    # shared index for result files {path: (size, mtime, ResultFileIndex)}
+    _indexes = {}
+
+    def __init__(self, path, hoys=None, start_line=None, header=True, mode=0,
+                 source=None, state=None):
+        self._path = path
+        self._hoys = hoys
+        self._start_line = start_line or 0
+        self._header = header
+        self._mode = mode
+        self._source = source
+        self._state = state
+
+    @property
+    def isResultFile(self):
+        """Return True for ResultFile."""
+        return True
+
+    @property
+    def path(self):
+        """Full path to the result file."""
+        return self._path
+
+    @property
+    def hoys(self):
+        """Hours of the year for the columns of the file."""
+        if self._hoys is None:
+            return xrange(self.index.column_count)
+        return self._hoys
+
+    @property
+    def start_line(self):
+        """Index of the row for the first sensor of the grid."""
+        return self._start_line
+
+    @property
+    def header(self):
+        """A Boolean to declare if the file has a header."""
+        return self._header
+
+    @property
+    def mode(self):
+        """Mode for converting the values."""
+        return self._mode
+
+    @property
+    def source(self):
+        """Name of the source."""
+        return self._source
+
+    @property
+    def state(self):
+        """Name of the state."""
+        return self._state
+
+    @property
+    def index(self):
+        """Offset index for this file. The index will be created on first access."""
+        path = os.path.abspath(self._path)
+        stat = os.stat(path)
+        try:
+            size, mtime, index = self._indexes[path]
+        except KeyError:
+            pass
+        else:
+            if (size, mtime) == (stat.st_size, stat.st_mtime):
+                return index
+
+        index = ResultFileIndex(path, self._header)
+        self._indexes[path] = (stat.st_size, stat.st_mtime, index)
+        return index
+
+    def column_index(self, hoy):
+        """Get index of the column for an hour of the year."""
+        hoys = self.hoys
+        try:
+            return hoys.index(hoy)
+        except (AttributeError, ValueError):
+            # xrange in Python 2 or values which are not exactly the same
+            pass
+        hoys = list(hoys)
+        i = bisect_left(hoys, hoy)
+        if i != len(hoys) and abs(hoys[i] - hoy) < 1e-6:
+            return i
+        raise ValueError('{} is not a valid hour in {}.'.format(hoy, self._path))
+
+    def _convert(self, values):
+        """Convert string or float values based on mode."""
+        mode = self._mode
+        if mode == 0:
+            return tuple(int(float(v)) for v in values)
+        elif mode == 1:
+            return tuple(1 if float(v) > 0 else 0 for v in values)
+        else:
+            return tuple(float(v) / mode for v in values)
+
+    def sensor_values(self, sensor_index, hoys=None):
+        """Get values for a sensor.
+
+        Args:
+            sensor_index: Index of the sensor in the analysis grid.
+            hoys: An optional list of hours. By default all the hours will be returned.
+
+        Returns:
+            A tuple of values for each hour.
+        """
+        return self.values([sensor_index], hoys)[0]
+
+    def hourly_values(self, hoy, sensor_count):
+        """Get values for all the sensors for an hour.
+
+        Args:
+            hoy: An hour of the year.
+            sensor_count: Number of sensors in the analysis grid.
+
+        Returns:
+            A tuple of values for each sensor.
+        """
+        return tuple(v[0] for v in self.values(xrange(sensor_count), [hoy]))
+
+    def values(self, sensor_indexes, hoys=None):
+        """Get values for several sensors and hours.
+
+        Args:
+            sensor_indexes: A list of sensor indexes in the analysis grid.
+            hoys: An optional list of hours. By default all the hours will be returned.
+
+        Returns:
+            A list of tuples. Each tuple includes hourly values for a sensor.
+        """
+        index = self.index
+        columns = None if hoys is None else [self.column_index(h) for h in hoys]
+        rows = [self._start_line + i for i in sensor_indexes]
+        return [self._convert(v) for v in index.read(rows, columns)]
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __iter__(self):
+        """Iterate (path, hoys, start_line, header, mode).
+
+        This keeps the result files compatible with the old namedtuples.
+        """
+        return iter((self._path, self._hoys, self._start_line, self._header,
+                     self._mode))
+
+    def __repr__(self):
+        return 'ResultFile::{}::{}'.format(os.path.split(self._path)[-1],
+                                           self._start_line)
+
+
+class ResultFileIndex(object):
+    """Offset index for a Radiance matrix.
+
+    Attributes:
+        path: Full path to the file.
+        header: A Boolean to declare if the file has a header.
+    """
+
+    __slots__ = ('_path', '_format', '_column_count', '_data_start', '_row_offsets')
+
+    def __init__(self, path, header=True):
+        if os.path.getsize(path) < 2:
+            raise EmptyFileError(path)
+        self._path = path
+        self._format = 'ascii'
+        self._column_count = None
+        self._row_offsets = None
+
+        with open(path, 'rb') as inf:
+            self._data_start = self._parse_header(inf) if header else 0
+            if self._format == 'ascii':
+                self._index_rows(inf)
+
+    def _parse_header(self, inf):
+        """Parse the header and return the start of the data."""
+        ncomp = 1
+        for i in xrange(40):
+            line = inf.readline().decode('ascii', 'replace').strip()
+            if line[:5] == 'NCOLS':
+                self._column_count = int(line.split('=')[-1])
+            elif line[:5] == 'NCOMP':
+                ncomp = int(line.split('=')[-1])
+            elif line[:6] == 'FORMAT':
+                self._format = line.split('=')[-1].strip()
+                break
+        else:
+            raise ValueError('Failed to find FORMAT in header of {}.'.format(self._path))
+
+        inf.readline()  # pass empty line
+        if self._format not in ('ascii', 'float', 'double'):
+            raise ValueError(
+                'Unsupported format for {}: {}'.format(self._path, self._format))
+        if self._format != 'ascii':
+            assert ncomp == 1 and self._column_count, \
+                'Binary result files must have NCOLS and a single component: ' \
+                '{}'.format(self._path)
+        return inf.tell()
+
+    def _index_rows(self, inf):
+        """Find the start of every row in an ascii file."""
+        offsets = array('d')  # double is exact for offsets up to 2 ** 53 bytes
+        pos = self._data_start
+        inf.seek(pos)
+        for line in inf:
+            if line.strip():
+                offsets.append(pos)
+            pos += len(line)
+        self._row_offsets = offsets
+        if self._column_count is None and offsets:
+            inf.seek(int(offsets[0]))
+            self._column_count = len(inf.readline().split())
+
+    @property
+    def format(self):
+        """File format (ascii, float or double)."""
+        return self._format
+
+    @property
+    def column_count(self):
+        """Number of columns."""
+        return self._column_count
+
+    @property
+    def row_count(self):
+        """Number of rows."""
+        if self._row_offsets is not None:
+            return len(self._row_offsets)
+        size = 4 if self._format == 'float' else 8
+        return (os.path.getsize(self._path) - self._data_start) // \
+            (size * self._column_count)
+
+    def read(self, rows, columns=None):
+        """Read values for rows and columns.
+
+        Args:
+            rows: A list of row indexes.
+            columns: An optional list of column indexes. By default all the columns
+                will be returned.
+
+        Returns:
+            A generator of values for each row. Values are strings for ascii files and
+            floats for binary files.
+        """
+        with open(self._path, 'rb') as inf:
+            if self._format == 'ascii':
+                for row in rows:
+                    inf.seek(int(self._row_offsets[row]))
+                    line = inf.readline()
+                    if columns is None:
+                        yield line.split()
+                    else:
+                        # avoid splitting the rest of the row
+                        values = line.split(None, max(columns) + 1)
+                        yield [values[c] for c in columns]
+            else:
+                size, typecode = (4, 'f') if self._format == 'float' else (8, 'd')
+                row_size = size * self._column_count
+                for row in rows:
+                    start = self._data_start + row * row_size
+                    if columns is None:
+                        inf.seek(start)
+                        yield struct.unpack(
+                            '%d%s' % (self._column_count, typecode), inf.read(row_size))
+                    else:
+                        values = []
+                        for c in columns:
+                            inf.seek(start + c * size)
+                            values.append(struct.unpack(typecode, inf.read(size))[0])
+                        yield values
+
+    def __repr__(self):
+        return 'ResultFileIndex::{}::{}x{}'.format(
+            self._format, self.row_count, self._column_count)
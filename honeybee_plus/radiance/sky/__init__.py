@@ -1 +1,13 @@
 """Honeybee skies."""
+from .._lazyimport import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'Analemma': '.analemma',
+    'AnalemmaReversed': '.analemma',
+    'CertainIlluminanceLevel': '.certainIlluminance',
+    'CIE': '.cie',
+    'ClimateBased': '.climatebased',
+    'SkyMatrix': '.skymatrix',
+    'SkyVector': '.skyvector',
+    'SunMatrix': '.sunmatrix'
+})
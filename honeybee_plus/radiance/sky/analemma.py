@@ -3,9 +3,6 @@ from ._skyBase import RadianceSky
 from ..material.light import Light
 from ..geometry.source import Source
 
-from ladybug.epw import EPW
-from ladybug.sunpath import Sunpath
-
 import os
 
 try:
@@ -61,6 +58,7 @@ class Analemma(RadianceSky):
             is_leap_year: A boolean to indicate if hours are for a leap year
                 (default: False).
         """
+        from ladybug.sunpath import Sunpath
         sun_vectors = []
         sun_up_hours = []
         hoys = hoys or range(8760)
@@ -89,6 +87,7 @@ class Analemma(RadianceSky):
             is_leap_year: A boolean to indicate if hours are for a leap year
                 (default: False).
         """
+        from ladybug.sunpath import Sunpath
         sun_vectors = []
         north = north or 0
 
@@ -147,6 +146,7 @@ class Analemma(RadianceSky):
             is_leap_year: A boolean to indicate if hours are for a leap year
                 (default: False).
         """
+        from ladybug.epw import EPW
         return cls.from_location(EPW(epw_file).location, hoys, north, is_leap_year)
 
     @classmethod
@@ -164,6 +164,7 @@ class Analemma(RadianceSky):
             is_leap_year: A boolean to indicate if hours are for a leap year
                 (default: False).
         """
+        from ladybug.epw import EPW
         return cls.from_location_sun_up_hours(EPW(epw_file).location, sun_up_hours,
                                               north, is_leap_year)
 
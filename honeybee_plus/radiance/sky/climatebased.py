@@ -2,7 +2,6 @@ from ._pointintimesky import PointInTimeSky
 from ..command.gendaylit import Gendaylit
 
 from ladybug.location import Location
-from ladybug.wea import Wea
 
 
 class ClimateBased(PointInTimeSky):
@@ -60,6 +59,7 @@ class ClimateBased(PointInTimeSky):
     @classmethod
     def from_wea(cls, wea, month, day, hour, north=0, suffix=None):
         """Create sky from wea file."""
+        from ladybug.wea import Wea
         assert isinstance(wea, Wea), \
             TypeError('Expected WEA not {}.'.format(type(wea)))
 
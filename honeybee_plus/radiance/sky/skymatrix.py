@@ -1,4 +1,3 @@
-from ladybug.wea import Wea
 from ._skyBase import RadianceSky
 from ..command.gendaymtx import Gendaymtx
 from ..parameters.gendaymtx import GendaymtxParameters
@@ -54,6 +53,7 @@ class SkyMatrix(RadianceSky):
             "suffix": string //Suffix for sky matrix
             }
         """
+        from ladybug.wea import Wea
         wea = Wea.from_dict(rec_json["wea"])
         return cls(wea, rec_json["sky_density"], rec_json["north"],
                    rec_json["hoys"], rec_json["mode"], rec_json["suffix"])
@@ -62,6 +62,7 @@ class SkyMatrix(RadianceSky):
     def from_epw_file(cls, epw_file, sky_density=1, north=0,
                       hoys=None, mode=0, suffix=None):
         """Create sky from an epw file."""
+        from ladybug.wea import Wea
         return cls(Wea.from_epw_file(epw_file), sky_density, north, hoys, mode,
                    suffix=suffix)
 
@@ -87,6 +88,7 @@ class SkyMatrix(RadianceSky):
 
     @wea.setter
     def wea(self, w):
+        from ladybug.wea import Wea
         assert isinstance(w, Wea), \
             TypeError('wea must be a WEA object not a {}'.format(type(w)))
         self._wea = w
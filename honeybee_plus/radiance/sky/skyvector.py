@@ -4,7 +4,6 @@ from ..command.gensky import Gensky
 from ..command.gendaylit import Gendaylit
 from ..parameters.gendaylit import GendaylitParameters
 
-from ladybug.epw import EPW
 from ladybug.dt import DateTime
 import os
 
@@ -69,6 +68,7 @@ class SkyVector(RadianceSky):
             sky_density: A positive intger for sky density. [1] Tregenza Sky,
                 [2] Reinhart Sky, etc. (Default: 1)
         """
+        from ladybug.epw import EPW
         epw = EPW(epw_file)
         location = epw.location
         hoy = DateTime(month, day, hour).hoy
@@ -3,8 +3,6 @@ from .gendaylit import gendaylit
 from .analemma import AnalemmaReversed
 
 from ladybug.dt import DateTime
-from ladybug.sunpath import Sunpath
-from ladybug.wea import Wea
 from ladybug.location import Location
 
 import os
@@ -124,6 +122,7 @@ class SunMatrix(RadianceSky):
     @classmethod
     def from_epw_file(cls, epw_file, north=0, hoys=None, output_type=0):
         """Create sun matrix from an epw file."""
+        from ladybug.wea import Wea
         return cls.from_wea(Wea.from_epw_file(epw_file), north, hoys, output_type)
 
     @classmethod
@@ -210,6 +209,7 @@ class SunMatrix(RadianceSky):
 
         This method is called everytime that output type is set.
         """
+        from ladybug.sunpath import Sunpath
         month_date_time = (DateTime.from_hoy(idx, is_leap_year) for idx in hoys)
 
         sp = Sunpath.from_location(wea.location, north)
@@ -1,4 +1,6 @@
 """Radiance scene."""
+from .radfile import RadFile
+
 from collections import namedtuple
 import zipfile
 import base64
@@ -54,6 +56,13 @@ class StaticScene(object):
                 tuple(f for f in fs if f.lower().endswith('.rad')),
                 tuple(f for f in fs if f.lower().endswith('.oct')))
 
+    def to_rad_file(self):
+        """Import materials and geometries from mat and rad files as a RadFile.
+
+        Geometries are imported as compact arrays. See RadFile.from_file.
+        """
+        return RadFile.from_file(self.files.mat + self.files.rad)
+
     def to_rad_string(self):
         """Return list of files as single string."""
         return ''.join(fp for f in self.files for fp in f)
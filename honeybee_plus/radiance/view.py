@@ -67,19 +67,19 @@ class View(object):
             print(g)
 
         > -vtv -vp 0.000 0.000 0.000 -vd 0.000 0.000 1.000 -vu 0.000 1.000
-           0.000 -vh 29.341 -vv 32.204 -x 300 -y 300 -vs -0.500 -vl -0.500
+           0.000 -vh 32.204 -vv 32.204 -x 300 -y 300 -vs -0.500 -vl -0.500
            -vo 100.000
 
         > -vtv -vp 0.000 0.000 0.000 -vd 0.000 0.000 1.000 -vu 0.000 1.000
-           0.000 -vh 29.341 -vv 32.204 -x 300 -y 300 -vs 0.500 -vl -0.500
+           0.000 -vh 32.204 -vv 32.204 -x 300 -y 300 -vs 0.500 -vl -0.500
            -vo 100.000
 
         > -vtv -vp 0.000 0.000 0.000 -vd 0.000 0.000 1.000 -vu 0.000 1.000
-           0.000 -vh 29.341 -vv 32.204 -x 300 -y 300 -vs -0.500 -vl 0.500
+           0.000 -vh 32.204 -vv 32.204 -x 300 -y 300 -vs -0.500 -vl 0.500
            -vo 100.000
 
         > -vtv -vp 0.000 0.000 0.000 -vd 0.000 0.000 1.000 -vu 0.000 1.000
-          0.000 -vh 29.341 -vv 32.204 -x 300 -y 300 -vs 0.500 -vl 0.500
+          0.000 -vh 32.204 -vv 32.204 -x 300 -y 300 -vs 0.500 -vl 0.500
           -vo 100.000
     """
 
@@ -243,17 +243,22 @@ class View(object):
     def calculate_view_grid(self, x_div_count=1, y_div_count=1):
         """Return a list of views for grid of views.
 
-        Views will be returned row by row from right to left.
+        Views will be returned row by row from bottom-left to top-right. The view
+        with index i is at column i % x_div_count and row i // x_div_count from the
+        bottom of the original view. For perspective and parallel views the tiles
+        cover the original view without gaps or overlaps and can be stitched back
+        together (e.g. using pcompos).
+
         Args:
             x_div_count: Set number of divisions in x direction (Default: 1).
             y_div_count: Set number of divisions in y direction (Default: 1).
         Returns:
-            A tuple of views. Views are sorted row by row from right to left.
+            A list of views. Views are sorted row by row from bottom-left to top-right.
         """
         PI = math.pi
         try:
-            x_div_count = abs(x_div_count)
-            y_div_count = abs(y_div_count)
+            x_div_count = abs(int(x_div_count))
+            y_div_count = abs(int(y_div_count))
         except TypeError as e:
             raise ValueError("Division count should be a number.\n%s" % str(e))
 
@@ -262,9 +267,9 @@ class View(object):
         if x_div_count == y_div_count == 1:
             return [self]
 
-        _views = range(x_div_count * y_div_count)
-        _x = int(self.x_resolution / x_div_count)
-        _y = int(self.y_resolution / y_div_count)
+        x_res, y_res = self.pixel_resolution()
+        _x = int(x_res / x_div_count)
+        _y = int(y_res / y_div_count)
 
         if self.view_type == 2:
             # parallel view (vtl)
@@ -274,7 +279,7 @@ class View(object):
         elif self.view_type == 0:
             # perspective (vtv)
             _vh = (2. * 180. / PI) * \
-                math.atan(((PI / 180. / 2.) * self.view_h_size) / x_div_count)
+                math.atan(math.tan((PI / 180. / 2.) * self.view_h_size) / x_div_count)
             _vv = (2. * 180. / PI) * \
                 math.atan(math.tan((PI / 180. / 2.) * self.view_v_size) / y_div_count)
 
@@ -290,24 +295,17 @@ class View(object):
             return [self]
 
         # create a set of new views
-        for viewCount in range(len(_views)):
+        _views = []
+        for viewCount in range(x_div_count * y_div_count):
             # calculate view shift and view lift
-            if x_div_count == 1:
-                _vs = 0
-            else:
-                _vs = (((viewCount % x_div_count) / (x_div_count - 1)) - 0.5) \
-                    * (x_div_count - 1)
-
-            if y_div_count == 1:
-                _vl = 0
-            else:
-                _vl = ((int(viewCount / y_div_count) / (y_div_count - 1)) - 0.5) \
-                    * (y_div_count - 1)
+            _vs = viewCount % x_div_count - (x_div_count - 1) / 2.0
+            _vl = viewCount // x_div_count - (y_div_count - 1) / 2.0
 
             # create a copy from the current copy
             _nView = deepcopy(self)
 
             # update parameters
+            _nView.name = '%s_%d' % (self.name, viewCount)
             _nView.view_h_size = _vh
             _nView.view_v_size = _vv
             _nView.x_resolution = _x
@@ -316,10 +314,32 @@ class View(object):
             _nView.view_lift = _vl
 
             # add the new view to views list
-            _views[viewCount] = _nView
+            _views.append(_nView)
 
         return _views
 
+    def pixel_resolution(self):
+        """Get the image resolution for square pixels as (x, y).
+
+        Similar to rpict with the default pixel aspect ratio (-pa 1) the resolution
+        is reduced in one direction to match the aspect ratio of the view. For view
+        types other than perspective and parallel the resolution will not change.
+        """
+        x_res, y_res = int(self.x_resolution), int(self.y_resolution)
+        vh, vv = float(self.view_h_size), float(self.view_v_size)
+        if self.view_type == 0:
+            aspect = math.tan(math.radians(vv) / 2.0) / math.tan(math.radians(vh) / 2.0)
+        elif self.view_type == 2:
+            aspect = vv / vh
+        else:
+            return x_res, y_res
+
+        if y_res / float(x_res) > aspect:
+            y_res = int(x_res * aspect + 0.5)
+        else:
+            x_res = int(y_res / aspect + 0.5)
+        return x_res, y_res
+
     def add_fore_clip(self, distance):
         """Set view fore clip (-vo) at a distance from the view point.
 
@@ -352,9 +372,9 @@ class View(object):
         __viewComponents = [_view, _viewSize]
 
         # add lift and shift if not 0
-        if self.view_lift != 0 and self.view_shift != 0:
+        if self.view_lift or self.view_shift:
             __viewComponents.append(
-                "-vs %.3f -vl %.3f" % (self.view_shift, self.view_lift)
+                "-vs %.3f -vl %.3f" % (self.view_shift or 0, self.view_lift or 0)
             )
 
         if self.__viewForeClip:
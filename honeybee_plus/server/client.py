@@ -1,26 +1,196 @@
-import urllib2
-from mpupload import MultiPartForm
+"""Honeybee server libraries."""
+from .mpupload import MultiPartForm
 
+import hashlib
+import json
+import os
+import socket
 
-class Client():
-    """Client class for honeybee to set requests to server."""
+try:
+    from http.client import HTTPConnection, HTTPSConnection, HTTPException
+    from urllib.parse import urlsplit
+except ImportError:
+    # python 2
+    from httplib import HTTPConnection, HTTPSConnection, HTTPException
+    from urlparse import urlsplit
 
-    def __init__(self, url):
+
+class Client(object):
+    """Client class for honeybee to send requests to server.
+
+    The connection to the server is kept open and reused for the following requests.
+
+    Attributes:
+        url: Server url for uploads (e.g. http://localhost:8000/upload).
+        chunk_size: Size of each chunk in bytes for chunked uploads (Default: 8 MB).
+        retries: Number of times to retry a chunk before giving up (Default: 3).
+        timeout: Optional time out in seconds for the connection.
+
+    Usage:
+        client = Client('http://localhost:8000/upload')
+        client.upload_file('c:/ladybug/room.zip')
+        # upload a large file in chunks. Run it again to resume a failed upload.
+        client.upload_file_chunked('c:/ladybug/annual.zip')
+        client.close()
+    """
+
+    def __init__(self, url, chunk_size=8 * 1024 * 1024, retries=3, timeout=None):
         self.url = url
+        self.chunk_size = chunk_size
+        self.retries = retries
+        self.timeout = timeout
         self.headers = {
             'Content-Type': 'application/zip'
         }
+        self._connection = None
+
+    @property
+    def path(self):
+        """Path to upload url on server."""
+        return urlsplit(self.url).path.rstrip('/') or ''
+
+    def _connect(self):
+        parsed = urlsplit(self.url)
+        connection = HTTPSConnection if parsed.scheme == 'https' else HTTPConnection
+        if self.timeout is None:
+            return connection(parsed.netloc)
+        return connection(parsed.netloc, timeout=self.timeout)
+
+    def close(self):
+        """Close the connection to the server."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def request(self, method, path, body=None, headers=None):
+        """Send a request to the server.
+
+        If the connection has been closed by the server the request will be sent once
+        more using a new connection. Requests with a file-like body are not sent again.
+
+        Returns:
+            A tuple of (status, data).
+        """
+        for attempt in range(2):
+            if self._connection is None:
+                self._connection = self._connect()
+            try:
+                self._connection.request(method, path, body, headers or {})
+                response = self._connection.getresponse()
+                return response.status, response.read()
+            except (socket.error, HTTPException):
+                self.close()
+                if attempt or not (body is None or isinstance(body, bytes)):
+                    raise
+
+    def _request_json(self, method, path, data=None, expected=(200,)):
+        """Send a JSON request and return the JSON response."""
+        body = json.dumps(data).encode('utf-8') if data is not None else None
+        headers = {'Content-Type': 'application/json'} if body else {}
+        status, data = self.request(method, path, body, headers)
+        if status not in expected:
+            raise IOError('{} {} failed [{}]: {}'.format(method, path, status, data))
+        return json.loads(data.decode('utf-8')) if data else {}
 
     def upload_file(self, filename):
-        """Upload a file and send it to the server."""
+        """Upload a file as a multipart form.
+
+        The file is streamed from disk and is never loaded to memory.
+        """
         form = MultiPartForm()
-        # add file
-        form.add_file('file', filename, open(filename, 'rb'))
-        request = urllib2.Request(self.url)
-        body = str(form)
-        request.add_header('Content-type', form.get_content_type())
-        request.add_header('Content-length', str(len(body)))
-        request.add_data(body)
-        request.get_data()
-        data = urllib2.urlopen(request).read()
+        with open(filename, 'rb') as file_handle:
+            form.add_file('file', filename, file_handle)
+            headers = {'Content-Type': form.get_content_type(),
+                       'Content-Length': str(form.content_length())}
+            status, data = self.request('POST', self.path or '/', form.open(), headers)
+        if status not in (200, 201):
+            raise IOError('Failed to upload {} [{}]: {}'.format(filename, status, data))
         return data
+
+    def upload_file_chunked(self, filename):
+        """Upload a file in chunks with a checksum for each chunk.
+
+        The upload id is saved next to the file (filename.upload) until the upload
+        is completed. If the upload fails, run this method again to send the chunks
+        which are not received by the server.
+
+        The server must support these requests under the upload url:
+            POST /uploads with {"filename", "size", "chunk_size"} returns {"id"}.
+            GET /uploads/<id> returns {"chunks"} as a list of received chunk indexes.
+            PUT /uploads/<id>/chunks/<index> with X-Checksum-SHA256 header. Server
+                must reject the chunk if the checksum doesn't match.
+            POST /uploads/<id>/complete with {"sha256"} for the whole file.
+
+        Returns:
+            Response from the server for the complete request.
+        """
+        size = os.path.getsize(filename)
+        upload_id, received = self._resume_upload(filename, size)
+        uploads = '{}/uploads/{}'.format(self.path, upload_id)
+
+        file_hash = hashlib.sha256()
+        with open(filename, 'rb') as inf:
+            index = 0
+            while True:
+                chunk = inf.read(self.chunk_size)
+                if not chunk:
+                    break
+                file_hash.update(chunk)
+                if index not in received:
+                    self._upload_chunk('{}/chunks/{}'.format(uploads, index), chunk)
+                index += 1
+
+        response = self._request_json(
+            'POST', uploads + '/complete', {'sha256': file_hash.hexdigest()})
+        os.remove(filename + '.upload')
+        return response
+
+    def _resume_upload(self, filename, size):
+        """Get upload id and received chunks for a previous upload or start a new one."""
+        state_file = filename + '.upload'
+        state = {'url': self.url, 'size': size, 'chunk_size': self.chunk_size,
+                 'mtime': os.path.getmtime(filename)}
+        if os.path.isfile(state_file):
+            with open(state_file) as inf:
+                previous = json.load(inf)
+            upload_id = previous.pop('id', None)
+            if upload_id and previous == state:
+                try:
+                    status = self._request_json(
+                        'GET', '{}/uploads/{}'.format(self.path, upload_id))
+                except IOError:
+                    # the server doesn't have this upload anymore
+                    pass
+                else:
+                    return upload_id, set(status.get('chunks', ()))
+
+        upload = self._request_json(
+            'POST', self.path + '/uploads',
+            {'filename': os.path.basename(filename), 'size': size,
+             'chunk_size': self.chunk_size}, expected=(200, 201))
+        state['id'] = upload['id']
+        with open(state_file, 'w') as outf:
+            json.dump(state, outf)
+        return upload['id'], set()
+
+    def _upload_chunk(self, path, chunk):
+        """Upload a chunk and retry if it fails."""
+        headers = {'Content-Type': 'application/octet-stream',
+                   'Content-Length': str(len(chunk)),
+                   'X-Checksum-SHA256': hashlib.sha256(chunk).hexdigest()}
+        for attempt in range(self.retries + 1):
+            try:
+                status, data = self.request('PUT', path, chunk, headers)
+            except (socket.error, HTTPException) as e:
+                status, data = None, str(e)
+            if status in (200, 201, 204):
+                return
+        raise IOError('Failed to upload {} after {} attempts [{}]: {}'.format(
+            path, self.retries + 1, status, data))
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        return 'Client::{}'.format(self.url)
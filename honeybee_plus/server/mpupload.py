@@ -1,15 +1,28 @@
-import itertools
-import mimetools
 import mimetypes
+import os
+import uuid
 
 
 class MultiPartForm(object):
-    """Accumulate the data to be used when posting a form."""
+    """Accumulate the data to be used when posting a form.
+
+    Files are not loaded to memory. Use open to get a file-like object that reads the
+    body of the form from the files in chunks.
+
+    Usage:
+        form = MultiPartForm()
+        form.add_file('file', 'project.zip', open('project.zip', 'rb'))
+        body = form.open()
+        while True:
+            chunk = body.read(8192)
+            if not chunk:
+                break
+    """
 
     def __init__(self):
         self.form_fields = []
         self.files = []
-        self.boundary = mimetools.choose_boundary()
+        self.boundary = uuid.uuid4().hex
 
     def get_content_type(self):
         return 'multipart/form-data; boundary=%s' % self.boundary
@@ -19,46 +32,83 @@ class MultiPartForm(object):
         self.form_fields.append((name, value))
 
     def add_file(self, fieldname, filename, file_handle, mimetype=None):
-        """Add a file to be uploaded."""
-        body = file_handle.read()
+        """Add a file to be uploaded.
+
+        The file will be read from the current position of file_handle when the form
+        is sent.
+        """
         if mimetype is None:
             mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
-        self.files.append((fieldname, filename, mimetype, body))
-
-    def __str__(self):
-        """Return a string representing the form data, including attached files."""
-        # Build a list of lists, each containing "lines" of the
-        # request.  Each part is separated by a boundary string.
-        # Once the list is built, return a string where each
-        # line is separated by '\r\n'.
-        parts = []
+        self.files.append((fieldname, filename, mimetype, file_handle))
+
+    def _parts(self):
+        """Get the form as a list of bytes and file handles."""
         part_boundary = '--' + self.boundary
+        parts = []
+        for name, value in self.form_fields:
+            parts.append('\r\n'.join(
+                (part_boundary, 'Content-Disposition: form-data; name="%s"' % name,
+                 '', str(value), '')).encode('utf-8'))
+
+        for field_name, filename, content_type, file_handle in self.files:
+            parts.append('\r\n'.join(
+                (part_boundary,
+                 'Content-Disposition: file; name="%s"; filename="%s"' %
+                 (field_name, os.path.basename(filename)),
+                 'Content-Type: %s' % content_type, '', '')).encode('utf-8'))
+            parts.append(file_handle)
+            parts.append(b'\r\n')
+
+        parts.append(('--' + self.boundary + '--\r\n').encode('utf-8'))
+        return parts
+
+    def content_length(self):
+        """Size of the body in bytes."""
+        length = 0
+        for part in self._parts():
+            if isinstance(part, bytes):
+                length += len(part)
+            else:
+                length += os.fstat(part.fileno()).st_size - part.tell()
+        return length
+
+    def open(self):
+        """Return a file-like object to read the body of the form."""
+        return _FormReader(self._parts())
+
+    def __iter__(self):
+        """Iterate over the body of the form in chunks."""
+        body = self.open()
+        while True:
+            chunk = body.read(_FormReader.chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+
+class _FormReader(object):
+    """A file-like object to read a list of bytes and file handles one after another."""
+
+    chunk_size = 1024 * 1024
+
+    def __init__(self, parts):
+        self._parts = list(parts)
 
-        # Add the form fields
-        parts.extend(
-            [part_boundary,
-             'Content-Disposition: form-data; name="%s"' % name,
-             '',
-             value,
-             ]
-            for name, value in self.form_fields
-        )
-
-        # Add the files to upload
-        parts.extend(
-            [part_boundary,
-             'Content-Disposition: file; name="%s"; filename="%s"' %
-             (field_name, filename),
-             'Content-Type: %s' % content_type,
-             '',
-             body,
-             ]
-            for field_name, filename, content_type, body in self.files
-        )
-
-        # Flatten the list and add closing boundary marker,
-        # then return CR+LF separated data
-        flattened = list(itertools.chain(*parts))
-        flattened.append('--' + self.boundary + '--')
-        flattened.append('')
-        return '\r\n'.join(flattened)
+    def read(self, size=-1):
+        if size is None or size < 0:
+            return b''.join(iter(lambda: self.read(self.chunk_size), b''))
+        while self._parts:
+            part = self._parts[0]
+            if isinstance(part, bytes):
+                chunk, rest = part[:size], part[size:]
+                if rest:
+                    self._parts[0] = rest
+                else:
+                    self._parts.pop(0)
+            else:
+                chunk = part.read(size)
+                if not chunk:
+                    self._parts.pop(0)
+                    continue
+            return chunk
+        return b''
@@ -0,0 +1,431 @@
+"""Distribute the steps of a recipe to several workers using a work queue.
+
+A Coordinator reads the command file of a recipe, finds the dependencies between the
+steps from the files that they read and write, and places each step on a queue as
+soon as the steps that it depends on are done. Independent steps (e.g. window groups,
+window group states and rendering tiles) will be executed by the workers at the same
+time. Workers pull the steps from the queue, run them and return the exit code, the
+output log and the size of the output files.
+
+Commands in a command file use relative paths and every worker must have access to
+the project folder (e.g. a shared network drive).
+
+SQLiteQueue is a queue which is stored in a single SQLite file and can be used to run
+several workers on the same machine or on machines that share the same folder. Other
+queues can be used by subclassing WorkQueue.
+
+Usage:
+    # start workers on each machine
+    python -m honeybee_plus.server.workqueue worker //server/jobs/queue.db
+
+    # run the recipe
+    queue = SQLiteQueue('//server/jobs/queue.db')
+    command_file = recipe.write('//server/jobs', 'room')
+    recipe.run(command_file, executor=Coordinator(queue))
+"""
+from ..radiance.command.pipeline import parse_rad_string, _unquote
+from ..radiance.radparser import referenced_files
+from ..radiance.recipe.runreport import _shell_lines, _batch_command
+
+import argparse
+import json
+import os
+import socket
+import sqlite3
+import subprocess
+import time
+
+
+class Job(object):
+    """A step of a recipe.
+
+    Attributes:
+        command: Command line.
+        cwd: Working directory for the command.
+        inputs: A list of files which are read by the command.
+        outputs: A list of files which are written by the command.
+        id: Job id in the queue (Default: None).
+        status: One of pending, running, done or failed (Default: pending).
+        worker: Name of the worker which has executed the job.
+        returncode: Exit code of the command.
+        log: Standard output and standard error of the command.
+        output_sizes: A dictionary of output files and their size after the job is
+            executed. Missing files will be None.
+    """
+
+    __slots__ = ('command', 'cwd', 'inputs', 'outputs', 'id', 'status', 'worker',
+                 'returncode', 'log', 'output_sizes')
+
+    def __init__(self, command, cwd, inputs=None, outputs=None, id=None,
+                 status='pending', worker=None, returncode=None, log=None,
+                 output_sizes=None):
+        self.command = command
+        self.cwd = cwd
+        self.inputs = list(inputs or ())
+        self.outputs = list(outputs or ())
+        self.id = id
+        self.status = status
+        self.worker = worker
+        self.returncode = returncode
+        self.log = log
+        self.output_sizes = output_sizes or {}
+
+    @property
+    def is_finished(self):
+        """Return True if the job is done or failed."""
+        return self.status in ('done', 'failed')
+
+    def to_json(self):
+        """Convert job to a dictionary."""
+        return {key: getattr(self, key) for key in self.__slots__}
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        return 'Job::{}::{}::{}'.format(self.id, self.status, self.command)
+
+
+class WorkQueue(object):
+    """Base class for work queues.
+
+    A work queue must be safe to use from several processes at the same time.
+    """
+
+    def put(self, job):
+        """Add a job to the queue and return the job id."""
+        raise NotImplementedError('put must be implemented in every work queue.')
+
+    def pull(self, worker):
+        """Mark the next pending job as running and return it.
+
+        Returns None if there is no pending job.
+        """
+        raise NotImplementedError('pull must be implemented in every work queue.')
+
+    def complete(self, job):
+        """Update the status, return code, log and output sizes for a job."""
+        raise NotImplementedError('complete must be implemented in every work queue.')
+
+    def get(self, job_id):
+        """Get a job by id."""
+        raise NotImplementedError('get must be implemented in every work queue.')
+
+
+class SQLiteQueue(WorkQueue):
+    """A work queue which is stored in a SQLite database.
+
+    Attributes:
+        db_file: Path to database file. The file will be created if it doesn't exist.
+        timeout: Time in seconds to wait for other processes to release the
+            database (Default: 30).
+    """
+
+    _fields = ('id', 'command', 'cwd', 'inputs', 'outputs', 'status', 'worker',
+               'returncode', 'log', 'output_sizes')
+    _json_fields = ('inputs', 'outputs', 'output_sizes')
+
+    def __init__(self, db_file, timeout=30):
+        self.db_file = os.path.abspath(db_file)
+        self.timeout = timeout
+        with self._connect() as conn:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS jobs ('
+                'id INTEGER PRIMARY KEY AUTOINCREMENT, command TEXT, cwd TEXT, '
+                'inputs TEXT, outputs TEXT, status TEXT, worker TEXT, '
+                'returncode INTEGER, log TEXT, output_sizes TEXT)')
+
+    def _connect(self):
+        # isolation_level=None to control the transactions in pull
+        return _Connection(sqlite3.connect(self.db_file, timeout=self.timeout,
+                                           isolation_level=None))
+
+    def _to_job(self, row):
+        values = dict(zip(self._fields, row))
+        for key in self._json_fields:
+            values[key] = json.loads(values[key]) if values[key] else None
+        return Job(**values)
+
+    def put(self, job):
+        """Add a job to the queue and return the job id."""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                'INSERT INTO jobs (command, cwd, inputs, outputs, status) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (job.command, job.cwd, json.dumps(job.inputs), json.dumps(job.outputs),
+                 'pending'))
+            job.id = cursor.lastrowid
+            job.status = 'pending'
+        return job.id
+
+    def pull(self, worker):
+        """Mark the next pending job as running and return it."""
+        with self._connect() as conn:
+            # lock the database so two workers can't pull the same job
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                row = conn.execute(
+                    'SELECT {} FROM jobs WHERE status = ? ORDER BY id LIMIT 1'.format(
+                        ', '.join(self._fields)), ('pending',)).fetchone()
+                if row:
+                    conn.execute('UPDATE jobs SET status = ?, worker = ? WHERE id = ?',
+                                 ('running', worker, row[0]))
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+
+        if not row:
+            return None
+        job = self._to_job(row)
+        job.status, job.worker = 'running', worker
+        return job
+
+    def complete(self, job):
+        """Update the status, return code, log and output sizes for a job."""
+        with self._connect() as conn:
+            conn.execute(
+                'UPDATE jobs SET status = ?, returncode = ?, log = ?, output_sizes = ? '
+                'WHERE id = ?',
+                (job.status, job.returncode, job.log, json.dumps(job.output_sizes),
+                 job.id))
+
+    def get(self, job_id):
+        """Get a job by id."""
+        with self._connect() as conn:
+            row = conn.execute(
+                'SELECT {} FROM jobs WHERE id = ?'.format(', '.join(self._fields)),
+                (job_id,)).fetchone()
+        assert row, 'Failed to find job {} in {}.'.format(job_id, self.db_file)
+        return self._to_job(row)
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        return 'SQLiteQueue::{}'.format(self.db_file)
+
+
+class _Connection(object):
+    """Close a SQLite connection at the end of a with statement."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self.conn
+
+    def __exit__(self, *args):
+        self.conn.close()
+
+
+class Worker(object):
+    """Pull jobs from a work queue and execute them.
+
+    Attributes:
+        queue: A WorkQueue.
+        name: Worker name (Default: hostname and process id).
+        env: Optional environment variables for the commands.
+    """
+
+    def __init__(self, queue, name=None, env=None):
+        self.queue = queue
+        self.name = name or '{}:{}'.format(socket.gethostname(), os.getpid())
+        self.env = env
+
+    def execute(self, job):
+        """Execute a job and update the queue."""
+        p = subprocess.Popen(job.command, shell=True, cwd=job.cwd, env=self.env,
+                             stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        log = p.communicate()[0]
+        job.log = log.decode('utf-8', 'replace')
+        job.returncode = p.returncode
+        job.status = 'done' if p.returncode == 0 else 'failed'
+        job.output_sizes = {
+            f: os.path.getsize(f) if os.path.isfile(f) else None for f in job.outputs}
+        self.queue.complete(job)
+        return job
+
+    def run(self, max_jobs=None, idle_timeout=None, poll_interval=0.5):
+        """Execute jobs until the queue is empty for idle_timeout seconds.
+
+        Args:
+            max_jobs: Maximum number of jobs to execute (Default: no limit).
+            idle_timeout: Time in seconds to wait for new jobs. By default the worker
+                keeps waiting for new jobs.
+            poll_interval: Time in seconds between checking the queue for new jobs.
+
+        Returns:
+            Number of executed jobs.
+        """
+        count = 0
+        idle_start = time.time()
+        while max_jobs is None or count < max_jobs:
+            job = self.queue.pull(self.name)
+            if job is None:
+                if idle_timeout is not None and time.time() - idle_start > idle_timeout:
+                    break
+                time.sleep(poll_interval)
+                continue
+            self.execute(job)
+            count += 1
+            idle_start = time.time()
+        return count
+
+
+def command_file_jobs(command_file):
+    """Convert a command file to jobs and find the dependencies between them.
+
+    A job depends on an earlier job if it reads or writes the file that the earlier
+    job writes, or if it writes a file that the earlier job reads. Output files are
+    detected from output redirection (> file). A command without output redirection
+    may write any file and all the jobs before and after it depend on it.
+
+    Octrees and meshes which are referenced by instance and mesh objects in the input
+    .rad files are also considered as inputs. The .rad files must exist when the
+    jobs are created.
+
+    Returns:
+        A tuple of (jobs, dependencies). dependencies is a list of sets of indexes of
+        the jobs that each job depends on.
+    """
+    cwd = os.path.dirname(os.path.abspath(command_file))
+    jobs, dependencies, files = [], [], []
+    barrier = None
+    references = {}
+    with open(command_file) as inf:
+        for line in inf:
+            line = line.strip()
+            if not line or _shell_lines.match(line):
+                continue
+            if line.lower().startswith('cd '):
+                cwd = os.path.join(cwd, _unquote(line[3:].strip()))
+                continue
+
+            line = _batch_command(line)
+            args, stdin, stdout = parse_rad_string(line)
+            tokens = set(os.path.normpath(os.path.join(cwd, _unquote(arg)))
+                         for arg in args[1:] + [stdin] if arg)
+            for token in tuple(tokens):
+                if token.endswith('.rad') and os.path.isfile(token):
+                    if (cwd, token) not in references:
+                        references[(cwd, token)] = set(
+                            os.path.normpath(os.path.join(cwd, f))
+                            for f in referenced_files(token))
+                    tokens.update(references[(cwd, token)])
+            outputs = set((os.path.normpath(os.path.join(cwd, stdout)),)) \
+                if stdout else set()
+
+            index = len(jobs)
+            if not outputs:
+                deps = set(range(index))
+                barrier = index
+            else:
+                deps = set() if barrier is None else set((barrier,))
+                for count, (prev_tokens, prev_outputs) in enumerate(files):
+                    if prev_outputs & (tokens | outputs) or outputs & prev_tokens:
+                        deps.add(count)
+
+            jobs.append(Job(line, cwd, sorted(tokens), sorted(outputs)))
+            dependencies.append(deps)
+            files.append((tokens, outputs))
+
+    return jobs, dependencies
+
+
+class Coordinator(object):
+    """Distribute the steps of a command file to the workers of a work queue.
+
+    Attributes:
+        queue: A WorkQueue.
+        poll_interval: Time in seconds between checking the status of the jobs
+            (Default: 0.5).
+        timeout: Optional time out in seconds for the whole run.
+    """
+
+    def __init__(self, queue, poll_interval=0.5, timeout=None):
+        self.queue = queue
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+
+    def run(self, jobs, dependencies):
+        """Put the jobs on the queue as soon as their dependencies are done.
+
+        No more jobs will be added to the queue after a job fails.
+
+        Returns:
+            A list of jobs. Jobs which are not added to the queue will be pending with
+            id set to None.
+        """
+        start = time.time()
+        running = set()
+        done = set()
+        failed = False
+        while True:
+            if not failed:
+                for count, job in enumerate(jobs):
+                    if job.id is None and dependencies[count] <= done:
+                        self.queue.put(job)
+                        running.add(count)
+
+            if not running:
+                break
+
+            if self.timeout is not None and time.time() - start > self.timeout:
+                raise RuntimeError(
+                    'Distributed run timed out after {} seconds. {} jobs are still '
+                    'running.'.format(self.timeout, len(running)))
+
+            time.sleep(self.poll_interval)
+            for count in tuple(running):
+                job = self.queue.get(jobs[count].id)
+                if not job.is_finished:
+                    continue
+                jobs[count] = job
+                running.discard(count)
+                if job.status == 'done':
+                    done.add(count)
+                else:
+                    failed = True
+                    print('Failed to run job {} on {} [exit code: {}]:\n{}\n{}'.format(
+                        job.id, job.worker, job.returncode, job.command, job.log))
+
+        return jobs
+
+    def run_command_file(self, command_file):
+        """Run the steps of a command file on the workers.
+
+        Returns:
+            True if all the steps are executed successfully.
+        """
+        jobs = self.run(*command_file_jobs(command_file))
+        return all(job.status == 'done' for job in jobs)
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        return 'Coordinator::{}'.format(self.queue)
+
+
+def main(args=None):
+    """Command line interface to start a worker."""
+    parser = argparse.ArgumentParser(description='Honeybee work queue.')
+    subparsers = parser.add_subparsers(dest='action')
+    worker = subparsers.add_parser('worker', help='Execute jobs from a SQLite queue.')
+    worker.add_argument('db_file', help='Path to SQLite queue.')
+    worker.add_argument('--max-jobs', type=int, default=None)
+    worker.add_argument('--idle-timeout', type=float, default=None)
+    worker.add_argument('--poll-interval', type=float, default=0.5)
+    args = parser.parse_args(args)
+
+    count = Worker(SQLiteQueue(args.db_file)).run(
+        args.max_jobs, args.idle_timeout, args.poll_interval)
+    print('Executed {} jobs.'.format(count))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""Benchmark the time to import honeybee modules in a new process.
+
+Usage:
+    python tests/dev_tests/importtime_benchmark.py [repeat]
+
+Short-lived workers (e.g. python -m honeybee_plus.server.workqueue worker) pay the
+import time on every start. The script imports each module in a fresh interpreter
+and prints the best time and the number of honeybee and ladybug modules which are
+loaded as a side effect. Use python -X importtime -c "import module" to find the
+slow imports for a module.
+"""
+import subprocess
+import sys
+
+MODULES = (
+    'honeybee_plus',
+    'honeybee_plus.radiance.command.rtrace',
+    'honeybee_plus.radiance.factory',
+    'honeybee_plus.radiance.recipe.runreport',
+    'honeybee_plus.server.workqueue',
+    'honeybee_plus.radiance.recipe.pointintime.gridbased',
+    'honeybee_plus.radiance.recipe.recipedcutil',
+    'honeybee_plus.radiance.recipe.daylightcoeff.gridbased',
+    'honeybee_plus.radiance.recipe.solaraccess.gridbased'
+)
+
+CODE = """
+import sys, time
+start = time.time()
+import {}
+loaded = [m for m in sys.modules if m.startswith(('honeybee', 'ladybug'))]
+print('{{}} {{}}'.format(time.time() - start, len(loaded)))
+"""
+
+
+def import_time(module):
+    """Import a module in a new process and return (seconds, module count)."""
+    output = subprocess.check_output([sys.executable, '-c', CODE.format(module)])
+    # honeybee config may print warnings before the results
+    seconds, count = output.decode('utf-8').strip().splitlines()[-1].split()
+    return float(seconds), int(count)
+
+
+def main(repeat):
+    # the first run fills the bytecode cache
+    for module in MODULES:
+        import_time(module)
+
+    for module in MODULES:
+        results = [import_time(module) for _ in range(repeat)]
+        print('{:<56} {:>8.1f} ms {:>5} modules'.format(
+            module, 1000 * min(r[0] for r in results), results[0][1]))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,62 @@
+"""Benchmark listing materials for surfaces with separate identical materials.
+
+Usage:
+    python tests/dev_tests/materialregistry_benchmark.py [surface_count]
+
+Every surface gets its own Plastic instance with one of a few definitions. The script
+times RadFile.materials and RadFile.radiance_material_names before and after interning
+the materials with a MaterialRegistry. Interning pays off if the time for interning is
+less than the time saved in the calls after interning.
+"""
+from honeybee_plus.hbsurface import HBSurface
+from honeybee_plus.radiance.material.plastic import Plastic
+from honeybee_plus.radiance.materialregistry import MaterialRegistry
+from honeybee_plus.radiance.radfile import RadFile
+
+import sys
+import time
+
+
+def create_surfaces(surface_count, material_count=10):
+    surfaces = []
+    for i in range(surface_count):
+        x = i % 1000
+        pts = ((x, 0, 0), (x + 1, 0, 0), (x + 1, 0, 3), (x, 0, 3))
+        srf = HBSurface('wall_%d' % i, pts, 0)
+        m = i % material_count
+        srf.radiance_material = Plastic('wall_mat_%d' % m, 0.1 * m, 0.1 * m, 0.1 * m)
+        surfaces.append(srf)
+    return surfaces
+
+
+def main(surface_count):
+    surfaces = create_surfaces(surface_count)
+    rad_file = RadFile(surfaces)
+    for blacked in (False, True):
+        st = time.time()
+        before = rad_file.materials(blacked=blacked)
+        print('materials (blacked={}) before interning: {:.3f} s'.format(
+            blacked, time.time() - st))
+    st = time.time()
+    names = rad_file.radiance_material_names()
+    print('material names before interning: {:.3f} s'.format(time.time() - st))
+
+    st = time.time()
+    registry = MaterialRegistry()
+    registry.intern_surfaces(surfaces)
+    print('interning {} surfaces to {} materials: {:.3f} s'.format(
+        surface_count, len(registry), time.time() - st))
+
+    for blacked in (False, True):
+        st = time.time()
+        after = rad_file.materials(blacked=blacked)
+        print('materials (blacked={}) after interning: {:.3f} s'.format(
+            blacked, time.time() - st))
+    st = time.time()
+    assert rad_file.radiance_material_names() == names
+    print('material names after interning: {:.3f} s'.format(time.time() - st))
+    assert before == after
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
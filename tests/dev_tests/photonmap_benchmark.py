@@ -0,0 +1,116 @@
+"""Benchmark photon maps against a high number of ambient bounces.
+
+Usage:
+    python tests/dev_tests/photonmap_benchmark.py [target_folder]
+
+The scene is a deep side-lit room with a mirror light shelf, a mirror sill and a
+mirror strip on the ceiling under a sunny CIE sky. The script runs a point-in-time
+grid-based recipe three times:
+
+    reference: -ab 8 with a high number of ambient divisions.
+    ambient: -ab 5 which is the usual setting for scenes with mirrors.
+    photon map: global and caustic photon maps with -ab 1 for final gathering.
+
+It prints the run time and the relative difference to the reference for the ambient
+and photon map runs. Radiance must be installed.
+"""
+from honeybee_plus.config import radbin_path
+from honeybee_plus.hbsurface import HBSurface
+from honeybee_plus.radiance.analysisgrid import AnalysisGrid
+from honeybee_plus.radiance.material.glass import Glass
+from honeybee_plus.radiance.material.mirror import Mirror
+from honeybee_plus.radiance.material.plastic import Plastic
+from honeybee_plus.radiance.parameters.rtrace import RtraceParameters
+from honeybee_plus.radiance.recipe.photonmap import PhotonMap
+from honeybee_plus.radiance.recipe.pointintime.gridbased import GridBased
+from honeybee_plus.radiance.recipe.tuning import relative_difference
+from honeybee_plus.radiance.sky.cie import CIE
+
+import sys
+import tempfile
+import time
+
+
+def rectangle(name, pts, surface_type, material):
+    srf = HBSurface(name, pts, surface_type)
+    srf.radiance_material = material
+    return srf
+
+
+def create_surfaces(width=4, depth=8, height=3):
+    wall = Plastic('wall_mat', 0.5, 0.5, 0.5)
+    ceiling = Plastic('ceiling_mat', 0.8, 0.8, 0.8)
+    floor = Plastic('floor_mat', 0.2, 0.2, 0.2)
+    mirror = Mirror('mirror_mat', 0.95, 0.95, 0.95)
+    glass = Glass('glass_mat', 0.6, 0.6, 0.6)
+    w, d, h = width, depth, height
+    surfaces = [
+        rectangle('floor', ((0, 0, 0), (0, d, 0), (w, d, 0), (w, 0, 0)), 2, floor),
+        rectangle('ceiling', ((0, 0, h), (w, 0, h), (w, d, h), (0, d, h)), 3,
+                  ceiling),
+        rectangle('north', ((0, d, 0), (0, d, h), (w, d, h), (w, d, 0)), 0, wall),
+        rectangle('east', ((w, 0, 0), (w, d, 0), (w, d, h), (w, 0, h)), 0, wall),
+        rectangle('west', ((0, 0, 0), (0, 0, h), (0, d, h), (0, d, 0)), 0, wall),
+        rectangle('south_low', ((0, 0, 0), (w, 0, 0), (w, 0, 0.9), (0, 0, 0.9)), 0,
+                  wall),
+        rectangle('window', ((0, 0, 0.9), (w, 0, 0.9), (w, 0, h), (0, 0, h)), 5,
+                  glass),
+        # light shelf, sill and a strip on the ceiling which redirect the sun
+        rectangle('shelf_out', ((0, -1, 2.1), (w, -1, 2.1), (w, 0, 2.1),
+                                (0, 0, 2.1)), 6, mirror),
+        rectangle('shelf_in', ((0, 0, 2.1), (w, 0, 2.1), (w, 1, 2.1), (0, 1, 2.1)),
+                  6, mirror),
+        rectangle('sill', ((0, -0.5, 0.9), (w, -0.5, 0.9), (w, 0, 0.9),
+                           (0, 0, 0.9)), 6, mirror),
+        rectangle('ceiling_strip', ((0, 1, h - 0.01), (0, 4, h - 0.01),
+                                    (w, 4, h - 0.01), (w, 1, h - 0.01)), 6, mirror)
+    ]
+    return surfaces
+
+
+def create_grid(width=4, depth=8, spacing=0.5):
+    pts = [(x * spacing + spacing / 2.0, y * spacing + spacing / 2.0, 0.8)
+           for x in range(int(width / spacing)) for y in range(int(depth / spacing))]
+    return AnalysisGrid.from_points_and_vectors(pts, None, 'room')
+
+
+def run_recipe(target_folder, name, rad_parameters, photon_map=None):
+    sky = CIE.from_lat_long('boston', 42.3, -71.0, -5, 0, 12, 21, 12, sky_type=0)
+    recipe = GridBased(sky, (create_grid(),), rad_parameters=rad_parameters,
+                       hb_objects=create_surfaces())
+    recipe.photon_map = photon_map
+    start = time.time()
+    command_file = recipe.write(target_folder, name)
+    recipe.run(command_file)
+    values = [value[0] for ag in recipe.results() for value in ag.sum_values_by_id()]
+    return time.time() - start, values
+
+
+def main(target_folder):
+    if not radbin_path:
+        print('Radiance is not installed. Set the path in honeybee_plus/config.json.')
+        return
+
+    reference = RtraceParameters(2)
+    reference.ambient_bounces = 8
+    reference.ambient_divisions = 8192
+    reference.ambient_supersamples = 4096
+    reference.limit_weight = 0.0001
+
+    ambient = RtraceParameters(1)
+    ambient.ambient_bounces = 5
+
+    ref_time, ref_values = run_recipe(target_folder, 'reference', reference)
+    print('reference (-ab 8): {:.2f} s'.format(ref_time))
+
+    runs = (('ambient (-ab 5)', ambient, None),
+            ('photon map', RtraceParameters(1), PhotonMap(200000, 50000)))
+    for name, parameters, photon_map in runs:
+        run_time, values = run_recipe(
+            target_folder, name.split()[0], parameters, photon_map)
+        print('{}: {:.2f} s, difference to reference {:.4f}'.format(
+            name, run_time, relative_difference(values, ref_values)))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1] if len(sys.argv) > 1 else tempfile.mkdtemp())
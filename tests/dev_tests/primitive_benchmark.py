@@ -0,0 +1,46 @@
+"""Micro-benchmark for cached Radiance strings of primitives.
+
+Usage:
+    python tests/dev_tests/primitive_benchmark.py [count]
+
+The script serializes a few materials many times similar to writing materials,
+blacked materials and window-group states for a recipe. Uncached times use
+_to_rad_string which generates the string on every call.
+"""
+from honeybee_plus.radiance.material.glass import Glass
+from honeybee_plus.radiance.material.glow import WhiteGlow
+from honeybee_plus.radiance.material.plastic import Plastic, BlackMaterial
+
+import sys
+import time
+
+
+def main(count):
+    st = time.time()
+    for i in range(count // 10):
+        Plastic('wall_%d' % i, 0.5, 0.5, 0.5)
+    print('create {} plastics: {:.3f} s'.format(count // 10, time.time() - st))
+
+    mixture = Plastic('mixture', 0.5, 0.5, 0.5)
+    materials = (Plastic('wall', 0.5, 0.5, 0.5), Glass('window', 0.6, 0.6, 0.6),
+                 BlackMaterial('wall'), WhiteGlow('window'),
+                 Plastic('floor', 0.2, 0.2, 0.2, modifier=mixture))
+
+    for minimal in (False, True):
+        st = time.time()
+        for _ in range(count // len(materials)):
+            for m in materials:
+                m._to_rad_string(minimal)
+        uncached = time.time() - st
+
+        st = time.time()
+        for _ in range(count // len(materials)):
+            for m in materials:
+                m.to_rad_string(minimal)
+        cached = time.time() - st
+        print('{} to_rad_string(minimal={}) calls: uncached {:.3f} s, '
+              'cached {:.3f} s'.format(count, minimal, uncached, cached))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,85 @@
+"""Benchmark writing a large context to a Radiance file.
+
+Usage:
+    python tests/dev_tests/radfile_benchmark.py [surface_count]
+
+The script creates a list of rectangular HBSurfaces with a few shared materials and
+writes them using RadFile.write, which streams materials and polygons to the file, and
+using the full string from RadFile.to_rad_string. Peak memory is measured using
+tracemalloc (Python 3 only).
+
+It also compares writing the surfaces three times (normal, blacked and flipped) and
+calculating normals from the honeybee surfaces and from a RadGeometry.
+"""
+from honeybee_plus.hbsurface import HBSurface
+from honeybee_plus.radiance.radfile import RadFile
+from honeybee_plus.radiance.radgeometry import RadGeometry
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+
+def create_surfaces(surface_count):
+    surfaces = []
+    for i in range(surface_count):
+        x, y = i % 1000, i // 1000
+        pts = ((x, y, 0), (x + 1, y, 0), (x + 1, y, 3), (x, y, 3))
+        surfaces.append(HBSurface('context_%d' % i, pts, surface_type=6))
+    return surfaces
+
+
+def measure(func, *args):
+    tracemalloc.start()
+    st = time.time()
+    func(*args)
+    duration = time.time() - st
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return duration, peak / 1024.0 ** 2
+
+
+def write_string(rad_file, folder):
+    with open(os.path.join(folder, 'string.rad'), 'w') as outf:
+        outf.write(rad_file.header() + '\n\n' + rad_file.to_rad_string())
+
+
+def write_surfaces(surfaces, folder):
+    rad_file = RadFile(surfaces)
+    rad_file.write(folder, 'normal.rad')
+    rad_file.write_geometries_blacked(folder, 'blacked.rad')
+    rad_file.write_geometries(folder, 'flipped.rad', flipped=True)
+    return [srf.normal for srf in surfaces]
+
+
+def write_geometry(surfaces, folder):
+    geometry = RadGeometry.from_surfaces(surfaces)
+    rad_file = RadFile([], rad_geometry=geometry)
+    rad_file.write(folder, 'normal.rad')
+    rad_file.write_geometries_blacked(folder, 'blacked.rad')
+    rad_file.write_geometries(folder, 'flipped.rad', flipped=True)
+    return geometry.normals
+
+
+def main(surface_count):
+    folder = tempfile.mkdtemp()
+    try:
+        rad_file = RadFile(create_surfaces(surface_count))
+        duration, peak = measure(rad_file.write, folder, 'stream.rad')
+        print('streaming write: %.2f s, peak memory: %.2f MB' % (duration, peak))
+        duration, peak = measure(write_string, rad_file, folder)
+        print('full string write: %.2f s, peak memory: %.2f MB' % (duration, peak))
+        for func in (write_surfaces, write_geometry):
+            st = time.time()
+            func(rad_file.hb_surfaces, folder)
+            print('%s (3 files and normals): %.2f s' % (func.__name__, time.time() - st))
+    finally:
+        shutil.rmtree(folder)
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    main(count)
@@ -0,0 +1,82 @@
+"""Benchmark importing a large Radiance file.
+
+Usage:
+    python tests/dev_tests/radgeometry_benchmark.py [polygon_count]
+
+The script writes a Radiance file with many polygons and imports it as Polygon objects
+and as a RadGeometry. It also filters, moves and writes back the RadGeometry through
+RadFile. Peak memory is measured using tracemalloc (Python 3 only).
+"""
+from honeybee_plus.radiance.geometry.polygon import Polygon
+from honeybee_plus.radiance.radfile import RadFile
+from honeybee_plus.radiance.radgeometry import RadGeometry
+from honeybee_plus.radiance.radparser import iter_records_from_file
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+
+def write_file(file_path, polygon_count):
+    with open(file_path, 'w') as outf:
+        outf.write('void plastic context_mat\n0\n0\n5 0.2 0.2 0.2 0 0\n\n')
+        for i in range(polygon_count):
+            x, y = i % 1000, i // 1000
+            outf.write(
+                'context_mat polygon context_%d\n0\n0\n12\n'
+                '\t%d %d 0\n\t%d %d 0\n\t%d %d 3\n\t%d %d 3\n\n'
+                % (i, x, y, x + 1, y, x + 1, y, x, y))
+
+
+def import_polygons(file_path):
+    polygons = []
+    for record in iter_records_from_file(file_path):
+        if record.type == 'polygon':
+            values = record.real_args
+            points = (values[i:i + 3] for i in range(0, len(values), 3))
+            polygons.append(Polygon(record.name, points))
+    return polygons
+
+
+def import_and_write(file_path, folder):
+    geometry = RadGeometry.from_files([file_path])
+    geometry = geometry.filter_by_bounding_box((0, 0, 0), (500, 1000, 10))
+    geometry.move((0, 0, -1))
+    RadFile([], rad_geometry=geometry).write(folder, 'out.rad')
+
+
+def measure(func, *args):
+    tracemalloc.start()
+    st = time.time()
+    result = func(*args)
+    duration = time.time() - st
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, duration, peak / 1024.0 ** 2
+
+
+def main(polygon_count):
+    folder = tempfile.mkdtemp()
+    try:
+        file_path = os.path.join(folder, 'context.rad')
+        write_file(file_path, polygon_count)
+        print('file size: %.2f MB' % (os.path.getsize(file_path) / 1024.0 ** 2))
+        result, duration, peak = measure(import_polygons, file_path)
+        del result
+        print('Polygon objects: %.2f s, peak memory: %.2f MB' % (duration, peak))
+        result, duration, peak = measure(RadGeometry.from_files, [file_path])
+        del result
+        print('RadGeometry: %.2f s, peak memory: %.2f MB' % (duration, peak))
+        _, duration, peak = measure(import_and_write, file_path, folder)
+        print('RadGeometry import, filter, move and write: %.2f s, peak memory: %.2f MB'
+              % (duration, peak))
+    finally:
+        shutil.rmtree(folder)
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    main(count)
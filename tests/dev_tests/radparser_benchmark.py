@@ -0,0 +1,70 @@
+"""Benchmark parsing a large Radiance file.
+
+Usage:
+    python tests/dev_tests/radparser_benchmark.py [polygon_count]
+
+The script writes a Radiance file with a few materials and many multi-line polygons and
+parses it with the regex parser that radparser used to have and with the streaming
+tokenizer in radparser.iter_records_from_file. Peak memory is measured using
+tracemalloc (Python 3 only).
+"""
+from honeybee_plus.radiance.radparser import iter_records_from_file
+
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+
+def write_file(file_path, polygon_count):
+    with open(file_path, 'w') as outf:
+        outf.write('# context\n\nvoid plastic context_mat\n0\n0\n5 0.2 0.2 0.2 0 0\n\n')
+        for i in range(polygon_count):
+            x, y = i % 1000, i // 1000
+            outf.write(
+                'context_mat polygon context_%d\n0\n0\n12\n'
+                '\t%d %d 0\n\t%d %d 0\n\t%d %d 3\n\t%d %d 3\n\n'
+                % (i, x, y, x + 1, y, x + 1, y, x, y))
+
+
+def regex_parse(file_path):
+    with open(file_path, 'r') as inf:
+        raw = re.findall(r'^\s*([^0-9].*(\s*[\d.-]+.*)*)', inf.read(), re.MULTILINE)
+    objs = (' '.join(o[0].split()) for o in raw)
+    return sum(1 for o in objs if o and o[0] not in ['#', '!'])
+
+
+def stream_parse(file_path):
+    return sum(1 for _ in iter_records_from_file(file_path))
+
+
+def measure(func, *args):
+    tracemalloc.start()
+    st = time.time()
+    count = func(*args)
+    duration = time.time() - st
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return count, duration, peak / 1024.0 ** 2
+
+
+def main(polygon_count):
+    folder = tempfile.mkdtemp()
+    try:
+        file_path = os.path.join(folder, 'context.rad')
+        write_file(file_path, polygon_count)
+        print('file size: %.2f MB' % (os.path.getsize(file_path) / 1024.0 ** 2))
+        for name, func in (('regex', regex_parse), ('tokenizer', stream_parse)):
+            count, duration, peak = measure(func, file_path)
+            print('%s: %d objects, %.2f s, peak memory: %.2f MB'
+                  % (name, count, duration, peak))
+    finally:
+        shutil.rmtree(folder)
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    main(count)
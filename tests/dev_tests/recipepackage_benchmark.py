@@ -0,0 +1,79 @@
+"""Benchmark shipping a large recipe as JSON and as a binary recipe package.
+
+Usage:
+    python tests/dev_tests/recipepackage_benchmark.py [surface_count] [point_count]
+
+The script creates a solar access recipe with many surfaces and analysis
+points and compares the size and the time to write and load the recipe using
+to_json/from_json and to_package/from_package.
+"""
+from honeybee_plus.hbsurface import HBSurface
+from honeybee_plus.radiance.analysisgrid import AnalysisGrid
+from honeybee_plus.radiance.material.plastic import Plastic
+from honeybee_plus.radiance.recipe.solaraccess.gridbased import SolarAccessGridBased
+from honeybee_plus.radiance.recipe.recipepackage import _json_default
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+
+def create_recipe(surface_count, point_count):
+    materials = [Plastic('wall_mat_%d' % i, 0.1 * i, 0.1 * i, 0.1 * i)
+                 for i in range(10)]
+    surfaces = []
+    for i in range(surface_count):
+        x, y = i % 1000, i // 1000
+        pts = ((x, y, 0), (x + 1, y, 0), (x + 1, y, 3), (x, y, 3))
+        srf = HBSurface('wall_%d' % i, pts, 0)
+        srf.radiance_material = materials[i % 10]
+        surfaces.append(srf)
+
+    grids = []
+    for g in range(10):
+        pts = [(0.5 * (i % 100), 0.5 * (i // 100), 0.75)
+               for i in range(point_count // 10)]
+        grids.append(AnalysisGrid.from_points_and_vectors(pts, None, 'grid_%d' % g))
+
+    sun_vectors = [(-0.810513, 0.579652, -0.084093), (-0.67166, 0.702357, -0.235729)]
+    return SolarAccessGridBased(sun_vectors, [1908, 2000], grids, hb_objects=surfaces)
+
+
+def main(surface_count, point_count):
+    recipe = create_recipe(surface_count, point_count)
+    folder = tempfile.mkdtemp()
+    try:
+        json_file = os.path.join(folder, 'recipe.json')
+        st = time.time()
+        with open(json_file, 'w') as outf:
+            json.dump(recipe.to_json(), outf, default=_json_default)
+        print('json write: {:.2f} s'.format(time.time() - st))
+        st = time.time()
+        with open(json_file) as inf:
+            SolarAccessGridBased.from_json(json.load(inf))
+        print('json load: {:.2f} s'.format(time.time() - st))
+
+        package = os.path.join(folder, 'recipe.hbpkg')
+        st = time.time()
+        recipe.to_package(package)
+        print('package write: {:.2f} s'.format(time.time() - st))
+        for lazy in (False, True):
+            st = time.time()
+            loaded = SolarAccessGridBased.from_package(package, lazy)
+            print('package load (lazy={}): {:.2f} s'.format(lazy, time.time() - st))
+        st = time.time()
+        loaded.write_analysis_grids(folder, 'grids')
+        print('write lazy grids to pts: {:.2f} s'.format(time.time() - st))
+
+        print('size: json {:.1f} MB, package {:.1f} MB'.format(
+            os.path.getsize(json_file) / 1e6, os.path.getsize(package) / 1e6))
+    finally:
+        shutil.rmtree(folder)
+
+
+if __name__ == '__main__':
+    args = [int(v) for v in sys.argv[1:3]]
+    main(*(args or (20000, 200000)))
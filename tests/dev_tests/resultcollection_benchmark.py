@@ -0,0 +1,93 @@
+"""Benchmark hourly queries against sensor-major and time-major result tables.
+
+Usage:
+    python tests/dev_tests/resultcollection_benchmark.py [sensor_count] [hour_count]
+
+The script creates a temporary database with a single grid and sky as the only source,
+runs TimeSeries.values_hourly for a number of hours without the time-major index and
+runs the same queries again after the index is created.
+"""
+from honeybee_plus.radiance.analysisgrid import AnalysisGrid
+from honeybee_plus.radiance.recipe.id import get_id
+from honeybee_plus.radiance.resultcollection.database import Database
+from honeybee_plus.radiance.resultcollection.timeseries import TimeSeries
+
+import os
+import random
+import shutil
+import sqlite3 as lite
+import sys
+import tempfile
+import time
+
+
+def create_database(filepath, sensor_count, hour_count):
+    db = Database(filepath, remove_if_exist=True)
+    pts = [(i, 0, 0) for i in range(sensor_count)]
+    vectors = [(0, 0, 1)] * sensor_count
+    db.add_analysis_grids(
+        [AnalysisGrid.from_points_and_vectors(pts, vectors, 'benchmark')])
+    table_name = db.add_result_tables(get_id('solar_access'))[0]
+    command = """INSERT INTO %s (sensor_id, grid_id, source_id, moy, value)
+        VALUES (?, ?, ?, ?, ?)""" % table_name
+
+    conn = lite.connect(filepath)
+    conn.execute('PRAGMA synchronous=OFF')
+    values = (
+        (sensor_id, 0, 0, hoy * 60, random.randint(0, 1))
+        for sensor_id in range(sensor_count) for hoy in range(hour_count)
+    )
+    conn.executemany(command, values)
+    conn.commit()
+    conn.close()
+    return table_name
+
+
+def query_plan(filepath, table_name):
+    command = 'EXPLAIN QUERY PLAN SELECT value FROM %s WHERE moy=? ' \
+        'ORDER BY sensor_id;' % table_name
+    conn = lite.connect(filepath)
+    plan = conn.execute(command, (60,)).fetchall()
+    conn.close()
+    return ' | '.join(str(p[-1]) for p in plan)
+
+
+def time_hourly_queries(result_grid, hoys):
+    st = time.time()
+    for hoy in hoys:
+        result_grid.values_hourly(hoy)
+    return (time.time() - st) / len(hoys)
+
+
+def main(sensor_count=10000, hour_count=500, query_count=20):
+    folder = tempfile.mkdtemp()
+    filepath = os.path.join(folder, 'radout.db')
+    try:
+        print('creating %d x %d results...' % (sensor_count, hour_count))
+        table_name = create_database(filepath, sensor_count, hour_count)
+        hoys = random.sample(range(hour_count), min(query_count, hour_count))
+
+        sensor_major = TimeSeries(filepath, time_major_index=False)
+        print('sensor-major plan: %s' % query_plan(filepath, table_name))
+        sm_time = time_hourly_queries(sensor_major, hoys)
+
+        time_major = TimeSeries(filepath)
+        st = time.time()
+        time_major.build_time_major_index()
+        index_time = time.time() - st
+        print('time-major plan: %s' % query_plan(filepath, table_name))
+        tm_time = time_hourly_queries(time_major, hoys)
+
+        assert sensor_major.values_hourly(hoys[0]) == \
+            time_major.values_hourly(hoys[0])
+
+        print('\nsensor-major: %.2f ms per hour' % (sm_time * 1000))
+        print('time-major:   %.2f ms per hour' % (tm_time * 1000))
+        print('index build:  %.2f s (once)' % index_time)
+        print('speedup:      %.1fx' % (sm_time / tm_time))
+    finally:
+        shutil.rmtree(folder)
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
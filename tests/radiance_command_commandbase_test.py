@@ -0,0 +1,75 @@
+import unittest
+from honeybee_plus import config
+from honeybee_plus.radiance.command._commandbase import RadianceCommand
+
+import subprocess
+import sys
+import tempfile
+
+
+class PythonCommand(RadianceCommand):
+    """A command which runs a python script instead of a Radiance program."""
+
+    def __init__(self, script):
+        RadianceCommand.__init__(self)
+        self.script = script
+
+    def to_rad_string(self, relative_path=False):
+        return '"{}" -c "{}"'.format(sys.executable, self.script)
+
+    @property
+    def input_files(self):
+        return None
+
+
+class CommandBaseTestCase(unittest.TestCase):
+    """Test for (honeybee/radiance/command/_commandbase.py)."""
+
+    # preparing to test
+    def setUp(self):
+        """Set up the test case by setting a library folder."""
+        self.radlib_path = config.radlib_path
+        self.folder = tempfile.mkdtemp()
+        config.radlib_path = self.folder
+
+    # ending the test
+    def tearDown(self):
+        """Cleaning up after the test."""
+        config.radlib_path = self.radlib_path
+
+    @unittest.skipIf(sys.version_info < (3, 5), 'async commands need Python 3.5+')
+    def test_execute_async(self):
+        """Output should be streamed from both stdout and stderr."""
+        import asyncio
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+        lines = []
+        cmd = PythonCommand(
+            "import sys; print('out'); sys.stdout.flush(); sys.stderr.write('err')")
+        self.loop.run_until_complete(
+            cmd.execute_async(on_output=lambda line, s: lines.append((line, s))))
+        assert sorted(lines) == [('err', 'stderr'), ('out', 'stdout')]
+
+        with self.assertRaises(subprocess.CalledProcessError):
+            self.loop.run_until_complete(
+                PythonCommand('import sys; sys.exit(2)').execute_async())
+
+    @unittest.skipIf(sys.version_info < (3, 5), 'async commands need Python 3.5+')
+    def test_execute_async_timeout(self):
+        """Commands should run concurrently and be killed after the timeout."""
+        import asyncio
+        from honeybee_plus.radiance.command._commandasync import execute_many_async
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+        commands = [PythonCommand('import time; time.sleep(0.5)') for _ in range(4)]
+        start = self.loop.time()
+        self.loop.run_until_complete(execute_many_async(commands))
+        assert self.loop.time() - start < 1.5
+
+        with self.assertRaises(asyncio.TimeoutError):
+            self.loop.run_until_complete(
+                PythonCommand('import time; time.sleep(10)').execute_async(timeout=0.2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+from honeybee_plus import config
+from honeybee_plus.radiance.command.pipeline import Pipeline, pipe_commands, \
+    parse_rad_string
+from honeybee_plus.radiance.command.rcontrib import Rcontrib
+from honeybee_plus.radiance.recipe.recipedcutil import matrix_calculation, \
+    rgb_matrix_file_to_ill, final_matrix_addition
+
+import os
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+
+class PipelineTestCase(unittest.TestCase):
+    """Test for (honeybee/radiance/command/pipeline.py)."""
+
+    # preparing to test
+    def setUp(self):
+        """Set up the test case by creating matrix calculation commands."""
+        self.dct = matrix_calculation(
+            'tmp/total.rgb', d_matrix='result/matrix/normal.dc', sky_matrix='sky/s.smx')
+        self.rmtx = rgb_matrix_file_to_ill(('tmp/total.rgb',), 'result/total.ill')
+
+    def test_parse_rad_string(self):
+        """Redirections at the end of the command should be separated."""
+        args, stdin, stdout = parse_rad_string('rcontrib -ab 2 a.oct <room.pts > o.dc')
+        assert args == ['rcontrib', '-ab', '2', 'a.oct']
+        assert stdin == 'room.pts'
+        assert stdout == 'o.dc'
+
+    def test_pipeline(self):
+        """Intermediate file should be replaced by a pipe."""
+        pipeline = Pipeline((self.dct, self.rmtx))
+        rad_string = pipeline.to_rad_string()
+        assert 'tmp' not in rad_string
+        assert rad_string.startswith(self.dct.to_rad_string().split(' > ')[0] + ' | ')
+        assert rad_string.endswith(' - > ' + os.path.normpath('result/total.ill'))
+        assert pipeline.intermediate_files == (os.path.normpath('tmp/total.rgb'),)
+
+        # rcontrib keeps reading points from the file
+        rct = Rcontrib('result/room')
+        rct.octree_file = 'room.oct'
+        rct.points_file = 'room.pts'
+        rmtx = rgb_matrix_file_to_ill(('result/room.dc',), 'result/room.ill')
+        rad_string = Pipeline((rct, rmtx)).to_rad_string()
+        assert ' room.oct < room.pts | ' in rad_string
+        assert 'room.dc' not in rad_string
+
+    def test_quoted_files(self):
+        """Paths with white space should be piped with both types of quotes."""
+        for wrapper in ('"', "'"):
+            with mock.patch.object(config, 'wrapper', wrapper):
+                dct = matrix_calculation(
+                    'tmp/west wg.rgb', d_matrix='result/matrix/normal..west wg.dc',
+                    sky_matrix='sky/s.smx')
+                rmtx = rgb_matrix_file_to_ill(('tmp/west wg.rgb',), 'result/west wg.ill')
+                args, _, stdout = parse_rad_string(dct.to_rad_string())
+                assert stdout == os.path.normpath('tmp/west wg.rgb')
+                assert args[1] == '{0}result/matrix/normal..west wg.dc{0}'.format(
+                    wrapper)
+                commands = pipe_commands((dct, rmtx))
+                assert len(commands) == 1
+                output_file = os.path.normpath('result/west wg.ill')
+                assert commands[0].to_rad_string().endswith(
+                    ' - > {0}{1}{0}'.format(wrapper, output_file))
+
+    def test_pipe_commands(self):
+        """Only files which are not reused should be replaced by pipes."""
+        dct = matrix_calculation(
+            'tmp/direct.rgb', d_matrix='result/matrix/black.dc', sky_matrix='sky/s.smx')
+        rmtx = rgb_matrix_file_to_ill(('tmp/direct.rgb',), 'result/direct.ill')
+        final = final_matrix_addition(
+            'result/total.ill', 'result/direct.ill', 'result/sun.ill', 'result/f.ill')
+        commands = pipe_commands((self.dct, self.rmtx, dct, rmtx, final))
+        assert len(commands) == 2
+        assert len(commands[1]) == 3
+
+        commands = pipe_commands((self.dct, self.rmtx, dct, rmtx, final),
+                                 keep_files=('result/direct.ill',))
+        assert len(commands) == 3
+        assert all(hasattr(cmd, 'isPipeline') for cmd in commands[:2])
+        assert commands[2] is final
+
+        commands = pipe_commands((self.dct, self.rmtx), keep_files=('tmp/total.rgb',))
+        assert len(commands) == 2
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+import honeybee_plus.radiance.material as material
+from honeybee_plus.radiance.material.plastic import Plastic
+
+import importlib
+import subprocess
+import sys
+
+
+class LazyImportTestCase(unittest.TestCase):
+    """Test for (honeybee/radiance/_lazyimport.py)."""
+
+    @unittest.skipIf(sys.version_info < (3, 7), 'lazy exports need Python 3.7+')
+    def test_lazy_exports(self):
+        """Classes should be imported from sub-modules on first use."""
+        assert material.Plastic is Plastic
+        assert 'Plastic' in vars(material)
+        assert 'Mirror' in dir(material)
+        with self.assertRaises(AttributeError):
+            material.Plaster
+        from honeybee_plus.radiance.command import Rtrace
+        assert Rtrace.__module__ == 'honeybee_plus.radiance.command.rtrace'
+
+    @unittest.skipIf(sys.version_info < (3, 7), 'lazy exports need Python 3.7+')
+    def test_exports_resolve(self):
+        """Every name in the packages should be importable."""
+        for name in ('material', 'geometry', 'sky', 'command', 'parameters'):
+            package = importlib.import_module('honeybee_plus.radiance.' + name)
+            for attr in package.__dir__():
+                getattr(package, attr)
+
+    def test_command_import(self):
+        """Importing a command should not import ladybug or the materials."""
+        code = 'import sys, honeybee_plus.radiance.command.rtrace; ' \
+            'print(sorted(m for m in sys.modules if m.startswith(' \
+            '("ladybug", "honeybee_plus.radiance.material."))))'
+        output = subprocess.check_output([sys.executable, '-c', code])
+        assert output.strip().splitlines()[-1] == b'[]', output
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -83,6 +83,32 @@ class MaterialTypeTestCase(unittest.TestCase):
             ('void', 'plastic', 'grey', 0, 0, 5, 0.100, 0.100,
              0.100, 0.100, 0.001)
 
+    def test_cached_rad_string(self):
+        """Checking cached radiance strings are updated after changes."""
+        mixture = Plastic("mixture", 0.5, 0.5, 0.5)
+        plastic = Plastic("grey", 0.1, 0.1, 0.1, modifier=mixture)
+        rad_string = plastic.to_rad_string()
+        assert plastic.to_rad_string() is rad_string
+
+        plastic.r_reflectance = 0.2
+        assert '0.2 0.1 0.1' in plastic.to_rad_string()
+        plastic.name = 'dark_grey'
+        assert 'plastic dark_grey' in plastic.to_rad_string(minimal=True)
+        # change in modifier
+        mixture.g_reflectance = 0.3
+        assert '0.5 0.3 0.5' in plastic.to_rad_string()
+        plastic.modifier = None
+        assert plastic.to_rad_string().startswith('void plastic dark_grey')
+
+    def test_cached_rad_string_modifier_not_rendered(self):
+        """Changing a modifier which was never rendered should update the string."""
+        mixture = Plastic('mix', 0.2, 0.2, 0.2)
+        plastic = Plastic('grey', 0.1, 0.1, 0.1, modifier=mixture)
+        plastic.to_rad_string(include_modifier=False)
+        mixture.name = 'renamed'
+        assert plastic.to_rad_string(include_modifier=False).startswith(
+            'renamed plastic grey')
+
 
 if __name__ == '__main__':
     # You can run the test module from the root folder by running runtestunits.py
@@ -0,0 +1,82 @@
+import unittest
+from honeybee_plus.hbsurface import HBSurface
+from honeybee_plus.radiance.material.plastic import Plastic
+from honeybee_plus.radiance.materialregistry import MaterialRegistry
+from honeybee_plus.radiance.radfile import RadFile
+
+
+class MaterialRegistryTestCase(unittest.TestCase):
+    """Test for (honeybee/radiance/materialregistry.py)."""
+
+    # preparing to test
+    def setUp(self):
+        """Set up the test case by creating surfaces with separate materials."""
+        self.surfaces = []
+        for i in range(10):
+            pts = ((i, 0, 0), (i + 1, 0, 0), (i + 1, 0, 3), (i, 0, 3))
+            srf = HBSurface('wall_%d' % i, pts, 0)
+            name = 'generic_wall' if i < 8 else 'dark_wall'
+            value = 0.5 if i < 8 else 0.2
+            srf.radiance_material = Plastic(name, value, value, value)
+            self.surfaces.append(srf)
+
+    # ending the test
+    def tearDown(self):
+        """Cleaning up after the test."""
+        pass
+
+    def test_intern(self):
+        """Test sharing identical materials."""
+        # default black materials are only interned if they are created
+        for srf in self.surfaces:
+            srf.radiance_properties.black_material
+        registry = MaterialRegistry()
+        count = registry.intern_surfaces(self.surfaces)
+        # 2 materials and 2 black materials
+        self.assertEqual(count, 4)
+        self.assertEqual(registry.names, ('dark_wall', 'generic_wall'))
+        materials = [srf.radiance_material for srf in self.surfaces]
+        self.assertTrue(all(m is materials[0] for m in materials[:8]))
+        self.assertIsNot(materials[0], materials[9])
+        self.assertIs(self.surfaces[0].radiance_properties.black_material,
+                      self.surfaces[7].radiance_properties.black_material)
+        self.assertIn(Plastic('generic_wall', 0.5, 0.5, 0.5), registry)
+        self.assertEqual(registry.rad_string(materials[9]),
+                         materials[9].to_rad_string())
+
+    def test_rad_file(self):
+        """Test materials in RadFile after interning."""
+        rad_file = RadFile(self.surfaces)
+        before = rad_file.materials()
+        rad_file.intern_materials()
+        self.assertEqual(rad_file.materials(), before)
+        self.assertEqual(len(rad_file.materials()), 2)
+        self.assertEqual(len(tuple(rad_file.unique_materials())), 2)
+        self.assertEqual(sorted(rad_file.radiance_material_names()),
+                         ['dark_wall', 'generic_wall'])
+        self.assertEqual(rad_file.find_bsdf_materials(), ())
+
+    def test_key(self):
+        """Test keys for materials with different modifiers."""
+        base = Plastic('base', 0.5, 0.5, 0.5)
+        material = Plastic('wall', 0.5, 0.5, 0.5, modifier=base)
+        key = MaterialRegistry.key(material)
+        self.assertEqual(key, MaterialRegistry.key(
+            Plastic('wall', 0.5, 0.5, 0.5, modifier=Plastic('base', 0.5, 0.5, 0.5))))
+        self.assertNotEqual(key, MaterialRegistry.key(
+            Plastic('wall', 0.5, 0.5, 0.5, modifier=Plastic('base', 0.2, 0.2, 0.2))))
+        self.assertNotEqual(key, MaterialRegistry.key(Plastic('wall', 0.5, 0.5, 0.5)))
+
+    def test_shared_black_material(self):
+        """Test changing material for a surface with shared black material."""
+        registry = MaterialRegistry()
+        registry.intern_surfaces(self.surfaces)
+        self.surfaces[0].radiance_material = Plastic('new_wall')
+        self.assertEqual(
+            self.surfaces[0].radiance_properties.black_material.name, 'new_wall')
+        self.assertEqual(
+            self.surfaces[1].radiance_properties.black_material.name, 'generic_wall')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+from __future__ import division
+import unittest
+from honeybee_plus.schedule import Schedule
+from honeybee_plus.radiance.analysisgrid import AnalysisGrid
+from honeybee_plus.radiance.quantization import LinearQuantizer, LogQuantizer, \
+    QuantizedHourlyValues
+from honeybee_plus.radiance.resultcollection.database import Database
+from honeybee_plus.radiance.resultcollection.timeseries import TimeSeries
+
+import os
+import random
+import shutil
+import tempfile
+
+
+class QuantizationTestCase(unittest.TestCase):
+    """Test for (honeybee/radiance/quantization.py)."""
+
+    # preparing to test
+    def setUp(self):
+        """Set up the test case by writing an annual result file."""
+        self.folder = tempfile.mkdtemp()
+        self.result_file = os.path.join(self.folder, 'results.ill')
+        self.sensor_count = 4
+        self.hoys = list(range(8760))
+        rnd = random.Random(0)
+        with open(self.result_file, 'w') as outf:
+            for s in range(self.sensor_count):
+                values = (int(rnd.lognormvariate(5.5, 1.5)) if 6 < h % 24 < 19 else 0
+                          for h in self.hoys)
+                outf.write('\t'.join(str(v) for v in values) + '\t\n')
+
+    # ending the test
+    def tearDown(self):
+        """Cleaning up after the test."""
+        shutil.rmtree(self.folder)
+
+    def _grid(self, quantizer=None):
+        pts = [(i, 0, 0) for i in range(self.sensor_count)]
+        ag = AnalysisGrid.from_points_and_vectors(pts, name='test_grid')
+        ag.quantizer = quantizer
+        ag.set_values_from_file(self.result_file, self.hoys, header=False)
+        return ag
+
+    def test_linear_error_bound(self):
+        """Decoded values should be within scale / 2 of the input."""
+        q = LinearQuantizer.from_max_value(100000)
+        for v in (0, 0.4, 1, 299.6, 300, 12345.678, 100000):
+            assert abs(q.decode(q.encode(v)) - v) <= q.max_error + 1e-9
+        assert q.encode(-5) == 0
+        assert q.encode(10 ** 7) == 2 ** 16 - 1
+
+    def test_log_error_bound(self):
+        """Decoded values should be within the relative error bound of the input."""
+        q = LogQuantizer()
+        assert q.max_relative_error < 0.0002
+        assert q.decode(q.encode(0)) == 0
+        for v in (0.02, 1, 299, 300, 301, 12345.678, 999999):
+            assert abs(q.decode(q.encode(v)) - v) <= v * q.max_relative_error + 1e-12
+
+    def test_hourly_values(self):
+        """Quantized container should behave like the hourly dictionary."""
+        values = QuantizedHourlyValues(LogQuantizer())
+        values.set_value(120, 0, 1000)
+        values[60] = (500, 250)
+        assert values.keys() == [60, 120]
+        assert 60 in values and 180 not in values
+        assert values[120][1] is None
+        assert abs(values[60][1] - 250) < 0.1
+
+    def test_annual_metrics_parity(self):
+        """Annual metrics from quantized values should match the original values.
+
+        Only the hours with a value within the error bound of a threshold can change.
+        """
+        grid = self._grid()
+        expected = grid.annual_metrics()
+        occ_hour_count = len(Schedule.eight_am_to_six_pm().occupied_hours)
+        for q in (LogQuantizer(), LinearQuantizer.from_max_value(60000)):
+            ag = self._grid(q)
+            assert ag.analysis_points[0].quantizer == q
+            for count, ap in enumerate(ag):
+                near_threshold = 0
+                for v in grid[count].values(state=0):
+                    error = q.max_error if hasattr(q, 'max_error') \
+                        else v * q.max_relative_error
+                    if any(abs(v - t) <= error for t in (100, 300, 3000)):
+                        near_threshold += 1
+                tolerance = 100 * near_threshold / occ_hour_count + 1e-9
+                for metric, exp_metric in zip(ag.annual_metrics(), expected):
+                    assert abs(metric[count] - exp_metric[count]) <= tolerance
+                    assert tolerance < 0.5
+
+    def test_database_quantization(self):
+        """Values should be stored as codes and decoded on read."""
+        db_file = os.path.join(self.folder, 'radout.db')
+        db = Database(db_file)
+        db.add_analysis_grids([self._grid()])
+        q = LinearQuantizer.from_max_value(60000, bits=Database.QUANTIZATIONBITS)
+        db.set_grid_quantizer(0, q)
+        assert db.grid_quantizer(0) == q
+        db.add_result_tables(200002)
+        db.load_dc_result_from_file(
+            self.result_file, 'two_phase', moys=[h * 60 for h in self.hoys],
+            header=False)
+        stored = db.execute('SELECT MAX(value) FROM two_phase;')[0][0]
+        assert stored <= 2 ** 15 - 1
+
+        ts = TimeSeries(db_file, recipe_id=200002)
+        with open(self.result_file) as inf:
+            first_sensor = [float(v) for v in next(inf).split()]
+        values = ts.values(hoys=[12, 13, 14])[0]
+        for v, ev in zip(values, first_sensor[12:15]):
+            assert abs(v - min(ev, q.max_value)) <= q.max_error + 1e-9
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+import unittest
+from honeybee_plus.hbsurface import HBSurface
+from honeybee_plus.hbfensurface import HBFenSurface
+from honeybee_plus.radiance.geometry.polygon import Polygon
+from honeybee_plus.radiance.material.plastic import BlackMaterial
+from honeybee_plus.radiance.geometry.mesh import Mesh
+from honeybee_plus.radiance.radfile import RadFile, polygon_rad_string, \
+    mesh_rad_string
+
+import os
+import shutil
+import tempfile
+
+
+class RadFileTestCase(unittest.TestCase):
+    """Test for (honeybee/radiance/radfile.py)."""
+
+    # preparing to test
+    def setUp(self):
+        """Set up the test case by creating a few surfaces."""
+        self.folder = tempfile.mkdtemp()
+        surfaces = []
+        for i in range(10):
+            pts = ((i, 0, 0), (i + 1, 0, 0), (i + 1, 0, 3), (i, 0, 3))
+            surfaces.append(HBSurface('wall_%d' % i, pts, surface_type=0))
+        self.rad_file = RadFile(surfaces)
+
+    # ending the test
+    def tearDown(self):
+        """Cleaning up after the test."""
+        shutil.rmtree(self.folder)
+
+    def test_polygon_string(self):
+        """Polygon string should match the Polygon primitive."""
+        srf = self.rad_file.hb_surfaces[0]
+        pts = srf.duplicate_vertices()[0]
+        expected = Polygon(srf.name, pts, srf.radiance_material) \
+            .to_rad_string(include_modifier=False)
+        assert polygon_rad_string(srf.radiance_material.name, srf.name, pts) == \
+            expected
+        assert RadFile.get_surface_rad_string(srf) == expected
+
+    def test_write(self):
+        """Materials should be written once followed by all the geometries."""
+        fp = self.rad_file.write(self.folder, 'test.rad')
+        with open(fp) as inf:
+            content = inf.read()
+        assert content.count(' plastic ') == 1
+        assert content.count(' polygon ') == 10
+        assert content.endswith(self.rad_file.geometries(join=True) + '\n')
+
+    def test_write_blacked(self):
+        """All the geometries should use black material as modifier."""
+        fp = self.rad_file.write_geometries_blacked(self.folder, 'black.rad')
+        name = BlackMaterial().name
+        with open(fp) as inf:
+            lines = [line for line in inf if ' polygon ' in line]
+        assert len(lines) == 10
+        assert all(line.startswith(name + ' polygon ') for line in lines)
+
+    def test_write_meshes(self):
+        """Quads should be written to an obj file and a mesh for each material."""
+        wall = HBSurface('wall', ((0, 1, 0), (5, 1, 0), (5, 1, 3), (2, 1, 4), (0, 1, 3)))
+        self.rad_file.hb_surfaces.append(wall)
+        fp = self.rad_file.write_meshes(self.folder, 'test.rad', execute=False)
+        with open(fp) as inf:
+            content = inf.read()
+        assert content.count(' mesh ') == 1
+        assert content.count(' polygon ') == 1
+        with open(os.path.join(self.folder, 'test..generic_wall.obj')) as inf:
+            lines = inf.read().split('\n')
+        assert sum(1 for line in lines if line.startswith('v ')) == 22
+        assert sum(1 for line in lines if line.startswith('f ')) == 10
+        assert lines.index('f 1 2 3 4') > 0
+
+        srf = self.rad_file.hb_surfaces[0]
+        expected = Mesh('context', 'context.msh', modifier=srf.radiance_material) \
+            .to_rad_string(include_modifier=False)
+        assert mesh_rad_string(srf.radiance_material.name, 'context', 'context.msh') \
+            == expected
+
+    def test_write_meshes_project_folder(self):
+        """Meshes should be relative to the project and compiled by the commands."""
+        scene_folder = os.path.join(self.folder, 'scene', 'opaque')
+        self.rad_file.as_mesh = True
+        fp = self.rad_file.write_geometries(scene_folder, 'test.rad', mkdir=True,
+                                            project_folder=self.folder)
+        with open(fp) as inf:
+            content = inf.read()
+        assert '\n1 scene/opaque/test..generic_wall.msh\n' in content
+        assert self.folder not in content
+        assert self.rad_file.mesh_commands == (
+            'obj2mesh scene/opaque/test..generic_wall.obj '
+            'scene/opaque/test..generic_wall.msh',)
+        assert not os.path.isfile(os.path.join(scene_folder, 'test..generic_wall.msh'))
+
+    def test_curtain_wall(self):
+        """Stitching many windows should not hit the recursion limit."""
+        wall = HBSurface('wall', ((0, 0, 0), (80, 0, 0), (80, 0, 80), (0, 0, 80)))
+        for i in range(1200):
+            x, z = 2 * (i % 40) + 0.5, 2 * (i // 40) + 0.5
+            wall.add_fenestration_surface(HBFenSurface(
+                'glass_%d' % i, ((x, 0, z), (x + 1, 0, z), (x + 1, 0, z + 1),
+                                 (x, 0, z + 1))))
+        polyline = wall.duplicate_vertices()[0]
+        assert len(polyline) == 5 + 6 * 1200
+        assert polyline[:6] == [(0, 0, 0), (80, 0, 0), (80, 0, 80), (0, 0, 80),
+                                (0, 0, 0), (0.5, 0, 0.5)]
+        # polyline is cached until the points change
+        assert wall.duplicate_vertices()[0] == polyline
+        wall.children_surfaces[0].points = ((0.5, 0, 0.5), (1.5, 0, 0.5), (1, 0, 1))
+        assert len(wall.duplicate_vertices()[0]) == len(polyline) - 1
+        wall.add_fenestration_surface(HBFenSurface(
+            'glass', ((0.5, 0, 79), (1.5, 0, 79), (1.5, 0, 79.5), (0.5, 0, 79.5))))
+        assert len(wall.duplicate_vertices()[0]) == len(polyline) + 5
+
+
+if __name__ == '__main__':
+    unittest.main()
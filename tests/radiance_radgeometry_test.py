@@ -0,0 +1,126 @@
+import unittest
+from honeybee_plus.hbsurface import HBSurface
+from honeybee_plus.hbfensurface import HBFenSurface
+from honeybee_plus.radiance.radfile import RadFile
+from honeybee_plus.radiance.radgeometry import RadGeometry
+from honeybee_plus.radiance.radparser import iter_records_from_file
+from honeybee_plus.radiance.recipe.recipeutil import input_srfs_to_rad_files
+
+import os
+import shutil
+import tempfile
+
+
+class RadGeometryTestCase(unittest.TestCase):
+    """Test for (honeybee/radiance/radgeometry.py)."""
+
+    # preparing to test
+    def setUp(self):
+        """Set up the test case by writing a Radiance file."""
+        self.folder = tempfile.mkdtemp()
+        self.rad_file = os.path.join(self.folder, 'context.rad')
+        with open(self.rad_file, 'w') as outf:
+            outf.write('# context\n'
+                       'void plastic ground_mat\n0\n0\n5 0.2 0.2 0.2 0 0\n\n'
+                       'void plastic building_mat\n0\n0\n5 0.5 0.5 0.5 0 0\n\n'
+                       'ground_mat polygon ground\n0\n0\n12\n'
+                       '-100 -100 0\n100 -100 0\n100 100 0\n-100 100 0\n\n'
+                       'building_mat sphere dome\n0\n0\n4 50 50 10 5\n\n')
+            for i in range(10):
+                outf.write('building_mat polygon building_%d\n0\n0\n9\n'
+                           '%d 0 0\n%d 0 0\n%d 0 10\n\n'
+                           % (i, i * 20, i * 20 + 10, i * 20))
+
+    # ending the test
+    def tearDown(self):
+        """Cleaning up after the test."""
+        shutil.rmtree(self.folder)
+
+    def test_import(self):
+        """Test importing polygons to arrays."""
+        geometry = RadGeometry.from_files([self.rad_file])
+        assert geometry.polygon_count == 11
+        assert geometry.vertex_count == 34
+        assert geometry.modifier_names == ['ground_mat', 'building_mat']
+        assert [r.name for r in geometry.modifiers] == ['ground_mat', 'building_mat']
+        assert [r.name for r in geometry.others] == ['dome']
+        assert geometry.modifier_name(3) == 'building_mat'
+        assert geometry.points(3) == ((40, 0, 0), (50, 0, 0), (40, 0, 10))
+
+    def test_blacked_non_polygons(self):
+        """Blacked and glowed materials should include non-polygon modifiers."""
+        rad_file = os.path.join(self.folder, 'ball.rad')
+        with open(rad_file, 'w') as outf:
+            outf.write('void plastic grey\n0\n0\n5 0.5 0.5 0.5 0 0\n\n'
+                       'void plastic blue\n0\n0\n5 0 0 0.8 0 0\n\n'
+                       'grey polygon floor\n0\n0\n9\n0 0 0\n1 0 0\n1 1 0\n\n'
+                       'blue sphere ball\n0\n0\n4 0 0 1 0.5\n\n')
+        geometry = RadGeometry.from_files(rad_file)
+        for kwargs in ({'blacked': True}, {'glowed': True}):
+            materials = [m.split()[2] for m in geometry.iter_materials(**kwargs)]
+            assert materials == ['grey', 'blue']
+        assert geometry.subset([]).modifier_names == ['blue']
+        combined = RadGeometry()
+        combined.extend(geometry)
+        assert sorted(combined.modifier_names) == ['blue', 'grey']
+
+    def test_filter_and_transform(self):
+        """Test filtering and moving polygons."""
+        geometry = RadGeometry.from_files(self.rad_file)
+        buildings = geometry.filter_by_modifiers(['ground_mat'], exclude=True)
+        assert buildings.names[0] == 'building_0' and len(buildings) == 10
+        assert len(buildings.others) == 1
+        near = geometry.filter_by_bounding_box((-10, -10, -10), (45, 10, 10))
+        assert near.names == ['ground'] + ['building_%d' % i for i in range(3)]
+        near.move((0, 0, -2))
+        assert near.points(1)[2] == (0, 0, 8)
+        near.transform(((0, -1, 0, 0), (1, 0, 0, 0), (0, 0, 1, 0)))
+        assert near.points(2)[1] == (0, 30, -2)
+
+    def test_rad_file(self):
+        """Test importing and writing back with RadFile."""
+        rad_file = RadFile.from_file([self.rad_file])
+        assert sorted(rad_file.radiance_material_names()) == \
+            ['building_mat', 'ground_mat']
+        rad_file.write(self.folder, 'out.rad')
+        records = list(iter_records_from_file(os.path.join(self.folder, 'out.rad')))
+        original = list(iter_records_from_file(self.rad_file))
+        assert len(records) == len(original)
+        assert records[2].type == 'polygon' and records[-1].type == 'sphere'
+        assert [float(v) for v in records[2].real_args] == \
+            [float(v) for v in original[2].real_args]
+
+        flipped = list(rad_file.rad_geometry.iter_geometries(flipped=True))
+        assert flipped[1].endswith('9 0.0 0.0 10.0 10.0 0.0 0.0 0.0 0.0 0.0')
+        black = list(rad_file.iter_materials(blacked=True))
+        assert len(black) == 2 and black[0].startswith('void plastic ground_mat')
+
+    def test_surfaces(self):
+        """Test creating geometry from honeybee surfaces."""
+        wall = HBSurface('wall', ((0, 0, 0), (10, 0, 0), (10, 0, 3), (0, 0, 3)))
+        wall.add_fenestration_surface(
+            HBFenSurface('glass', ((2, 0, 1), (8, 0, 1), (8, 0, 2), (2, 0, 2))))
+        floor = HBSurface('floor', ((0, 0, 0), (0, 10, 0), (10, 10, 0), (10, 0, 0)))
+        surfaces = [wall, floor]
+        geometry = RadGeometry.from_surfaces(surfaces)
+        rad_file = RadFile(surfaces)
+        for mode in range(3):
+            for flipped in (False, True):
+                assert RadFile([], rad_geometry=RadGeometry.from_surfaces(
+                    surfaces, mode, flipped)).geometries(0, flipped=False) == \
+                    rad_file.geometries(mode, flipped=flipped)
+        assert RadFile([], rad_geometry=geometry).materials(0) == rad_file.materials()
+
+        for count, srf in enumerate(surfaces):
+            normal = geometry.normal(count)
+            assert all(abs(a - b) < 1e-9 for a, b in zip(normal, srf.normal))
+        assert abs(geometry.area(1) - 100) < 1e-9
+        assert abs(geometry.area(2) - 6) < 1e-9
+
+        opq, glz, _ = input_srfs_to_rad_files([geometry])
+        assert opq.rad_geometry.names == ['wall', 'floor']
+        assert glz.rad_geometry.names == ['glass']
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+from honeybee_plus.radiance.radparser import iter_records, iter_records_from_file, \
+    parse_from_string
+
+import os
+import shutil
+import tempfile
+
+
+class RadparserTestCase(unittest.TestCase):
+    """Test for (honeybee/radiance/radparser.py)."""
+
+    # preparing to test
+    def setUp(self):
+        """Set up the test case by initiating the class."""
+        self.rad_string = \
+            '# materials\n' \
+            '!xform -n context context.rad\n' \
+            'void brightfunc glass_angular_effect\n' \
+            '2 A1+(1-A1)(exp(-5.85Rdot)-0.00287989916) .\n' \
+            '0\n' \
+            '1 0.08\n' \
+            '\n' \
+            'glass_angular_effect mirror glass_mat 1 void 0 3 1 1 1  # inline\n' \
+            'glass_mat polygon window\n' \
+            '0\n' \
+            '0\n' \
+            '12\n' \
+            '    0 0 0\n' \
+            '    1 0 0\n' \
+            '    1 0 1\n' \
+            '    0 0 1\n'
+        self.folder = tempfile.mkdtemp()
+
+    # ending the test
+    def tearDown(self):
+        """Cleaning up after the test."""
+        shutil.rmtree(self.folder)
+
+    def test_records(self):
+        """Test parsing comments, commands and multi-line objects."""
+        records = list(iter_records(self.rad_string.splitlines()))
+        assert [r.type for r in records] == ['brightfunc', 'mirror', 'polygon']
+        assert records[0].string_args == \
+            ['A1+(1-A1)(exp(-5.85Rdot)-0.00287989916)', '.']
+        assert records[0].real_args == ['0.08']
+        assert records[1].modifier == 'glass_angular_effect'
+        assert records[1].string_args == ['void']
+        assert records[2].name == 'window'
+        assert len(records[2].real_args) == 12
+        assert parse_from_string(self.rad_string)[1] == \
+            'glass_angular_effect mirror glass_mat 1 void 0 3 1 1 1'
+
+    def test_file(self):
+        """Test parsing a file in blocks."""
+        file_path = os.path.join(self.folder, 'test.rad')
+        with open(file_path, 'w') as outf:
+            for i in range(100):
+                outf.write(self.rad_string.replace('window', 'window_%d' % i))
+        records = list(iter_records_from_file(file_path, block_size=64))
+        assert len(records) == 300
+        assert records[-1].name == 'window_99'
+        assert records[-1].real_args[-3:] == ['0', '0', '1']
+
+    def test_invalid_input(self):
+        """Test errors for incomplete or invalid objects."""
+        with self.assertRaises(ValueError):
+            list(iter_records(['void plastic mat 0 0 5 0.5 0.5']))
+        with self.assertRaises(ValueError):
+            list(iter_records(['void plastic mat 0 0 five 0.5 0.5 0.5 0 0']))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+from honeybee_plus.radiance.recipe.checkpoint import CheckpointManifest
+from honeybee_plus.radiance.recipe.runreport import profile_command_file
+
+import os
+import shutil
+import sys
+import tempfile
+
+
+class CheckpointTestCase(unittest.TestCase):
+    """Test for (honeybee/radiance/recipe/checkpoint.py)."""
+
+    # preparing to test
+    def setUp(self):
+        """Set up the test case by writing a command file with two steps."""
+        self.folder = tempfile.mkdtemp()
+        self.write_file('sky.rad', 'void glow sky_glow 0 0 4 1 1 1 0\n')
+        copy = '"{}" -c "import sys; print(open(sys.argv[1]).read())" {} > {}'
+        self.command_file = os.path.join(self.folder, 'commands.bat')
+        with open(self.command_file, 'w') as outf:
+            outf.write('\n'.join((
+                'cd {}'.format(self.folder),
+                copy.format(sys.executable, 'sky.rad', 'sky_1.rad'),
+                copy.format(sys.executable, 'sky_1.rad', 'sky_2.rad'))))
+
+    # ending the test
+    def tearDown(self):
+        """Cleaning up after the test."""
+        shutil.rmtree(self.folder)
+
+    def write_file(self, name, content):
+        with open(os.path.join(self.folder, name), 'w') as outf:
+            outf.write(content)
+
+    def run_commands(self):
+        """Run the commands and return the skipped steps."""
+        manifest = CheckpointManifest.from_command_file(self.command_file)
+        report = profile_command_file(self.command_file, manifest=manifest)
+        assert report.succeeded
+        return [s.skipped for s in report]
+
+    def test_resume(self):
+        """Only the steps with changed files should be executed again."""
+        assert self.run_commands() == [False, False]
+        assert len(CheckpointManifest.from_command_file(self.command_file)) == 2
+        assert self.run_commands() == [True, True]
+
+        os.remove(os.path.join(self.folder, 'sky_2.rad'))
+        assert self.run_commands() == [True, False]
+
+        # the first output changes and the second step should also be executed
+        self.write_file('sky.rad', 'void glow sky_glow 0 0 4 2 2 2 0\n')
+        assert self.run_commands() == [False, False]
+
+
+if __name__ == '__main__':
+    unittest.main()
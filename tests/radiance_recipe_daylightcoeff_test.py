@@ -0,0 +1,65 @@
+import unittest
+from honeybee_plus.radiance.analysisgrid import AnalysisGrid
+from honeybee_plus.radiance.recipe.daylightcoeff.gridbased import \
+    DaylightCoeffGridBased
+from honeybee_plus.radiance.sky.skymatrix import SkyMatrix
+from honeybee_plus.hbsurface import HBSurface
+
+import os
+import shutil
+import tempfile
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+
+class DaylightCoeffGridBasedTestCase(unittest.TestCase):
+    """Test for (honeybee/radiance/recipe/daylightcoeff/gridbased.py)."""
+
+    # preparing to test
+    def setUp(self):
+        """Set up the test case by initiating a recipe with a wall."""
+        self.folder = tempfile.mkdtemp()
+        sky = SkyMatrix.from_epw_file(os.path.abspath('tests/room/test.epw'))
+        analysis_grid = AnalysisGrid.from_points_and_vectors([(1, 1, 0.8)])
+        wall = HBSurface('wall', ((0, 0, 0), (2, 0, 0), (2, 0, 3), (0, 0, 3)), 0)
+        self.rp = DaylightCoeffGridBased(sky, [analysis_grid], hb_objects=[wall],
+                                         context_as_instance=True)
+
+    # ending the test
+    def tearDown(self):
+        """Cleaning up after the test."""
+        shutil.rmtree(self.folder)
+
+    def test_context_commands_reused_sky(self):
+        """Context octrees should be built if the sky matrices are reused."""
+        self.rp.write(self.folder, 'room')
+        sky_folder = os.path.join(self.folder, 'room', self.rp.sub_folder, 'sky')
+        for command in self.rp.commands:
+            if str(command).startswith('gendaymtx'):
+                smx = str(command).split('>')[-1].strip()
+                open(os.path.join(sky_folder, os.path.basename(smx)), 'w').close()
+
+        with mock.patch.object(SkyMatrix, 'hours_match', return_value=True):
+            self.rp.write(self.folder, 'room')
+        commands = [str(c) for c in self.rp.commands]
+        assert not any(c.startswith('gendaymtx') for c in commands)
+        oconvs = [i for i, c in enumerate(commands) if '..ctx' in c.split('>')[-1]]
+        rflux = [i for i, c in enumerate(commands) if c.startswith('rfluxmtx')]
+        assert len(oconvs) == 2 and rflux and max(oconvs) < min(rflux)
+
+    def test_context_as_instance_json(self):
+        """context_as_instance should be kept in JSON."""
+        with mock.patch.object(SkyMatrix, 'to_json', return_value={}), \
+                mock.patch.object(SkyMatrix, 'from_json',
+                                  return_value=self.rp.sky_matrix):
+            rec_json = self.rp.to_json()
+            assert rec_json['context_as_instance'] is True
+            assert DaylightCoeffGridBased.from_json(rec_json).context_as_instance
+            del rec_json['context_as_instance']
+            assert not DaylightCoeffGridBased.from_json(rec_json).context_as_instance
+
+
+if __name__ == '__main__':
+    unittest.main()
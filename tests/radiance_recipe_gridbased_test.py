@@ -3,8 +3,13 @@ from honeybee_plus.radiance.sky.certainIlluminance \
     import CertainIlluminanceLevel as radSky
 from honeybee_plus.radiance.analysisgrid import AnalysisGrid
 from honeybee_plus.radiance.recipe.pointintime.gridbased import GridBased
+from honeybee_plus.radiance.sky.cie import CIE
 
 import pytest
+try:
+    from unittest import mock
+except ImportError:
+    import mock
 
 
 class GridbasedTestCase(unittest.TestCase):
@@ -40,6 +45,16 @@ class GridbasedTestCase(unittest.TestCase):
             self.rp.results("Results should not be available unless the analysis is executed!")
         # more tests here
 
+    def test_json(self):
+        """Ambient cache should be set from the arguments and kept in JSON."""
+        rp = GridBased(self.rp.sky, self.rp.analysis_grids, ambient_cache=True)
+        rec_json = rp.to_json()
+        assert rec_json['ambient_cache'] is True
+        with mock.patch.object(CIE, 'from_json', return_value=rp.sky):
+            assert GridBased.from_json(rec_json).ambient_cache
+            del rec_json['ambient_cache']
+            assert not GridBased.from_json(rec_json).ambient_cache
+
     # test for specific cases
     def test_single_point_input(self):
         """A single point should be converted to a single test group."""
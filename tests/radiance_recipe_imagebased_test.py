@@ -0,0 +1,78 @@
+import unittest
+from honeybee_plus.radiance.sky.climatebased import ClimateBased
+from honeybee_plus.radiance.view import View
+from honeybee_plus.radiance.recipe.pointintime.imagebased import ImageBased
+
+import os
+import shutil
+import tempfile
+
+
+class ImageBasedTestCase(unittest.TestCase):
+    """Test for (honeybee/radiance/recipe/pointintime/imagebased.py)."""
+
+    # preparing to test
+    def setUp(self):
+        """Set up the test case by initiating the class."""
+        self.folder = tempfile.mkdtemp()
+        self.view = View('test_view', view_h_size=90, view_v_size=60,
+                         x_resolution=1000, y_resolution=1000)
+        sky = ClimateBased.from_lat_long('test', 42.3, -71.0, -5, 0, 6, 21, 12, 800, 150)
+        self.rp = ImageBased(sky, [self.view])
+
+    # ending the test
+    def tearDown(self):
+        """Cleaning up after the test."""
+        shutil.rmtree(self.folder)
+
+    def test_view_grid(self):
+        """Sub-views should cover the view without gaps."""
+        views = self.view.calculate_view_grid(2, 3)
+        assert len(views) == 6
+        assert [(v.view_shift, v.view_lift) for v in views[:3]] == \
+            [(-0.5, -1), (0.5, -1), (-0.5, 0)]
+        x_res, y_res = self.view.pixel_resolution()
+        assert (x_res, y_res) == (1000, 577)
+        assert (views[0].x_resolution, views[0].y_resolution) == (500, 192)
+        assert abs(views[0].view_v_size - 21.787) < 0.001
+
+    def test_tiled_commands(self):
+        """Tiles should be rendered separately and stitched with pcompos."""
+        self.rp.view_grid = (2, 2)
+        self.rp.write(self.folder, 'tiled')
+        project_folder = os.path.join(self.folder, 'tiled', 'imagebased')
+        rpict = [c for c in self.rp.commands if c.startswith('rpict')]
+        assert len(rpict) == 4
+        assert all('-pa 0' in c for c in rpict)
+        assert os.path.isfile(os.path.join(project_folder, 'view', 'test_view_3.vf'))
+        assert self.rp.commands[-1] == \
+            'pcompos result/test_view_0.hdr 0 0 result/test_view_1.hdr 500 0 ' \
+            'result/test_view_2.hdr 0 288 result/test_view_3.hdr 500 288 ' \
+            '> result/test_view.hdr'
+        assert self.rp.result_files == \
+            [os.path.join(project_folder, 'result/test_view.hdr')]
+
+    def test_ambient_cache(self):
+        """Overture and tiles should share the same ambient file."""
+        self.rp.view_grid = (2, 1)
+        self.rp.ambient_cache = True
+        self.rp.write(self.folder, 'cached')
+        rpict = [c for c in self.rp.commands if c.startswith('rpict')]
+        assert len(rpict) == 3
+        assert '-x 64 -y 64' in rpict[0] and 'test_view_overture' in rpict[0]
+        ambient_files = set(c.split(' -af ')[1].split()[0] for c in rpict)
+        assert len(ambient_files) == 1
+        ambient_file = ambient_files.pop()
+        assert ambient_file.startswith(os.path.join('..', 'ambient', ''))
+        assert not self.rp.radiance_parameters.ambient_file.to_rad_string()
+
+        # the same scene and sky should use the same ambient file
+        self.rp.write(self.folder, 'cached')
+        assert ' -af {} '.format(ambient_file) in self.rp.commands[-2]
+        self.rp.radiance_parameters.ambient_bounces = 3
+        self.rp.write(self.folder, 'cached')
+        assert ' -af {} '.format(ambient_file) not in self.rp.commands[-2]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+from honeybee_plus.radiance.sky.certainIlluminance \
+    import CertainIlluminanceLevel as radSky
+from honeybee_plus.radiance.analysisgrid import AnalysisGrid
+from honeybee_plus.radiance.recipe.pointintime.gridbased import GridBased
+from honeybee_plus.radiance.recipe.photonmap import PhotonMap
+from honeybee_plus.radiance.sky.cie import CIE
+from honeybee_plus.hbsurface import HBSurface
+
+import os
+import shutil
+import tempfile
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+
+class PhotonMapTestCase(unittest.TestCase):
+    """Test for (honeybee/radiance/recipe/photonmap.py)."""
+
+    # preparing to test
+    def setUp(self):
+        """Set up the test case by initiating a recipe with a window."""
+        self.folder = tempfile.mkdtemp()
+        window = HBSurface('window', ((0, 0, 1), (2, 0, 1), (2, 0, 2), (0, 0, 2)), 5)
+        analysis_grid = AnalysisGrid.from_points_and_vectors([(1, 1, 0.8)])
+        self.rp = GridBased(radSky(1000), analysis_grids=[analysis_grid],
+                            hb_objects=[window], photon_map=PhotonMap(20000, 5000))
+
+    # ending the test
+    def tearDown(self):
+        """Cleaning up after the test."""
+        shutil.rmtree(self.folder)
+
+    def test_commands(self):
+        """mkpmap should run after oconv and rtrace should use the photon maps."""
+        self.rp.write(self.folder, 'pmap')
+        mkpmap = self.rp.commands[-3]
+        rtrace = self.rp.commands[-2]
+        assert mkpmap.startswith('mkpmap') and self.rp.commands[-4].startswith('oconv')
+        gpm = mkpmap.split(' -apg ')[1].split()[0]
+        assert gpm.startswith(os.path.join('..', 'photonmap', ''))
+        assert ' -apg {} 20000 '.format(gpm) in mkpmap
+        assert ' -apc {} 5000 '.format(gpm[:-4] + '.cpm') in mkpmap
+        assert ' -apO {}'.format(gpm[:-4] + '.ports') in mkpmap
+        assert ' -ap {} 50 -ap {} 50 '.format(gpm, gpm[:-4] + '.cpm') in rtrace
+        assert ' -ab 1 ' in rtrace
+        assert self.rp.radiance_parameters.ambient_bounces == 2
+
+        project_folder = os.path.join(self.folder, 'pmap', 'gridbased')
+        with open(os.path.join(project_folder, gpm[:-4] + '.ports')) as inf:
+            assert inf.read().split() == \
+                sorted(self.rp.glazing_rad_file.radiance_material_names())
+
+        # photon maps are reused for the same scene and sky
+        for ext in ('.gpm', '.cpm'):
+            open(os.path.join(project_folder, gpm[:-4] + ext), 'w').close()
+        self.rp.write(self.folder, 'pmap')
+        assert not any(c.startswith('mkpmap') for c in self.rp.commands)
+        assert ' -ap {} 50 '.format(gpm) in self.rp.commands[-2]
+
+    def test_json(self):
+        """Photon map settings should be kept in the recipe JSON."""
+        self.rp.photon_map.ports = ['glass']
+        self.rp.photon_map.mkpmap_parameters.max_bounce = 5
+        rec_json = self.rp.to_json()
+        with mock.patch.object(CIE, 'from_json', return_value=self.rp.sky):
+            photon_map = GridBased.from_json(rec_json).photon_map
+            assert photon_map.to_json() == self.rp.photon_map.to_json()
+            assert photon_map.mkpmap_parameters.to_rad_string() == '-apm 5'
+            rec_json['photon_map'] = None
+            assert GridBased.from_json(rec_json).photon_map is None
+
+
+if __name__ == '__main__':
+    unittest.main()
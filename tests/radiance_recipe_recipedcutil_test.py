@@ -0,0 +1,55 @@
+import unittest
+from honeybee_plus.radiance.geometry.instance import Instance
+from honeybee_plus.radiance.recipe.recipedcutil import \
+    write_context_instance_daylight_coeff
+
+from collections import namedtuple
+import os
+import shutil
+import tempfile
+
+
+class RecipeDCUtilTestCase(unittest.TestCase):
+    """Test for (honeybee/radiance/recipe/recipedcutil.py)."""
+
+    # preparing to test
+    def setUp(self):
+        """Set up the test case by creating the opaque and extra files."""
+        self.folder = tempfile.mkdtemp()
+        Files = namedtuple('Files', ['fp', 'fpblk'])
+        opaque = os.path.join(self.folder, 'scene', 'opaque')
+        extra = os.path.join(self.folder, 'scene', 'extra')
+        os.makedirs(opaque)
+        geometry = os.path.join(opaque, 'room..opq.rad')
+        self.opqfiles = Files((os.path.join(opaque, 'room..opq.mat'), geometry),
+                              (os.path.join(opaque, 'room..blk.mat'), geometry))
+        self.extrafiles = Files(
+            (os.path.join(extra, 'site.rad'), os.path.join(extra, 'trees.oct')),
+            (os.path.join(extra, 'black.mat'), os.path.join(extra, 'site_blacked.rad'))
+        )
+
+    # ending the test
+    def tearDown(self):
+        """Cleaning up after the test."""
+        shutil.rmtree(self.folder)
+
+    def test_context_instance(self):
+        """Static context should be frozen once and replaced by instances."""
+        opqfiles, extrafiles, commands = write_context_instance_daylight_coeff(
+            self.folder, 'room', self.opqfiles, self.extrafiles)
+
+        oconvs = [c for c in commands if not c.startswith('::')]
+        assert len(oconvs) == 2
+        assert 'site.rad' in oconvs[0] and 'trees.oct' not in oconvs[0]
+        assert 'site_blacked.rad' in oconvs[1] and 'room..blk.mat' in oconvs[1]
+        assert extrafiles.fp == (self.extrafiles.fp[1],)
+        assert extrafiles.fpblk == ()
+
+        with open(opqfiles.fp[0]) as inf:
+            instance = Instance.from_string(inf.read())
+        assert instance.octree_file == 'scene/opaque/room..ctx.oct'
+        assert oconvs[0].endswith(os.path.normpath(instance.octree_file))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import unittest
+from honeybee_plus.hbsurface import HBSurface
+from honeybee_plus.radiance.analysisgrid import AnalysisGrid
+from honeybee_plus.radiance.material.glass import Glass
+from honeybee_plus.radiance.material.plastic import Plastic
+from honeybee_plus.radiance.radgeometry import RadGeometry
+from honeybee_plus.radiance.radparser import iter_records
+from honeybee_plus.radiance.recipe.recipepackage import read_recipe_package
+from honeybee_plus.radiance.recipe.solaraccess.gridbased import SolarAccessGridBased
+
+import os
+import shutil
+import tempfile
+
+
+class RecipePackageTestCase(unittest.TestCase):
+    """Test for (honeybee/radiance/recipe/recipepackage.py)."""
+
+    # preparing to test
+    def setUp(self):
+        """Set up the test case by creating a recipe."""
+        self.folder = tempfile.mkdtemp()
+        wall_mat = Plastic('wall_mat', 0.5, 0.5, 0.5)
+        surfaces = []
+        for i in range(4):
+            pts = ((i, 0, 0), (i + 1, 0, 0), (i + 1, 0, 3), (i, 0, 3))
+            srf = HBSurface('wall_%d' % i, pts, 0)
+            srf.radiance_material = wall_mat
+            surfaces.append(srf)
+        window = HBSurface('window', ((0, 1, 1), (1, 1, 1), (1, 1, 2), (0, 1, 2)), 5)
+        window.radiance_material = Glass('glass_mat', 0.6, 0.6, 0.6)
+        surfaces.append(window)
+
+        grids = [
+            AnalysisGrid.from_points_and_vectors(
+                [(x * 0.5, 1.25, 0.75) for x in range(10)], None, 'grid_1'),
+            AnalysisGrid.from_points_and_vectors(
+                [(x, 2, 0.123456) for x in range(5)], [(0, 1, 0)], 'grid_2')
+        ]
+        sun_vectors = [(-0.810513, 0.579652, -0.084093),
+                       (-0.67166, 0.702357, -0.235729)]
+        self.recipe = SolarAccessGridBased(sun_vectors, [1908, 2000], grids,
+                                           hb_objects=surfaces)
+        self.package = self.recipe.to_package(os.path.join(self.folder, 'job.hbpkg'))
+
+    # ending the test
+    def tearDown(self):
+        """Cleaning up after the test."""
+        shutil.rmtree(self.folder)
+
+    def test_round_trip(self):
+        """Test loading the recipe from a package."""
+        recipe = SolarAccessGridBased.from_package(self.package)
+        self.assertEqual(recipe.to_json(), self.recipe.to_json())
+        # materials are deduplicated
+        materials = set(id(srf.radiance_material) for srf in recipe.hb_objects)
+        self.assertEqual(len(materials), 2)
+        self.assertEqual(len(recipe.glazing_surfaces), 1)
+
+    def test_lazy(self):
+        """Test loading the grids on demand."""
+        recipe = read_recipe_package(self.package, lazy=True)
+        grid = recipe.analysis_grids[1]
+        self.assertEqual(len(grid), 5)
+        self.assertEqual(grid.to_rad_string(),
+                         self.recipe.analysis_grids[1].to_rad_string())
+        self.assertFalse(grid.is_loaded)
+        self.assertEqual(recipe.total_point_count, 15)
+        self.assertFalse(grid.is_loaded)
+        self.assertEqual(grid.analysis_points[0].direction, (0, 1, 0))
+        self.assertTrue(grid.is_loaded)
+        self.assertEqual(recipe.to_json(), self.recipe.to_json())
+
+    def test_lazy_duplicate(self):
+        """Changes to a duplicated grid should not change the original grid."""
+        grid = read_recipe_package(self.package, lazy=True).analysis_grids[0]
+        dup = grid.duplicate()
+        self.assertIsNot(dup, grid)
+        self.assertFalse(dup.is_loaded)
+        dup.analysis_points[0].location = (9, 9, 9)
+        self.assertFalse(grid.is_loaded)
+        self.assertEqual(tuple(grid.analysis_points[0].location), (0, 1.25, 0.75))
+        loaded = grid.duplicate()
+        loaded.analysis_points[0].location = (8, 8, 8)
+        self.assertEqual(tuple(grid.analysis_points[0].location), (0, 1.25, 0.75))
+
+    def test_rad_geometry(self):
+        """RadGeometry objects should be packaged with the surfaces."""
+        context = RadGeometry.from_records(iter_records((
+            'void plastic ctx_mat 0 0 5 0.2 0.2 0.2 0 0\n'
+            'ctx_mat polygon ground 0 0 12 0 0 0 10 0 0 10 10 0 0 10 0\n'
+            'ctx_mat polygon roof 0 0 9 0 0 5 1 0 5 1 1 5\n'
+            'ctx_mat sphere ball 0 0 4 0 0 5 1\n',)))
+        self.recipe.hb_objects = list(self.recipe.hb_objects) + [context]
+        package = self.recipe.to_package(os.path.join(self.folder, 'ctx.hbpkg'))
+        recipe = SolarAccessGridBased.from_package(package)
+        self.assertEqual([srf.name for srf in recipe.hb_objects[:-1]],
+                         [srf.name for srf in self.recipe.hb_objects[:-1]])
+        geometry = recipe.hb_objects[-1]
+        self.assertTrue(geometry.isRadGeometry)
+        self.assertEqual(list(geometry.iter_materials()),
+                         list(context.iter_materials()))
+        self.assertEqual(list(geometry.iter_geometries()),
+                         list(context.iter_geometries()))
+
+    def test_invalid_file(self):
+        """Test reading a file which is not a package."""
+        file_path = os.path.join(self.folder, 'job.json')
+        with open(file_path, 'w') as outf:
+            outf.write('{}')
+        with self.assertRaises(ValueError):
+            read_recipe_package(file_path)
+
+
+if __name__ == '__main__':
+    unittest.main()
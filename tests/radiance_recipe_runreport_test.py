@@ -0,0 +1,87 @@
+import unittest
+from honeybee_plus.radiance.recipe.runreport import RunReport, profile_command_file, \
+    profile_command, _batch_command
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+
+class RunReportTestCase(unittest.TestCase):
+    """Test for (honeybee/radiance/recipe/runreport.py)."""
+
+    # preparing to test
+    def setUp(self):
+        """Set up the test case by writing a command file."""
+        self.folder = tempfile.mkdtemp()
+        os.mkdir(os.path.join(self.folder, 'result'))
+        with open(os.path.join(self.folder, 'sky.rad'), 'w') as outf:
+            outf.write('void glow sky_glow 0 0 4 1 1 1 0\n' * 100)
+        self.command_file = os.path.join(self.folder, 'commands.bat')
+        python = '"{}" -c'.format(sys.executable)
+        with open(self.command_file, 'w') as outf:
+            outf.write('\n'.join((
+                '#!/usr/bin/env bash', 'cd {}'.format(self.folder), '',
+                'echo copying the sky',
+                '{} "import sys; print(open(sys.argv[1]).read())" sky.rad '
+                '> result/sky.rad'.format(python),
+                '{} "x = bytearray(50 * 1024 ** 2)"'.format(python),
+                '{} "import sys; sys.exit(3)"'.format(python))))
+
+    # ending the test
+    def tearDown(self):
+        """Cleaning up after the test."""
+        shutil.rmtree(self.folder)
+
+    def test_profile_command_file(self):
+        """Each command should be executed and profiled separately."""
+        report = profile_command_file(self.command_file)
+        assert len(report) == 3
+        assert not report.succeeded
+        assert [s.returncode for s in report] == [0, 0, 3]
+
+        copy = report.steps[0]
+        size = os.path.getsize(os.path.join(self.folder, 'sky.rad'))
+        assert copy.input_bytes == size
+        assert copy.output_bytes >= size
+        if hasattr(os, 'wait4'):
+            assert report.steps[1].peak_memory > 50 * 1024 ** 2
+            assert copy.cpu_time > 0
+
+        report_file = report.write(os.path.join(self.folder, 'report.json'))
+        with open(report_file) as inf:
+            loaded = RunReport.from_json(json.load(inf))
+        assert loaded.to_json() == report.to_json()
+        assert len(report.summary().split('\n')) == 5
+
+    def test_referenced_and_numbered_files(self):
+        """Instance octrees and numbered outputs should be included."""
+        with open(os.path.join(self.folder, 'context.oct'), 'w') as outf:
+            outf.write('o' * 1000)
+        with open(os.path.join(self.folder, 'scene.rad'), 'w') as outf:
+            outf.write('void instance context\n1 context.oct\n0\n0\n')
+        script = "import sys; [open(sys.argv[2] % i, 'w').write('x') for i in range(3)]"
+        command = '"{}" -c "{}" scene.rad result/%03d.hdr'.format(sys.executable, script)
+        step = profile_command(command, self.folder)
+        assert step.returncode == 0
+        assert step.input_bytes == 1000 + os.path.getsize(
+            os.path.join(self.folder, 'scene.rad'))
+        assert step.output_bytes == 3
+
+    def test_batch_command(self):
+        """%% should only be collapsed for batch files on Windows."""
+        line = 'dctimestep result/dc/%%03d.hdr sky.smx'
+        with mock.patch.object(os, 'name', 'nt'):
+            assert _batch_command(line) == 'dctimestep result/dc/%03d.hdr sky.smx'
+        with mock.patch.object(os, 'name', 'posix'):
+            assert _batch_command(line) == line
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+from honeybee_plus.radiance.sky.certainIlluminance \
+    import CertainIlluminanceLevel as radSky
+from honeybee_plus.radiance.analysisgrid import AnalysisGrid
+from honeybee_plus.radiance.recipe.pointintime.gridbased import GridBased
+from honeybee_plus.radiance.recipe.tuning import ParameterTuner, parameter_levels
+
+import os
+import shutil
+import tempfile
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+
+class FakeTuner(ParameterTuner):
+    """A tuner which converges with the number of ambient bounces."""
+
+    def run_level(self, recipe, target_folder, project_name):
+        self.runs.append(project_name)
+        ab = recipe.radiance_parameters.ambient_bounces
+        return [100 * (1 - 0.5 ** ab) for _ in recipe.analysis_grids[0]]
+
+
+class TuningTestCase(unittest.TestCase):
+    """Test for (honeybee/radiance/recipe/tuning.py)."""
+
+    # preparing to test
+    def setUp(self):
+        """Set up the test case by initiating a point-in-time recipe."""
+        points = [(x, y, 0) for x in range(10) for y in range(10)]
+        analysis_grid = AnalysisGrid.from_points_and_vectors(points)
+        self.recipe = GridBased(radSky(1000), analysis_grids=[analysis_grid])
+
+    def test_parameter_levels(self):
+        """Ambient parameters should increase for each level."""
+        levels = parameter_levels(self.recipe.radiance_parameters, 3)
+        assert [p.ambient_bounces for p in levels] == [2, 3, 4]
+        assert [p.ambient_divisions for p in levels] == [512, 1024, 2048]
+        assert levels[2].ambient_accuracy == 0.25 / 4
+        assert self.recipe.radiance_parameters.ambient_bounces == 2
+
+    def test_tune(self):
+        """The cheapest converged level should be selected on a sample."""
+        tuner = FakeTuner(self.recipe, tolerance=0.07, sample_size=20)
+        tuner.runs = []
+        par = tuner.tune('/tmp', 'room')
+        assert par.ambient_bounces == 3
+        assert len(tuner.runs) == 3
+        assert len(tuner.levels[0].values) == 20
+        assert len(self.recipe.analysis_grids[0]) == 100
+        assert round(tuner.levels[1].difference, 3) == 0.067
+
+    def test_run_level_write(self):
+        """Sample recipe should be written to a flat folder for each level."""
+        folder = tempfile.mkdtemp()
+        tuner = ParameterTuner(self.recipe, sample_size=20)
+        try:
+            # stop before running Radiance
+            with mock.patch.object(GridBased, 'run', side_effect=StopIteration):
+                with self.assertRaises(StopIteration):
+                    tuner.tune(folder, 'room')
+            assert os.path.isfile(
+                os.path.join(folder, 'room_level_0', 'gridbased', 'commands.bat'))
+        finally:
+            shutil.rmtree(folder)
+
+
+if __name__ == '__main__':
+    unittest.main()
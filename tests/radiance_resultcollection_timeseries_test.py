@@ -0,0 +1,70 @@
+import unittest
+from honeybee_plus.radiance.analysisgrid import AnalysisGrid
+from honeybee_plus.radiance.recipe.id import get_id
+from honeybee_plus.radiance.resultcollection.database import Database
+from honeybee_plus.radiance.resultcollection.timeseries import TimeSeries
+
+import os
+import shutil
+import tempfile
+
+
+class TimeSeriesTestCase(unittest.TestCase):
+    """Test for (honeybee/radiance/resultcollection/timeseries.py)."""
+
+    # preparing to test
+    def setUp(self):
+        """Set up the test case by creating a small database."""
+        self.folder = tempfile.mkdtemp()
+        self.db_file = os.path.join(self.folder, 'radout.db')
+        self.sensor_count = 5
+        self.hoys = (8, 9, 10, 11)
+        db = Database(self.db_file)
+        pts = [(i, 0, 0) for i in range(self.sensor_count)]
+        vectors = [(0, 0, 1)] * self.sensor_count
+        db.add_analysis_grids(
+            [AnalysisGrid.from_points_and_vectors(pts, vectors, 'test_grid')])
+        self.table_name = db.add_result_tables(get_id('solar_access'))[0]
+        values = [(s, 0, 0, h * 60, s * 100 + h)
+                  for s in range(self.sensor_count) for h in self.hoys]
+        db.executemany(
+            """INSERT INTO %s (sensor_id, grid_id, source_id, moy, value)
+            VALUES (?, ?, ?, ?, ?)""" % self.table_name, values)
+        self.db = db
+
+    # ending the test
+    def tearDown(self):
+        """Cleaning up after the test."""
+        shutil.rmtree(self.folder)
+
+    def test_time_major_index_is_lazy(self):
+        """Index should only be created on the first hourly query."""
+        ts = TimeSeries(self.db_file)
+        assert not ts.has_time_major_index
+        ts.values_hourly(9)
+        assert ts.has_time_major_index
+
+    def test_time_major_index_disabled(self):
+        """Index should not be created if time_major_index is set to False."""
+        ts = TimeSeries(self.db_file, time_major_index=False)
+        assert ts.values_hourly(9) == tuple(s * 100 + 9 for s in range(5))
+        assert not self.db.has_time_major_index(self.table_name)
+
+    def test_values_hourly(self):
+        """Hourly values should be the same with or without the index."""
+        ts = TimeSeries(self.db_file, time_major_index=False)
+        expected = [ts.values_hourly(h) for h in self.hoys]
+        ts.build_time_major_index()
+        assert [ts.values_hourly(h) for h in self.hoys] == expected
+        assert expected[0] == tuple(s * 100 + 8 for s in range(5))
+
+    def test_add_time_major_index(self):
+        """Adding the index twice should not fail."""
+        assert self.db.add_time_major_index(self.table_name)
+        assert not self.db.add_time_major_index(self.table_name)
+        self.db.remove_time_major_index(self.table_name)
+        assert not self.db.has_time_major_index(self.table_name)
+
+
+if __name__ == '__main__':
+    unittest.main()
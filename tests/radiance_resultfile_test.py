@@ -0,0 +1,76 @@
+import unittest
+from honeybee_plus.radiance.analysisgrid import AnalysisGrid
+from honeybee_plus.radiance.resultfile import ResultFile
+
+import os
+import shutil
+import struct
+import tempfile
+
+
+class ResultFileTestCase(unittest.TestCase):
+    """Test for (honeybee/radiance/resultfile.py)."""
+
+    # preparing to test
+    def setUp(self):
+        """Set up the test case by writing ascii and binary result files."""
+        self.folder = tempfile.mkdtemp()
+        self.sensor_count = 6
+        self.hoys = [h + 0.5 for h in range(8, 18)]
+        self.values = [[s * 1000 + h for h in range(len(self.hoys))]
+                       for s in range(self.sensor_count)]
+        header = '#?RADIANCE\nNROWS={}\nNCOLS={}\nNCOMP=1\nFORMAT={}\n\n'
+
+        self.ascii_file = os.path.join(self.folder, 'scene..default.ill')
+        with open(self.ascii_file, 'w') as outf:
+            outf.write(header.format(self.sensor_count, len(self.hoys), 'ascii'))
+            for row in self.values:
+                outf.write('\t'.join('%.1f' % v for v in row) + '\t\n')
+
+        self.binary_file = os.path.join(self.folder, 'scene..default.dat')
+        with open(self.binary_file, 'wb') as outf:
+            outf.write(header.format(
+                self.sensor_count, len(self.hoys), 'float').encode('ascii'))
+            for row in self.values:
+                outf.write(struct.pack('%df' % len(row), *row))
+
+    # ending the test
+    def tearDown(self):
+        """Cleaning up after the test."""
+        shutil.rmtree(self.folder)
+
+    def _grid(self):
+        pts = [(i, 0, 0) for i in range(self.sensor_count)]
+        return AnalysisGrid.from_points_and_vectors(pts, name='test_grid')
+
+    def test_ascii_and_binary(self):
+        """Values should be the same for ascii and binary files."""
+        for fp in (self.ascii_file, self.binary_file):
+            rf = ResultFile(fp, self.hoys, start_line=2)
+            assert rf.index.row_count == self.sensor_count
+            assert rf.sensor_values(0) == tuple(self.values[2])
+            assert rf.sensor_values(1, [9.5, 16.5]) == \
+                (self.values[3][1], self.values[3][8])
+            assert rf.hourly_values(12.5, 4) == tuple(
+                self.values[s][4] for s in range(2, 6))
+
+    def test_lazy_loading(self):
+        """Lazy grid should not load the values until they are needed."""
+        ag = self._grid()
+        ag.set_values_from_file(self.ascii_file, self.hoys, 'scene', 'default',
+                                lazy=True)
+        assert not ag.has_values
+        assert ag.digit_sign == 1
+        assert ag.hoys == self.hoys
+        assert ag.values_from_files([4], [10.5], 'scene', 'default') == [(4002,)]
+        with self.assertRaises(ValueError):
+            ag.values_from_files(source='window')
+
+        # load all the values
+        ag.load_values_from_files()
+        assert ag.has_values
+        assert ag[5].values(self.hoys, 'scene', 'default') == tuple(self.values[5])
+
+
+if __name__ == '__main__':
+    unittest.main()
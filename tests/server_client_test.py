@@ -0,0 +1,144 @@
+import unittest
+from honeybee_plus.server.client import Client
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+except ImportError:
+    # python 2
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    """An HTTP server which handles each connection in a thread."""
+
+    daemon_threads = True
+
+
+class UploadHandler(BaseHTTPRequestHandler):
+    """A stand-in server for uploads."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        BaseHTTPRequestHandler.setup(self)
+        self.server.connections += 1
+
+    def log_message(self, *args):
+        pass
+
+    def send(self, status, data=None):
+        body = json.dumps(data).encode('utf-8') if data is not None else b''
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def read_body(self):
+        return self.rfile.read(int(self.headers['Content-Length']))
+
+    def do_POST(self):
+        body = self.read_body()
+        parts = self.path.strip('/').split('/')
+        if parts == ['upload']:
+            self.server.forms.append(body)
+            self.send(200, {'size': len(body)})
+        elif parts == ['upload', 'uploads']:
+            upload_id = str(len(self.server.uploads))
+            self.server.uploads[upload_id] = {}
+            self.send(201, {'id': upload_id})
+        else:
+            chunks = self.server.uploads[parts[2]]
+            data = b''.join(chunks[i] for i in sorted(chunks))
+            sha256 = json.loads(body.decode('utf-8'))['sha256']
+            assert hashlib.sha256(data).hexdigest() == sha256
+            self.send(200, {'size': len(data)})
+
+    def do_GET(self):
+        chunks = self.server.uploads[self.path.strip('/').split('/')[2]]
+        self.send(200, {'chunks': sorted(chunks)})
+
+    def do_PUT(self):
+        body = self.read_body()
+        parts = self.path.strip('/').split('/')
+        index = int(parts[4])
+        self.server.puts.append(index)
+        if index in self.server.fail_chunks:
+            self.server.fail_chunks.remove(index)
+            body = body[1:]
+        if hashlib.sha256(body).hexdigest() != self.headers['X-Checksum-SHA256']:
+            self.send(400, {'error': 'checksum'})
+        else:
+            self.server.uploads[parts[2]][index] = body
+            self.send(204)
+
+
+class ClientTestCase(unittest.TestCase):
+    """Test for (honeybee/server/client.py)."""
+
+    # preparing to test
+    def setUp(self):
+        """Set up the test case by starting a server and writing a file."""
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), UploadHandler)
+        self.server.connections = 0
+        self.server.forms, self.server.uploads, self.server.puts = [], {}, []
+        self.server.fail_chunks = []
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.start()
+        self.client = Client('http://127.0.0.1:%d/upload' % self.server.server_port,
+                             chunk_size=1000, retries=1)
+
+        self.folder = tempfile.mkdtemp()
+        self.filename = os.path.join(self.folder, 'room.zip')
+        self.data = os.urandom(4500)
+        with open(self.filename, 'wb') as outf:
+            outf.write(self.data)
+
+    # ending the test
+    def tearDown(self):
+        """Cleaning up after the test."""
+        self.client.close()
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        shutil.rmtree(self.folder)
+
+    def test_upload_file(self):
+        """Multipart form should be streamed using the same connection."""
+        self.client.upload_file(self.filename)
+        self.client.upload_file(self.filename)
+        assert len(self.server.forms) == 2
+        form = self.server.forms[0]
+        assert self.data in form
+        assert b'filename="room.zip"' in form
+        assert self.server.connections == 1
+
+    def test_upload_file_chunked(self):
+        """Failed uploads should continue from the missing chunks."""
+        # chunk 2 is corrupted on both attempts
+        self.server.fail_chunks = [2, 2]
+        with self.assertRaises(IOError):
+            self.client.upload_file_chunked(self.filename)
+        assert os.path.isfile(self.filename + '.upload')
+        assert sorted(self.server.uploads['0']) == [0, 1]
+
+        self.server.puts = []
+        # chunk 3 is corrupted once and should be sent again
+        self.server.fail_chunks = [3]
+        response = self.client.upload_file_chunked(self.filename)
+        assert response['size'] == len(self.data)
+        assert self.server.puts == [2, 3, 3, 4]
+        assert len(self.server.uploads) == 1
+        assert not os.path.isfile(self.filename + '.upload')
+        assert self.server.connections == 1
+
+
+if __name__ == '__main__':
+    unittest.main()
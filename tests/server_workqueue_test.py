@@ -0,0 +1,92 @@
+import unittest
+from honeybee_plus.server.workqueue import SQLiteQueue, Coordinator, command_file_jobs
+from honeybee_plus.radiance.analysisgrid import AnalysisGrid
+from honeybee_plus.radiance.recipe.daylightcoeff.gridbased import \
+    DaylightCoeffGridBased
+from honeybee_plus.radiance.sky.skymatrix import SkyMatrix
+from honeybee_plus.hbsurface import HBSurface
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+
+class WorkQueueTestCase(unittest.TestCase):
+    """Test for (honeybee/server/workqueue.py)."""
+
+    # preparing to test
+    def setUp(self):
+        """Set up the test case by writing a command file with independent steps."""
+        self.folder = tempfile.mkdtemp()
+        python = '"{}" -c'.format(sys.executable)
+        render = '{} "import time; time.sleep(0.5); print(1)" > result/tile_{}.hdr'
+        combine = '{} "import sys; print(len(sys.argv))" {} > result/view.hdr'
+        self.command_file = os.path.join(self.folder, 'commands.bat')
+        with open(self.command_file, 'w') as outf:
+            outf.write('\n'.join(
+                ['cd {}'.format(self.folder), 'mkdir result'] +
+                [render.format(python, i) for i in range(4)] +
+                [combine.format(
+                    python, ' '.join('result/tile_%d.hdr' % i for i in range(4)))]))
+
+    # ending the test
+    def tearDown(self):
+        """Cleaning up after the test."""
+        shutil.rmtree(self.folder)
+
+    def test_command_file_jobs(self):
+        """Tiles should only depend on mkdir and the last step on the tiles."""
+        jobs, dependencies = command_file_jobs(self.command_file)
+        assert len(jobs) == 6
+        assert dependencies == [set(), {0}, {0}, {0}, {0}, {0, 1, 2, 3, 4}]
+        assert jobs[1].outputs == [os.path.join(self.folder, 'result', 'tile_0.hdr')]
+
+    def test_context_instance_jobs(self):
+        """Steps should depend on the octrees that their .rad files reference."""
+        sky = SkyMatrix.from_epw_file(os.path.abspath('tests/room/test.epw'))
+        analysis_grid = AnalysisGrid.from_points_and_vectors([(1, 1, 0.8)])
+        wall = HBSurface('wall', ((0, 0, 0), (2, 0, 0), (2, 0, 3), (0, 0, 3)), 0)
+        rp = DaylightCoeffGridBased(sky, [analysis_grid], hb_objects=[wall])
+        rp.context_as_instance = True
+        jobs, dependencies = command_file_jobs(rp.write(self.folder, 'room'))
+
+        octrees = {}
+        for count, job in enumerate(jobs):
+            for output in job.outputs:
+                if output.endswith('.oct') and '..ctx' in output:
+                    octrees[count] = output
+        assert len(octrees) == 2
+        for count, job in enumerate(jobs):
+            if job.command.startswith('rfluxmtx'):
+                instances = [c for c, octree in octrees.items() if octree in job.inputs]
+                assert instances and set(instances) <= dependencies[count]
+
+    def test_coordinator(self):
+        """Independent steps should be executed by several worker processes."""
+        db_file = os.path.join(self.folder, 'queue.db')
+        queue = SQLiteQueue(db_file)
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        workers = [
+            subprocess.Popen(
+                [sys.executable, '-m', 'honeybee_plus.server.workqueue', 'worker',
+                 db_file, '--idle-timeout', '2', '--poll-interval', '0.05'],
+                cwd=root, stdout=subprocess.PIPE)
+            for _ in range(3)]
+        try:
+            jobs = Coordinator(queue, poll_interval=0.05, timeout=60).run(
+                *command_file_jobs(self.command_file))
+        finally:
+            for worker in workers:
+                worker.communicate()
+
+        assert all(job.status == 'done' for job in jobs)
+        assert len(set(job.worker for job in jobs)) > 1
+        assert jobs[-1].output_sizes[jobs[-1].outputs[0]] > 0
+        with open(os.path.join(self.folder, 'result', 'view.hdr')) as inf:
+            assert inf.read().strip() == '5'
+
+
+if __name__ == '__main__':
+    unittest.main()